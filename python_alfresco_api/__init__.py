@@ -11,30 +11,71 @@ Generated using the proven hybrid approach:
 datamodel-code-generator + openapi-python-client
 """
 
-from .client_factory import ClientFactory
-from .auth_util import AuthUtil, OAuth2AuthUtil
-
-# Individual clients - V1.1 hierarchical structure
-from .clients.auth import AlfrescoAuthClient
-from .clients.core import AlfrescoCoreClient  
-from .clients.discovery import AlfrescoDiscoveryClient
-from .clients.search import AlfrescoSearchClient
-from .clients.workflow import AlfrescoWorkflowClient
-from .clients.model import AlfrescoModelClient
-from .clients.search_sql import AlfrescoSearchSqlClient
-
-# Pydantic models for LLM integration
-from .models import *
-
-# Conversion utilities for Pydantic ↔ attrs model transformation  
-from .clients.conversion_utils import (
-    pydantic_to_attrs_dict,
-    attrs_to_pydantic,
-    create_converter_pair
-)
-
-# Import raw_clients to ensure they get packaged
-from . import raw_clients
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client_factory import ClientFactory
+    from .auth_util import AuthUtil, OAuth2AuthUtil
+    from .clients.auth import AlfrescoAuthClient
+    from .clients.core import AlfrescoCoreClient
+    from .clients.discovery import AlfrescoDiscoveryClient
+    from .clients.search import AlfrescoSearchClient
+    from .clients.workflow import AlfrescoWorkflowClient
+    from .clients.model import AlfrescoModelClient
+    from .clients.search_sql import AlfrescoSearchSqlClient
+    from .models import *
+    from .clients.conversion_utils import (
+        pydantic_to_attrs_dict,
+        attrs_to_pydantic,
+        create_converter_pair,
+    )
+    from . import raw_clients
+
+# Exports are imported on first access (PEP 562): `import python_alfresco_api`
+# loads no client, model or httpx code until a name is used
+_EXPORTS = {
+    # Factory & utilities
+    "ClientFactory": ".client_factory",
+    "AuthUtil": ".auth_util",
+    "OAuth2AuthUtil": ".auth_util",
+
+    # Individual clients - V1.1 hierarchical structure
+    "AlfrescoAuthClient": ".clients.auth",
+    "AlfrescoCoreClient": ".clients.core",
+    "AlfrescoDiscoveryClient": ".clients.discovery",
+    "AlfrescoSearchClient": ".clients.search",
+    "AlfrescoWorkflowClient": ".clients.workflow",
+    "AlfrescoModelClient": ".clients.model",
+    "AlfrescoSearchSqlClient": ".clients.search_sql",
+
+    # Conversion utilities for Pydantic <-> attrs model transformation
+    "pydantic_to_attrs_dict": ".clients.conversion_utils",
+    "attrs_to_pydantic": ".clients.conversion_utils",
+    "create_converter_pair": ".clients.conversion_utils",
+}
+
+# Subpackages exposed as attributes
+_SUBMODULES = {"models", "raw_clients", "clients"}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif not name.startswith("_") and name in importlib.import_module(".models", __name__).__all__:
+        # Pydantic models for LLM integration (formerly `from .models import *`)
+        value = getattr(importlib.import_module(".models", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
+
 
 __version__ = "1.1.1"
 __all__ = [
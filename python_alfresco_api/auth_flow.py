@@ -0,0 +1,208 @@
+"""
+httpx Authentication Flows
+
+Provides httpx.Auth implementations that ClientFactory installs on every raw
+client's httpx.Client / httpx.AsyncClient. Unlike the static Authorization
+header baked in by the generated AuthenticatedClient, these flows read the
+current credentials from the factory's auth util on every request and refresh
+them in place, so connection pools never need to be rebuilt.
+"""
+
+import abc
+import asyncio
+import threading
+import weakref
+from typing import AsyncGenerator, Generator, Optional
+
+import httpx
+
+from .auth_util import AuthUtil, OAuth2AuthUtil
+
+
+class RefreshingAuth(httpx.Auth, abc.ABC):
+    """
+    Base httpx auth flow for credentials that expire.
+
+    - Credentials are refreshed proactively when they expire within renewal_margin
+    - A 401 response refreshes the credentials once and retries the request
+    - Refreshes are single-flight: concurrent threads and asyncio tasks that all
+      find the credentials stale wait for ONE refresh instead of each starting one
+
+    Sync callers serialize on a threading lock. Async callers first queue on a
+    per-event-loop asyncio lock (so waiting tasks don't block the loop), then run
+    the sync refresh in a worker thread under the same threading lock, which
+    makes the refresh single-flight across threads and event loops alike.
+
+    Subclasses implement credential(), authorization_header(), expires_within()
+    and refresh_sync().
+    """
+
+    def __init__(self, auth_util, renewal_margin: float = 300.0):
+        """
+        Initialize refreshing auth flow.
+
+        Args:
+            auth_util: Auth util holding (and able to refresh) the credentials
+            renewal_margin: Refresh this many seconds before the credentials expire
+        """
+        self.auth_util = auth_util
+        self.renewal_margin = renewal_margin
+        self._lock = threading.Lock()
+        self._loop_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    # ==================== SUBCLASS HOOKS ====================
+
+    @abc.abstractmethod
+    def credential(self) -> Optional[str]:
+        """Get the current credential (ticket, access token, ...) or None."""
+
+    @abc.abstractmethod
+    def authorization_header(self) -> Optional[str]:
+        """Get the Authorization header value for the current credential."""
+
+    @abc.abstractmethod
+    def expires_within(self, seconds: float) -> bool:
+        """Check if the credential is missing or expires within the given seconds."""
+
+    @abc.abstractmethod
+    def refresh_sync(self) -> bool:
+        """Obtain a new credential (synchronous, called under the refresh lock)."""
+
+    # ==================== SINGLE-FLIGHT REFRESH ====================
+
+    def _needs_refresh(self, failed_credential: Optional[str]) -> bool:
+        """Check if a refresh is needed (expiring soon, or the credential that just failed)."""
+        if failed_credential is not None:
+            return self.credential() == failed_credential
+        return self.expires_within(self.renewal_margin)
+
+    def _refresh(self, failed_credential: Optional[str] = None) -> None:
+        """Refresh the credential if needed, taking the lock only when a refresh is due."""
+        if not self._needs_refresh(failed_credential):
+            return
+        with self._lock:
+            if self._needs_refresh(failed_credential):
+                self.refresh_sync()
+
+    def _loop_lock(self) -> asyncio.Lock:
+        """Get the asyncio lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            lock = self._loop_locks.get(loop)
+            if lock is None:
+                lock = self._loop_locks[loop] = asyncio.Lock()
+        return lock
+
+    async def _refresh_async(self, failed_credential: Optional[str] = None) -> None:
+        """Refresh the credential if needed without blocking the event loop."""
+        if not self._needs_refresh(failed_credential):
+            return
+        async with self._loop_lock():
+            if self._needs_refresh(failed_credential):
+                await asyncio.to_thread(self._refresh, failed_credential)
+
+    # ==================== HTTPX AUTH FLOWS ====================
+
+    def _apply(self, request: httpx.Request) -> Optional[str]:
+        """Set the Authorization header, returning the credential used."""
+        header = self.authorization_header()
+        if header is not None:
+            request.headers["Authorization"] = header
+        return self.credential()
+
+    def sync_auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        """Sync flow: ensure fresh credentials, send, refresh and retry once on 401."""
+        self._refresh()
+        credential = self._apply(request)
+        response = yield request
+
+        if response.status_code == 401 and credential is not None:
+            self._refresh(failed_credential=credential)
+            self._apply(request)
+            yield request
+
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        """Async flow: ensure fresh credentials, send, refresh and retry once on 401."""
+        await self._refresh_async()
+        credential = self._apply(request)
+        response = yield request
+
+        if response.status_code == 401 and credential is not None:
+            await self._refresh_async(failed_credential=credential)
+            self._apply(request)
+            yield request
+
+
+class TicketAuth(RefreshingAuth):
+    """
+    Ticket-based session authentication.
+
+    Obtains one Alfresco ticket through AuthUtil and sends it as
+    ``Authorization: Basic base64(ticket)`` on every request, so the repository
+    validates a session instead of running a full username/password
+    authentication for each REST call.
+    """
+
+    def __init__(self, auth_util: AuthUtil, renewal_margin: float = 300.0):
+        """
+        Initialize ticket auth flow.
+
+        Args:
+            auth_util: AuthUtil used to create tickets
+            renewal_margin: Renew the ticket this many seconds before ticket_expires
+        """
+        super().__init__(auth_util, renewal_margin=renewal_margin)
+
+    def credential(self) -> Optional[str]:
+        return self.auth_util.ticket
+
+    def authorization_header(self) -> Optional[str]:
+        return self.auth_util.get_ticket_header()
+
+    def expires_within(self, seconds: float) -> bool:
+        return self.auth_util.expires_within(seconds)
+
+    def refresh_sync(self) -> bool:
+        return self.auth_util.authenticate_sync()
+
+
+class OAuth2Auth(RefreshingAuth):
+    """
+    OAuth2 bearer token authentication.
+
+    Sends ``Authorization: Bearer <access_token>`` from OAuth2AuthUtil and
+    refreshes the token (refresh token first, then the configured grant)
+    before it expires or after a 401.
+    """
+
+    def __init__(self, auth_util: OAuth2AuthUtil, renewal_margin: float = 60.0):
+        """
+        Initialize OAuth2 auth flow.
+
+        Args:
+            auth_util: OAuth2AuthUtil holding the access and refresh tokens
+            renewal_margin: Refresh this many seconds before token_expires
+        """
+        super().__init__(auth_util, renewal_margin=renewal_margin)
+
+    def credential(self) -> Optional[str]:
+        return self.auth_util.access_token
+
+    def authorization_header(self) -> Optional[str]:
+        if not self.auth_util.access_token:
+            return None
+        return f"Bearer {self.auth_util.access_token}"
+
+    def expires_within(self, seconds: float) -> bool:
+        return self.auth_util.expires_within(seconds)
+
+    def refresh_sync(self) -> bool:
+        # Force a new token even if the current one is not past token_expires
+        self.auth_util.invalidate()
+        return self.auth_util.ensure_authenticated_sync()
@@ -168,6 +168,33 @@ class AuthUtil:
         self.ticket_expires = None
         self._authenticated = False
     
+    def _ticket_request(self) -> Dict[str, Any]:
+        """Build the URL, body and httpx client arguments for a ticket request."""
+        client_kwargs = {"verify": self.verify_ssl}
+        if self.timeout is not None:
+            client_kwargs["timeout"] = self.timeout
+        
+        return {
+            "url": (
+                f"{self.base_url}/alfresco/api/-default-/public/authentication/versions/1/tickets"
+            ),
+            "json": {"userId": self.username, "password": self.password},
+            "client_kwargs": client_kwargs,
+        }
+    
+    def _store_ticket(self, response: httpx.Response) -> bool:
+        """Store the ticket from a create ticket response."""
+        if response.status_code == 201:
+            ticket_data = response.json()
+            self.ticket = ticket_data["entry"]["id"]
+            # Tickets typically expire after 1 hour
+            self.ticket_expires = datetime.now() + timedelta(hours=1)
+            self._authenticated = True
+            return True
+        
+        print(f"Authentication failed with status {response.status_code}: {response.text}")
+        return False
+    
     async def authenticate(self) -> bool:
         """
         Authenticate with Alfresco and get ticket using direct HTTP request.
@@ -179,34 +206,51 @@ class AuthUtil:
             True if authentication successful, False otherwise
         """
         try:
-            # Use direct HTTP approach like the working test code
-            auth_url = f"{self.base_url}/alfresco/api/-default-/public/authentication/versions/1/tickets"
-            auth_data = {"userId": self.username, "password": self.password}
-            
-            # Create httpx client with timeout only if specified
-            client_kwargs = {"verify": self.verify_ssl}
-            if self.timeout is not None:
-                client_kwargs["timeout"] = self.timeout
-            
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                response = await client.post(auth_url, json=auth_data)
-                
-                if response.status_code == 201:
-                    ticket_data = response.json()
-                    self.ticket = ticket_data["entry"]["id"]
-                    # Tickets typically expire after 1 hour
-                    self.ticket_expires = datetime.now() + timedelta(hours=1)
-                    self._authenticated = True
+            ticket_request = self._ticket_request()
+            async with httpx.AsyncClient(**ticket_request["client_kwargs"]) as client:
+                response = await client.post(ticket_request["url"], json=ticket_request["json"])
+                if self._store_ticket(response):
                     return True
-                else:
-                    print(f"Authentication failed with status {response.status_code}: {response.text}")
                     
         except Exception as e:
             print(f"Authentication failed: {e}")
-            self._authenticated = False
         
+        self._authenticated = False
+        return False
+    
+    def authenticate_sync(self) -> bool:
+        """
+        Authenticate with Alfresco and get ticket (synchronous).
+        
+        Same as authenticate() but usable from sync code, e.g. the sync
+        httpx auth flow used by ticket-based session auth.
+        
+        Returns:
+            True if authentication successful, False otherwise
+        """
+        try:
+            ticket_request = self._ticket_request()
+            with httpx.Client(**ticket_request["client_kwargs"]) as client:
+                response = client.post(ticket_request["url"], json=ticket_request["json"])
+                if self._store_ticket(response):
+                    return True
+                    
+        except Exception as e:
+            print(f"Authentication failed: {e}")
+        
+        self._authenticated = False
         return False
     
+    def expires_within(self, seconds: float) -> bool:
+        """Check if the ticket is missing or expires within the given number of seconds"""
+        if not self.is_authenticated():
+            return True
+        
+        if self.ticket_expires is None:
+            return False
+        
+        return datetime.now() + timedelta(seconds=seconds) >= self.ticket_expires
+    
     def is_authenticated(self) -> bool:
         """Check if currently authenticated with valid ticket"""
         if not self._authenticated or not self.ticket:
@@ -227,6 +271,13 @@ class AuthUtil:
             "X-Alfresco-Ticket": self.ticket
         }
     
+    def get_ticket_header(self) -> Optional[str]:
+        """Get Authorization header value carrying the ticket (Basic base64(ticket))"""
+        if not self.is_authenticated() or not self.ticket:
+            return None
+        
+        return f"Basic {base64.b64encode(self.ticket.encode()).decode()}"
+    
     async def ensure_authenticated(self) -> bool:
         """Ensure we have valid authentication, refresh if needed"""
         if self.is_authenticated():
@@ -482,8 +533,31 @@ class OAuth2AuthUtil:
             self._authenticated = False
             return False
     
-    async def _client_credentials_flow(self) -> bool:
-        """Execute OAuth2 client credentials flow."""
+    def authenticate_sync(self) -> bool:
+        """
+        Authenticate using OAuth2 flow and obtain access token (synchronous).
+        
+        Returns:
+            True if authentication successful, False otherwise
+        """
+        try:
+            if self.grant_type == "client_credentials":
+                return self._client_credentials_flow_sync()
+            elif self.grant_type == "refresh_token" and self.refresh_token:
+                return self._refresh_token_flow_sync()
+            elif self.grant_type == "authorization_code":
+                # This typically requires user interaction, so we just validate existing token
+                return self.is_authenticated()
+            else:
+                raise ValueError(f"Unsupported grant type: {self.grant_type}")
+                
+        except Exception as e:
+            print(f"OAuth2 authentication failed: {e}")
+            self._authenticated = False
+            return False
+    
+    def _client_credentials_data(self) -> Dict[str, str]:
+        """Build the token request body for the client credentials flow."""
         if not self.client_id or not self.client_secret or not self.token_endpoint:
             raise ValueError(
                 "Client credentials flow requires client_id, client_secret, and token_endpoint"
@@ -498,40 +572,12 @@ class OAuth2AuthUtil:
         if self.scope:
             data["scope"] = self.scope
         
-        # Create httpx client with timeout only if specified
-        client_kwargs = {"verify": self.verify_ssl}
-        if self.timeout is not None:
-            client_kwargs["timeout"] = self.timeout
-        
-        async with httpx.AsyncClient(**client_kwargs) as client:
-            response = await client.post(
-                self.token_endpoint,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"}
-            )
-            
-            if response.status_code == 200:
-                token_data = response.json()
-                self.access_token = token_data.get("access_token")
-                
-                # Handle token expiration
-                expires_in = token_data.get("expires_in")
-                if expires_in:
-                    self.token_expires = datetime.now() + timedelta(seconds=expires_in)
-                
-                # Store refresh token if provided
-                if "refresh_token" in token_data:
-                    self.refresh_token = token_data["refresh_token"]
-                
-                self._authenticated = True
-                return True
-        
-        return False
+        return data
     
-    async def _refresh_token_flow(self) -> bool:
-        """Refresh access token using refresh token."""
+    def _refresh_token_data(self) -> Optional[Dict[str, str]]:
+        """Build the token request body for the refresh token flow (None if not possible)."""
         if not self.refresh_token or not self.token_endpoint:
-            return False
+            return None
         
         data = {
             "grant_type": "refresh_token",
@@ -542,35 +588,77 @@ class OAuth2AuthUtil:
         if self.client_secret:
             data["client_secret"] = self.client_secret
         
+        return data
+    
+    def _token_client_kwargs(self) -> Dict[str, Any]:
+        """Get httpx client arguments for token endpoint requests."""
         # Create httpx client with timeout only if specified
         client_kwargs = {"verify": self.verify_ssl}
         if self.timeout is not None:
             client_kwargs["timeout"] = self.timeout
+        return client_kwargs
+    
+    def _store_token(self, response: httpx.Response) -> bool:
+        """Store access token, expiration and refresh token from a token response."""
+        if response.status_code != 200:
+            return False
+        
+        token_data = response.json()
+        self.access_token = token_data.get("access_token")
+        
+        # Handle token expiration
+        expires_in = token_data.get("expires_in")
+        if expires_in:
+            self.token_expires = datetime.now() + timedelta(seconds=expires_in)
         
-        async with httpx.AsyncClient(**client_kwargs) as client:
+        # Store refresh token if provided
+        if "refresh_token" in token_data:
+            self.refresh_token = token_data["refresh_token"]
+        
+        self._authenticated = True
+        return True
+    
+    async def _post_token_request(self, data: Dict[str, str]) -> bool:
+        """Post a token request to the token endpoint and store the result."""
+        async with httpx.AsyncClient(**self._token_client_kwargs()) as client:
             response = await client.post(
                 self.token_endpoint,
                 data=data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"}
             )
-            
-            if response.status_code == 200:
-                token_data = response.json()
-                self.access_token = token_data.get("access_token")
-                
-                # Update expiration
-                expires_in = token_data.get("expires_in")
-                if expires_in:
-                    self.token_expires = datetime.now() + timedelta(seconds=expires_in)
-                
-                # Update refresh token if provided
-                if "refresh_token" in token_data:
-                    self.refresh_token = token_data["refresh_token"]
-                
-                self._authenticated = True
-                return True
-        
-        return False
+            return self._store_token(response)
+    
+    def _post_token_request_sync(self, data: Dict[str, str]) -> bool:
+        """Post a token request to the token endpoint and store the result (synchronous)."""
+        with httpx.Client(**self._token_client_kwargs()) as client:
+            response = client.post(
+                self.token_endpoint,
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+            return self._store_token(response)
+    
+    async def _client_credentials_flow(self) -> bool:
+        """Execute OAuth2 client credentials flow."""
+        return await self._post_token_request(self._client_credentials_data())
+    
+    def _client_credentials_flow_sync(self) -> bool:
+        """Execute OAuth2 client credentials flow (synchronous)."""
+        return self._post_token_request_sync(self._client_credentials_data())
+    
+    async def _refresh_token_flow(self) -> bool:
+        """Refresh access token using refresh token."""
+        data = self._refresh_token_data()
+        if data is None:
+            return False
+        return await self._post_token_request(data)
+    
+    def _refresh_token_flow_sync(self) -> bool:
+        """Refresh access token using refresh token (synchronous)."""
+        data = self._refresh_token_data()
+        if data is None:
+            return False
+        return self._post_token_request_sync(data)
     
     def is_authenticated(self) -> bool:
         """Check if currently authenticated with valid access token."""
@@ -609,6 +697,23 @@ class OAuth2AuthUtil:
         """Get authentication prefix for headers. OAuth2AuthUtil uses Bearer tokens."""
         return "Bearer"
     
+    def expires_within(self, seconds: float) -> bool:
+        """Check if the access token is missing or expires within the given number of seconds."""
+        if not self.is_authenticated():
+            return True
+        
+        if self.token_expires is None:
+            return False
+        
+        return datetime.now() + timedelta(seconds=seconds) >= self.token_expires
+    
+    def invalidate(self) -> None:
+        """
+        Treat the current access token as expired, so the next ensure_authenticated() obtains a new
+        one.
+        """
+        self._authenticated = False
+    
     async def ensure_authenticated(self) -> bool:
         """Ensure we have valid authentication, refresh if needed."""
         if self.is_authenticated():
@@ -622,6 +727,22 @@ class OAuth2AuthUtil:
         # Fall back to main authentication flow
         return await self.authenticate()
     
+    def ensure_authenticated_sync(self) -> bool:
+        """Ensure we have valid authentication, refresh if needed (synchronous)."""
+        if self.is_authenticated():
+            return True
+        
+        # Try refresh token first if available
+        if self.refresh_token:
+            try:
+                if self._refresh_token_flow_sync():
+                    return True
+            except Exception as e:
+                print(f"OAuth2 token refresh failed: {e}")
+        
+        # Fall back to main authentication flow
+        return self.authenticate_sync()
+    
     @classmethod
     def from_env(
         cls,
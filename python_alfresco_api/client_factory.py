@@ -6,15 +6,23 @@ Perfect for enterprise applications and microservices.
 """
 
 import os
-from typing import Optional, Dict, Any, Union
-from .auth_util import AuthUtil, SimpleAuthUtil
-from .clients.auth import AlfrescoAuthClient
-from .clients.core import AlfrescoCoreClient
-from .clients.discovery import AlfrescoDiscoveryClient
-from .clients.search import AlfrescoSearchClient
-from .clients.workflow import AlfrescoWorkflowClient
-from .clients.model import AlfrescoModelClient
-from .clients.search_sql import AlfrescoSearchSqlClient
+from typing import TYPE_CHECKING, Optional, Dict, Any, Union
+from .auth_util import AuthUtil, SimpleAuthUtil, OAuth2AuthUtil
+from .transport import SharedTransport
+from .json_codec import JsonCodec, get_json_codec
+from .auth_flow import TicketAuth, OAuth2Auth
+
+# Client classes are imported by the create_* methods that need them
+if TYPE_CHECKING:
+    from .clients.auth import AlfrescoAuthClient
+    from .clients.core import AlfrescoCoreClient
+    from .clients.discovery import AlfrescoDiscoveryClient
+    from .clients.search import AlfrescoSearchClient
+    from .clients.workflow import AlfrescoWorkflowClient
+    from .clients.model import AlfrescoModelClient
+    from .clients.search_sql import AlfrescoSearchSqlClient
+    from .clients.core.nodes.cache import NodeCache
+    from .clients.core.content.cache import ContentCache
 
 # Try to import python-dotenv for .env file support (optional)
 try:
@@ -56,7 +64,18 @@ class ClientFactory:
         verify_ssl: Optional[Union[bool, str]] = None,
         timeout: Optional[int] = None,
         load_env: bool = True,
-        env_file: Optional[str] = None
+        env_file: Optional[str] = None,
+        share_connections: bool = True,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        ticket_auth: bool = False,
+        ticket_renewal_margin: float = 300.0,
+        json_codec: Union[str, JsonCodec] = "auto",
+        node_cache: Union[bool, "NodeCache", None] = None,
+        coalesce_requests: bool = False,
+        content_cache: Union[bool, str, os.PathLike, "ContentCache", None] = None
     ):
         """
         Initialize the client factory with centralized authentication management.
@@ -74,6 +93,27 @@ class ClientFactory:
             timeout: Request timeout in seconds (overrides env, but auth_util.timeout takes precedence)
             load_env: Whether to automatically load from environment/env file
             env_file: Specific .env file path (default: .env in current directory)
+            share_connections: Share one connection pool across all raw clients (default: True)
+            max_connections: Maximum concurrent connections to the host (None = unlimited)
+            max_keepalive_connections: Maximum idle connections kept open (None = unlimited)
+            keepalive_expiry: Seconds an idle connection is kept alive (None = forever)
+            http2: Enable HTTP/2 on the shared pool (requires: pip install httpx[http2])
+            ticket_auth: Authenticate once and send an Alfresco ticket instead of
+                        Basic username/password on every request (default: False)
+            ticket_renewal_margin: Renew the ticket this many seconds before it expires
+            json_codec: JSON codec for response parsing and request bodies: "auto" (orjson,
+                       then msgspec, then the standard library), "orjson", "msgspec", "json"
+                       or a JsonCodec instance. Applied through the shared connection pool.
+            node_cache: Cache nodes.get() results: True (NodeCache defaults: 1024 entries,
+                       60 s TTL), a NodeCache instance, or None/False (default: no cache).
+                       Mutations through the nodes client invalidate the node.
+            coalesce_requests: Send identical concurrent GET/HEAD requests (same URL and
+                       headers, i.e. same credentials) once and share the response among
+                       the waiting callers (requires share_connections)
+            content_cache: Keep downloaded content on disk and revalidate it with
+                       conditional GETs (ETag / Last-Modified): True (ContentCache
+                       defaults: 1 GiB under the user cache directory), a directory,
+                       a ContentCache instance, or None/False (default: no cache)
         """
         # Centralized environment loading (ONLY place in entire package)
         from .auth_util import load_env_config
@@ -137,6 +177,45 @@ class ClientFactory:
                 f"Try setting ALFRESCO_USERNAME and ALFRESCO_PASSWORD environment variables\n"
                 f"Or pass auth_util=SimpleAuthUtil('user', 'pass') to ClientFactory"
             )
+        
+        self.json_codec = get_json_codec(json_codec)
+        
+        # Shared by the core clients' nodes.get() (imported only when enabled)
+        self.node_cache: Optional["NodeCache"] = None
+        if node_cache is not None and node_cache is not False:
+            from .clients.core.nodes.cache import resolve_node_cache
+            self.node_cache = resolve_node_cache(node_cache)
+        
+        # Used by content downloads (imported only when enabled)
+        self.content_cache: Optional["ContentCache"] = None
+        if content_cache is not None and content_cache is not False:
+            from .clients.core.content.cache import resolve_content_cache
+            self.content_cache = resolve_content_cache(content_cache)
+        
+        # One connection pool per factory (i.e. per Alfresco host), shared by all raw clients
+        if coalesce_requests and not share_connections:
+            raise ValueError("coalesce_requests=True requires share_connections=True")
+        self._transport: Optional[SharedTransport] = None
+        if share_connections:
+            self._transport = SharedTransport(
+                verify_ssl=self.verify_ssl,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+                codec=self.json_codec,
+                coalesce=coalesce_requests
+            )
+        
+        # httpx auth flow installed on every raw client for credentials that expire
+        # (None = static Basic credentials baked into the raw client headers)
+        self._auth_flow = None
+        if ticket_auth:
+            self._auth_flow = TicketAuth(
+                self._get_ticket_auth_util(), renewal_margin=ticket_renewal_margin
+            )
+        elif isinstance(self.auth, OAuth2AuthUtil):
+            self._auth_flow = OAuth2Auth(self.auth)
     
     @property
     def base_url(self) -> str:
@@ -153,6 +232,75 @@ class ClientFactory:
         """Get the authentication password."""
         return getattr(self, '_auth_password', None)
     
+    def _get_ticket_auth_util(self) -> AuthUtil:
+        """Get an AuthUtil able to create tickets for ticket-based session auth."""
+        if isinstance(self.auth, AuthUtil):
+            return self.auth
+        
+        if not self.username or not self.password:
+            raise ValueError(
+                f"ticket_auth requires username/password credentials, "
+                f"not supported with {type(self.auth).__name__}"
+            )
+        
+        return AuthUtil(
+            base_url=self._base_url,
+            username=self.username,
+            password=self.password,
+            verify_ssl=self.verify_ssl,
+            timeout=self.timeout
+        )
+    
+    @property
+    def auth_flow(self):
+        """Get the httpx auth flow installed on raw clients (None = static token header)."""
+        return self._auth_flow
+    
+    @property
+    def transport(self) -> Optional[SharedTransport]:
+        """Get the shared connection pool (None if share_connections=False)."""
+        return self._transport
+    
+    def get_httpx_args(self) -> Dict[str, Any]:
+        """
+        Get extra httpx arguments for raw clients created by this factory.
+        
+        Passed as ``httpx_args`` to every raw AuthenticatedClient so that its
+        httpx.Client and httpx.AsyncClient mount their per-API base URL on top
+        of the factory's shared connection pool and use the factory's auth flow.
+        
+        Returns:
+            Dict of keyword arguments for httpx.Client / httpx.AsyncClient
+        """
+        httpx_args: Dict[str, Any] = {}
+        if self._transport is not None:
+            httpx_args["transport"] = self._transport
+        if self._auth_flow is not None:
+            httpx_args["auth"] = self._auth_flow
+        return httpx_args
+    
+    def close(self) -> None:
+        """Close the shared sync and async connection pools."""
+        if self._transport is not None:
+            self._transport.close_pool()
+    
+    async def aclose(self) -> None:
+        """Close the shared sync and async connection pools."""
+        if self._transport is not None:
+            await self._transport.aclose_pool()
+    
+    def __enter__(self) -> 'ClientFactory':
+        return self
+    
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> 'ClientFactory':
+        return self
+    
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+    
     @classmethod
     def from_env(cls, env_file: Optional[str] = None) -> 'ClientFactory':
         """
@@ -184,19 +332,27 @@ class ClientFactory:
             "verify_ssl": self.verify_ssl,
             "timeout": self.timeout,
             "has_auth": self.auth is not None,
-            "dotenv_available": DOTENV_AVAILABLE
+            "dotenv_available": DOTENV_AVAILABLE,
+            "shared_transport": repr(self._transport) if self._transport is not None else None,
+            "json_codec": self.json_codec.name,
+            "node_cache": repr(self.node_cache) if self.node_cache is not None else None,
+            "content_cache": repr(self.content_cache) if self.content_cache is not None else None,
+            "auth_flow": type(self._auth_flow).__name__ if self._auth_flow is not None else None
         }
     
-    def create_auth_client(self) -> AlfrescoAuthClient:
+    def create_auth_client(self) -> "AlfrescoAuthClient":
         """Create Authentication API client with shared authentication"""
+        from .clients.auth import AlfrescoAuthClient
         return AlfrescoAuthClient(self)
     
-    def create_core_client(self) -> AlfrescoCoreClient:
+    def create_core_client(self) -> "AlfrescoCoreClient":
         """Create Core API client with shared authentication"""
+        from .clients.core import AlfrescoCoreClient
         return AlfrescoCoreClient(self)
     
-    def create_discovery_client(self) -> AlfrescoDiscoveryClient:
+    def create_discovery_client(self) -> "AlfrescoDiscoveryClient":
         """Create Discovery API client with shared authentication"""
+        from .clients.discovery import AlfrescoDiscoveryClient
         return AlfrescoDiscoveryClient(self)
     
     def create_discovery_client_v11(self):
@@ -204,20 +360,24 @@ class ClientFactory:
         # V1.1 is now the hierarchical structure, so just return the regular discovery client
         return self.create_discovery_client()
     
-    def create_search_client(self) -> AlfrescoSearchClient:
+    def create_search_client(self) -> "AlfrescoSearchClient":
         """Create Search API client with shared authentication"""
+        from .clients.search import AlfrescoSearchClient
         return AlfrescoSearchClient(self)
     
-    def create_workflow_client(self) -> AlfrescoWorkflowClient:
+    def create_workflow_client(self) -> "AlfrescoWorkflowClient":
         """Create Workflow API client with shared authentication"""
+        from .clients.workflow import AlfrescoWorkflowClient
         return AlfrescoWorkflowClient(self)
     
-    def create_model_client(self) -> AlfrescoModelClient:
+    def create_model_client(self) -> "AlfrescoModelClient":
         """Create Model API client with shared authentication"""
+        from .clients.model import AlfrescoModelClient
         return AlfrescoModelClient(self)
     
-    def create_search_sql_client(self) -> AlfrescoSearchSqlClient:
+    def create_search_sql_client(self) -> "AlfrescoSearchSqlClient":
         """Create Search SQL API client with shared authentication"""
+        from .clients.search_sql import AlfrescoSearchSqlClient
         return AlfrescoSearchSqlClient(self)
     
     def create_all_clients(self) -> Dict[str, Any]:
@@ -16,9 +16,27 @@ Key Benefits:
 - [ASYNC] Dual sync/async APIs (sync for simpler use, async for web apps)
 """
 
-# Modern clients with three-tier architecture and lazy loading
-from .core import AlfrescoCoreClient
-from .master_client import AlfrescoMasterClient
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core import AlfrescoCoreClient
+    from .master_client import AlfrescoMasterClient
+
+# Modern clients with three-tier architecture, imported on first access (PEP 562)
+_EXPORTS = {
+    'AlfrescoCoreClient': '.core',
+    'AlfrescoMasterClient': '.master_client',
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
 # Global models shared across ALL APIs (Level 1)
 from .models import (
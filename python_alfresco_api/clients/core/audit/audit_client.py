@@ -14,9 +14,11 @@ Perfect for MCP servers and documentation generation.
 """
 
 import asyncio
-from typing import Optional, List, Union, Any
+from typing import Optional, List, Union, Any, Iterator, AsyncIterator
 from httpx import Response
 
+from ...paging import paginate, apaginate
+
 # Import from Level 3 (operation-specific models)
 from .models import AuditResponse, AuditListResponse, CreateAuditRequest
 
@@ -269,6 +271,48 @@ class AuditClient:
             fields=fields if fields is not None else UNSET
         )
     
+    def iter_audit_entries_for_audit_app(
+        self,
+        audit_app_id: str,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Iterate over all audit entries of an audit app, fetching pages lazily (sync). kwargs as for
+        list_audit_entries_for_audit_app().
+        """
+        return paginate(
+            self.list_audit_entries_for_audit_app,
+            audit_app_id,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            **kwargs,
+        )
+    
+    def iter_audit_entries_for_audit_app_async(
+        self,
+        audit_app_id: str,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over all audit entries of an audit app, fetching pages lazily (async). kwargs as for
+        list_audit_entries_for_audit_app_async().
+        """
+        return apaginate(
+            self.list_audit_entries_for_audit_app_async,
+            audit_app_id,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            **kwargs,
+        )
+    
     # =================================================================
     # LIST AUDIT ENTRIES FOR NODE
     # =================================================================
@@ -327,6 +371,48 @@ class AuditClient:
             fields=fields if fields is not None else UNSET
         )
     
+    def iter_audit_entries_for_node(
+        self,
+        node_id: str,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Iterate over all audit entries of a node, fetching pages lazily (sync). kwargs as for
+        list_audit_entries_for_node().
+        """
+        return paginate(
+            self.list_audit_entries_for_node,
+            node_id,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            **kwargs,
+        )
+    
+    def iter_audit_entries_for_node_async(
+        self,
+        node_id: str,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over all audit entries of a node, fetching pages lazily (async). kwargs as for
+        list_audit_entries_for_node_async().
+        """
+        return apaginate(
+            self.list_audit_entries_for_node_async,
+            node_id,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            **kwargs,
+        )
+    
     # =================================================================
     # GET AUDIT ENTRY
     # =================================================================
@@ -12,5 +12,43 @@ from . import models
 # Import the main client class
 from .content_client import ContentClient
 
+# Disk content cache (ClientFactory(content_cache=...))
+from .cache import ContentCache, cache_key
+from .models import ContentCacheStats
+
+# Streaming download functions
+from .download_content import (
+    DEFAULT_CHUNK_SIZE, iter_content, download_content, aiter_content, download_content_async,
+    download_content_segmented_async
+)
+
+# Streaming upload functions
+from .upload_content import (
+    upload_content, upload_content_async, upload_content_detailed, upload_content_detailed_async,
+    replace_content, replace_content_async, replace_content_detailed, replace_content_detailed_async
+)
+
 # Export the client class and models
-__all__ = ['ContentClient', 'UploadResponse', 'DownloadResponse', 'models'] 
\ No newline at end of file
+__all__ = [
+    'ContentClient',
+    'UploadResponse',
+    'DownloadResponse',
+    'models',
+    'ContentCache',
+    'ContentCacheStats',
+    'cache_key',
+    'DEFAULT_CHUNK_SIZE',
+    'iter_content',
+    'download_content',
+    'aiter_content',
+    'download_content_async',
+    'download_content_segmented_async',
+    'upload_content',
+    'upload_content_async',
+    'upload_content_detailed',
+    'upload_content_detailed_async',
+    'replace_content',
+    'replace_content_async',
+    'replace_content_detailed',
+    'replace_content_detailed_async',
+] 
\ No newline at end of file
@@ -0,0 +1,341 @@
+"""
+Content cache - node content on local disk, revalidated with conditional GETs.
+
+Preview and export services download the same documents over and over.
+With a cache enabled, a download sends the stored validators
+(If-None-Match: <ETag>, If-Modified-Since: <Last-Modified>); a 304 Not
+Modified answer is served from disk instead of transferring the body again:
+
+    factory = ClientFactory(content_cache=True)                 # defaults below
+    cache = ContentCache("/var/cache/previews", max_size=10 * 1024**3)
+    factory = ClientFactory(content_cache=cache)
+    core.content.download_file("file-123", "/tmp/preview.pdf")  # cached after the first call
+
+- every download is revalidated with the server, so cached content is
+  never stale (and permissions are still checked on each request)
+- only responses carrying an ETag or Last-Modified are stored; bodies
+  larger than `max_size` are streamed without being stored
+- entries are keyed by server and node id (see cache_key()), so one
+  directory can serve several repositories
+- each entry is one file (a JSON header line with the validators, then the
+  body), written to a temp file and renamed into place, so several
+  processes can share one directory
+- entries are evicted least recently used (by file mtime, bumped on every
+  hit) once the directory holds more than `max_size` bytes
+- hits are copied to path destinations with os.sendfile where available
+
+Downloads with resume=True or an explicit if_modified_since bypass the cache.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Mapping, Optional, Union
+
+from ...model.dictionary import default_cache_dir
+from .models import ContentCacheStats
+
+# 1 GiB
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+_SUFFIX = ".entry"
+
+# Response headers kept with the body
+_ETAG = "ETag"
+_LAST_MODIFIED = "Last-Modified"
+_CONTENT_TYPE = "Content-Type"
+
+
+class CachedContent:
+    """An open cache entry: validators plus a handle on the stored body."""
+
+    def __init__(self, path: Path, file: IO[bytes], header: Dict[str, Any], offset: int, size: int):
+        self.path = path
+        self.header = header
+        self.size = size
+        self._file = file
+        self._offset = offset
+        self._position = 0
+
+    @property
+    def content_type(self) -> Optional[str]:
+        return self.header.get(_CONTENT_TYPE)
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers (If-None-Match / If-Modified-Since)."""
+        headers = {}
+        if self.header.get(_ETAG):
+            headers["If-None-Match"] = self.header[_ETAG]
+        if self.header.get(_LAST_MODIFIED):
+            headers["If-Modified-Since"] = self.header[_LAST_MODIFIED]
+        return headers
+
+    def read(self, size: int) -> bytes:
+        """Next chunk of the body (b"" at the end)."""
+        self._file.seek(self._offset + self._position)
+        chunk = self._file.read(min(size, self.size - self._position))
+        self._position += len(chunk)
+        return chunk
+
+    def copy_to_path(
+        self,
+        path: Union[str, Path],
+        chunk_size: int,
+        progress_callback: Optional[Callable[[int, Optional[int]], Any]] = None
+    ) -> int:
+        """Write the body to a file (os.sendfile when supported); returns the bytes written."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as out:
+            done = 0
+            if hasattr(os, "sendfile"):
+                try:
+                    while done < self.size:
+                        sent = os.sendfile(
+                            out.fileno(), self._file.fileno(), self._offset + done,
+                            min(chunk_size, self.size - done)
+                        )
+                        if sent == 0:
+                            break
+                        done += sent
+                        if progress_callback is not None:
+                            progress_callback(done, self.size)
+                except OSError:
+                    # File-to-file sendfile unsupported here: copy through user space
+                    if done:
+                        raise
+            self._position = done
+            while True:
+                chunk = self.read(chunk_size)
+                if not chunk:
+                    break
+                out.write(chunk)
+                done += len(chunk)
+                if progress_callback is not None:
+                    progress_callback(done, self.size)
+        return done
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "CachedContent":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class PendingContent:
+    """A body being downloaded into the cache: committed only once complete."""
+
+    def __init__(self, cache: "ContentCache", path: Path, header: Dict[str, Any]):
+        self.cache = cache
+        self.path = path
+        fd, self._tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        self._file: Optional[IO[bytes]] = os.fdopen(fd, "wb")
+        self._file.write(json.dumps(header).encode() + b"\n")
+        self.size = 0
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk; past the cache's max_size the entry is dropped."""
+        if self._file is None:
+            return
+        self.size += len(chunk)
+        if self.size > self.cache.max_size:
+            self.discard()
+            return
+        self._file.write(chunk)
+
+    def commit(self) -> None:
+        """Move the complete body into place (and evict beyond max_size)."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        try:
+            replaced = self.path.stat().st_size
+        except OSError:
+            replaced = 0
+        os.replace(self._tmp, self.path)
+        self.cache._stored(self.path, replaced)
+
+    def discard(self) -> None:
+        """Drop the partial body."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        try:
+            os.unlink(self._tmp)
+        except OSError:
+            pass
+
+
+class ContentCache:
+    """
+    Size-bounded, disk-backed LRU cache of downloaded content.
+
+    Args:
+        directory: Cache directory (default: $XDG_CACHE_HOME/python-alfresco-api/content)
+        max_size: Maximum bytes kept on disk
+    """
+
+    def __init__(
+        self, directory: Optional[Union[str, Path]] = None, max_size: int = DEFAULT_MAX_SIZE
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if directory is None:
+            directory = default_cache_dir() / "content"
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # Bytes on disk, scanned on the first store
+        self._size: Optional[int] = None
+        self._hits = self._misses = self._stores = self._evictions = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (hashlib.sha256(key.encode()).hexdigest()[:40] + _SUFFIX)
+
+    def open(self, key: str) -> Optional[CachedContent]:
+        """The entry stored under key (see cache_key()), or None."""
+        path = self._path(key)
+        try:
+            file = open(path, "rb")
+        except OSError:
+            return None
+        try:
+            line = file.readline()
+            header = json.loads(line)
+            if not isinstance(header, dict) or header.get("key") != key:
+                raise ValueError("not a cache entry for this key")
+            size = os.fstat(file.fileno()).st_size - len(line)
+        except (OSError, ValueError):
+            file.close()
+            return None
+        return CachedContent(path, file, header, len(line), size)
+
+    def begin(self, key: str, headers: Mapping[str, str]) -> Optional[PendingContent]:
+        """Start storing a 200 response's body (None if not revalidatable or too large)."""
+        with self._lock:
+            self._misses += 1
+        if not headers.get(_ETAG) and not headers.get(_LAST_MODIFIED):
+            return None
+        length = headers.get("Content-Length")
+        if length is not None and length.isdigit() and int(length) > self.max_size:
+            return None
+        header = {"key": key}
+        for name in (_ETAG, _LAST_MODIFIED, _CONTENT_TYPE):
+            if headers.get(name):
+                header[name] = headers[name]
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return PendingContent(self, self._path(key), header)
+
+    def hit(self, entry: CachedContent) -> None:
+        """Record a 304 served from entry (bumps it in the LRU order)."""
+        with self._lock:
+            self._hits += 1
+        try:
+            os.utime(entry.path)
+        except OSError:
+            pass
+
+    def invalidate(self, key: str) -> bool:
+        """Delete the entry stored under key; returns whether there was one."""
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            return False
+        with self._lock:
+            self._size = None
+        return True
+
+    def clear(self) -> None:
+        """Delete every entry (statistics are kept)."""
+        with self._lock:
+            for entry in self._entries():
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+            self._size = 0
+
+    def stats(self) -> ContentCacheStats:
+        """Hit / miss / store / eviction counters and the bytes on disk."""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry.stat().st_size for entry in self._entries())
+            return ContentCacheStats(
+                hits=self._hits, misses=self._misses, stores=self._stores,
+                evictions=self._evictions, size=self._size, max_size=self.max_size
+            )
+
+    def __repr__(self) -> str:
+        return f"ContentCache(directory='{self.directory}', max_size={self.max_size})"
+
+    def _entries(self):
+        try:
+            return [entry for entry in os.scandir(self.directory) if entry.name.endswith(_SUFFIX)]
+        except OSError:
+            return []
+
+    def _stored(self, path: Path, replaced: int = 0) -> None:
+        """Account for a committed entry (over `replaced` bytes) and evict beyond max_size."""
+        with self._lock:
+            self._stores += 1
+            if self._size is not None:
+                self._size += path.stat().st_size - replaced
+                if self._size <= self.max_size:
+                    return
+            # Rescan: other processes may share the directory
+            entries = []
+            for entry in self._entries():
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path, entry.stat().st_size))
+                except OSError:
+                    pass
+            total = sum(size for _, _, size in entries)
+            for _, entry_path, size in sorted(entries):
+                if total <= self.max_size:
+                    break
+                if entry_path == str(path):
+                    continue
+                try:
+                    os.unlink(entry_path)
+                except OSError:
+                    continue
+                total -= size
+                self._evictions += 1
+            self._size = total
+
+
+def cache_key(base_url: str, node_id: str) -> str:
+    """Cache key of a node's content on one server (node ids are only unique per repository)."""
+    return f"{base_url}|{node_id}"
+
+
+def resolve_content_cache(
+    content_cache: Union[bool, str, os.PathLike, ContentCache, None]
+) -> Optional[ContentCache]:
+    """ClientFactory(content_cache=...) value -> cache (True = defaults, a path = its directory)."""
+    if content_cache is True:
+        return ContentCache()
+    if content_cache is False or content_cache is None:
+        return None
+    if isinstance(content_cache, (str, os.PathLike)):
+        return ContentCache(content_cache)
+    return content_cache
+
+
+def client_content_cache(client: Any) -> Optional[ContentCache]:
+    """The content cache of a core client's factory (None if disabled)."""
+    return getattr(getattr(client, "_client_factory", None), "content_cache", None)
+
+
+__all__ = [
+    'ContentCache', 'ContentCacheStats', 'CachedContent', 'PendingContent',
+    'DEFAULT_MAX_SIZE', 'cache_key', 'resolve_content_cache', 'client_content_cache'
+]
@@ -7,10 +7,17 @@ Part of the three-tier V1.1 architecture.
 
 from typing import Optional, Union, IO, Any
 from pathlib import Path
-from datetime import datetime
 
 # Import from Level 3 (operation-specific models)
+from .cache import ContentCache, client_content_cache
 from .models import UploadResponse, DownloadResponse
+from .download_content import (
+    DEFAULT_CHUNK_SIZE, ProgressCallback, download_content, download_content_async,
+    download_content_segmented_async
+)
+from .upload_content import (
+    upload_content, upload_content_async, replace_content, replace_content_async
+)
 
 # Raw client imports (lazy loaded)
 def _get_raw_client():
@@ -53,6 +60,8 @@ class ContentClient:
         """Initialize with client factory for raw client access."""
         self.parent_client = parent_client
         self._raw_client = None
+        # Content cache for download_file() (ClientFactory(content_cache=...); None = off)
+        self.cache: Optional[ContentCache] = client_content_cache(parent_client)
     
     @property
     def raw_client(self):
@@ -68,6 +77,8 @@ class ContentClient:
         filename: Optional[str] = None,
         properties: Optional[dict] = None,
         auto_rename: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
         **kwargs
     ) -> UploadResponse:
         """
@@ -75,6 +86,8 @@ class ContentClient:
         
         Perfect for MCP servers, scripts, and content workflows.
         Creates a new file node with content in the specified parent folder.
+        The content is streamed in chunks (size and checksum are computed on
+        the fly), so memory use does not depend on the file size.
         
         Args:
             file_path: Path to file, Path object, or binary stream
@@ -82,9 +95,13 @@ class ContentClient:
             filename: Custom filename (default: use file's name)
             properties: Custom properties to set on the file
             auto_rename: Automatically rename if name conflicts exist
+            chunk_size: Bytes per streamed chunk (default: 1 MiB)
+            progress_callback: Called as progress_callback(bytes_uploaded, total_bytes)
+            **kwargs: Passed to upload_content (node_type, description, relative_path,
+                     include, checksum)
             
         Returns:
-            UploadResponse: Response with uploaded file details
+            UploadResponse: Response with uploaded file details, size and checksum
             
         Examples:
             >>> # Upload a simple file
@@ -100,103 +117,43 @@ class ContentClient:
             
         Raises:
             FileNotFoundError: If file_path doesn't exist
-            PermissionError: If insufficient permissions
-            ValueError: If invalid parameters
+            httpx.HTTPStatusError: If the server rejects the upload
         """
-        # Get the raw client
-        raw_client = self.raw_client
-        
-        # Use the nodes API to create a file node with content
-        try:
-            # Handle file path/stream
-            if isinstance(file_path, (str, Path)):
-                # It's a file path
-                path = Path(file_path)
-                with open(path, 'rb') as f:
-                    content = f.read()
-                name = filename or path.name
-            else:
-                # It's a binary stream
-                content = file_path.read()
-                name = filename or "uploaded_file"
-            
-            # Create a simple mock upload response for testing
-            from ..nodes.models import Node
-            from ..models import NodeType
-            from datetime import datetime
-            
-            mock_node = Node(
-                id="uploaded-" + name.replace(".", "-"),
-                name=name,
-                node_type=NodeType.CONTENT,
-                is_file=True,
-                is_folder=False,
-                created_at=datetime.now(),
-                modified_at=datetime.now(),
-                created_by_user=None,
-                modified_by_user=None,
-                content=None,
-                properties=properties,
-                parent_id=parent_id,
-                path=None,
-                permissions=None,
-                aspects=None,
-                allowable_operations=None,
-                is_locked=False
-            )
-            
-            return UploadResponse(
-                entry=mock_node,
-                file_name=name,
-                file_size=len(content)
-            )
-            
-        except Exception as e:
-            # Fallback to basic mock response with a mock node
-            from ..nodes.models import Node
-            from ..models import NodeType
-            
-            mock_node = Node(
-                id="error-node",
-                name=filename or "upload_error",
-                node_type=NodeType.CONTENT,
-                is_file=True,
-                is_folder=False,
-                created_at=datetime.now(),
-                modified_at=datetime.now(),
-                created_by_user=None,
-                modified_by_user=None,
-                content=None,
-                properties=None,
-                parent_id=None,
-                path=None,
-                permissions=None,
-                aspects=None,
-                allowable_operations=None,
-                is_locked=False
-            )
-            
-            return UploadResponse(
-                entry=mock_node,
-                file_name=filename or "upload_error",
-                file_size=0
-            )
+        return upload_content(
+            self.parent_client,
+            file_path,
+            parent_id=parent_id,
+            filename=filename,
+            properties=properties,
+            auto_rename=auto_rename,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            **kwargs
+        )
     
     def download_file(
         self,
         node_id: str,
-        output_path: Optional[Union[str, Path]] = None,
+        output_path: Optional[Union[str, Path, IO[bytes]]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
         **kwargs
     ) -> DownloadResponse:
         """
         Download a file from Alfresco repository.
         
         Perfect for MCP servers, backup scripts, and content workflows.
-        Downloads the content of the specified node to local storage.
+        Streams the content of the specified node to local storage in chunks,
+        so memory use does not depend on the file size.
         
         Args:
             node_id: ID of the file node to download
-            output_path: Where to save the file (default: current directory)
+            output_path: Where to save the file, or a binary sink with write()
+                        (default: ./{node_id}_download)
+            chunk_size: Bytes per streamed chunk (default: 1 MiB)
+            progress_callback: Called as progress_callback(bytes_downloaded, total_bytes)
+            **kwargs: Passed to download_content (attachment, if_modified_since, resume,
+                     cache - default: this client's content cache)
             
         Returns:
             DownloadResponse: Response with download details and file path
@@ -209,45 +166,36 @@ class ContentClient:
             >>> # Download to specific location
             >>> result = client.download_file("file-123", "/downloads/report.pdf")
             
-        Raises:
-            FileNotFoundError: If node doesn't exist
-            PermissionError: If insufficient permissions
-            IOError: If download fails
-        """
-        # Get the raw client
-        raw_client = self.raw_client
-        
-        # Use the raw client API to get node content
-        try:
-            # For now, create a mock response for testing
-            # Real implementation would use raw client calls
-            
-            # Determine output path
-            if output_path is None:
-                output_path = f"./{node_id}_download"
-            
-            # Mock content for testing
-            mock_content = b"Mock file content"
+            >>> # Large file with progress reporting
+            >>> result = client.download_file(
+            ...     "file-123", "/downloads/scan.tiff",
+            ...     chunk_size=8 * 1024 * 1024,
+            ...     progress_callback=lambda done, total: print(f"{done}/{total}")
+            ... )
             
-            # Save the content to file
-            with open(output_path, 'wb') as f:
-                f.write(mock_content)
+            >>> # Continue an interrupted download (HTTP Range)
+            >>> result = client.download_file("file-123", "/downloads/scan.tiff", resume=True)
             
-            return DownloadResponse(
-                node_id=node_id,
-                file_path=str(output_path),
-                file_size=len(mock_content),
-                content_type="application/octet-stream"
-            )
+            >>> # With ClientFactory(content_cache=True): unchanged content comes from disk
+            >>> result = client.download_file("file-123", "/previews/report.pdf")
+            >>> print(result.from_cache)
             
-        except Exception as e:
-            # Fallback to mock response for testing
-            return DownloadResponse(
-                node_id=node_id,
-                file_path=str(output_path) if output_path else f"./{node_id}_download",
-                file_size=100,  # Mock size
-                content_type="text/plain"
-            )
+        Raises:
+            httpx.HTTPStatusError: If the node doesn't exist or access is denied
+            IOError: If writing the file fails
+        """
+        if output_path is None:
+            output_path = f"./{node_id}_download"
+        kwargs.setdefault("cache", self.cache)
+        
+        return download_content(
+            self.parent_client,
+            node_id,
+            output_path,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            **kwargs
+        )
     
     def update_content(
         self,
@@ -255,19 +203,25 @@ class ContentClient:
         file_path: Union[str, Path, IO[bytes]],
         major_version: bool = False,
         comment: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
         **kwargs
     ) -> UploadResponse:
         """
         Update content of existing file.
         
         Perfect for document revision workflows and content updates.
-        Replaces the content of an existing file node.
+        Replaces the content of an existing file node, streaming the new
+        content in chunks.
         
         Args:
             node_id: ID of the file node to update
             file_path: Path to new content or binary stream
             major_version: Create major version (default: minor version)
             comment: Version comment
+            chunk_size: Bytes per streamed chunk (default: 1 MiB)
+            progress_callback: Called as progress_callback(bytes_uploaded, total_bytes)
+            **kwargs: Passed to replace_content (name, content_type, include, checksum)
             
         Returns:
             UploadResponse: Response with updated file details
@@ -284,58 +238,16 @@ class ContentClient:
             ...     comment="Final version for Q4"
             ... )
         """
-        # Get the raw client
-        raw_client = self.raw_client
-        
-        # Use the nodes API to update node content
-        try:
-            # Handle file path/stream
-            if isinstance(file_path, (str, Path)):
-                path = Path(file_path)
-                with open(path, 'rb') as f:
-                    content = f.read()
-                name = path.name
-            else:
-                content = file_path.read()
-                name = "updated_content"
-            
-            # Create a simple mock update response for testing
-            from ..nodes.models import Node
-            from ..models import NodeType
-            from datetime import datetime
-            
-            mock_node = Node(
-                id=node_id,
-                name=name,
-                node_type=NodeType.CONTENT,
-                is_file=True,
-                is_folder=False,
-                created_at=datetime.now(),
-                modified_at=datetime.now(),
-                created_by_user=None,
-                modified_by_user=None,
-                content=None,
-                properties=None,
-                parent_id=None,
-                path=None,
-                permissions=None,
-                aspects=None,
-                allowable_operations=None
-            )
-            
-            return UploadResponse(
-                entry=mock_node,
-                file_name=name,
-                file_size=len(content)
-            )
-            
-        except Exception as e:
-            # Fallback to basic mock response
-            return UploadResponse(
-                entry=None,
-                file_name="update_error",
-                file_size=0
-            )
+        return replace_content(
+            self.parent_client,
+            node_id,
+            file_path,
+            major_version=major_version,
+            comment=comment,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            **kwargs
+        )
     
     # ==================== ASYNC METHODS ====================
     
@@ -345,69 +257,62 @@ class ContentClient:
         parent_id: str = "-my-",
         filename: Optional[str] = None,
         properties: Optional[dict] = None,
-        auto_rename: bool = True
+        auto_rename: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        **kwargs
     ) -> UploadResponse:
-        """Async version of upload_file."""
-        # Handle file path/stream
-        if isinstance(file_path, (str, Path)):
-            # It's a file path
-            path = Path(file_path)
-            with open(path, 'rb') as f:
-                content = f.read()
-            name = filename or path.name
-        else:
-            # It's a binary stream
-            content = file_path.read()
-            name = filename or "uploaded_file"
-        
-        # For now, return a mock response structure
-        # Real implementation would use raw client calls
-        from ..nodes.models import Node
-        from ..models import NodeType
-        from datetime import datetime
-        
-        # Create mock node with all required fields
-        mock_node = Node(
-            id="uploaded-" + name.replace(".", "-"),
-            name=name,
-            node_type=NodeType.CONTENT,
-            is_file=True,
-            is_folder=False,
-            created_at=datetime.now(),
-            modified_at=datetime.now(),
-            created_by_user=None,
-            modified_by_user=None,
-            content=None,
-            properties=properties,
+        """Async version of upload_file (file reads run in a worker thread)."""
+        return await upload_content_async(
+            self.parent_client,
+            file_path,
             parent_id=parent_id,
-            path=None,
-            permissions=None,
-            aspects=None,
-            allowable_operations=None
-        )
-        
-        return UploadResponse(
-            entry=mock_node,
-            file_name=name,
-            file_size=len(content)
+            filename=filename,
+            properties=properties,
+            auto_rename=auto_rename,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            **kwargs
         )
     
     async def download_file_async(
         self,
         node_id: str,
-        output_path: Optional[Union[str, Path]] = None
+        output_path: Optional[Union[str, Path, IO[bytes]]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        segments: int = 1,
+        **kwargs
     ) -> DownloadResponse:
-        """Async version of download_file."""
-        # For now, return a mock response structure
-        # Real implementation would download content and save to file
+        """
+        Async version of download_file (streams over the async httpx client).
         
-        file_path = str(output_path) if output_path else f"./{node_id}.download"
+        With segments > 1 the file is fetched as that many concurrent HTTP
+        Range segments written into a preallocated file (output_path must be
+        a path; **kwargs go to download_content_segmented_async, no caching).
+        """
+        if output_path is None:
+            output_path = f"./{node_id}_download"
+        
+        if segments > 1:
+            return await download_content_segmented_async(
+                self.parent_client,
+                node_id,
+                output_path,
+                segments=segments,
+                chunk_size=chunk_size,
+                progress_callback=progress_callback,
+                **kwargs
+            )
         
-        return DownloadResponse(
-            node_id=node_id,
-            file_path=file_path,
-            file_size=0,  # Would get from actual download
-            content_type="application/octet-stream"
+        kwargs.setdefault("cache", self.cache)
+        return await download_content_async(
+            self.parent_client,
+            node_id,
+            output_path,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            **kwargs
         )
     
     async def update_content_async(
@@ -415,45 +320,21 @@ class ContentClient:
         node_id: str,
         file_path: Union[str, Path, IO[bytes]],
         major_version: bool = False,
-        comment: Optional[str] = None
+        comment: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        **kwargs
     ) -> UploadResponse:
-        """Async version of update_content."""
-        # Handle file path/stream
-        if isinstance(file_path, (str, Path)):
-            path = Path(file_path)
-            with open(path, 'rb') as f:
-                content = f.read()
-        else:
-            content = file_path.read()
-        
-        # For now, return a mock response structure
-        # Real implementation would use raw client calls
-        from ..nodes.models import Node
-        from ..models import NodeType
-        
-        mock_node = Node(
-            id=node_id,
-            name="updated_content",
-            node_type=NodeType.CONTENT, 
-            is_file=True,
-            is_folder=False,
-            created_at=datetime.now(),
-            modified_at=datetime.now(),
-            created_by_user=None,
-            modified_by_user=None,
-            content=None,
-            properties=None,
-            parent_id=None,
-            path=None,
-            permissions=None,
-            aspects=None,
-            allowable_operations=None
-        )
-        
-        return UploadResponse(
-            entry=mock_node,
-            file_name="updated_content",
-            file_size=len(content)
+        """Async version of update_content (file reads run in a worker thread)."""
+        return await replace_content_async(
+            self.parent_client,
+            node_id,
+            file_path,
+            major_version=major_version,
+            comment=comment,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            **kwargs
         )
     
     def __repr__(self) -> str:
@@ -0,0 +1,734 @@
+"""
+Streaming content download operations for Alfresco nodes.
+
+Streams GET /nodes/{nodeId}/content (the generated get_node_content raw
+operation) in fixed-size chunks straight to a file or a caller-supplied sink,
+so peak memory is one chunk regardless of file size.
+Function-based approach with sync and async variants.
+
+HTTP Range requests are used to:
+- resume an interrupted download from the bytes already on disk (resume=True)
+- fetch N segments concurrently into a preallocated file (download_content_segmented_async)
+
+With a ContentCache (cache=...) downloads are conditional GETs against the
+stored ETag / Last-Modified, and a 304 is served from disk (see cache.py).
+"""
+
+import asyncio
+import contextlib
+import inspect
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import httpx
+
+from .cache import CachedContent, ContentCache, cache_key
+from .models import DownloadResponse
+
+# Default chunk size for streamed reads/writes (1 MiB)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# progress_callback(bytes_downloaded, total_bytes) - total_bytes is None if unknown
+ProgressCallback = Callable[[int, Optional[int]], Any]
+
+# Destination: local file path, or any object with a write(bytes) method
+Destination = Union[str, Path, Any]
+
+
+def _content_kwargs(
+    attachment: bool,
+    if_modified_since: Optional[datetime] = None,
+    byte_range: Optional[str] = None
+) -> Dict[str, Any]:
+    """Keyword arguments for the get_node_content raw operation."""
+    kwargs: Dict[str, Any] = {"attachment": attachment}
+    if if_modified_since is not None:
+        kwargs["if_modified_since"] = if_modified_since
+    if byte_range is not None:
+        kwargs["range_"] = byte_range
+    return kwargs
+
+
+def _byte_range(start: int, end: Optional[int] = None) -> str:
+    """Range header value for bytes start..end (inclusive, open-ended if end is None)."""
+    return f"bytes={start}-{'' if end is None else end}"
+
+
+def _is_path(destination: Destination) -> bool:
+    """Check if the destination is a local file path rather than a sink."""
+    return isinstance(destination, (str, Path))
+
+
+def _destination_name(destination: Destination) -> Optional[str]:
+    """Get a file path for the response model (sinks use their name, if any)."""
+    if _is_path(destination):
+        return str(destination)
+    name = getattr(destination, "name", None)
+    return name if isinstance(name, str) else None
+
+
+def _open_destination(destination: Destination, append: bool = False):
+    """Open a path destination for writing, creating parent directories."""
+    path = Path(destination)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return open(path, "ab" if append else "wb")
+
+
+def _resume_offset(destination: Destination, resume: bool) -> int:
+    """Bytes already on disk for a resumable path destination (0 if none)."""
+    if not resume or not _is_path(destination):
+        return 0
+    try:
+        return os.path.getsize(destination)
+    except OSError:
+        return 0
+
+
+def _content_range_total(response) -> Optional[int]:
+    """Get the full size from a Content-Range header ("bytes 0-99/1000", "bytes */1000")."""
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _resume_complete(response, offset: int) -> bool:
+    """Check if a 416 reply means the file on disk is already complete."""
+    return offset > 0 and response.status_code == 416 and _content_range_total(response) == offset
+
+
+def _conditional_request(
+    node_id: str, content_kwargs: Dict[str, Any], cached: CachedContent
+) -> Dict[str, Any]:
+    """
+    get_node_content request arguments plus the cached entry's validators (If-None-Match is not a
+    raw parameter).
+    """
+    from ....raw_clients.alfresco_core_client.core_client.api.nodes import get_node_content
+
+    request_kwargs = get_node_content._get_kwargs(node_id, **content_kwargs)
+    request_kwargs["headers"].update(cached.validators())
+    return request_kwargs
+
+
+def _cached_response(
+    node_id: str, destination: Destination, size: int, cached: CachedContent
+) -> DownloadResponse:
+    return DownloadResponse(
+        node_id=node_id,
+        file_path=_destination_name(destination),
+        file_size=size,
+        content_type=cached.content_type,
+        from_cache=True
+    )
+
+
+def _not_modified_response(node_id: str) -> DownloadResponse:
+    return DownloadResponse(node_id=node_id, file_size=0, not_modified=True)
+
+
+# ==================== SYNC ====================
+
+
+def _open_content(
+    client, node_id: str, content_kwargs: Dict[str, Any], cached: Optional[CachedContent]
+):
+    """Streamed get_node_content response (conditional when a cached entry is given)."""
+    from ....raw_clients.alfresco_core_client.core_client.api.nodes import get_node_content
+    from ....raw_clients.alfresco_core_client.core_client.streaming import build_streaming_response
+
+    if cached is None:
+        return get_node_content.sync_detailed(node_id, client=client.raw_client, **content_kwargs)
+    httpx_client = client.raw_client.get_httpx_client()
+    request = httpx_client.build_request(**_conditional_request(node_id, content_kwargs, cached))
+    response = httpx_client.send(request, stream=True)
+    return build_streaming_response(
+        response,
+        get_node_content._DOCUMENTED_STATUSES,
+        client.raw_client.raise_on_unexpected_status,
+    )
+
+
+def _serve_cached(
+    cache: ContentCache,
+    cached: CachedContent,
+    node_id: str,
+    destination: Destination,
+    chunk_size: int,
+    progress_callback: Optional[ProgressCallback]
+) -> DownloadResponse:
+    """Answer a 304 from the cached body."""
+    cache.hit(cached)
+    if _is_path(destination):
+        size = cached.copy_to_path(destination, chunk_size, progress_callback)
+    else:
+        size = 0
+        while True:
+            chunk = cached.read(chunk_size)
+            if not chunk:
+                break
+            destination.write(chunk)
+            size += len(chunk)
+            if progress_callback is not None:
+                progress_callback(size, cached.size)
+    return _cached_response(node_id, destination, size, cached)
+
+
+def iter_content(
+    client,
+    node_id: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    attachment: bool = False,
+    if_modified_since: Optional[datetime] = None
+) -> Iterator[bytes]:
+    """
+    Iterate over the content of a node in chunks (synchronous).
+
+    The HTTP response stays open until the iterator is exhausted or closed.
+    Nothing is yielded if the content was not modified since if_modified_since.
+
+    Args:
+        client: Core client (anything with a raw_client property)
+        node_id: ID of the file node
+        chunk_size: Bytes per chunk
+        attachment: Request the content as an attachment
+        if_modified_since: Only return content modified after this time
+
+    Yields:
+        bytes: Content chunks of at most chunk_size bytes
+    """
+    from ....raw_clients.alfresco_core_client.core_client.api.nodes import get_node_content
+
+    with get_node_content.sync_detailed(
+        node_id, client=client.raw_client, **_content_kwargs(attachment, if_modified_since)
+    ) as response:
+        if response.status_code == 304:
+            return
+        response.raise_for_status()
+        yield from response.iter_bytes(chunk_size=chunk_size)
+
+
+def download_content(
+    client,
+    node_id: str,
+    destination: Destination,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress_callback: Optional[ProgressCallback] = None,
+    attachment: bool = False,
+    if_modified_since: Optional[datetime] = None,
+    resume: bool = False,
+    cache: Optional[ContentCache] = None
+) -> DownloadResponse:
+    """
+    Stream node content to a file or sink (synchronous).
+
+    With resume=True and a path destination that already holds part of the
+    file, only the missing bytes are requested (Range: bytes=<size>-) and
+    appended. Servers that ignore Range send the full content, which then
+    overwrites the partial file.
+
+    With a cache, the request carries the cached ETag / Last-Modified: a 304
+    is served from disk (from_cache=True), and a full response is stored
+    while it streams to the destination. Without a cache, a 304 answering
+    if_modified_since returns not_modified=True and leaves the destination
+    untouched.
+
+    Args:
+        client: Core client (anything with a raw_client property)
+        node_id: ID of the file node to download
+        destination: Local file path, or an object with a write(bytes) method
+        chunk_size: Bytes per chunk (peak memory is about one chunk)
+        progress_callback: Called as progress_callback(bytes_downloaded, total_bytes)
+        attachment: Request the content as an attachment
+        if_modified_since: Only return content modified after this time
+        resume: Continue a partial download already at the path destination
+        cache: ContentCache to revalidate against and store into (not used with
+               resume or if_modified_since)
+
+    Returns:
+        DownloadResponse: Download details (file path, size, content type)
+
+    Examples:
+        ```python
+        # Stream to a file
+        result = download_content(core_client, "file-123", "/data/scan.tiff")
+
+        # Stream to a sink with progress reporting
+        with open("video.mp4", "wb") as sink:
+            download_content(
+                core_client, "file-456", sink,
+                chunk_size=4 * 1024 * 1024,
+                progress_callback=lambda done, total: print(done, total)
+            )
+        ```
+
+    Raises:
+        httpx.HTTPStatusError: If the server returns an error status
+    """
+    offset = _resume_offset(destination, resume)
+    byte_range = _byte_range(offset) if offset else None
+    use_cache = cache is not None and not resume and if_modified_since is None
+    key = cache_key(str(client.raw_client.get_httpx_client().base_url), node_id)
+    cached = cache.open(key) if use_cache else None
+
+    with cached if cached is not None else contextlib.nullcontext(), _open_content(
+        client, node_id, _content_kwargs(attachment, if_modified_since, byte_range), cached
+    ) as response:
+        if cached is not None and response.status_code == 304:
+            return _serve_cached(cache, cached, node_id, destination, chunk_size, progress_callback)
+        if response.status_code == 304:
+            return _not_modified_response(node_id)
+        if _resume_complete(response, offset):
+            return DownloadResponse(
+                node_id=node_id,
+                file_path=_destination_name(destination),
+                file_size=offset,
+                resumed_from=offset,
+            )
+        response.raise_for_status()
+        if response.status_code != 206:
+            # Full content: start over
+            offset = 0
+        total = response.content_length
+        if total is not None:
+            total += offset
+        downloaded = offset
+        pending = (
+            cache.begin(key, response.headers)
+            if use_cache and response.status_code == 200
+            else None
+        )
+
+        sink = (
+            _open_destination(destination, append=offset > 0)
+            if _is_path(destination)
+            else destination
+        )
+        try:
+            for chunk in response.iter_bytes(chunk_size=chunk_size):
+                sink.write(chunk)
+                if pending is not None:
+                    pending.write(chunk)
+                downloaded += len(chunk)
+                if progress_callback is not None:
+                    progress_callback(downloaded, total)
+            if pending is not None:
+                pending.commit()
+        finally:
+            if pending is not None:
+                pending.discard()
+            if sink is not destination:
+                sink.close()
+
+        return DownloadResponse(
+            node_id=node_id,
+            file_path=_destination_name(destination),
+            file_size=downloaded,
+            content_type=response.content_type,
+            resumed_from=offset
+        )
+
+
+# ==================== ASYNC ====================
+
+
+async def _aopen_content(
+    client, node_id: str, content_kwargs: Dict[str, Any], cached: Optional[CachedContent]
+):
+    """Streamed get_node_content response (async; conditional when a cached entry is given)."""
+    from ....raw_clients.alfresco_core_client.core_client.api.nodes import get_node_content
+    from ....raw_clients.alfresco_core_client.core_client.streaming import abuild_streaming_response
+
+    if cached is None:
+        return await get_node_content.asyncio_detailed(
+            node_id, client=client.raw_client, **content_kwargs
+        )
+    httpx_client = client.raw_client.get_async_httpx_client()
+    request = httpx_client.build_request(**_conditional_request(node_id, content_kwargs, cached))
+    response = await httpx_client.send(request, stream=True)
+    return await abuild_streaming_response(
+        response,
+        get_node_content._DOCUMENTED_STATUSES,
+        client.raw_client.raise_on_unexpected_status,
+    )
+
+
+async def _aserve_cached(
+    cache: ContentCache,
+    cached: CachedContent,
+    node_id: str,
+    destination: Destination,
+    chunk_size: int,
+    progress_callback: Optional[ProgressCallback]
+) -> DownloadResponse:
+    """Answer a 304 from the cached body (file I/O in a worker thread)."""
+    await asyncio.to_thread(cache.hit, cached)
+    if _is_path(destination):
+        size = await asyncio.to_thread(cached.copy_to_path, destination, chunk_size)
+        if progress_callback is not None:
+            result = progress_callback(size, cached.size)
+            if inspect.isawaitable(result):
+                await result
+    else:
+        size = 0
+        while True:
+            chunk = await asyncio.to_thread(cached.read, chunk_size)
+            if not chunk:
+                break
+            result = destination.write(chunk)
+            if inspect.isawaitable(result):
+                await result
+            size += len(chunk)
+            if progress_callback is not None:
+                result = progress_callback(size, cached.size)
+                if inspect.isawaitable(result):
+                    await result
+    return _cached_response(node_id, destination, size, cached)
+
+
+async def aiter_content(
+    client,
+    node_id: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    attachment: bool = False,
+    if_modified_since: Optional[datetime] = None
+) -> AsyncIterator[bytes]:
+    """
+    Iterate over the content of a node in chunks (asynchronous).
+
+    Nothing is yielded if the content was not modified since if_modified_since.
+
+    Args:
+        client: Core client (anything with a raw_client property)
+        node_id: ID of the file node
+        chunk_size: Bytes per chunk
+        attachment: Request the content as an attachment
+        if_modified_since: Only return content modified after this time
+
+    Yields:
+        bytes: Content chunks of at most chunk_size bytes
+    """
+    from ....raw_clients.alfresco_core_client.core_client.api.nodes import get_node_content
+
+    async with await get_node_content.asyncio_detailed(
+        node_id, client=client.raw_client, **_content_kwargs(attachment, if_modified_since)
+    ) as response:
+        if response.status_code == 304:
+            return
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+            yield chunk
+
+
+async def download_content_async(
+    client,
+    node_id: str,
+    destination: Destination,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress_callback: Optional[ProgressCallback] = None,
+    attachment: bool = False,
+    if_modified_since: Optional[datetime] = None,
+    resume: bool = False,
+    cache: Optional[ContentCache] = None
+) -> DownloadResponse:
+    """
+    Stream node content to a file or sink (asynchronous).
+
+    File writes run in a worker thread so the event loop is never blocked on
+    disk I/O. A sink's write() (and progress_callback) may be sync or async.
+    resume=True continues a partial download and cache= revalidates against
+    a ContentCache as in download_content().
+
+    Args:
+        client: Core client (anything with a raw_client property)
+        node_id: ID of the file node to download
+        destination: Local file path, or an object with a write(bytes) method
+        chunk_size: Bytes per chunk (peak memory is about one chunk)
+        progress_callback: Called as progress_callback(bytes_downloaded, total_bytes)
+        attachment: Request the content as an attachment
+        if_modified_since: Only return content modified after this time
+        resume: Continue a partial download already at the path destination
+        cache: ContentCache to revalidate against and store into (not used with
+               resume or if_modified_since)
+
+    Returns:
+        DownloadResponse: Download details (file path, size, content type)
+
+    Raises:
+        httpx.HTTPStatusError: If the server returns an error status
+    """
+    offset = _resume_offset(destination, resume)
+    byte_range = _byte_range(offset) if offset else None
+    use_cache = cache is not None and not resume and if_modified_since is None
+    key = cache_key(str(client.raw_client.get_async_httpx_client().base_url), node_id)
+    cached = await asyncio.to_thread(cache.open, key) if use_cache else None
+
+    with cached if cached is not None else contextlib.nullcontext():
+        async with await _aopen_content(
+            client, node_id, _content_kwargs(attachment, if_modified_since, byte_range), cached
+        ) as response:
+            if cached is not None and response.status_code == 304:
+                return await _aserve_cached(
+                    cache, cached, node_id, destination, chunk_size, progress_callback
+                )
+            if response.status_code == 304:
+                return _not_modified_response(node_id)
+            if _resume_complete(response, offset):
+                return DownloadResponse(
+                    node_id=node_id,
+                    file_path=_destination_name(destination),
+                    file_size=offset,
+                    resumed_from=offset,
+                )
+            response.raise_for_status()
+            if response.status_code != 206:
+                # Full content: start over
+                offset = 0
+            total = response.content_length
+            if total is not None:
+                total += offset
+            downloaded = offset
+            pending = None
+            if use_cache and response.status_code == 200:
+                pending = await asyncio.to_thread(cache.begin, key, response.headers)
+
+            if _is_path(destination):
+                sink = await asyncio.to_thread(_open_destination, destination, offset > 0)
+
+                def write(chunk: bytes):
+                    return asyncio.to_thread(sink.write, chunk)
+
+            else:
+                sink = destination
+                write = sink.write
+            try:
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    result = write(chunk)
+                    if inspect.isawaitable(result):
+                        await result
+                    if pending is not None:
+                        await asyncio.to_thread(pending.write, chunk)
+                    downloaded += len(chunk)
+                    if progress_callback is not None:
+                        result = progress_callback(downloaded, total)
+                        if inspect.isawaitable(result):
+                            await result
+                if pending is not None:
+                    await asyncio.to_thread(pending.commit)
+            finally:
+                if pending is not None:
+                    pending.discard()
+                if sink is not destination:
+                    await asyncio.to_thread(sink.close)
+
+            return DownloadResponse(
+                node_id=node_id,
+                file_path=_destination_name(destination),
+                file_size=downloaded,
+                content_type=response.content_type,
+                resumed_from=offset
+            )
+
+
+# ==================== SEGMENTED (ASYNC) ====================
+
+# Serializes seek+write on platforms without os.pwrite
+_seek_lock = threading.Lock()
+
+
+def _preallocate(path: Path, size: int) -> int:
+    """Create (or truncate) the destination at its final size and return an fd."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+    os.ftruncate(fd, size)
+    return fd
+
+
+def _pwrite(fd: int, data: bytes, offset: int) -> None:
+    """Write all of data at offset without moving a shared file position."""
+    view = memoryview(data)
+    while view:
+        if hasattr(os, "pwrite"):
+            written = os.pwrite(fd, view, offset)
+        else:
+            with _seek_lock:
+                os.lseek(fd, offset, os.SEEK_SET)
+                written = os.write(fd, view)
+        view = view[written:]
+        offset += written
+
+
+async def _write_at(fd: int, data: bytes, offset: int) -> None:
+    """
+    Write data at offset in a worker thread.
+
+    A cancelled caller still waits for the write to finish: the thread
+    cannot be stopped, and the fd must stay open until it is done.
+    """
+    write = asyncio.ensure_future(asyncio.to_thread(_pwrite, fd, data, offset))
+    try:
+        await asyncio.shield(write)
+    except asyncio.CancelledError:
+        await write
+        raise
+
+
+def _segment_ranges(total: int, segments: int, min_segment_size: int) -> List[Tuple[int, int]]:
+    """Split 0..total-1 into at most `segments` inclusive byte ranges."""
+    segments = max(1, min(segments, total // max(min_segment_size, 1)))
+    size = -(-total // segments)
+    return [(start, min(start + size, total) - 1) for start in range(0, total, size)]
+
+
+async def _fetch_segment(
+    client,
+    node_id: str,
+    attachment: bool,
+    fd: int,
+    start: int,
+    end: int,
+    chunk_size: int,
+    max_retries: int,
+    advance: Callable[[int], Any]
+) -> None:
+    """Fetch bytes start..end into fd, resuming from the last written byte on failure."""
+    from ....raw_clients.alfresco_core_client.core_client.api.nodes import get_node_content
+
+    position = start
+    for attempt in range(max_retries + 1):
+        try:
+            async with await get_node_content.asyncio_detailed(
+                node_id,
+                client=client.raw_client,
+                **_content_kwargs(attachment, byte_range=_byte_range(position, end)),
+            ) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise IOError(f"Server ignored Range request for bytes {position}-{end}")
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    chunk = chunk[:end + 1 - position]
+                    await _write_at(fd, chunk, position)
+                    position += len(chunk)
+                    await advance(len(chunk))
+        except httpx.TransportError:
+            if attempt == max_retries:
+                raise
+            continue
+        if position > end:
+            return
+    raise IOError(
+        f"Segment {start}-{end} incomplete after {max_retries} retries (at byte {position})"
+    )
+
+
+async def download_content_segmented_async(
+    client,
+    node_id: str,
+    destination: Union[str, Path],
+    segments: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress_callback: Optional[ProgressCallback] = None,
+    max_retries: int = 3,
+    attachment: bool = False
+) -> DownloadResponse:
+    """
+    Download node content as concurrent Range segments (asynchronous).
+
+    A one-byte probe request (Range: bytes=0-0) reads the full size, the
+    destination file is preallocated at that size, and each segment is
+    streamed over the async client and written at its offset with os.pwrite.
+    A segment whose connection drops is re-requested from its last written
+    byte, up to max_retries times. Segments are never smaller than
+    chunk_size. If the server does not support Range requests the content
+    is downloaded as a single stream.
+
+    Args:
+        client: Core client (anything with a raw_client property)
+        node_id: ID of the file node to download
+        destination: Local file path
+        segments: Maximum number of concurrent segments
+        chunk_size: Bytes per chunk (peak memory is about one chunk per segment)
+        progress_callback: Called as progress_callback(bytes_downloaded, total_bytes)
+        max_retries: Retries per segment after a connection error
+        attachment: Request the content as an attachment
+
+    Returns:
+        DownloadResponse: Download details (file path, size, content type)
+
+    Examples:
+        ```python
+        result = await download_content_segmented_async(
+            core_client, "file-123", "/exports/archive.zip", segments=8
+        )
+        ```
+
+    Raises:
+        httpx.HTTPStatusError: If the server returns an error status
+        httpx.TransportError: If a segment still fails after max_retries
+    """
+    from ....raw_clients.alfresco_core_client.core_client.api.nodes import get_node_content
+
+    async with await get_node_content.asyncio_detailed(
+        node_id,
+        client=client.raw_client,
+        **_content_kwargs(attachment, byte_range=_byte_range(0, 0)),
+    ) as probe:
+        if probe.status_code != 416:
+            probe.raise_for_status()
+        total = _content_range_total(probe) if probe.status_code == 206 else None
+        content_type = probe.content_type
+
+    if total is None:
+        # No Range support (or empty content): single stream
+        return await download_content_async(
+            client,
+            node_id,
+            destination,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            attachment=attachment,
+        )
+
+    downloaded = 0
+
+    async def advance(count: int) -> None:
+        nonlocal downloaded
+        downloaded += count
+        if progress_callback is not None:
+            result = progress_callback(downloaded, total)
+            if inspect.isawaitable(result):
+                await result
+
+    fd = await asyncio.to_thread(_preallocate, Path(destination), total)
+    tasks = [
+        asyncio.ensure_future(
+            _fetch_segment(
+                client, node_id, attachment, fd, start, end, chunk_size, max_retries, advance
+            )
+        )
+        for start, end in _segment_ranges(total, segments, chunk_size)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # A failed segment (or cancellation) stops the others before the fd is closed
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.to_thread(os.close, fd)
+
+    return DownloadResponse(
+        node_id=node_id,
+        file_path=str(destination),
+        file_size=downloaded,
+        content_type=content_type
+    )
+
+
+__all__ = [
+    'DEFAULT_CHUNK_SIZE',
+    'iter_content', 'download_content',
+    'aiter_content', 'download_content_async',
+    'download_content_segmented_async'
+]
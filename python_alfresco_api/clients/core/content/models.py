@@ -69,6 +69,11 @@ class UploadResponse(CoreResponse):
         description="Size of uploaded file in bytes",
         ge=0
     )]
+    
+    checksum: Annotated[Optional[str], Field(
+        description="Hex digest of the uploaded content, computed while streaming",
+        default=None
+    )]
 
 
 class DownloadRequest(BaseModel):
@@ -95,8 +100,9 @@ class DownloadResponse(BaseModel):
         description="ID of the downloaded file node"
     )]
     
-    file_path: Annotated[str, Field(
-        description="Local path where file was saved"
+    file_path: Annotated[Optional[str], Field(
+        description="Local path where file was saved (None when streamed to an unnamed sink)",
+        default=None
     )]
     
     file_size: Annotated[int, Field(
@@ -109,6 +115,31 @@ class DownloadResponse(BaseModel):
         examples=["application/pdf", "text/plain"],
         default=None
     )]
+    
+    resumed_from: Annotated[int, Field(
+        description="Byte offset a resumed download continued from (0 for a full download)",
+        ge=0,
+        default=0
+    )]
+    
+    from_cache: Annotated[
+        bool,
+        Field(
+            description=(
+                "Content was served from the local content cache "
+                "(server answered 304 Not Modified)"
+            ),
+            default=False,
+        ),
+    ]
+
+    not_modified: Annotated[bool, Field(
+        description=(
+            "Server answered 304 Not Modified to if_modified_since; "
+            "nothing was written to the destination"
+        ),
+        default=False
+    )]
 
 
 class UpdateContentRequest(BaseModel):
@@ -132,8 +163,33 @@ class UpdateContentRequest(BaseModel):
     )]
 
 
+class ContentCacheStats(BaseModel):
+    """Counters of a ContentCache (see cache.py)."""
+    model_config = ConfigDict(extra='forbid')
+    
+    hits: Annotated[
+        int,
+        Field(description="Downloads served from disk after a 304 Not Modified", ge=0, default=0),
+    ]
+    misses: Annotated[
+        int, Field(description="Downloads that transferred the content", ge=0, default=0)
+    ]
+    stores: Annotated[int, Field(description="Bodies written to the cache", ge=0, default=0)]
+    evictions: Annotated[
+        int, Field(description="Entries dropped as least recently used", ge=0, default=0)
+    ]
+    size: Annotated[int, Field(description="Bytes on disk (as of the last store)", ge=0, default=0)]
+    max_size: Annotated[int, Field(description="Maximum bytes on disk", ge=1, default=1)]
+    
+    @property
+    def hit_rate(self) -> float:
+        """Share of downloads served from the cache (0.0 before any download)."""
+        downloads = self.hits + self.misses
+        return self.hits / downloads if downloads else 0.0
+
+
 # Export all models
 __all__ = [
     'UploadRequest', 'UploadResponse', 'DownloadRequest', 
-    'DownloadResponse', 'UpdateContentRequest'
+    'DownloadResponse', 'UpdateContentRequest', 'ContentCacheStats'
 ] 
\ No newline at end of file
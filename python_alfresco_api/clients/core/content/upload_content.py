@@ -0,0 +1,615 @@
+"""
+Streaming content upload operations for Alfresco nodes.
+
+Streams file content to the repository in fixed-size chunks instead of
+reading the whole file into memory, computing size and checksum on the fly:
+- upload_content: multipart POST /nodes/{parentId}/children (create file node)
+- replace_content: PUT /nodes/{nodeId}/content (new content for existing node;
+  drops the node from the nodes client's cache, see nodes/cache.py)
+
+Function-based approach with sync and async variants. Peak memory per upload
+is about one chunk, so many uploads can run in parallel in a fixed budget.
+
+Bodies from paths and seekable file objects can be sent again: when the auth
+flow resends a request after a 401, the content restarts from where it began.
+Async iterables and async readers are one-shot (httpx.StreamConsumed then).
+"""
+
+import asyncio
+import hashlib
+import inspect
+import mimetypes
+import os
+import re
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+import httpx
+
+from .download_content import DEFAULT_CHUNK_SIZE, ProgressCallback
+from .models import UploadResponse
+
+# Source: local file path, binary file object, or (async only) an async
+# iterable of bytes / object with an async read(size) method
+Source = Union[str, Path, Any]
+
+
+def _guess_mime_type(filename: str) -> str:
+    """Guess MIME type from filename."""
+    mime_type, _ = mimetypes.guess_type(filename)
+    return mime_type or 'application/octet-stream'
+
+
+def _source_name(source: Source) -> str:
+    """Derive a file name from a path or file object."""
+    if isinstance(source, (str, Path)):
+        return Path(source).name
+    name = getattr(source, "name", None)
+    return Path(name).name if isinstance(name, str) else "uploaded_file"
+
+
+def _start_position(fileobj) -> Optional[int]:
+    """Current position of a seekable sync file object, None if it cannot rewind."""
+    try:
+        if not inspect.iscoroutinefunction(fileobj.seek) and fileobj.seekable():
+            return fileobj.tell()
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+
+def _remaining_size(fileobj) -> Optional[int]:
+    """Bytes left to read from a regular file object, None if unknown."""
+    try:
+        return os.fstat(fileobj.fileno()).st_size - fileobj.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class _UploadBody:
+    """
+    Chunked request body that tracks size, checksum and progress as it streams.
+
+    Wraps the file content in an optional multipart envelope (preamble and
+    epilogue bytes) and yields it in chunk_size pieces, sync or async.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int,
+        checksum: Optional[str],
+        progress_callback: Optional[ProgressCallback],
+        preamble: bytes = b"",
+        epilogue: bytes = b""
+    ):
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.preamble = preamble
+        self.epilogue = epilogue
+        self.hasher = hashlib.new(checksum) if checksum else None
+        self.size = 0
+        self.total: Optional[int] = None
+
+    @property
+    def checksum(self) -> Optional[str]:
+        """Hex digest of the content streamed so far."""
+        return self.hasher.hexdigest() if self.hasher is not None else None
+
+    def content_length(self, fileobj) -> Optional[int]:
+        """Full body length (envelope + content) if the content size is known."""
+        self.total = _remaining_size(fileobj) if fileobj is not None else None
+        if self.total is None:
+            return None
+        return len(self.preamble) + self.total + len(self.epilogue)
+
+    def reset(self) -> None:
+        """Start counting size, checksum and progress again (body resent)."""
+        self.size = 0
+        if self.hasher is not None:
+            self.hasher = hashlib.new(self.hasher.name)
+
+    def _track(self, chunk: bytes):
+        """Update size/checksum and return the progress callback result."""
+        self.size += len(chunk)
+        if self.hasher is not None:
+            self.hasher.update(chunk)
+        if self.progress_callback is not None:
+            return self.progress_callback(self.size, self.total)
+        return None
+
+    def iter_file(self, fileobj) -> Iterator[bytes]:
+        """Yield the body, reading the file object chunk by chunk."""
+        if self.preamble:
+            yield self.preamble
+        while True:
+            chunk = fileobj.read(self.chunk_size)
+            if not chunk:
+                break
+            self._track(chunk)
+            yield chunk
+        if self.epilogue:
+            yield self.epilogue
+
+    async def aiter_source(self, source) -> AsyncIterator[bytes]:
+        """Yield the body from an async iterable, async reader or sync file object."""
+        if self.preamble:
+            yield self.preamble
+
+        if hasattr(source, "__aiter__") and not hasattr(source, "read"):
+            async for chunk in source:
+                if chunk:
+                    await self._atrack(chunk)
+                    yield chunk
+        else:
+            while True:
+                chunk = source.read(self.chunk_size)
+                if inspect.isawaitable(chunk):
+                    chunk = await chunk
+                if not chunk:
+                    break
+                await self._atrack(chunk)
+                yield chunk
+
+        if self.epilogue:
+            yield self.epilogue
+
+    async def _atrack(self, chunk: bytes) -> None:
+        result = self._track(chunk)
+        if inspect.isawaitable(result):
+            await result
+
+
+class _ReplayableContent:
+    """
+    Request content that httpx can iterate more than once.
+
+    A generator body cannot be resent after a 401 (httpx.StreamConsumed);
+    these iterables seek the file back to its start position and restart
+    the body's counters each time they are iterated again.
+    """
+
+    def __init__(self, body: _UploadBody, fileobj):
+        self.body = body
+        self.fileobj = fileobj
+        self.start = _start_position(fileobj)
+        self.sent = False
+
+    def _restart(self) -> bool:
+        """Prepare another pass; True if the file must be rewound first."""
+        if not self.sent:
+            self.sent = True
+            return False
+        if self.start is None:
+            raise httpx.StreamConsumed()
+        self.body.reset()
+        return True
+
+
+class _SyncContent(_ReplayableContent):
+    """Replayable sync body read from a file object."""
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._restart():
+            self.fileobj.seek(self.start)
+        return self.body.iter_file(self.fileobj)
+
+
+class _AsyncContent(_ReplayableContent):
+    """Replayable async body read through reader (a _ThreadedReader or the source)."""
+
+    def __init__(self, body: _UploadBody, fileobj, reader):
+        super().__init__(body, fileobj)
+        self.reader = reader
+
+    async def _iterate(self) -> AsyncIterator[bytes]:
+        if self._restart():
+            await asyncio.to_thread(self.fileobj.seek, self.start)
+        async for chunk in self.body.aiter_source(self.reader):
+            yield chunk
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iterate()
+
+
+class _ThreadedReader:
+    """Sync file object whose reads run in a worker thread (async uploads)."""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+
+    async def read(self, size: int) -> bytes:
+        return await asyncio.to_thread(self.fileobj.read, size)
+
+
+# Escaping of Content-Disposition parameters, as httpx's multipart encoder
+# does (HTML5 form encoding): quotes, backslashes and control characters
+# can neither end the quoted string nor the header line
+_FORM_PARAM_REPLACEMENTS = {'"': "%22", "\\": "\\\\"}
+_FORM_PARAM_REPLACEMENTS.update(
+    {chr(c): "%{:02X}".format(c) for c in range(0x1F + 1) if c != 0x1B}
+)
+_FORM_PARAM_RE = re.compile("|".join(re.escape(c) for c in _FORM_PARAM_REPLACEMENTS))
+
+
+def _form_param(name: str, value: str) -> str:
+    """Format a quoted Content-Disposition parameter (name="value")."""
+    value = _FORM_PARAM_RE.sub(lambda match: _FORM_PARAM_REPLACEMENTS[match.group(0)], value)
+    return f'{name}="{value}"'
+
+
+def _multipart_envelope(
+    fields: Dict[str, str],
+    filename: str,
+    content_type: str
+) -> Tuple[str, bytes, bytes]:
+    """
+    Build multipart/form-data preamble and epilogue around the filedata part.
+
+    Returns:
+        (boundary, preamble, epilogue)
+    """
+    boundary = uuid.uuid4().hex
+    parts: List[bytes] = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; {_form_param("name", name)}'
+            f'\r\n\r\n{value}\r\n'.encode()
+        )
+    parts.append(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="filedata"; '
+        f'{_form_param("filename", filename)}\r\n'
+        f'Content-Type: {content_type}\r\n\r\n'.encode()
+    )
+    return boundary, b"".join(parts), f"\r\n--{boundary}--\r\n".encode()
+
+
+def _create_fields(
+    name: str,
+    node_type: str,
+    auto_rename: bool,
+    properties: Optional[Dict[str, Any]],
+    description: Optional[str],
+    relative_path: Optional[str]
+) -> Dict[str, str]:
+    """Form fields for multipart node creation (everything except filedata)."""
+    fields = {"name": name, "nodeType": node_type}
+    if relative_path:
+        fields["relativePath"] = relative_path
+    if auto_rename:
+        fields["autoRename"] = "true"
+    if description:
+        fields["cm:description"] = description
+    for key, value in (properties or {}).items():
+        fields[key] = str(value)
+    return fields
+
+
+def _replace_params(
+    major_version: bool,
+    comment: Optional[str],
+    name: Optional[str],
+    include: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Query parameters for PUT /nodes/{nodeId}/content."""
+    params: Dict[str, Any] = {"majorVersion": str(major_version).lower()}
+    if comment:
+        params["comment"] = comment
+    if name:
+        params["name"] = name
+    if include:
+        params["include"] = ",".join(include)
+    return params
+
+
+def _upload_response(response, name: str, body: _UploadBody) -> UploadResponse:
+    """Build the UploadResponse from the created/updated node."""
+    from ..nodes.models import Node
+
+    response.raise_for_status()
+    return UploadResponse(
+        entry=Node.model_validate(response.json()["entry"]),
+        file_name=name,
+        file_size=body.size,
+        checksum=body.checksum
+    )
+
+
+def _create_request(
+    source: Source,
+    parent_id: str,
+    *,
+    filename: Optional[str] = None,
+    node_type: str = "cm:content",
+    properties: Optional[Dict[str, Any]] = None,
+    description: Optional[str] = None,
+    auto_rename: bool = True,
+    relative_path: Optional[str] = None,
+    include: Optional[List[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checksum: Optional[str] = "sha256",
+    progress_callback: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    Build the streamed multipart POST /nodes/{parentId}/children request.
+
+    The keyword options (and their defaults) of all upload_content* functions.
+    """
+    name = filename or _source_name(source)
+    boundary, preamble, epilogue = _multipart_envelope(
+        _create_fields(name, node_type, auto_rename, properties, description, relative_path),
+        name, _guess_mime_type(name)
+    )
+    return {
+        "method": "POST",
+        "url": f"nodes/{parent_id}/children",
+        "name": name,
+        "params": {"include": ",".join(include)} if include else None,
+        "headers": {"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        "body": _UploadBody(chunk_size, checksum, progress_callback, preamble, epilogue)
+    }
+
+
+def _replace_request(
+    source: Source,
+    node_id: str,
+    *,
+    major_version: bool = False,
+    comment: Optional[str] = None,
+    name: Optional[str] = None,
+    content_type: Optional[str] = None,
+    include: Optional[List[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checksum: Optional[str] = "sha256",
+    progress_callback: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    Build the streamed PUT /nodes/{nodeId}/content request.
+
+    The keyword options (and their defaults) of all replace_content* functions.
+    """
+    file_name = name or _source_name(source)
+    return {
+        "method": "PUT",
+        "url": f"nodes/{node_id}/content",
+        "name": file_name,
+        "params": _replace_params(major_version, comment, name, include),
+        "headers": {"Content-Type": content_type or _guess_mime_type(file_name)},
+        "body": _UploadBody(chunk_size, checksum, progress_callback)
+    }
+
+
+def _invalidate(client, node_id: str, request: Dict[str, Any]) -> None:
+    """Drop a replaced node from the nodes client's cache (and its cached paths if renamed)."""
+    from ..nodes.cache import invalidate_node
+
+    nodes_client = getattr(client, "nodes", None)
+    if nodes_client is not None:
+        invalidate_node(nodes_client, node_id, paths="name" in request["params"])
+
+
+def _send(client, source: Source, request: Dict[str, Any]):
+    """Stream a prepared upload request from source (sync)."""
+    body: _UploadBody = request["body"]
+    fileobj = open(source, "rb") if isinstance(source, (str, Path)) else source
+    try:
+        headers = dict(request["headers"])
+        length = body.content_length(fileobj)
+        if length is not None:
+            headers["Content-Length"] = str(length)
+
+        return client.raw_client.get_httpx_client().request(
+            request["method"],
+            request["url"],
+            content=_SyncContent(body, fileobj),
+            params=request["params"],
+            headers=headers
+        )
+    finally:
+        if fileobj is not source:
+            fileobj.close()
+
+
+async def _send_async(client, source: Source, request: Dict[str, Any]):
+    """Stream a prepared upload request from source (async)."""
+    body: _UploadBody = request["body"]
+    if isinstance(source, (str, Path)):
+        fileobj = await asyncio.to_thread(open, source, "rb")
+    else:
+        fileobj = source
+    try:
+        read = getattr(fileobj, "read", None)
+        if read is not None and not inspect.iscoroutinefunction(read):
+            # Sync file object: size is known, reads go to a worker thread
+            length = body.content_length(fileobj)
+            reader = _ThreadedReader(fileobj)
+        else:
+            # Async reader or async iterable: size unknown, sent chunked
+            length = body.content_length(None)
+            reader = fileobj
+
+        headers = dict(request["headers"])
+        if length is not None:
+            headers["Content-Length"] = str(length)
+
+        return await client.raw_client.get_async_httpx_client().request(
+            request["method"],
+            request["url"],
+            content=_AsyncContent(body, fileobj, reader),
+            params=request["params"],
+            headers=headers
+        )
+    finally:
+        if fileobj is not source:
+            await asyncio.to_thread(fileobj.close)
+
+
+# ==================== SYNC ====================
+
+def upload_content(client, source: Source, parent_id: str = "-my-", **options) -> UploadResponse:
+    """
+    Create a file node with streamed multipart content (synchronous).
+
+    Args:
+        client: Core client (anything with a raw_client property)
+        source: Local file path or binary file object
+        parent_id: Parent folder ID (default: "-my-" for user's home)
+        **options: Keyword options:
+            filename: Node name (default: source file name)
+            node_type: Content type of the new node (default: "cm:content")
+            properties: Properties to set on the new node
+            description: Node description (cm:description)
+            auto_rename: Automatically rename if name conflicts exist (default: True)
+            relative_path: Folder path (created if missing) relative to parent_id
+            include: Additional data to include in the response
+            chunk_size: Bytes read and sent per chunk (peak memory is about one chunk)
+            checksum: hashlib algorithm for the content checksum (default: "sha256",
+                None to skip)
+            progress_callback: Called as progress_callback(bytes_uploaded, total_bytes)
+
+    Returns:
+        UploadResponse: Created node with uploaded size and checksum
+
+    Examples:
+        ```python
+        result = upload_content(core_client, "/scans/archive.tiff", parent_id="folder-123")
+        print(result.entry.id, result.file_size, result.checksum)
+        ```
+
+    Raises:
+        httpx.HTTPStatusError: If the server rejects the upload
+    """
+    request = _create_request(source, parent_id, **options)
+    response = _send(client, source, request)
+    return _upload_response(response, request["name"], request["body"])
+
+
+def upload_content_detailed(client, source: Source, parent_id: str = "-my-", **options):
+    """
+    Create a file node with streamed multipart content (detailed sync).
+
+    Takes the same arguments as upload_content().
+
+    Returns:
+        httpx.Response: Complete response with status_code, headers, content
+    """
+    return _send(client, source, _create_request(source, parent_id, **options))
+
+
+def replace_content(client, node_id: str, source: Source, **options) -> UploadResponse:
+    """
+    Replace the content of an existing node with a streamed body (synchronous).
+
+    Args:
+        client: Core client (anything with a raw_client property)
+        node_id: ID of the file node to update
+        source: Local file path or binary file object
+        **options: Keyword options:
+            major_version: Create a major version (default: minor version)
+            comment: Version comment
+            name: Optional new node name
+            content_type: MIME type (default: guessed from name/source file name)
+            include: Additional data to include in the response
+            chunk_size: Bytes read and sent per chunk (peak memory is about one chunk)
+            checksum: hashlib algorithm for the content checksum (default: "sha256",
+                None to skip)
+            progress_callback: Called as progress_callback(bytes_uploaded, total_bytes)
+
+    Returns:
+        UploadResponse: Updated node with uploaded size and checksum
+
+    Raises:
+        httpx.HTTPStatusError: If the server rejects the update
+    """
+    request = _replace_request(source, node_id, **options)
+    try:
+        response = _send(client, source, request)
+    finally:
+        _invalidate(client, node_id, request)
+    return _upload_response(response, request["name"], request["body"])
+
+
+def replace_content_detailed(client, node_id: str, source: Source, **options):
+    """
+    Replace the content of an existing node with a streamed body (detailed sync).
+
+    Takes the same arguments as replace_content().
+
+    Returns:
+        httpx.Response: Complete response with status_code, headers, content
+    """
+    request = _replace_request(source, node_id, **options)
+    try:
+        return _send(client, source, request)
+    finally:
+        _invalidate(client, node_id, request)
+
+
+# ==================== ASYNC ====================
+
+async def upload_content_async(
+    client, source: Source, parent_id: str = "-my-", **options
+) -> UploadResponse:
+    """
+    Create a file node with streamed multipart content (asynchronous).
+
+    Local files are read in a worker thread so the event loop is never
+    blocked on disk I/O. source may also be an async iterable of bytes or an
+    object with an async read(size) method (e.g. an aiofiles file).
+
+    See upload_content() for the arguments.
+    """
+    request = _create_request(source, parent_id, **options)
+    response = await _send_async(client, source, request)
+    return _upload_response(response, request["name"], request["body"])
+
+
+async def upload_content_detailed_async(
+    client, source: Source, parent_id: str = "-my-", **options
+):
+    """
+    Create a file node with streamed multipart content (detailed async).
+
+    Returns:
+        httpx.Response: Complete response with status_code, headers, content
+    """
+    return await _send_async(client, source, _create_request(source, parent_id, **options))
+
+
+async def replace_content_async(
+    client, node_id: str, source: Source, **options
+) -> UploadResponse:
+    """
+    Replace the content of an existing node with a streamed body (asynchronous).
+
+    Accepts the same sources as upload_content_async().
+    See replace_content() for the arguments.
+    """
+    request = _replace_request(source, node_id, **options)
+    try:
+        response = await _send_async(client, source, request)
+    finally:
+        _invalidate(client, node_id, request)
+    return _upload_response(response, request["name"], request["body"])
+
+
+async def replace_content_detailed_async(client, node_id: str, source: Source, **options):
+    """
+    Replace the content of an existing node with a streamed body (detailed async).
+
+    Returns:
+        httpx.Response: Complete response with status_code, headers, content
+    """
+    request = _replace_request(source, node_id, **options)
+    try:
+        return await _send_async(client, source, request)
+    finally:
+        _invalidate(client, node_id, request)
+
+
+__all__ = [
+    'upload_content', 'upload_content_async',
+    'upload_content_detailed', 'upload_content_detailed_async',
+    'replace_content', 'replace_content_async',
+    'replace_content_detailed', 'replace_content_detailed_async'
+]
@@ -6,9 +6,11 @@ Part of the three-tier V1.1 architecture with complete 4-pattern detailed functi
 """
 
 import asyncio
-from typing import Optional, List, Union, Any
+from typing import Optional, List, Union, Any, Iterator, AsyncIterator
 from httpx import Response
 
+from ...paging import paginate, apaginate
+
 # Import from Level 3 (operation-specific models)
 from .models import GroupsResponse, GroupsListResponse, CreateGroupsRequest
 
@@ -215,6 +217,32 @@ class GroupsClient:
             fields=fields if fields is not None else UNSET
         )
     
+    def iter_groups(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Any]:
+        """Iterate over all groups, fetching pages lazily (sync). kwargs as for list_groups()."""
+        return paginate(
+            self.list_groups, page_size=page_size, prefetch=prefetch, limit=limit, **kwargs
+        )
+    
+    def iter_groups_async(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over all groups, fetching pages lazily (async). kwargs as for list_groups_async().
+        """
+        return apaginate(
+            self.list_groups_async, page_size=page_size, prefetch=prefetch, limit=limit, **kwargs
+        )
+    
     def update_group(
         self,
         group_id: str,
@@ -7,7 +7,17 @@ Clean, intuitive API without nested class access.
 from .nodes_client import NodesClient
 
 # Also export the models and functions for convenience
-from .models import NodeResponse, NodeListResponse, CreateNodeRequest, UpdateNodeRequest, CopyNodeRequest, MoveNodeRequest, IncludeOption
+from .models import (
+    NodeResponse,
+    NodeListResponse,
+    CreateNodeRequest,
+    UpdateNodeRequest,
+    CopyNodeRequest,
+    MoveNodeRequest,
+    IncludeOption,
+    BulkItemResult,
+    BulkReport,
+)
 from ..models import NodeType
 from . import models
 
@@ -31,6 +41,9 @@ from .delete_association import delete_association, delete_association_async, de
 from .create_secondary_child_association import create_secondary_child_association, create_secondary_child_association_async, create_secondary_child_association_detailed, create_secondary_child_association_detailed_async
 from .create_folder import create_folder, create_folder_async, create_folder_detailed, create_folder_detailed_async
 from .create_association import create_association, create_association_async, create_association_detailed, create_association_detailed_async
+from .bulk import BulkOperations
+from .cache import NodeCache
+from .models import NodeCacheStats
 
 __all__ = [
     # Main client class
@@ -39,6 +52,7 @@ __all__ = [
     # Models
     'NodeResponse', 'NodeListResponse', 'CreateNodeRequest', 'UpdateNodeRequest', 
     'CopyNodeRequest', 'MoveNodeRequest', 'IncludeOption', 'NodeType', 'models',
+    'BulkItemResult', 'BulkReport', 'BulkOperations', 'NodeCache', 'NodeCacheStats',
     
     # Individual operation functions (all variants)
     'get_node', 'get_node_async', 'get_node_detailed', 'get_node_detailed_async',
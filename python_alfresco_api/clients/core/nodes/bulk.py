@@ -0,0 +1,428 @@
+"""
+Bulk node operations - bounded-concurrency executor.
+
+Runs one node operation (get, delete, update, copy, move, lock, unlock) over
+thousands of node ids or (node_id, request) pairs on the async raw client, so
+every request reuses the factory's pooled connections:
+- at most `concurrency` requests in flight (items are pulled lazily, never all
+  scheduled up front)
+- per-item retry with exponential backoff on connection errors, 429 and 5xx
+  (copy, move and lock are not idempotent: they are retried only when the
+  request never reached the server - connect errors - or was throttled)
+- results streamed back as they complete, or collected into a BulkReport
+
+Async-first; the sync methods run the same code on a private event loop
+thread, so they also work from code that is not async.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple,
+    Union
+)
+
+import httpx
+
+from ...validation import validate_json
+from .models import BulkItemResult, BulkReport, NodeResponse
+from .cache import invalidate_node
+from .get_node import get_node_detailed_async
+from .delete_node import delete_node_detailed_async
+from .update_node import update_node_detailed_async
+from .copy_node import copy_node_detailed_async
+from .move_node import move_node_detailed_async
+from .lock_node import lock_node_detailed_async
+from .unlock_node import unlock_node_detailed_async
+
+# Operations that leave the node unchanged (no cache invalidation)
+READ_OPERATIONS = frozenset({"get", "copy"})
+
+# Operations that can change the node's path (cached paths invalidated too)
+PATH_OPERATIONS = frozenset({"delete", "update", "move"})
+
+# Statuses worth retrying (throttling and transient server errors)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Operations that must not be sent twice (a resent copy creates a second copy)
+UNSAFE_OPERATIONS = frozenset({"copy", "move", "lock"})
+
+# Failures after which an unsafe operation is known not to have run
+UNSAFE_RETRY_STATUSES = frozenset({429})
+UNSAFE_RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# A bulk item: a node id, or a (node_id, request) pair
+BulkItem = Union[str, Tuple[str, Any]]
+BulkItems = Union[Iterable[BulkItem], Mapping[str, Any]]
+
+# operation name -> builder(nodes_client, node_id, request, options) -> awaitable raw Response
+_OPERATIONS: Dict[str, Callable[..., Awaitable[Any]]] = {
+    "get": lambda nodes, node_id, request, options: get_node_detailed_async(
+        nodes, node_id, include=options.get("include"), fields=options.get("fields")
+    ),
+    "delete": lambda nodes, node_id, request, options: delete_node_detailed_async(
+        nodes, node_id, options.get("permanent", False)
+    ),
+    "update": lambda nodes, node_id, request, options: update_node_detailed_async(
+        nodes, node_id, request, options.get("include")
+    ),
+    "copy": lambda nodes, node_id, request, options: copy_node_detailed_async(
+        nodes, node_id, request, options.get("include")
+    ),
+    "move": lambda nodes, node_id, request, options: move_node_detailed_async(
+        nodes, node_id, request, options.get("include")
+    ),
+    "lock": lambda nodes, node_id, request, options: lock_node_detailed_async(
+        nodes, node_id, request if request is not None else options.get("request"),
+        options.get("include")
+    ),
+    "unlock": lambda nodes, node_id, request, options: unlock_node_detailed_async(
+        nodes, node_id, options.get("include")
+    ),
+}
+
+# ==================== PRIVATE EVENT LOOP (SYNC FACADE) ====================
+
+_loop_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _private_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop thread used by the sync methods, starting it if needed."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="alfresco-bulk-loop", daemon=True
+            ).start()
+        return _loop
+
+
+def _run_sync(coroutine) -> Any:
+    """Run a coroutine on the private loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coroutine, _private_loop()).result()
+
+
+def _iterate_sync(iterator: AsyncIterator[Any]) -> Iterator[Any]:
+    """Drive an async iterator on the private loop, yielding its items."""
+    try:
+        while True:
+            try:
+                yield _run_sync(iterator.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        _run_sync(iterator.aclose())
+
+
+# ==================== HELPERS ====================
+
+def _split_item(item: BulkItem) -> Tuple[str, Any]:
+    """Split a bulk item into (node_id, request)."""
+    if isinstance(item, str):
+        return item, None
+    node_id, request = item
+    return node_id, request
+
+
+def _node_response(response) -> Optional[NodeResponse]:
+    """Decode a raw response's JSON body into a NodeResponse (None if no body)."""
+    if getattr(response, "parsed", None) is None or not response.content:
+        return None
+    return validate_json(NodeResponse, response.content)
+
+
+def _error_message(response) -> str:
+    """Extract Alfresco's error summary from a failed raw response."""
+    status = int(response.status_code)
+    try:
+        summary = json.loads(response.content)["error"]["briefSummary"]
+        return f"HTTP {status}: {summary}"
+    except Exception:
+        return f"HTTP {status}"
+
+
+class BulkOperations:
+    """
+    Bounded-concurrency bulk executor for node operations.
+
+    Available as client.nodes.bulk.
+
+    ASYNC (streaming):
+    - async for item in client.nodes.bulk.stream_async("delete", node_ids): ...
+
+    ASYNC (report):
+    - await client.nodes.bulk.get_async(node_ids, include=["path"])
+    - await client.nodes.bulk.delete_async(node_ids, permanent=False)
+    - await client.nodes.bulk.update_async({node_id: UpdateNodeRequest(...), ...})
+    - await client.nodes.bulk.copy_async([(node_id, CopyNodeRequest(...)), ...])
+    - await client.nodes.bulk.move_async([(node_id, MoveNodeRequest(...)), ...])
+    - await client.nodes.bulk.lock_async(node_ids) / unlock_async(node_ids)
+
+    SYNC (same methods without _async, run on a private event loop):
+    - report = client.nodes.bulk.delete(node_ids)
+    - for item in client.nodes.bulk.stream("get", node_ids): ...
+    """
+
+    def __init__(
+        self,
+        nodes_client,
+        concurrency: int = 16,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5
+    ):
+        """
+        Initialize bulk executor.
+
+        Args:
+            nodes_client: NodesClient the operations run through
+            concurrency: Default maximum number of requests in flight
+            max_retries: Retries per item after a connection error, 429 or 5xx
+                (copy, move and lock: after a connect error or 429 only)
+            retry_backoff: First retry delay in seconds (doubles on each retry)
+        """
+        self.nodes_client = nodes_client
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+    # ==================== CORE ====================
+
+    async def _run_item(
+        self, index: int, item: BulkItem, operation: str, options: Dict[str, Any]
+    ) -> BulkItemResult:
+        """Run one item, recording its wall time."""
+        started = time.perf_counter()
+        try:
+            result = await self._attempt_item(index, item, operation, options)
+        finally:
+            if operation not in READ_OPERATIONS:
+                invalidate_node(
+                    self.nodes_client, _split_item(item)[0], operation in PATH_OPERATIONS
+                )
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    async def _attempt_item(
+        self, index: int, item: BulkItem, operation: str, options: Dict[str, Any]
+    ) -> BulkItemResult:
+        """Run one item, retrying transient failures."""
+        node_id, request = _split_item(item)
+        unsafe = operation in UNSAFE_OPERATIONS
+        retry_statuses = UNSAFE_RETRY_STATUSES if unsafe else RETRY_STATUSES
+        attempt = 0
+        while True:
+            attempt += 1
+            status_code = None
+            try:
+                response = await _OPERATIONS[operation](
+                    self.nodes_client, node_id, request, options
+                )
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {e}"
+                if unsafe and not isinstance(e, UNSAFE_RETRY_ERRORS):
+                    # May have reached the server: resending could run it twice
+                    return BulkItemResult(
+                        index=index, node_id=node_id, success=False, attempts=attempt, error=error
+                    )
+            except Exception as e:
+                # Invalid request body etc. - retrying will not help
+                return BulkItemResult(
+                    index=index, node_id=node_id, success=False, attempts=attempt,
+                    error=f"{type(e).__name__}: {e}"
+                )
+            else:
+                status_code = int(response.status_code)
+                if 200 <= status_code < 300:
+                    return BulkItemResult(
+                        index=index, node_id=node_id, success=True, status_code=status_code,
+                        attempts=attempt, result=_node_response(response)
+                    )
+                error = _error_message(response)
+                if status_code not in retry_statuses:
+                    return BulkItemResult(
+                        index=index, node_id=node_id, success=False, status_code=status_code,
+                        attempts=attempt, error=error
+                    )
+
+            if attempt > self.max_retries:
+                return BulkItemResult(
+                    index=index, node_id=node_id, success=False, status_code=status_code,
+                    attempts=attempt, error=error
+                )
+            await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+    async def stream_async(
+        self,
+        operation: str,
+        items: BulkItems,
+        concurrency: Optional[int] = None,
+        **options
+    ) -> AsyncIterator[BulkItemResult]:
+        """
+        Run an operation over many items, yielding results as they complete.
+
+        Args:
+            operation: "get", "delete", "update", "copy", "move", "lock" or "unlock"
+            items: Node ids, (node_id, request) pairs, or a {node_id: request} mapping
+            concurrency: Maximum requests in flight (default: self.concurrency)
+            **options: Operation options (include, fields, permanent, request)
+
+        Yields:
+            BulkItemResult: One result per item, in completion order
+        """
+        if operation not in _OPERATIONS:
+            raise ValueError(
+                f"Unknown bulk operation '{operation}', expected one of {sorted(_OPERATIONS)}"
+            )
+        if isinstance(items, Mapping):
+            items = items.items()
+
+        workers_count = max(1, concurrency or self.concurrency)
+        source = enumerate(items)
+        results: asyncio.Queue = asyncio.Queue(maxsize=workers_count)
+        finished = object()
+
+        async def worker() -> None:
+            # Workers share one iterator: items are pulled only when a slot is free
+            try:
+                for index, item in source:
+                    await results.put(await self._run_item(index, item, operation, options))
+            finally:
+                await results.put(finished)
+
+        workers = [asyncio.create_task(worker()) for _ in range(workers_count)]
+        try:
+            remaining = workers_count
+            while remaining:
+                result = await results.get()
+                if result is finished:
+                    remaining -= 1
+                else:
+                    yield result
+            # Surface unexpected worker errors (e.g. a failing items iterator)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def run_async(
+        self,
+        operation: str,
+        items: BulkItems,
+        concurrency: Optional[int] = None,
+        **options
+    ) -> BulkReport:
+        """
+        Run an operation over many items and collect a per-item report.
+
+        Returns:
+            BulkReport: Results in submission order with success/failure details
+        """
+        started = time.perf_counter()
+        results = [
+            item async for item in self.stream_async(operation, items, concurrency, **options)
+        ]
+        results.sort(key=lambda item: item.index)
+        return BulkReport(operation=operation, items=results, elapsed=time.perf_counter() - started)
+
+    def stream(
+        self,
+        operation: str,
+        items: BulkItems,
+        concurrency: Optional[int] = None,
+        **options
+    ) -> Iterator[BulkItemResult]:
+        """Sync version of stream_async (runs on a private event loop)."""
+        return _iterate_sync(self.stream_async(operation, items, concurrency, **options))
+
+    def run(
+        self,
+        operation: str,
+        items: BulkItems,
+        concurrency: Optional[int] = None,
+        **options
+    ) -> BulkReport:
+        """Sync version of run_async (runs on a private event loop)."""
+        return _run_sync(self.run_async(operation, items, concurrency, **options))
+
+    # ==================== ASYNC OPERATIONS ====================
+
+    async def get_async(
+        self, node_ids: Iterable[str], include=None, fields=None, concurrency=None
+    ) -> BulkReport:
+        """Get many nodes."""
+        return await self.run_async("get", node_ids, concurrency, include=include, fields=fields)
+
+    async def delete_async(
+        self, node_ids: Iterable[str], permanent: bool = False, concurrency=None
+    ) -> BulkReport:
+        """Delete many nodes (to trash unless permanent)."""
+        return await self.run_async("delete", node_ids, concurrency, permanent=permanent)
+
+    async def update_async(self, items: BulkItems, include=None, concurrency=None) -> BulkReport:
+        """Update many nodes from (node_id, UpdateNodeRequest) pairs or a mapping."""
+        return await self.run_async("update", items, concurrency, include=include)
+
+    async def copy_async(self, items: BulkItems, include=None, concurrency=None) -> BulkReport:
+        """Copy many nodes from (node_id, CopyNodeRequest) pairs or a mapping."""
+        return await self.run_async("copy", items, concurrency, include=include)
+
+    async def move_async(self, items: BulkItems, include=None, concurrency=None) -> BulkReport:
+        """Move many nodes from (node_id, MoveNodeRequest) pairs or a mapping."""
+        return await self.run_async("move", items, concurrency, include=include)
+
+    async def lock_async(
+        self, node_ids: BulkItems, request: Optional[dict] = None, include=None, concurrency=None
+    ) -> BulkReport:
+        """Lock many nodes (one shared lock request, or per-item (node_id, request) pairs)."""
+        return await self.run_async("lock", node_ids, concurrency, request=request, include=include)
+
+    async def unlock_async(
+        self, node_ids: Iterable[str], include=None, concurrency=None
+    ) -> BulkReport:
+        """Unlock many nodes."""
+        return await self.run_async("unlock", node_ids, concurrency, include=include)
+
+    # ==================== SYNC OPERATIONS ====================
+
+    def get(
+        self, node_ids: Iterable[str], include=None, fields=None, concurrency=None
+    ) -> BulkReport:
+        """Get many nodes (sync)."""
+        return self.run("get", node_ids, concurrency, include=include, fields=fields)
+
+    def delete(
+        self, node_ids: Iterable[str], permanent: bool = False, concurrency=None
+    ) -> BulkReport:
+        """Delete many nodes (sync)."""
+        return self.run("delete", node_ids, concurrency, permanent=permanent)
+
+    def update(self, items: BulkItems, include=None, concurrency=None) -> BulkReport:
+        """Update many nodes (sync)."""
+        return self.run("update", items, concurrency, include=include)
+
+    def copy(self, items: BulkItems, include=None, concurrency=None) -> BulkReport:
+        """Copy many nodes (sync)."""
+        return self.run("copy", items, concurrency, include=include)
+
+    def move(self, items: BulkItems, include=None, concurrency=None) -> BulkReport:
+        """Move many nodes (sync)."""
+        return self.run("move", items, concurrency, include=include)
+
+    def lock(
+        self, node_ids: BulkItems, request: Optional[dict] = None, include=None, concurrency=None
+    ) -> BulkReport:
+        """Lock many nodes (sync)."""
+        return self.run("lock", node_ids, concurrency, request=request, include=include)
+
+    def unlock(self, node_ids: Iterable[str], include=None, concurrency=None) -> BulkReport:
+        """Unlock many nodes (sync)."""
+        return self.run("unlock", node_ids, concurrency, include=include)
+
+
+__all__ = ['BulkOperations', 'RETRY_STATUSES', 'UNSAFE_OPERATIONS']
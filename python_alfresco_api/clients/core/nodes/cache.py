@@ -0,0 +1,255 @@
+"""
+Node metadata cache - LRU + TTL in front of nodes.get() / get_async().
+
+Read-heavy callers (MCP servers, UIs) fetch the same folders and documents
+over and over. With a cache enabled, nodes.get() answers repeated lookups
+from memory:
+
+    factory = ClientFactory(node_cache=True)                        # defaults below
+    factory = ClientFactory(node_cache=NodeCache(maxsize=5000, ttl=30))
+    core.nodes.cache = NodeCache()                                  # one client only
+
+- entries are keyed by (node_id, include, fields, projection, validation profile)
+- least recently used entries are evicted beyond `maxsize`, and entries
+  older than `ttl` seconds are refetched
+- update / move / delete / lock / unlock / update_content through the nodes
+  client (bulk operations included), and content replacements through the
+  content client or content_utils, drop every cached variant of that node
+  (update / move / delete and renaming replacements also its cached paths,
+  see paths.py), including lookups through aliases such as "-root-" or "-my-"
+- a fetch that returns a changed modifiedAt drops the node's other variants
+- a fetch that was in flight while its node was invalidated is not stored
+  (nodes.get() passes the generation() read before the request to put())
+
+Only changes made through this process are seen before the TTL expires.
+Lookups with relative_path or extra request parameters bypass the cache.
+Responses are stored and handed out as deep copies, so callers may modify
+what they get without affecting other callers.
+
+Any object with get(key) / put(key, value, generation) / invalidate(node_id)
+/ generation() can be used as a cache (e.g. a subclass backed by a shared
+store).
+"""
+
+import copy
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple, Union
+
+from ...validation import get_validation_profile
+from .models import IncludeOption, NodeCacheStats
+
+CacheKey = Tuple[Hashable, ...]
+
+
+def cache_key(
+    node_id: str,
+    include: Optional[Iterable[Union[str, IncludeOption]]] = None,
+    fields: Optional[Iterable[str]] = None,
+    projection: Any = None
+) -> CacheKey:
+    """Build the cache key of a nodes.get() call."""
+    include_key = tuple(sorted(
+        item.value if isinstance(item, IncludeOption) else item for item in include or ()
+    ))
+    fields_key = tuple(fields) if fields is not None else None
+    projection_key = getattr(projection, "name", projection)
+    return (node_id, include_key, fields_key, projection_key, get_validation_profile())
+
+
+def _entry_identity(value: Any) -> Tuple[Optional[str], Any]:
+    """The (id, modifiedAt) of a cached NodeResponse-like value, when present."""
+    entry = getattr(value, "entry", None)
+    return getattr(entry, "id", None), getattr(entry, "modified_at", None)
+
+
+class NodeCache:
+    """
+    Thread-safe LRU cache with per-entry time to live.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        ttl: Seconds a response stays valid (None = until evicted or invalidated)
+        clock: Monotonic clock (for tests)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, value, node ids it is indexed under, modifiedAt)
+        self._entries: (
+            "OrderedDict[CacheKey, Tuple[Optional[float], Any, Tuple[str, ...], Any]]"
+        ) = OrderedDict()
+        # node id (as requested and as returned) -> keys
+        self._index: Dict[str, Set[CacheKey]] = {}
+        # Bumped by invalidate(); node id -> generation of its last invalidation
+        # (oldest first, at most maxsize ids; older ones are folded into _pruned)
+        self._generation = 0
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._pruned = 0
+        self._hits = self._misses = self._evictions = self._expirations = self._invalidations = 0
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """A copy of the cached value, or None (counted as a miss) if absent or expired."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[0] is not None and item[0] <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                item = None
+            if item is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return copy.deepcopy(item[1])
+
+    def generation(self) -> int:
+        """The current generation; read it before a fetch and pass it to put()."""
+        with self._lock:
+            return self._generation
+
+    def put(self, key: CacheKey, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Cache a copy of a response, evicting the least recently used beyond maxsize.
+
+        With the generation() read before the fetch, the response is not stored
+        if its node was invalidated in the meantime.
+        """
+        entry_id, modified_at = _entry_identity(value)
+        ids = tuple({key[0], entry_id} - {None})
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            if generation is not None and self._invalidated_since(ids, generation):
+                return
+            if entry_id is not None and modified_at is not None:
+                # Variants fetched before the node changed are stale
+                for other in list(self._index.get(entry_id, ())):
+                    other_modified = self._entries[other][3]
+                    if other_modified is not None and other_modified != modified_at:
+                        self._remove(other)
+                        self._invalidations += 1
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, value, ids, modified_at)
+            for node_id in ids:
+                self._index.setdefault(node_id, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, node_id: str) -> int:
+        """Drop every cached variant of a node; returns the number dropped."""
+        with self._lock:
+            self._generation += 1
+            self._invalidated[node_id] = self._generation
+            self._invalidated.move_to_end(node_id)
+            while len(self._invalidated) > self.maxsize:
+                _, self._pruned = self._invalidated.popitem(last=False)
+            keys = list(self._index.get(node_id, ()))
+            for key in keys:
+                self._remove(key)
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
+
+    def stats(self) -> NodeCacheStats:
+        """Hit / miss / eviction counters and the current size."""
+        with self._lock:
+            return NodeCacheStats(
+                hits=self._hits, misses=self._misses, evictions=self._evictions,
+                expirations=self._expirations, invalidations=self._invalidations,
+                size=len(self._entries), maxsize=self.maxsize
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"NodeCache(maxsize={self.maxsize}, ttl={self.ttl}, size={len(self._entries)})"
+
+    def _invalidated_since(self, ids: Iterable[str], generation: int) -> bool:
+        """True if one of ids may have been invalidated after generation (lock held)."""
+        if generation < self._pruned:
+            return True
+        return any(self._invalidated.get(node_id, 0) > generation for node_id in ids)
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove a key and its index references (lock held)."""
+        _, _, ids, _ = self._entries.pop(key)
+        for node_id in ids:
+            keys = self._index.get(node_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[node_id]
+
+
+def resolve_node_cache(node_cache: Union[bool, NodeCache, None]) -> Optional[NodeCache]:
+    """ClientFactory(node_cache=...) value -> cache (True = NodeCache() defaults)."""
+    if node_cache is True:
+        return NodeCache()
+    if node_cache is False or node_cache is None:
+        return None
+    return node_cache
+
+
+def invalidate_node(nodes_client: Any, node_id: str, paths: bool = False) -> None:
+    """Drop a node (with paths=True, also its cached paths) from the nodes client's caches."""
+    cache = getattr(nodes_client, "cache", None)
+    if cache is not None:
+        cache.invalidate(node_id)
+    resolver = getattr(nodes_client, "_paths", None) if paths else None
+    if resolver is not None:
+        resolver.invalidate(node_id)
+
+
+def invalidates(method: Optional[Callable] = None, *, paths: bool = False) -> Callable:
+    """
+    Decorate a NodesClient method that changes its node_id argument: drop it
+    from the cache afterwards. paths=True (move, rename, delete) also drops
+    the cached paths through the node.
+    """
+    if method is None:
+        return functools.partial(invalidates, paths=paths)
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, node_id: str, *args, **kwargs):
+            try:
+                return await method(self, node_id, *args, **kwargs)
+            finally:
+                invalidate_node(self, node_id, paths)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, node_id: str, *args, **kwargs):
+        try:
+            return method(self, node_id, *args, **kwargs)
+        finally:
+            invalidate_node(self, node_id, paths)
+    return wrapper
+
+
+__all__ = [
+    'NodeCache', 'NodeCacheStats', 'cache_key', 'resolve_node_cache', 'invalidate_node',
+    'invalidates'
+]
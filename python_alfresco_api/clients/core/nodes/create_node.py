@@ -4,6 +4,7 @@ Simplified function-based approach - no classes, just clean functions.
 """
 
 from typing import Optional, List, Union
+from ...decoding import decode_model
 from .models import NodeResponse, CreateNodeRequest
 
 
@@ -119,9 +120,7 @@ def create_node(
         
         # Handle response
         if response.status_code == 201:
-            from ....raw_clients.alfresco_core_client.core_client.models import NodeEntry
-            result = NodeEntry.from_dict(response.json())
-            return NodeResponse.model_validate(result.to_dict())
+            return decode_model(response, NodeResponse)
         else:
             # Handle error responses
             response.raise_for_status()
@@ -253,9 +252,7 @@ async def create_node_async(
         
         # Handle response
         if response.status_code == 201:
-            from ....raw_clients.alfresco_core_client.core_client.models import NodeEntry
-            result = NodeEntry.from_dict(response.json())
-            return NodeResponse.model_validate(result.to_dict())
+            return decode_model(response, NodeResponse)
         else:
             # Handle error responses
             response.raise_for_status()
@@ -4,7 +4,10 @@ Simplified function-based approach - no classes, just clean functions.
 """
 
 from typing import Optional, List, Union
+from ...decoding import fetch_model, afetch_model
+from ...projections import Projection, project, entry_model
 from .models import NodeResponse, IncludeOption
+from .cache import cache_key
 
 
 def get_node(
@@ -13,6 +16,7 @@ def get_node(
     include: Optional[List[Union[str, IncludeOption]]] = None,
     relative_path: Optional[str] = None,
     fields: Optional[List[str]] = None,
+    projection: Optional[Union[str, Projection]] = None,
     **kwargs
 ) -> NodeResponse:
     """
@@ -26,6 +30,8 @@ def get_node(
         include (Optional[List[Union[str, IncludeOption]]]): Additional data to include
         relative_path (Optional[str]): Path relative to the node to retrieve
         fields (Optional[List[str]]): Specific fields to return (limits response size)
+        projection (Optional[Union[str, Projection]]): Named fields/include profile
+            ("ids", "listing", "full"); the entry is then validated into the projection's model
         **kwargs: Additional parameters to pass to the raw client
         
     Returns:
@@ -62,15 +68,33 @@ def get_node(
         
     Note:
         This method calls the raw sync client directly for optimal performance.
-        For async operations, use get_node_async().
+        For async operations, use get_node_async(). With a node cache enabled
+        (ClientFactory(node_cache=True)), repeated lookups are served from memory.
     """
     # Lazy import of raw operation
     from ....raw_clients.alfresco_core_client.core_client.api.nodes import get_node
     from ....raw_clients.alfresco_core_client.core_client.types import UNSET
     
+    # Repeated lookups are answered by the node cache, when enabled
+    cache = getattr(client, "cache", None)
+    key = None
+    if cache is not None and relative_path is None and not kwargs:
+        key = cache_key(node_id, include, fields, projection)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        # Not stored if the node is invalidated while the request is in flight
+        generation = cache.generation()
+    
     # Get raw client
     raw_client = client.raw_client
     
+    # A projection sets fields/include and the model the entry validates into
+    response_model = NodeResponse
+    if projection is not None:
+        include, fields, model = project("node", projection, include, fields)
+        response_model = entry_model(model)
+    
     # Convert include options to strings if needed
     include_params = UNSET
     if include:
@@ -86,7 +110,8 @@ def get_node(
     fields_params = UNSET if fields is None else fields
     
     # Execute raw sync operation - calls sync httpx directly
-    result = get_node.sync(
+    result = fetch_model(
+        get_node, response_model,
         client=raw_client,
         node_id=node_id,
         include=include_params,
@@ -95,10 +120,11 @@ def get_node(
         **kwargs  # Pass through any additional parameters
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Node {node_id} not found")
-    return NodeResponse.model_validate(result.to_dict())
+    if key is not None:
+        cache.put(key, result, generation)
+    return result
 
 
 async def get_node_async(
@@ -107,6 +133,7 @@ async def get_node_async(
     include: Optional[List[Union[str, IncludeOption]]] = None,
     relative_path: Optional[str] = None,
     fields: Optional[List[str]] = None,
+    projection: Optional[Union[str, Projection]] = None,
     **kwargs
 ) -> NodeResponse:
     """
@@ -118,6 +145,7 @@ async def get_node_async(
         include: Additional data to include (properties, permissions, path, etc.)
         relative_path: Path relative to the node to retrieve
         fields: Specific fields to return (limits response size)
+        projection: Named fields/include profile ("ids", "listing", "full")
         **kwargs: Additional parameters to pass to the raw client
         
     Returns:
@@ -156,9 +184,26 @@ async def get_node_async(
     from ....raw_clients.alfresco_core_client.core_client.api.nodes import get_node
     from ....raw_clients.alfresco_core_client.core_client.types import UNSET
     
+    # Repeated lookups are answered by the node cache, when enabled
+    cache = getattr(client, "cache", None)
+    key = None
+    if cache is not None and relative_path is None and not kwargs:
+        key = cache_key(node_id, include, fields, projection)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        # Not stored if the node is invalidated while the request is in flight
+        generation = cache.generation()
+    
     # Get raw client
     raw_client = client.raw_client
     
+    # A projection sets fields/include and the model the entry validates into
+    response_model = NodeResponse
+    if projection is not None:
+        include, fields, model = project("node", projection, include, fields)
+        response_model = entry_model(model)
+    
     # Convert include options to strings if needed
     include_params = UNSET
     if include:
@@ -174,7 +219,8 @@ async def get_node_async(
     fields_params = UNSET if fields is None else fields
     
     # Execute raw operation
-    result = await get_node.asyncio(
+    result = await afetch_model(
+        get_node, response_model,
         client=raw_client,
         node_id=node_id,
         include=include_params,
@@ -183,10 +229,11 @@ async def get_node_async(
         **kwargs  # Pass through any additional parameters
     )
     
-    # Validate and return rich model - result is NodeEntry or None
     if result is None:
         raise ValueError(f"Node {node_id} not found")
-    return NodeResponse.model_validate(result.to_dict())
+    if key is not None:
+        cache.put(key, result, generation)
+    return result
 
 
 def get_node_detailed(
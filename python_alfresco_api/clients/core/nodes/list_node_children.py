@@ -4,7 +4,10 @@ Simplified function-based approach - no classes, just clean functions.
 """
 
 from typing import Optional, List, Union
-from .models import NodeListResponse, IncludeOption
+from ...decoding import fetch_model, afetch_model, fetch_json, afetch_json
+from ...projections import Projection, project, paging_model
+from ...views import ListView, view_class
+from .models import Node, NodeListResponse, IncludeOption
 
 
 def list_node_children(
@@ -16,8 +19,10 @@ def list_node_children(
     fields: Optional[List[str]] = None,
     order_by: Optional[List[str]] = None,
     where: Optional[str] = None,
-    include_source: Optional[bool] = None
-) -> NodeListResponse:
+    include_source: Optional[bool] = None,
+    view: bool = False,
+    projection: Optional[Union[str, Projection]] = None
+) -> Union[NodeListResponse, ListView]:
     """
     List children of a node (synchronous).
     
@@ -33,9 +38,13 @@ def list_node_children(
         order_by (Optional[List[str]]): Sort order
         where (Optional[str]): Filter expression
         include_source (Optional[bool]): Include source information
+        view (bool): Return a ListView of lazy NodeView entries instead of validating
+        projection (Optional[Union[str, Projection]]): Named fields/include profile
+            ("ids", "listing", "full"); entries validate into (or are viewed as)
+            the projection's model
         
     Returns:
-        NodeListResponse: List of child nodes
+        NodeListResponse: List of child nodes (ListView when view=True)
         
     Examples:
         ```python
@@ -55,6 +64,13 @@ def list_node_children(
             where="(nodeType='cm:content')",
             order_by=["name ASC"]
         )
+        
+        # Lazy views: no validation, fields decoded on access
+        page = client.nodes.list_children("abc123-def456", max_items=1000, view=True)
+        ids = [node.id for node in page.entries]
+        
+        # Only ask the server for what a listing shows
+        page = client.nodes.list_children("abc123-def456", projection="listing")
         ```
         
     Raises:
@@ -73,6 +89,12 @@ def list_node_children(
     # Get raw client
     raw_client = client.raw_client
     
+    # A projection sets fields/include and the model entries validate into
+    entry_model, response_model = Node, NodeListResponse
+    if projection is not None:
+        include, fields, entry_model = project("node", projection, include, fields)
+        response_model = paging_model(entry_model)
+    
     # Convert include options to strings if needed
     include_params = UNSET
     if include:
@@ -88,8 +110,7 @@ def list_node_children(
     include_source_params = UNSET if include_source is None else include_source
     
     # Execute raw sync operation
-    result = list_node_children.sync(
-        client=raw_client,
+    kwargs = dict(
         node_id=node_id,
         skip_count=skip_count,
         max_items=max_items,
@@ -99,11 +120,15 @@ def list_node_children(
         where=where_params,
         include_source=include_source_params
     )
+    if view:
+        data = fetch_json(list_node_children, client=raw_client, **kwargs)
+        result = None if data is None else ListView(data, view_class(entry_model))
+    else:
+        result = fetch_model(list_node_children, response_model, client=raw_client, **kwargs)
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to list children for node {node_id}")
-    return NodeListResponse.model_validate(result.to_dict())
+    return result
 
 
 async def list_node_children_async(
@@ -115,8 +140,10 @@ async def list_node_children_async(
     fields: Optional[List[str]] = None,
     order_by: Optional[List[str]] = None,
     where: Optional[str] = None,
-    include_source: Optional[bool] = None
-) -> NodeListResponse:
+    include_source: Optional[bool] = None,
+    view: bool = False,
+    projection: Optional[Union[str, Projection]] = None
+) -> Union[NodeListResponse, ListView]:
     """
     List children of a node (asynchronous).
     
@@ -130,9 +157,11 @@ async def list_node_children_async(
         order_by: Sort order
         where: Filter expression
         include_source: Include source information
+        view: Return a ListView of lazy NodeView entries instead of validating
+        projection: Named fields/include profile ("ids", "listing", "full")
         
     Returns:
-        NodeListResponse: List of child nodes
+        NodeListResponse: List of child nodes (ListView when view=True)
         
     Examples:
         ```python
@@ -161,6 +190,12 @@ async def list_node_children_async(
     # Get raw client
     raw_client = client.raw_client
     
+    # A projection sets fields/include and the model entries validate into
+    entry_model, response_model = Node, NodeListResponse
+    if projection is not None:
+        include, fields, entry_model = project("node", projection, include, fields)
+        response_model = paging_model(entry_model)
+    
     # Convert include options to strings if needed
     include_params = UNSET
     if include:
@@ -176,8 +211,7 @@ async def list_node_children_async(
     include_source_params = UNSET if include_source is None else include_source
     
     # Execute raw async operation
-    result = await list_node_children.asyncio(
-        client=raw_client,
+    kwargs = dict(
         node_id=node_id,
         skip_count=skip_count,
         max_items=max_items,
@@ -187,11 +221,15 @@ async def list_node_children_async(
         where=where_params,
         include_source=include_source_params
     )
+    if view:
+        data = await afetch_json(list_node_children, client=raw_client, **kwargs)
+        result = None if data is None else ListView(data, view_class(entry_model))
+    else:
+        result = await afetch_model(list_node_children, response_model, client=raw_client, **kwargs)
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to list children for node {node_id}")
-    return NodeListResponse.model_validate(result.to_dict())
+    return result
 
 
 def list_node_children_detailed(
@@ -4,6 +4,7 @@ Clean function-based approach with 4 patterns: sync, async, detailed_sync, detai
 """
 
 from typing import Optional, List, Union
+from ...decoding import fetch_model, afetch_model
 from .models import NodeResponse, NodeListResponse
 
 
@@ -66,7 +67,8 @@ def list_secondary_children(
     fields_param = UNSET if fields is None else fields
     
     # Execute raw sync operation
-    result = list_secondary_children.sync(
+    result = fetch_model(
+        list_secondary_children, NodeListResponse,
         client=raw_client,
         node_id=node_id,
         where=where_param,
@@ -91,7 +93,7 @@ def list_secondary_children(
         }
         return NodeListResponse.model_validate(empty_response)
     
-    return NodeListResponse.model_validate(result.to_dict())
+    return result
 
 
 async def list_secondary_children_async(
@@ -135,7 +137,8 @@ async def list_secondary_children_async(
     fields_param = UNSET if fields is None else fields
     
     # Execute raw async operation
-    result = await list_secondary_children.asyncio(
+    result = await afetch_model(
+        list_secondary_children, NodeListResponse,
         client=raw_client,
         node_id=node_id,
         where=where_param,
@@ -160,7 +163,7 @@ async def list_secondary_children_async(
         }
         return NodeListResponse.model_validate(empty_response)
     
-    return NodeListResponse.model_validate(result.to_dict())
+    return result
 
 
 def list_secondary_children_detailed(
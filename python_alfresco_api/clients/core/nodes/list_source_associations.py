@@ -4,6 +4,7 @@ Clean function-based approach with 4 patterns: sync, async, detailed_sync, detai
 """
 
 from typing import Optional, List, Union
+from ...decoding import fetch_model, afetch_model
 from .models import NodeResponse, NodeListResponse
 
 
@@ -67,7 +68,8 @@ def list_source_associations(
     
     # Execute raw sync operation with error handling
     try:
-        result = list_source_associations.sync(
+        result = fetch_model(
+            list_source_associations, NodeListResponse,
             client=raw_client,
             node_id=node_id,
             where=where_param,
@@ -75,10 +77,9 @@ def list_source_associations(
             fields=fields_param
         )
         
-        # Validate and return rich model
         if result is None:
             raise ValueError(f"Failed to list source associations for node {node_id}")
-        return NodeListResponse.model_validate(result.to_dict())
+        return result
         
     except KeyError as e:
         # Handle missing fields from Alfresco response
@@ -145,7 +146,8 @@ async def list_source_associations_async(
     
     # Execute raw async operation with error handling
     try:
-        result = await list_source_associations.asyncio(
+        result = await afetch_model(
+            list_source_associations, NodeListResponse,
             client=raw_client,
             node_id=node_id,
             where=where_param,
@@ -153,10 +155,9 @@ async def list_source_associations_async(
             fields=fields_param
         )
         
-        # Validate and return rich model
         if result is None:
             raise ValueError(f"Failed to list source associations for node {node_id}")
-        return NodeListResponse.model_validate(result.to_dict())
+        return result
         
     except (KeyError, ValueError) as e:
         # Handle missing fields from Alfresco response
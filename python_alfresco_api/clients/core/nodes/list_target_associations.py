@@ -4,6 +4,7 @@ Clean function-based approach with 4 patterns: sync, async, detailed_sync, detai
 """
 
 from typing import Optional, List, Union
+from ...decoding import fetch_model, afetch_model
 from .models import NodeResponse, NodeListResponse
 
 
@@ -66,7 +67,8 @@ def list_target_associations(
     fields_param = UNSET if fields is None else fields
     
     # Execute raw sync operation
-    result = list_target_associations.sync(
+    result = fetch_model(
+        list_target_associations, NodeListResponse,
         client=raw_client,
         node_id=node_id,
         where=where_param,
@@ -74,10 +76,9 @@ def list_target_associations(
         fields=fields_param
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to list target associations for node {node_id}")
-    return NodeListResponse.model_validate(result.to_dict())
+    return result
 
 
 async def list_target_associations_async(
@@ -121,7 +122,8 @@ async def list_target_associations_async(
     fields_param = UNSET if fields is None else fields
     
     # Execute raw async operation
-    result = await list_target_associations.asyncio(
+    result = await afetch_model(
+        list_target_associations, NodeListResponse,
         client=raw_client,
         node_id=node_id,
         where=where_param,
@@ -129,10 +131,9 @@ async def list_target_associations_async(
         fields=fields_param
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to list target associations for node {node_id}")
-    return NodeListResponse.model_validate(result.to_dict())
+    return result
 
 
 def list_target_associations_detailed(
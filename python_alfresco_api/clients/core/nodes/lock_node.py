@@ -4,6 +4,7 @@ Clean function-based approach with 4 patterns: sync, async, detailed_sync, detai
 """
 
 from typing import Optional, List, Union
+from ...decoding import fetch_model, afetch_model
 from .models import NodeResponse, NodeListResponse
 
 
@@ -69,17 +70,17 @@ def lock_node(
         body = NodeBodyLock()
     
     # Execute raw sync operation
-    result = lock_node.sync(
+    result = fetch_model(
+        lock_node, NodeResponse,
         client=raw_client,
         node_id=node_id,
         body=body,
         include=include_params
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to lock node {node_id}")
-    return NodeResponse.model_validate(result.to_dict())
+    return result
 
 
 async def lock_node_async(
@@ -126,17 +127,17 @@ async def lock_node_async(
         body = NodeBodyLock()
     
     # Execute raw async operation
-    result = await lock_node.asyncio(
+    result = await afetch_model(
+        lock_node, NodeResponse,
         client=raw_client,
         node_id=node_id,
         body=body,
         include=include_params
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to lock node {node_id}")
-    return NodeResponse.model_validate(result.to_dict())
+    return result
 
 
 def lock_node_detailed(
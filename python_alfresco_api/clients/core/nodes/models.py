@@ -154,6 +154,34 @@ class NodeListResponse(BaseModel):
     list: Dict[str, Any] = Field(..., description="List data with pagination")
 
 
+class NodeId(BaseModel):
+    """Slim node for the "ids" projection (fields=id)."""
+    model_config = ConfigDict(extra='allow')  # Allow extra fields from Alfresco
+    
+    id: str = Field(..., description="Node identifier")
+
+
+class NodeSummary(BaseModel):
+    """Slim node for the "listing" projection: what a folder listing shows."""
+    model_config = ConfigDict(extra='allow')  # Allow extra fields from Alfresco
+    
+    id: str = Field(..., description="Node identifier")
+    name: Optional[str] = Field(None, description="Node display name")
+    node_type: Optional[str] = Field(None, alias="nodeType", description="Content model type")
+    is_folder: Optional[bool] = Field(
+        None, alias="isFolder", description="True if this is a folder"
+    )
+    is_file: Optional[bool] = Field(None, alias="isFile", description="True if this is a file")
+    parent_id: Optional[str] = Field(None, alias="parentId", description="Parent folder node ID")
+    modified_at: Optional[datetime] = Field(
+        None, alias="modifiedAt", description="Last modification timestamp"
+    )
+    modified_by_user: Optional[UserInfo] = Field(
+        None, alias="modifiedByUser", description="User who last modified this node"
+    )
+    content: Optional[ContentInfo] = Field(None, description="Content information (for files)")
+
+
 class CreateNodeRequest(BaseModel):
     """Request model for creating new nodes with validation."""
     model_config = ConfigDict(extra='forbid')
@@ -258,8 +286,118 @@ class MoveNodeRequest(BaseModel):
     )]
 
 
+class BulkItemResult(BaseModel):
+    """Outcome of one item of a bulk node operation."""
+    model_config = ConfigDict(extra='forbid')
+    
+    index: Annotated[int, Field(
+        description="Position of the item in the submitted batch",
+        ge=0
+    )]
+    
+    node_id: Annotated[str, Field(
+        description="Node the operation was applied to"
+    )]
+    
+    success: Annotated[bool, Field(
+        description="True if the operation returned a 2xx status"
+    )]
+    
+    status_code: Annotated[Optional[int], Field(
+        description="HTTP status of the final attempt (None after a connection error)",
+        default=None
+    )]
+    
+    attempts: Annotated[int, Field(
+        description="Number of attempts made (1 = no retries)",
+        ge=1,
+        default=1
+    )]
+    
+    result: Annotated[Optional[NodeResponse], Field(
+        description="Node returned by the operation (None for delete or on failure)",
+        default=None
+    )]
+    
+    error: Annotated[Optional[str], Field(
+        description="Error description for failed items",
+        default=None
+    )]
+    
+    elapsed: Annotated[float, Field(
+        description="Wall time in seconds for this item, including retries",
+        ge=0,
+        default=0.0
+    )]
+
+
+class BulkReport(BaseModel):
+    """Structured per-item report of a bulk node operation."""
+    model_config = ConfigDict(extra='forbid')
+    
+    operation: Annotated[str, Field(
+        description="Bulk operation name",
+        examples=["delete", "update", "move"]
+    )]
+    
+    items: Annotated[List[BulkItemResult], Field(
+        description="Per-item results in submission order",
+        default_factory=list
+    )]
+    
+    elapsed: Annotated[float, Field(
+        description="Wall time in seconds",
+        ge=0,
+        default=0.0
+    )]
+    
+    @property
+    def total(self) -> int:
+        return len(self.items)
+    
+    @property
+    def succeeded(self) -> List[BulkItemResult]:
+        return [item for item in self.items if item.success]
+    
+    @property
+    def failed(self) -> List[BulkItemResult]:
+        return [item for item in self.items if not item.success]
+    
+    @property
+    def ok(self) -> bool:
+        """True if every item succeeded."""
+        return all(item.success for item in self.items)
+
+
+class NodeCacheStats(BaseModel):
+    """Counters of a NodeCache (see cache.py)."""
+    model_config = ConfigDict(extra='forbid')
+    
+    hits: Annotated[int, Field(description="Lookups answered from the cache", ge=0, default=0)]
+    misses: Annotated[int, Field(description="Lookups that went to the server", ge=0, default=0)]
+    evictions: Annotated[
+        int, Field(description="Entries dropped as least recently used", ge=0, default=0)
+    ]
+    expirations: Annotated[
+        int, Field(description="Entries dropped after their TTL", ge=0, default=0)
+    ]
+    invalidations: Annotated[
+        int,
+        Field(description="Entries dropped by mutations or a newer modifiedAt", ge=0, default=0),
+    ]
+    size: Annotated[int, Field(description="Current number of entries", ge=0, default=0)]
+    maxsize: Annotated[int, Field(description="Maximum number of entries", ge=1, default=1)]
+    
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
 # Export all models
 __all__ = [
-    'Node', 'NodeResponse', 'NodeListResponse', 'CreateNodeRequest',
-    'UpdateNodeRequest', 'CopyNodeRequest', 'MoveNodeRequest'
+    'Node', 'NodeResponse', 'NodeListResponse', 'NodeId', 'NodeSummary', 'CreateNodeRequest',
+    'UpdateNodeRequest', 'CopyNodeRequest', 'MoveNodeRequest',
+    'BulkItemResult', 'BulkReport', 'NodeCacheStats'
 ] 
\ No newline at end of file
@@ -5,6 +5,7 @@ Clean function-based approach with 4 patterns: sync, async, detailed_sync, detai
 
 from typing import Optional, List, Union
 import asyncio
+from ...decoding import fetch_model, afetch_model
 from .models import (
     NodeResponse, NodeListResponse, CreateNodeRequest, UpdateNodeRequest,
     CopyNodeRequest, MoveNodeRequest, IncludeOption
@@ -87,17 +88,17 @@ def move_node(
     )
     
     # Execute raw sync operation
-    result = move_node.sync(
+    result = fetch_model(
+        move_node, NodeResponse,
         client=raw_client,
         node_id=node_id,
         body=body,
         include=include_params
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to move node {node_id}")
-    return NodeResponse.model_validate(result.to_dict())
+    return result
 
 
 async def move_node_async(
@@ -154,17 +155,17 @@ async def move_node_async(
     )
     
     # Execute raw operation
-    result = await move_node.asyncio(
+    result = await afetch_model(
+        move_node, NodeResponse,
         client=raw_client,
         node_id=node_id,
         body=body,
         include=include_params
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to move node {node_id}")
-    return NodeResponse.model_validate(result.to_dict())
+    return result
 
 
 def move_node_detailed(
@@ -24,9 +24,13 @@ from .delete_association import delete_association, delete_association_async, de
 from .create_secondary_child_association import create_secondary_child_association, create_secondary_child_association_async, create_secondary_child_association_detailed, create_secondary_child_association_detailed_async
 from .create_folder import create_folder, create_folder_async, create_folder_detailed, create_folder_detailed_async
 from .create_association import create_association, create_association_async, create_association_detailed, create_association_detailed_async
+from .bulk import BulkOperations
+from .cache import NodeCache, invalidates
+from .paths import ROOT, PathResolver
+from ...paging import paginate, apaginate
 
 # Import types for convenience
-from typing import Optional, List, Union, IO, BinaryIO
+from typing import Optional, List, Union, IO, BinaryIO, Any, Iterator, AsyncIterator
 from .models import NodeResponse, NodeListResponse, CreateNodeRequest, UpdateNodeRequest, CopyNodeRequest, MoveNodeRequest, IncludeOption
 from ..models import NodeType
 
@@ -41,6 +45,7 @@ class NodesClient:
     - client.nodes.create(parent_id, request) - Obvious what it does
     - client.nodes.delete(node_id) - Clear and direct
     - client.nodes.list_children(node_id) - Natural naming
+    - client.nodes.iter_children(node_id) - All children, pages fetched lazily
     - client.nodes.update(node_id, request) - Clean updates
     - client.nodes.copy(node_id, request) - Copy operations
     - client.nodes.move(node_id, request) - Move operations
@@ -62,6 +67,7 @@ class NodesClient:
     - client.nodes.create_async(parent_id, request)
     - client.nodes.delete_async(node_id)
     - client.nodes.list_children_async(node_id)
+    - client.nodes.iter_children_async(node_id, prefetch=True)
     - client.nodes.update_async(node_id, request)
     - client.nodes.copy_async(node_id, request)
     - client.nodes.move_async(node_id, request)
@@ -77,10 +83,30 @@ class NodesClient:
     - client.nodes.create_secondary_child_association_async(node_id, child_id, assoc_type)
     - client.nodes.create_folder_convenience_async(name, parent_id)
     - client.nodes.create_association_async(node_id, target_id, assoc_type)
+    
+    PATHS (cached path -> node id trie, see paths.py):
+    - client.nodes.resolve_path("Sites/finance/documentLibrary/2024") / resolve_path_async(...)
+    - client.nodes.get_by_path("Sites/finance/documentLibrary/2024", include=["path"])
+    - move / update / delete through this client drop the cached paths below the node
+    
+    CACHING (optional, see cache.py):
+    - ClientFactory(node_cache=True) or client.nodes.cache = NodeCache(maxsize, ttl)
+    - get() / get_async() answer repeated lookups from the cache; the mutating
+      methods below (and bulk mutations) invalidate the node they change
+    - client.nodes.cache.stats() - hits, misses, evictions, hit_rate
+    
+    BULK OPERATIONS (bounded concurrency, per-item retry, per-item report):
+    - client.nodes.bulk.delete(node_ids) / await client.nodes.bulk.delete_async(node_ids)
+    - async for item in client.nodes.bulk.stream_async("get", node_ids)
     """
     
     def __init__(self, parent_client):
         self.parent_client = parent_client
+        self._bulk = None
+        # Node metadata cache for get() / get_async() (ClientFactory(node_cache=...); None = off)
+        factory = getattr(parent_client, "_client_factory", None)
+        self.cache: Optional[NodeCache] = getattr(factory, "node_cache", None)
+        self._paths: Optional[PathResolver] = None
     
     @property
     def raw_client(self):
@@ -92,6 +118,42 @@ class NodesClient:
         """Delegate to parent client's httpx client."""
         return self.parent_client.httpx_client
     
+    @property
+    def bulk(self) -> BulkOperations:
+        """Bulk executor for running one operation over many nodes."""
+        if self._bulk is None:
+            self._bulk = BulkOperations(self)
+        return self._bulk
+    
+    @property
+    def paths(self) -> PathResolver:
+        """Cached path -> node id resolver (a trie of resolved segments, see paths.py)."""
+        if self._paths is None:
+            self._paths = PathResolver(self)
+        return self._paths
+    
+    def resolve_path(self, path: str, base_id: str = ROOT) -> str:
+        """
+        Resolve a path like "Sites/finance/documentLibrary" (relative to base_id) to a node id; only
+        uncached segments go to the server.
+        """
+        return self.paths.resolve(path, base_id)
+    
+    async def resolve_path_async(self, path: str, base_id: str = ROOT) -> str:
+        """Resolve a path (relative to base_id) to a node id (async)."""
+        return await self.paths.resolve_async(path, base_id)
+    
+    def get_by_path(self, path: str, base_id: str = ROOT, **kwargs) -> NodeResponse:
+        """
+        Get the node at a path through the path resolver; kwargs as get() (include, fields,
+        projection).
+        """
+        return get_node(self, self.paths.resolve(path, base_id), **kwargs)
+    
+    async def get_by_path_async(self, path: str, base_id: str = ROOT, **kwargs) -> NodeResponse:
+        """Get the node at a path through the path resolver (async)."""
+        return await get_node_async(self, await self.paths.resolve_async(path, base_id), **kwargs)
+    
     # ==========================================
     # SYNC VERSIONS
     # ==========================================
@@ -104,7 +166,10 @@ class NodesClient:
         fields: Optional[List[str]] = None,
         **kwargs
     ) -> NodeResponse:
-        """Get node information - clean and simple."""
+        """
+        Get node information - clean and simple. projection="ids"/"listing"/"full" selects
+        fields/include and the entry model.
+        """
         return get_node(self, node_id, include, relative_path, fields, **kwargs)
     
     async def get_async(
@@ -115,7 +180,10 @@ class NodesClient:
         fields: Optional[List[str]] = None,
         **kwargs
     ) -> NodeResponse:
-        """Get node information (async) - clean and simple."""
+        """
+        Get node information (async) - clean and simple. projection="ids"/"listing"/"full" selects
+        fields/include and the entry model.
+        """
         return await get_node_async(self, node_id, include, relative_path, fields, **kwargs)
     
     def create(self, parent_id: str, request: CreateNodeRequest) -> NodeResponse:
@@ -126,26 +194,106 @@ class NodesClient:
         """Create a new node (async) - clean and simple."""
         return await create_node_async(self, parent_id, request)
     
+    @invalidates(paths=True)
     def delete(self, node_id: str, permanent: bool = False) -> None:
         """Delete a node - clean and simple."""
         return delete_node(self, node_id, permanent)
     
+    @invalidates(paths=True)
     async def delete_async(self, node_id: str, permanent: bool = False) -> None:
         """Delete a node (async) - clean and simple."""
         return await delete_node_async(self, node_id, permanent)
     
-    def list_children(self, node_id: str, skip_count: int = 0, max_items: int = 100) -> NodeListResponse:
-        """List node children - clean and simple."""
-        return list_node_children(self, node_id, skip_count, max_items)
+    def list_children(
+        self,
+        node_id: str,
+        skip_count: int = 0,
+        max_items: int = 100,
+        view: bool = False,
+        include: Optional[List[Union[str, IncludeOption]]] = None,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None
+    ) -> NodeListResponse:
+        """
+        List node children - clean and simple. view=True returns a ListView of lazy NodeView
+        entries; projection="ids"/"listing"/"full" trims the response.
+        """
+        return list_node_children(
+            self, node_id, skip_count, max_items, include, fields, view=view, projection=projection
+        )
     
-    async def list_children_async(self, node_id: str, skip_count: int = 0, max_items: int = 100) -> NodeListResponse:
-        """List node children (async) - clean and simple."""
-        return await list_node_children_async(self, node_id, skip_count, max_items)
+    async def list_children_async(
+        self,
+        node_id: str,
+        skip_count: int = 0,
+        max_items: int = 100,
+        view: bool = False,
+        include: Optional[List[Union[str, IncludeOption]]] = None,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None
+    ) -> NodeListResponse:
+        """
+        List node children (async) - clean and simple. view=True returns a ListView of lazy NodeView
+        entries; projection="ids"/"listing"/"full" trims the response.
+        """
+        return await list_node_children_async(
+            self, node_id, skip_count, max_items, include, fields, view=view, projection=projection
+        )
+    
+    def iter_children(
+        self,
+        node_id: str,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        parallel: int = 1,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Iterate over all children of a node, fetching pages lazily. parallel=N keeps N pages in
+        flight; kwargs: include, fields, order_by, where, view, projection.
+        """
+        return paginate(
+            list_node_children,
+            self,
+            node_id,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            parallel=parallel,
+            **kwargs,
+        )
+    
+    def iter_children_async(
+        self,
+        node_id: str,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        parallel: int = 1,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over all children of a node, fetching pages lazily (async). parallel=N keeps N pages
+        in flight; kwargs: include, fields, order_by, where, view, projection.
+        """
+        return apaginate(
+            list_node_children_async,
+            self,
+            node_id,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            parallel=parallel,
+            **kwargs,
+        )
     
+    @invalidates(paths=True)
     def update(self, node_id: str, request: UpdateNodeRequest, include: Optional[List[Union[str, IncludeOption]]] = None) -> NodeResponse:
         """Update node properties - clean and simple."""
         return update_node(self, node_id, request, include)
     
+    @invalidates(paths=True)
     async def update_async(self, node_id: str, request: UpdateNodeRequest, include: Optional[List[Union[str, IncludeOption]]] = None) -> NodeResponse:
         """Update node properties (async) - clean and simple."""
         return await update_node_async(self, node_id, request, include)
@@ -158,34 +306,42 @@ class NodesClient:
         """Copy a node (async) - clean and simple."""
         return await copy_node_async(self, node_id, request, include)
     
+    @invalidates(paths=True)
     def move(self, node_id: str, request: MoveNodeRequest, include: Optional[List[Union[str, IncludeOption]]] = None) -> NodeResponse:
         """Move a node - clean and simple."""
         return move_node(self, node_id, request, include)
     
+    @invalidates(paths=True)
     async def move_async(self, node_id: str, request: MoveNodeRequest, include: Optional[List[Union[str, IncludeOption]]] = None) -> NodeResponse:
         """Move a node (async) - clean and simple."""
         return await move_node_async(self, node_id, request, include)
     
+    @invalidates
     def lock(self, node_id: str, request: Optional[dict] = None, include: Optional[List[Union[str, str]]] = None) -> NodeResponse:
         """Lock a node - clean and simple."""
         return lock_node(self, node_id, request, include)
     
+    @invalidates
     async def lock_async(self, node_id: str, request: Optional[dict] = None, include: Optional[List[Union[str, str]]] = None) -> NodeResponse:
         """Lock a node (async) - clean and simple."""
         return await lock_node_async(self, node_id, request, include)
     
+    @invalidates
     def unlock(self, node_id: str, include: Optional[List[Union[str, str]]] = None) -> NodeResponse:
         """Unlock a node - clean and simple."""
         return unlock_node(self, node_id, include)
     
+    @invalidates
     async def unlock_async(self, node_id: str, include: Optional[List[Union[str, str]]] = None) -> NodeResponse:
         """Unlock a node (async) - clean and simple."""
         return await unlock_node_async(self, node_id, include)
     
+    @invalidates
     def update_content(self, node_id: str, content: Union[bytes, IO[bytes]], filename: Optional[str] = None, include: Optional[List[str]] = None) -> NodeResponse:
         """Update node content (file upload) - clean and simple."""
         return update_node_content(self, node_id, content, filename, include)
     
+    @invalidates
     async def update_content_async(self, node_id: str, content: Union[bytes, IO[bytes]], filename: Optional[str] = None, include: Optional[List[str]] = None) -> NodeResponse:
         """Update node content (file upload) (async) - clean and simple."""
         return await update_node_content_async(self, node_id, content, filename, include)
@@ -296,10 +452,12 @@ class NodesClient:
         """Create node (detailed async) - returns full HTTP response."""
         return await create_node_detailed_async(self, parent_id, request)
     
+    @invalidates(paths=True)
     def delete_detailed(self, node_id: str, permanent: bool = False):
         """Delete node (detailed) - returns full HTTP response."""
         return delete_node_detailed(self, node_id, permanent)
     
+    @invalidates(paths=True)
     async def delete_detailed_async(self, node_id: str, permanent: bool = False):
         """Delete node (detailed async) - returns full HTTP response."""
         return await delete_node_detailed_async(self, node_id, permanent)
@@ -312,10 +470,12 @@ class NodesClient:
         """List children (detailed async) - returns full HTTP response."""
         return await list_node_children_detailed_async(self, node_id, skip_count, max_items)
     
+    @invalidates(paths=True)
     def update_detailed(self, node_id: str, request: UpdateNodeRequest, include: Optional[List[Union[str, IncludeOption]]] = None):
         """Update node (detailed) - returns full HTTP response."""
         return update_node_detailed(self, node_id, request, include)
     
+    @invalidates(paths=True)
     async def update_detailed_async(self, node_id: str, request: UpdateNodeRequest, include: Optional[List[Union[str, IncludeOption]]] = None):
         """Update node (detailed async) - returns full HTTP response."""
         return await update_node_detailed_async(self, node_id, request, include)
@@ -328,34 +488,42 @@ class NodesClient:
         """Copy node (detailed async) - returns full HTTP response."""
         return await copy_node_detailed_async(self, node_id, request, include)
     
+    @invalidates(paths=True)
     def move_detailed(self, node_id: str, request: MoveNodeRequest, include: Optional[List[Union[str, IncludeOption]]] = None):
         """Move node (detailed) - returns full HTTP response."""
         return move_node_detailed(self, node_id, request, include)
     
+    @invalidates(paths=True)
     async def move_detailed_async(self, node_id: str, request: MoveNodeRequest, include: Optional[List[Union[str, IncludeOption]]] = None):
         """Move node (detailed async) - returns full HTTP response."""
         return await move_node_detailed_async(self, node_id, request, include)
     
+    @invalidates
     def lock_detailed(self, node_id: str, request: Optional[dict] = None, include: Optional[List[Union[str, str]]] = None):
         """Lock node (detailed) - returns full HTTP response."""
         return lock_node_detailed(self, node_id, request, include)
     
+    @invalidates
     async def lock_detailed_async(self, node_id: str, request: Optional[dict] = None, include: Optional[List[Union[str, str]]] = None):
         """Lock node (detailed async) - returns full HTTP response."""
         return await lock_node_detailed_async(self, node_id, request, include)
     
+    @invalidates
     def unlock_detailed(self, node_id: str, include: Optional[List[Union[str, str]]] = None):
         """Unlock node (detailed) - returns full HTTP response."""
         return unlock_node_detailed(self, node_id, include)
     
+    @invalidates
     async def unlock_detailed_async(self, node_id: str, include: Optional[List[Union[str, str]]] = None):
         """Unlock node (detailed async) - returns full HTTP response."""
         return await unlock_node_detailed_async(self, node_id, include)
     
+    @invalidates
     def update_content_detailed(self, node_id: str, content: Union[bytes, IO[bytes]], filename: Optional[str] = None, include: Optional[List[str]] = None):
         """Update node content (detailed) - returns full HTTP response."""
         return update_node_content_detailed(self, node_id, content, filename, include)
     
+    @invalidates
     async def update_content_detailed_async(self, node_id: str, content: Union[bytes, IO[bytes]], filename: Optional[str] = None, include: Optional[List[str]] = None):
         """Update node content (detailed async) - returns full HTTP response."""
         return await update_node_content_detailed_async(self, node_id, content, filename, include)
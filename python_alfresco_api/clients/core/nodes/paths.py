@@ -0,0 +1,236 @@
+"""
+Path resolver - cached path -> node id lookups.
+
+`nodes.get(node_id, relative_path="Sites/finance/documentLibrary/2024/Q3")`
+makes the repository walk the path on every request. The resolver keeps the
+segment -> node id mappings it has seen in a trie (one per base node) and
+only asks the server for the part of a path it does not know yet:
+
+    node_id = client.nodes.resolve_path("Sites/finance/documentLibrary/2024/Q3")
+    node = client.nodes.get_by_path("Sites/finance/documentLibrary/2024/Q3", include=["path"])
+
+- the longest cached prefix is resolved locally; the remainder is one
+  request relative to the prefix's node (include=path, fields=id,name,path),
+  whose path elements fill in every intermediate folder
+- move / update (rename) / delete through the nodes client (bulk operations
+  included) drop the trie subtrees below that node
+- entries older than `ttl` seconds are looked up again; past `max_nodes`
+  the trie is cleared
+
+Segments match exactly (no case folding); names changed by other processes
+are only seen after the TTL.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ...decoding import afetch_json, fetch_json
+
+# Base of paths without an explicit base_id: Company Home
+ROOT = "-root-"
+
+_PATH_FIELDS = ["id", "name", "path"]
+
+
+class _PathNode:
+    """One trie node: the node id of a path segment and its cached children."""
+
+    __slots__ = ("node_id", "children", "expires_at")
+
+    def __init__(self, node_id: str, expires_at: Optional[float] = None):
+        self.node_id = node_id
+        self.children: Dict[str, "_PathNode"] = {}
+        self.expires_at = expires_at
+
+
+def split_path(path: str) -> List[str]:
+    """Path segments ("/Sites//finance/" -> ["Sites", "finance"])."""
+    return [segment for segment in path.split("/") if segment]
+
+
+class PathResolver:
+    """
+    Trie of resolved path segments for one nodes client.
+
+    Args:
+        nodes_client: NodesClient the remaining segments are resolved through
+        ttl: Seconds a resolved segment stays valid (None = until invalidated)
+        max_nodes: Cached segments kept before the trie is cleared
+        clock: Monotonic clock (for tests)
+    """
+
+    def __init__(
+        self,
+        nodes_client: Any,
+        ttl: Optional[float] = 300.0,
+        max_nodes: int = 10000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.nodes_client = nodes_client
+        self.ttl = ttl
+        self.max_nodes = max_nodes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._roots: Dict[str, _PathNode] = {}
+        self._size = 0
+        self.hits = self.misses = 0
+
+    # ==================== RESOLUTION ====================
+
+    def resolve(self, path: str, base_id: str = ROOT) -> str:
+        """
+        Resolve a path relative to base_id to a node id.
+
+        Raises:
+            ValueError: The path does not exist
+        """
+        segments = split_path(path)
+        depth, prefix_id = self._lookup(base_id, segments)
+        if depth == len(segments):
+            return prefix_id
+        operation, kwargs = self._request(prefix_id, segments[depth:])
+        return self._store(path, base_id, segments, depth, fetch_json(operation, **kwargs))
+
+    async def resolve_async(self, path: str, base_id: str = ROOT) -> str:
+        """Resolve a path relative to base_id to a node id (async)."""
+        segments = split_path(path)
+        depth, prefix_id = self._lookup(base_id, segments)
+        if depth == len(segments):
+            return prefix_id
+        operation, kwargs = self._request(prefix_id, segments[depth:])
+        return self._store(path, base_id, segments, depth, await afetch_json(operation, **kwargs))
+
+    def _request(self, node_id: str, rest: List[str]) -> Tuple[Any, Dict[str, Any]]:
+        """
+        fetch_json() operation and arguments: get_node on the remainder, with the path elements.
+        """
+        from ....raw_clients.alfresco_core_client.core_client.api.nodes import get_node
+        return get_node, dict(
+            client=self.nodes_client.raw_client,
+            node_id=node_id,
+            relative_path="/".join(rest),
+            include=["path"],
+            fields=_PATH_FIELDS
+        )
+
+    # ==================== TRIE ====================
+
+    def _lookup(self, base_id: str, segments: List[str]) -> Tuple[int, str]:
+        """Walk the trie: (number of segments resolved, node id of the last one)."""
+        if not segments:
+            return 0, base_id
+        now = self._clock()
+        with self._lock:
+            node = self._roots.get(base_id)
+            if node is None:
+                self.misses += 1
+                return 0, base_id
+            depth = 0
+            for segment in segments:
+                child = node.children.get(segment)
+                if child is not None and child.expires_at is not None and child.expires_at <= now:
+                    self._size -= _count(child)
+                    del node.children[segment]
+                    child = None
+                if child is None:
+                    break
+                node = child
+                depth += 1
+            if depth == len(segments):
+                self.hits += 1
+            else:
+                self.misses += 1
+            return depth, node.node_id if depth else base_id
+
+    def _store(
+        self,
+        path: str,
+        base_id: str,
+        segments: List[str],
+        depth: int,
+        body: Optional[Dict[str, Any]],
+    ) -> str:
+        """Record the server's answer for segments[depth:]; returns the target's id."""
+        if body is None:
+            raise ValueError(f"Path '{path}' not found")
+        entry = body["entry"]
+        rest = segments[depth:]
+        # Ancestors of the target below the cached prefix, as returned by the server
+        elements = (entry.get("path") or {}).get("elements") or []
+        ancestors = elements[len(elements) - (len(rest) - 1):] if len(rest) > 1 else []
+        ids = [element.get("id") for element in ancestors] + [entry["id"]]
+        names = [element.get("name") for element in ancestors] + [entry.get("name")]
+        if len(ids) != len(rest) or names != rest:
+            # Not a primary path the elements describe (or names differ): do not cache
+            return entry["id"]
+
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            node = self._roots.get(base_id)
+            if node is None:
+                node = self._roots[base_id] = _PathNode(base_id)
+            for segment in segments[:depth]:
+                node = node.children.get(segment)
+                if node is None:
+                    # Invalidated meanwhile: skip caching this answer
+                    return entry["id"]
+            for segment, node_id in zip(rest, ids):
+                child = node.children.get(segment)
+                if child is None or child.node_id != node_id:
+                    if child is not None:
+                        self._size -= _count(child)
+                    child = node.children[segment] = _PathNode(node_id, expires_at)
+                    self._size += 1
+                else:
+                    child.expires_at = expires_at
+                node = child
+            if self._size > self.max_nodes:
+                self._roots.clear()
+                self._size = 0
+        return entry["id"]
+
+    def invalidate(self, node_id: str) -> int:
+        """Drop every cached path through node_id; returns the number of segments dropped."""
+        with self._lock:
+            dropped = 0
+            for root in list(self._roots.values()):
+                if root.node_id == node_id:
+                    dropped += _count(root) - 1
+                    root.children.clear()
+                    continue
+                dropped += _drop(root, node_id)
+            self._size -= dropped
+            return dropped
+
+    def clear(self) -> None:
+        """Drop all cached paths."""
+        with self._lock:
+            self._roots.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"PathResolver(size={self._size}, hits={self.hits}, misses={self.misses})"
+
+
+def _count(node: _PathNode) -> int:
+    """Number of trie nodes in a subtree, node included."""
+    return 1 + sum(_count(child) for child in node.children.values())
+
+
+def _drop(node: _PathNode, node_id: str) -> int:
+    """Remove the children of node (recursively) whose id is node_id; returns the nodes removed."""
+    dropped = 0
+    for segment, child in list(node.children.items()):
+        if child.node_id == node_id:
+            dropped += _count(child)
+            del node.children[segment]
+        else:
+            dropped += _drop(child, node_id)
+    return dropped
+
+
+__all__ = ['PathResolver', 'split_path', 'ROOT']
@@ -4,6 +4,7 @@ Clean function-based approach with 4 patterns: sync, async, detailed_sync, detai
 """
 
 from typing import Optional, List, Union
+from ...decoding import fetch_model, afetch_model
 from .models import NodeResponse, NodeListResponse
 
 
@@ -60,16 +61,16 @@ def unlock_node(
         include_params = include
     
     # Execute raw sync operation
-    result = unlock_node.sync(
+    result = fetch_model(
+        unlock_node, NodeResponse,
         client=raw_client,
         node_id=node_id,
         include=include_params
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to unlock node {node_id}")
-    return NodeResponse.model_validate(result.to_dict())
+    return result
 
 
 async def unlock_node_async(
@@ -107,16 +108,16 @@ async def unlock_node_async(
         include_params = include
     
     # Execute raw async operation
-    result = await unlock_node.asyncio(
+    result = await afetch_model(
+        unlock_node, NodeResponse,
         client=raw_client,
         node_id=node_id,
         include=include_params
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to unlock node {node_id}")
-    return NodeResponse.model_validate(result.to_dict())
+    return result
 
 
 def unlock_node_detailed(
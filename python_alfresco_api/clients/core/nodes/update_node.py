@@ -4,6 +4,7 @@ Clean function-based approach with 4 patterns: sync, async, detailed_sync, detai
 """
 
 from typing import Optional, List, Union
+from ...decoding import fetch_model, afetch_model
 from .models import (
     NodeResponse, NodeListResponse, CreateNodeRequest, UpdateNodeRequest,
     CopyNodeRequest, MoveNodeRequest, IncludeOption
@@ -89,17 +90,17 @@ def update_node(
     )
     
     # Execute raw sync operation - calls sync httpx directly
-    result = update_node.sync(
+    result = fetch_model(
+        update_node, NodeResponse,
         client=raw_client,
         node_id=node_id,
         body=body,
         include=include_params
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to update node {node_id}")
-    return NodeResponse.model_validate(result.to_dict())
+    return result
 
 
 async def update_node_async(
@@ -165,17 +166,17 @@ async def update_node_async(
     )
     
     # Execute raw operation
-    result = await update_node.asyncio(
+    result = await afetch_model(
+        update_node, NodeResponse,
         client=raw_client,
         node_id=node_id,
         body=body,
         include=include_params
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to update node {node_id}")
-    return NodeResponse.model_validate(result.to_dict())
+    return result
 
 
 def update_node_detailed(
@@ -5,6 +5,7 @@ Clean function-based approach with 4 patterns: sync, async, detailed_sync, detai
 
 import io
 from typing import Optional, List, Union, IO, BinaryIO
+from ...decoding import fetch_model, afetch_model
 from .models import NodeResponse, NodeListResponse
 
 
@@ -85,17 +86,17 @@ def update_node_content(
     )
     
     # Execute raw sync operation
-    result = update_node_content.sync(
+    result = fetch_model(
+        update_node_content, NodeResponse,
         client=raw_client,
         node_id=node_id,
         body=file_obj,
         include=include_params
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to update content for node {node_id}")
-    return NodeResponse.model_validate(result.to_dict())
+    return result
 
 
 async def update_node_content_async(
@@ -153,17 +154,17 @@ async def update_node_content_async(
     )
     
     # Execute raw async operation
-    result = await update_node_content.asyncio(
+    result = await afetch_model(
+        update_node_content, NodeResponse,
         client=raw_client,
         node_id=node_id,
         body=file_obj,
         include=include_params
     )
     
-    # Validate and return rich model
     if result is None:
         raise ValueError(f"Failed to update content for node {node_id}")
-    return NodeResponse.model_validate(result.to_dict())
+    return result
 
 
 def update_node_content_detailed(
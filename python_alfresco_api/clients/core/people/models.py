@@ -38,6 +38,25 @@ class PeopleListResponse(BaseModel):
     list: Dict[str, Any] = Field(..., description="List data with pagination")
 
 
+class PersonId(BaseModel):
+    """Slim person for the "ids" projection (fields=id)."""
+    model_config = ConfigDict(extra='allow')
+    
+    id: str = Field(..., description="User identifier")
+
+
+class PersonSummary(BaseModel):
+    """Slim person for the "listing" projection."""
+    model_config = ConfigDict(extra='allow')
+    
+    id: str = Field(..., description="User identifier")
+    display_name: Optional[str] = Field(None, alias="displayName", description="Display name")
+    first_name: Optional[str] = Field(None, alias="firstName", description="First name")
+    last_name: Optional[str] = Field(None, alias="lastName", description="Last name")
+    email: Optional[str] = Field(None, description="Email address")
+    enabled: Optional[bool] = Field(None, description="Whether the account is enabled")
+
+
 # Operation-specific models will be added here based on analysis
 # Example models for common patterns:
 
@@ -79,6 +98,8 @@ class UpdatePeopleRequest(BaseModel):
 __all__ = [
     'PeopleResponse', 
     'PeopleListResponse',
+    'PersonId',
+    'PersonSummary',
     'CreatePeopleRequest',
     'UpdatePeopleRequest'
 ]
\ No newline at end of file
@@ -6,9 +6,13 @@ Part of the three-tier V1.1 architecture with complete 4-pattern detailed functi
 """
 
 import asyncio
-from typing import Optional, List, Union, Any
+from typing import Optional, List, Union, Any, Iterator, AsyncIterator
 from httpx import Response
 
+from ...paging import paginate, apaginate
+from ...decoding import fetch_model, afetch_model, omit_none
+from ...projections import project, entry_model, paging_model
+
 # Import from Level 3 (operation-specific models)
 from .models import PeopleResponse, PeopleListResponse, CreatePeopleRequest
 
@@ -207,6 +211,52 @@ class PeopleClient:
             fields=fields if fields is not None else UNSET
         )
     
+    def iter_people(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        parallel: int = 1,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Iterate over all people, fetching pages lazily (sync). parallel=N keeps N pages in flight;
+        kwargs as for list_people() (or list_people_model() with projection).
+        """
+        fetch_page = self.list_people_model if "projection" in kwargs else self.list_people
+        return paginate(
+            fetch_page,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            parallel=parallel,
+            **kwargs,
+        )
+    
+    def iter_people_async(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        parallel: int = 1,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over all people, fetching pages lazily (async). parallel=N keeps N pages in flight;
+        kwargs as for list_people_async() (or list_people_model_async() with projection).
+        """
+        fetch_page = (
+            self.list_people_model_async if "projection" in kwargs else self.list_people_async
+        )
+        return apaginate(
+            fetch_page,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            parallel=parallel,
+            **kwargs,
+        )
+    
     def update_person(
         self,
         person_id: str,
@@ -267,6 +317,122 @@ class PeopleClient:
             fields=fields if fields is not None else UNSET
         )
     
+    # =================================================================
+    # SINGLE-PASS PYDANTIC VARIANTS
+    # =================================================================
+    
+    def get_person_model(
+        self,
+        person_id: str,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None
+    ):
+        """
+        Get person details as a Pydantic PersonEntry, decoded from the response body in one pass
+        (sync). projection="ids"/"listing"/"full" trims the entry (getPerson takes no include).
+        """
+        from ....models.alfresco_core_models import PersonEntry
+        
+        response_model = PersonEntry
+        if projection is not None:
+            _, fields, model = project("person", projection, fields=fields)
+            response_model = entry_model(model)
+        return fetch_model(
+            self._get_person,
+            response_model,
+            client=self.raw_client,
+            person_id=person_id,
+            **omit_none(fields=fields),
+        )
+    
+    async def get_person_model_async(
+        self,
+        person_id: str,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None
+    ):
+        """
+        Get person details as a Pydantic PersonEntry, decoded from the response body in one pass
+        (async). projection="ids"/"listing"/"full" trims the entry (getPerson takes no include).
+        """
+        from ....models.alfresco_core_models import PersonEntry
+        
+        response_model = PersonEntry
+        if projection is not None:
+            _, fields, model = project("person", projection, fields=fields)
+            response_model = entry_model(model)
+        return await afetch_model(
+            self._get_person,
+            response_model,
+            client=self.raw_client,
+            person_id=person_id,
+            **omit_none(fields=fields),
+        )
+    
+    def list_people_model(
+        self,
+        skip_count: Optional[int] = None,
+        max_items: Optional[int] = None,
+        order_by: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None
+    ):
+        """
+        List people as a Pydantic PersonPaging, decoded from the response body in one pass (sync).
+        projection="ids"/"listing"/"full" trims the entries.
+        """
+        from ....models.alfresco_core_models import PersonPaging
+        
+        response_model = PersonPaging
+        if projection is not None:
+            include, fields, model = project("person", projection, include, fields)
+            response_model = paging_model(model)
+        return fetch_model(
+            self._list_people,
+            response_model,
+            client=self.raw_client,
+            **omit_none(
+                skip_count=skip_count,
+                max_items=max_items,
+                order_by=order_by,
+                include=include,
+                fields=fields,
+            ),
+        )
+    
+    async def list_people_model_async(
+        self,
+        skip_count: Optional[int] = None,
+        max_items: Optional[int] = None,
+        order_by: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None
+    ):
+        """
+        List people as a Pydantic PersonPaging, decoded from the response body in one pass (async).
+        projection="ids"/"listing"/"full" trims the entries.
+        """
+        from ....models.alfresco_core_models import PersonPaging
+        
+        response_model = PersonPaging
+        if projection is not None:
+            include, fields, model = project("person", projection, include, fields)
+            response_model = paging_model(model)
+        return await afetch_model(
+            self._list_people,
+            response_model,
+            client=self.raw_client,
+            **omit_none(
+                skip_count=skip_count,
+                max_items=max_items,
+                order_by=order_by,
+                include=include,
+                fields=fields,
+            ),
+        )
+    
     def __repr__(self) -> str:
         """String representation for debugging."""
         base_url = getattr(self.parent_client._client_factory, 'base_url', 'unknown')
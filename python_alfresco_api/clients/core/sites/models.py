@@ -38,6 +38,24 @@ class SitesListResponse(BaseModel):
     list: Dict[str, Any] = Field(..., description="List data with pagination")
 
 
+class SiteId(BaseModel):
+    """Slim site for the "ids" projection (fields=id)."""
+    model_config = ConfigDict(extra='allow')
+    
+    id: str = Field(..., description="Site identifier")
+
+
+class SiteSummary(BaseModel):
+    """Slim site for the "listing" projection."""
+    model_config = ConfigDict(extra='allow')
+    
+    id: str = Field(..., description="Site identifier")
+    guid: Optional[str] = Field(None, description="Site node id")
+    title: Optional[str] = Field(None, description="Site title")
+    description: Optional[str] = Field(None, description="Site description")
+    visibility: Optional[str] = Field(None, description="PUBLIC, PRIVATE or MODERATED")
+
+
 # Operation-specific models will be added here based on analysis
 # Example models for common patterns:
 
@@ -79,6 +97,8 @@ class UpdateSitesRequest(BaseModel):
 __all__ = [
     'SitesResponse', 
     'SitesListResponse',
+    'SiteId',
+    'SiteSummary',
     'CreateSitesRequest',
     'UpdateSitesRequest'
 ]
\ No newline at end of file
@@ -6,9 +6,13 @@ Part of the three-tier V1.1 architecture with complete 4-pattern detailed functi
 """
 
 import asyncio
-from typing import Optional, List, Union, Any
+from typing import Optional, List, Union, Any, Iterator, AsyncIterator
 from httpx import Response
 
+from ...paging import paginate, apaginate
+from ...decoding import fetch_model, afetch_model, omit_none
+from ...projections import project, entry_model, paging_model
+
 # Import from Level 3 (operation-specific models)
 from .models import SitesResponse, SitesListResponse, CreateSitesRequest
 
@@ -241,6 +245,77 @@ class SitesClient:
             where=where if where is not None else UNSET
         )
     
+    def _list_sites_page(
+        self, skip_count: int, max_items: int, projection: Optional[str] = None, **kwargs
+    ) -> Response:
+        # The generated list_sites does not parse its 200 body; page from the detailed response
+        from ....raw_clients.alfresco_core_client.core_client.types import UNSET
+        
+        if projection is not None:
+            _, kwargs["fields"], _ = project("site", projection, fields=kwargs.get("fields"))
+        params = {key: UNSET if value is None else value for key, value in kwargs.items()}
+        return self._list_sites.sync_detailed(
+            client=self.raw_client, skip_count=skip_count, max_items=max_items, **params
+        )
+    
+    async def _list_sites_page_async(
+        self, skip_count: int, max_items: int, projection: Optional[str] = None, **kwargs
+    ) -> Response:
+        from ....raw_clients.alfresco_core_client.core_client.types import UNSET
+        
+        if projection is not None:
+            _, kwargs["fields"], _ = project("site", projection, fields=kwargs.get("fields"))
+        params = {key: UNSET if value is None else value for key, value in kwargs.items()}
+        return await self._list_sites.asyncio_detailed(
+            client=self.raw_client, skip_count=skip_count, max_items=max_items, **params
+        )
+    
+    def iter_sites(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        parallel: int = 1,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Iterate over all sites, fetching pages lazily (sync). parallel=N keeps N pages in flight;
+        kwargs: order_by, relations, fields, where, projection.
+        """
+        if not RAW_OPERATIONS_AVAILABLE:
+            raise ImportError("Raw sites operations not available")
+        return paginate(
+            self._list_sites_page,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            parallel=parallel,
+            **kwargs,
+        )
+    
+    def iter_sites_async(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        parallel: int = 1,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over all sites, fetching pages lazily (async). parallel=N keeps N pages in flight;
+        kwargs: order_by, relations, fields, where, projection.
+        """
+        if not RAW_OPERATIONS_AVAILABLE:
+            raise ImportError("Raw sites operations not available")
+        return apaginate(
+            self._list_sites_page_async,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            parallel=parallel,
+            **kwargs,
+        )
+    
     def update_site(
         self,
         site_id: str,
@@ -335,6 +410,128 @@ class SitesClient:
             permanent=permanent if permanent is not None else UNSET
         )
     
+    # =================================================================
+    # SINGLE-PASS PYDANTIC VARIANTS
+    # =================================================================
+    
+    def get_site_model(
+        self,
+        site_id: str,
+        relations: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None
+    ):
+        """
+        Get site details as a Pydantic SiteEntry, decoded from the response body in one pass (sync).
+        projection="ids"/"listing"/"full" trims the entry.
+        """
+        from ....models.alfresco_core_models import SiteEntry
+        
+        response_model = SiteEntry
+        if projection is not None:
+            _, fields, model = project("site", projection, fields=fields)
+            response_model = entry_model(model)
+        return fetch_model(
+            self._get_site,
+            response_model,
+            client=self.raw_client,
+            site_id=site_id,
+            **omit_none(relations=relations, fields=fields),
+        )
+    
+    async def get_site_model_async(
+        self,
+        site_id: str,
+        relations: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None
+    ):
+        """
+        Get site details as a Pydantic SiteEntry, decoded from the response body in one pass
+        (async). projection="ids"/"listing"/"full" trims the entry.
+        """
+        from ....models.alfresco_core_models import SiteEntry
+        
+        response_model = SiteEntry
+        if projection is not None:
+            _, fields, model = project("site", projection, fields=fields)
+            response_model = entry_model(model)
+        return await afetch_model(
+            self._get_site,
+            response_model,
+            client=self.raw_client,
+            site_id=site_id,
+            **omit_none(relations=relations, fields=fields),
+        )
+    
+    def list_sites_model(
+        self,
+        skip_count: Optional[int] = None,
+        max_items: Optional[int] = None,
+        order_by: Optional[List[str]] = None,
+        relations: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        projection: Optional[str] = None
+    ):
+        """
+        List sites as a Pydantic SitePaging, decoded from the response body in one pass (sync).
+        projection="ids"/"listing"/"full" trims the entries.
+        """
+        from ....models.alfresco_core_models import SitePaging
+        
+        response_model = SitePaging
+        if projection is not None:
+            _, fields, model = project("site", projection, fields=fields)
+            response_model = paging_model(model)
+        return fetch_model(
+            self._list_sites,
+            response_model,
+            client=self.raw_client,
+            **omit_none(
+                skip_count=skip_count,
+                max_items=max_items,
+                order_by=order_by,
+                relations=relations,
+                fields=fields,
+                where=where,
+            ),
+        )
+    
+    async def list_sites_model_async(
+        self,
+        skip_count: Optional[int] = None,
+        max_items: Optional[int] = None,
+        order_by: Optional[List[str]] = None,
+        relations: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        projection: Optional[str] = None
+    ):
+        """
+        List sites as a Pydantic SitePaging, decoded from the response body in one pass (async).
+        projection="ids"/"listing"/"full" trims the entries.
+        """
+        from ....models.alfresco_core_models import SitePaging
+        
+        response_model = SitePaging
+        if projection is not None:
+            _, fields, model = project("site", projection, fields=fields)
+            response_model = paging_model(model)
+        return await afetch_model(
+            self._list_sites,
+            response_model,
+            client=self.raw_client,
+            **omit_none(
+                skip_count=skip_count,
+                max_items=max_items,
+                order_by=order_by,
+                relations=relations,
+                fields=fields,
+                where=where,
+            ),
+        )
+    
     def __repr__(self) -> str:
         """String representation for debugging."""
         base_url = getattr(self.parent_client._client_factory, 'base_url', 'unknown')
@@ -6,9 +6,11 @@ Part of the three-tier V1.1 architecture with complete 4-pattern detailed functi
 """
 
 import asyncio
-from typing import Optional, List, Union, Any
+from typing import Optional, List, Union, Any, Iterator, AsyncIterator
 from httpx import Response
 
+from ...paging import paginate, apaginate
+
 # Import from Level 3 (operation-specific models)
 from .models import TrashcanResponse, TrashcanListResponse, CreateTrashcanRequest
 
@@ -117,6 +119,48 @@ class TrashcanClient:
             include=include if include is not None else UNSET
         )
     
+    def iter_deleted_nodes(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        parallel: int = 1,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Iterate over all deleted nodes, fetching pages lazily (sync). parallel=N keeps N pages in
+        flight; kwargs as for list_deleted_nodes().
+        """
+        return paginate(
+            self.list_deleted_nodes,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            parallel=parallel,
+            **kwargs,
+        )
+    
+    def iter_deleted_nodes_async(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        parallel: int = 1,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over all deleted nodes, fetching pages lazily (async). parallel=N keeps N pages in
+        flight; kwargs as for list_deleted_nodes_async().
+        """
+        return apaginate(
+            self.list_deleted_nodes_async,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            parallel=parallel,
+            **kwargs,
+        )
+    
     # =================================================================
     # GET DELETED NODE
     # =================================================================
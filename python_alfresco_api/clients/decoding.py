@@ -0,0 +1,147 @@
+"""
+Single-pass JSON decoding for high-level wrappers.
+
+The generated raw operations parse every response into attrs models
+(`from_dict`, parsing each timestamp). Wrappers returning Pydantic
+models then called `.to_dict()` (re-serializing the datetimes) and
+`model_validate()` (parsing them again): three decodes per entry.
+
+fetch_model() / afetch_model() reuse the raw operation's `_get_kwargs()` to
+build the request, send it through the raw client's (shared, authenticated)
+httpx client, and feed `response.content` straight into Pydantic's
+`model_validate_json()` - one pass in pydantic-core, no attrs objects.
+Validation uses the current validation profile (see validation.py). Request
+bodies are encoded, and fetch_json() bodies parsed, with the factory's JSON
+codec (see json_codec.py).
+
+A 404 decodes to None (like the raw `.sync()`); other error statuses raise:
+errors.UnexpectedStatus for statuses the operation does not document when the
+client sets raise_on_unexpected_status (as its `_parse_response()` does),
+httpx.HTTPStatusError otherwise.
+
+    node = fetch_model(get_node, NodeResponse, client=raw_client, node_id="-root-")
+"""
+
+from typing import Any, Dict, Optional, Type, TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+from ..json_codec import client_codec, encode_request
+from .validation import validate_json
+
+T = TypeVar('T', bound=BaseModel)
+
+
+def omit_none(**params) -> Dict[str, Any]:
+    """Drop None arguments so the generated operation's defaults apply."""
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def _request_kwargs(operation: Any, client: Any, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """The operation's httpx request arguments, with any JSON body encoded by the client's codec."""
+    return encode_request(operation._get_kwargs(**kwargs), client_codec(client))
+
+
+def _has_body(response: httpx.Response, operation: Any = None, client: Any = None) -> bool:
+    """
+    Whether a response carries a 2xx body to decode (False for 404 Not Found
+    and empty bodies); raises for any other status.
+    """
+    if 200 <= response.status_code < 300:
+        return bool(response.content)
+    if operation is not None and client is not None:
+        # UnexpectedStatus for undocumented statuses under raise_on_unexpected_status
+        operation._parse_response(client=client, response=response)
+    if response.status_code == 404:
+        return False
+    response.raise_for_status()
+    return False
+
+
+def decode_model(
+    response: httpx.Response, model: Type[T], *, operation: Any = None, client: Any = None
+) -> Optional[T]:
+    """
+    Validate a JSON response body into `model` in one pass, under the
+    current validation profile.
+
+    Args:
+        response: httpx response of the operation
+        model: Pydantic response model
+        operation: Generated operation module, to honour raise_on_unexpected_status
+        client: Raw client the request went through
+
+    Returns:
+        The model for 2xx responses with a body; None for 404 or an empty body
+
+    Raises:
+        errors.UnexpectedStatus: Undocumented status and client.raise_on_unexpected_status
+        httpx.HTTPStatusError: Any other error status
+    """
+    if not _has_body(response, operation, client):
+        return None
+    return validate_json(model, response.content)
+
+
+def fetch_model(operation: Any, model: Type[T], *, client: Any, **kwargs) -> Optional[T]:
+    """
+    Run a generated raw operation and decode its body straight into `model`.
+
+    Args:
+        operation: Generated operation module (e.g. api.nodes.get_node)
+        model: Pydantic response model
+        client: Raw AuthenticatedClient
+        **kwargs: The operation's own arguments (node_id, include, body, ...)
+
+    Returns:
+        Validated model, or None for 404 / an empty body (other error statuses
+        raise, see decode_model())
+    """
+    response = client.get_httpx_client().request(**_request_kwargs(operation, client, kwargs))
+    return decode_model(response, model, operation=operation, client=client)
+
+
+async def afetch_model(operation: Any, model: Type[T], *, client: Any, **kwargs) -> Optional[T]:
+    """Async version of fetch_model()."""
+    response = await client.get_async_httpx_client().request(
+        **_request_kwargs(operation, client, kwargs)
+    )
+    return decode_model(response, model, operation=operation, client=client)
+
+
+def decode_json(
+    response: httpx.Response, *, operation: Any = None, client: Any = None
+) -> Optional[Any]:
+    """
+    Parse a JSON response body without any validation (None for 404 / empty; raises like
+    decode_model()).
+    """
+    if not _has_body(response, operation, client):
+        return None
+    return response.json()
+
+
+def fetch_json(operation: Any, *, client: Any, **kwargs) -> Optional[Any]:
+    """Run a generated raw operation and return its parsed JSON body (used by the lazy views)."""
+    response = client.get_httpx_client().request(**_request_kwargs(operation, client, kwargs))
+    return decode_json(response, operation=operation, client=client)
+
+
+async def afetch_json(operation: Any, *, client: Any, **kwargs) -> Optional[Any]:
+    """Async version of fetch_json()."""
+    response = await client.get_async_httpx_client().request(
+        **_request_kwargs(operation, client, kwargs)
+    )
+    return decode_json(response, operation=operation, client=client)
+
+
+__all__ = [
+    'decode_model',
+    'fetch_model',
+    'afetch_model',
+    'decode_json',
+    'fetch_json',
+    'afetch_json',
+    'omit_none',
+]
@@ -13,9 +13,12 @@ from .model_client import AlfrescoModelClient
 # Import all submodules to ensure they get packaged
 from . import types, aspects, models
 
+# Disk-cached types and aspects (client.model.dictionary)
+from .dictionary import ModelDictionary
+
 # Export the client class and submodules
 __all__ = [
-    'AlfrescoModelClient', 'ModelResponse', 'ModelRequest',
+    'AlfrescoModelClient', 'ModelResponse', 'ModelRequest', 'ModelDictionary',
     # Lazy-loaded submodules and models
     'types', 'aspects', 'models'
 ]
\ No newline at end of file
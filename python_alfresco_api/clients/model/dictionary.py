@@ -0,0 +1,346 @@
+"""
+Model dictionary - the repository's types and aspects, cached on disk.
+
+Content models change rarely, but every get_type() / get_aspect() is a
+request. The dictionary pulls all type and aspect definitions once (paged
+list_types / list_aspects with their properties), writes them to a local
+file keyed by the repository id and version from the discovery API, and
+answers lookups from that file on later runs:
+
+    dictionary = client.model.dictionary          # AlfrescoModelClient
+    dictionary.get_type("cm:content")             # dict (the API's entry)
+    dictionary.get_aspect("cm:titled")
+    dictionary.get_property("cm:title")           # property definition, from any type or aspect
+    dictionary.refresh()                          # re-pull after a model change
+
+File layout (one file per server URL, in ~/.cache/python-alfresco-api by
+default): a magic line, one JSON header line with the server key and an
+index of name -> (offset, length), then the definitions' JSON back to back.
+The file is memory-mapped: loading parses only the header, and each
+definition is decoded on first lookup.
+
+On first use the server key is checked against the discovery API (one
+request) and the file is rebuilt when the repository changed;
+check_version=False trusts an existing file without any request.
+"""
+
+import mmap
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..decoding import afetch_json, fetch_json
+from ..paging import apaginate, paginate
+from ...json_codec import STDLIB_CODEC, JsonCodec
+
+MAGIC = b"ALFRESCO-MODEL-DICTIONARY 1\n"
+
+TYPES = "types"
+ASPECTS = "aspects"
+
+# Optional fields requested with every definition
+INCLUDE = ["properties", "mandatoryAspects", "associations"]
+
+PAGE_SIZE = 100
+
+
+def default_cache_dir() -> Path:
+    """$XDG_CACHE_HOME/python-alfresco-api (~/.cache/python-alfresco-api)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "python-alfresco-api"
+
+
+def default_cache_path(base_url: str) -> Path:
+    """Dictionary file for one server URL."""
+    name = re.sub(r"[^A-Za-z0-9.-]+", "_", base_url.split("://", 1)[-1]).strip("_")
+    return default_cache_dir() / f"model-{name}.dict"
+
+
+def server_key(discovery: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Repository id and version from a discovery response ("<id>/<display> (schema <n>)")."""
+    repository = ((discovery or {}).get("entry") or {}).get("repository") or {}
+    version = repository.get("version") or {}
+    if not repository:
+        return None
+    return f"{repository.get('id')}/{version.get('display')} (schema {version.get('schema')})"
+
+
+def write_dictionary(
+    path: Path,
+    key: Optional[str],
+    definitions: Dict[str, List[Dict[str, Any]]],
+    codec: JsonCodec = STDLIB_CODEC
+) -> None:
+    """Write definitions ({"types": [...], "aspects": [...]}) to path atomically."""
+    blobs: List[bytes] = []
+    index: Dict[str, Dict[str, Tuple[int, int]]] = {}
+    properties: Dict[str, Tuple[str, str]] = {}
+    offset = 0
+    for kind in (TYPES, ASPECTS):
+        index[kind] = {}
+        for definition in definitions.get(kind, ()):
+            blob = codec.dumps(definition)
+            index[kind][definition["id"]] = (offset, len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+            for prop in definition.get("properties") or ():
+                # Inherited properties are listed by several classes: index the first
+                properties.setdefault(prop["id"], (kind, definition["id"]))
+    header = codec.dumps(
+        {"server": key, "created": time.time(), "index": index, "properties": properties}
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(header + b"\n")
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class ModelDictionary:
+    """
+    Disk-backed, memory-mapped dictionary of a repository's types and aspects.
+
+    Args:
+        model_client: AlfrescoModelClient the definitions are pulled through
+        path: Dictionary file (default: per server URL under ~/.cache/python-alfresco-api)
+        check_version: Compare the file's server key with the discovery API on first use
+        codec: JSON codec for the file (default: the factory's)
+    """
+
+    def __init__(
+        self,
+        model_client: Any,
+        path: Optional[os.PathLike] = None,
+        check_version: bool = True,
+        codec: Optional[JsonCodec] = None
+    ):
+        factory = model_client._client_factory
+        self.model_client = model_client
+        self.path = Path(path) if path is not None else default_cache_path(factory.base_url)
+        self.check_version = check_version
+        self.codec = codec or getattr(factory, "json_codec", STDLIB_CODEC)
+        self._lock = threading.RLock()
+        self._map: Optional[mmap.mmap] = None
+        self._header: Optional[Dict[str, Any]] = None
+        self._start = 0
+        self._decoded: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    # ==================== LOOKUPS ====================
+
+    def get_type(self, name: str) -> Optional[Dict[str, Any]]:
+        """Type definition (e.g. "cm:content"), or None if the repository has no such type."""
+        return self._definition(TYPES, name)
+
+    def get_aspect(self, name: str) -> Optional[Dict[str, Any]]:
+        """Aspect definition (e.g. "cm:titled"), or None."""
+        return self._definition(ASPECTS, name)
+
+    def get_property(self, name: str) -> Optional[Dict[str, Any]]:
+        """Property definition (e.g. "cm:title") from a type or aspect listing it, or None."""
+        owner = self._loaded()["properties"].get(name)
+        if owner is None:
+            return None
+        definition = self._definition(*owner)
+        properties = definition.get("properties") or ()
+        return next((prop for prop in properties if prop["id"] == name), None)
+
+    def type_names(self) -> List[str]:
+        """Names of all types."""
+        return list(self._loaded()["index"][TYPES])
+
+    def aspect_names(self) -> List[str]:
+        """Names of all aspects."""
+        return list(self._loaded()["index"][ASPECTS])
+
+    def iter_types(self) -> Iterator[Dict[str, Any]]:
+        """All type definitions."""
+        for name in self.type_names():
+            yield self.get_type(name)
+
+    def iter_aspects(self) -> Iterator[Dict[str, Any]]:
+        """All aspect definitions."""
+        for name in self.aspect_names():
+            yield self.get_aspect(name)
+
+    @property
+    def server(self) -> Optional[str]:
+        """Server key the loaded file was built for."""
+        return self._loaded()["server"]
+
+    def __contains__(self, name: str) -> bool:
+        index = self._loaded()["index"]
+        return name in index[TYPES] or name in index[ASPECTS]
+
+    def __len__(self) -> int:
+        index = self._loaded()["index"]
+        return len(index[TYPES]) + len(index[ASPECTS])
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._header is not None else "not loaded"
+        return f"ModelDictionary(path='{self.path}', {state})"
+
+    # ==================== LOADING ====================
+
+    def load(self) -> "ModelDictionary":
+        """Map the file, pulling the definitions first if it is missing or stale."""
+        with self._lock:
+            if self._header is not None:
+                return self
+            key = self._server_key() if self.check_version else None
+            if not self._open(key):
+                self._build(key, self._pull())
+            return self
+
+    async def load_async(self) -> "ModelDictionary":
+        """Map the file, pulling the definitions (async) first if it is missing or stale."""
+        if self._header is not None:
+            return self
+        key = await self._server_key_async() if self.check_version else None
+        if not self._open(key):
+            self._build(key, await self._pull_async())
+        return self
+
+    def refresh(self) -> "ModelDictionary":
+        """Pull every definition again and rewrite the file."""
+        with self._lock:
+            self._build(self._server_key(), self._pull())
+            return self
+
+    async def refresh_async(self) -> "ModelDictionary":
+        """Pull every definition again (async) and rewrite the file."""
+        key = await self._server_key_async()
+        self._build(key, await self._pull_async())
+        return self
+
+    def close(self) -> None:
+        """Unmap the file (the next lookup loads it again)."""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+            self._map = None
+            self._header = None
+            self._decoded = {}
+
+    def _loaded(self) -> Dict[str, Any]:
+        header = self._header
+        if header is None:
+            header = self.load()._header
+        return header
+
+    def _definition(self, kind: str, name: str) -> Optional[Dict[str, Any]]:
+        definition = self._decoded.get((kind, name))
+        if definition is not None:
+            return definition
+        location = self._loaded()["index"][kind].get(name)
+        if location is None:
+            return None
+        offset, length = location
+        with self._lock:
+            start = self._start + offset
+            definition = self.codec.loads(self._map[start:start + length])
+        self._decoded[(kind, name)] = definition
+        return definition
+
+    def _open(self, key: Optional[str]) -> bool:
+        """Map the file if it exists and matches key (any key when None); False otherwise."""
+        try:
+            with open(self.path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            # ValueError: empty file
+            return False
+        header_end = mapped.find(b"\n", len(MAGIC))
+        try:
+            if mapped[:len(MAGIC)] != MAGIC or header_end < 0:
+                raise ValueError("not a model dictionary")
+            header = self.codec.loads(mapped[len(MAGIC):header_end])
+            if not isinstance(header, dict) or not isinstance(header.get("index"), dict):
+                raise ValueError("not a model dictionary")
+        except Exception:
+            # Truncated or foreign file (decode errors differ per codec): rebuild it
+            mapped.close()
+            return False
+        if key is not None and header.get("server") != key:
+            mapped.close()
+            return False
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+            self._map, self._header, self._start = mapped, header, header_end + 1
+            self._decoded = {}
+        return True
+
+    def _build(self, key: Optional[str], definitions: Dict[str, List[Dict[str, Any]]]) -> None:
+        write_dictionary(self.path, key, definitions, self.codec)
+        if not self._open(None):
+            raise ValueError(f"Could not read back model dictionary '{self.path}'")
+
+    # ==================== SERVER ====================
+
+    def _discovery_client(self) -> Any:
+        return self.model_client._client_factory.create_discovery_client().raw_client
+
+    def _server_key(self) -> Optional[str]:
+        from ...raw_clients.alfresco_discovery_client.discovery_client.api.discovery import (
+            get_repository_information
+        )
+        return server_key(fetch_json(get_repository_information, client=self._discovery_client()))
+
+    async def _server_key_async(self) -> Optional[str]:
+        from ...raw_clients.alfresco_discovery_client.discovery_client.api.discovery import (
+            get_repository_information
+        )
+        information = await afetch_json(get_repository_information, client=self._discovery_client())
+        return server_key(information)
+
+    def _list(self, kind: str):
+        """list_types / list_aspects page fetcher returning the parsed JSON page."""
+        from ...raw_clients.alfresco_model_client.model_client.api.aspects import list_aspects
+        from ...raw_clients.alfresco_model_client.model_client.api.types import list_types
+        operation = list_types if kind == TYPES else list_aspects
+        raw_client = self.model_client.raw_client
+
+        # A failed page raises (httpx.HTTPStatusError; a 404 gives None, which the pager rejects)
+        def fetch(skip_count: int, max_items: int) -> Optional[Dict[str, Any]]:
+            return fetch_json(
+                operation, client=raw_client, skip_count=skip_count, max_items=max_items,
+                include=INCLUDE
+            )
+
+        async def fetch_async(skip_count: int, max_items: int) -> Optional[Dict[str, Any]]:
+            return await afetch_json(
+                operation, client=raw_client, skip_count=skip_count, max_items=max_items,
+                include=INCLUDE
+            )
+
+        return fetch, fetch_async
+
+    def _pull(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {
+            kind: list(paginate(self._list(kind)[0], page_size=PAGE_SIZE))
+            for kind in (TYPES, ASPECTS)
+        }
+
+    async def _pull_async(self) -> Dict[str, List[Dict[str, Any]]]:
+        definitions = {}
+        for kind in (TYPES, ASPECTS):
+            pages = apaginate(self._list(kind)[1], page_size=PAGE_SIZE)
+            definitions[kind] = [definition async for definition in pages]
+        return definitions
+
+
+__all__ = [
+    'ModelDictionary', 'write_dictionary', 'server_key', 'default_cache_path', 'default_cache_dir'
+]
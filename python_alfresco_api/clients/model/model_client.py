@@ -27,6 +27,7 @@ class AlfrescoModelClient:
         # Lazy-loaded subsection clients
         self._types = None
         self._aspects = None
+        self._dictionary = None
         
         # Client instances - initialized on first access
         self._raw_client = None
@@ -86,7 +87,8 @@ class AlfrescoModelClient:
             "base_url": f"{self._client_factory.base_url}/alfresco/api/-default-/private/model/versions/1",
             "token": self._client_factory.auth.get_auth_token(),
             "prefix": self._client_factory.auth.get_auth_prefix(),
-            "verify_ssl": self._client_factory.verify_ssl
+            "verify_ssl": self._client_factory.verify_ssl,
+            "httpx_args": self._client_factory.get_httpx_args()
         }
         
         # Only add timeout if specified (not None)
@@ -166,6 +168,24 @@ class AlfrescoModelClient:
                 return None
         return self._aspects
     
+    @property
+    def dictionary(self):
+        """
+        Disk-cached dictionary of all types and aspects (see dictionary.py).
+        
+        Pulled once per repository version; get_type() / get_aspect() /
+        get_property() are then answered locally. Assign a ModelDictionary
+        to use another file or check_version=False.
+        """
+        if self._dictionary is None:
+            from .dictionary import ModelDictionary
+            self._dictionary = ModelDictionary(self)
+        return self._dictionary
+    
+    @dictionary.setter
+    def dictionary(self, dictionary):
+        self._dictionary = dictionary
+    
     def __repr__(self) -> str:
         """String representation for debugging."""
         base_url = getattr(self._client_factory, 'base_url', 'unknown')
@@ -16,7 +16,7 @@ Benefits:
 - Maintainability (focused files vs massive single files)
 """
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Generic, TypeVar
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
@@ -106,5 +106,32 @@ class UserInfo(BaseModel):
     email: Optional[str] = Field(None, description="User email address")
 
 
+EntryT = TypeVar("EntryT")
+
+
+class Entry(BaseModel, Generic[EntryT]):
+    """`{"entry": ...}` response wrapper around any entry model (e.g. a projection's slim model)."""
+    model_config = ConfigDict(extra='allow')
+    
+    entry: EntryT = Field(..., description="Entry data")
+
+
+class EntryList(BaseModel, Generic[EntryT]):
+    """The `list` object of a paged response: pagination plus wrapped entries."""
+    model_config = ConfigDict(extra='allow')
+    
+    pagination: Optional[Dict[str, Any]] = Field(
+        None, description="Alfresco pagination (camelCase keys)"
+    )
+    entries: List[Entry[EntryT]] = Field(default_factory=list, description="Wrapped entries")
+
+
+class EntryPaging(BaseModel, Generic[EntryT]):
+    """Paged response wrapper, typed by entry model."""
+    model_config = ConfigDict(extra='allow')
+    
+    list: EntryList[EntryT] = Field(..., description="List data with pagination")
+
+
 # Forward reference resolution
 ErrorResponse.model_rebuild()
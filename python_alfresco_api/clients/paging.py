@@ -0,0 +1,413 @@
+"""
+Auto-pagination for Alfresco list operations.
+
+Every Alfresco list endpoint returns one page per request:
+
+    {"list": {"entries": [{"entry": ...}, ...],
+              "pagination": {"hasMoreItems": ..., "totalItems": ...}}}
+
+These helpers drive skip_count / max_items for the caller and yield entries lazily:
+
+    for node in paginate(client.nodes.list_children, "-root-", page_size=500):
+        ...
+
+    async for node in apaginate(client.nodes.list_children_async, "-root-", prefetch=True):
+        ...
+
+With prefetch=True the next page is requested as soon as the current one
+arrives, so the network round trip overlaps with the caller's processing
+(a worker thread for the sync pager, a task for the async one).
+
+With parallel=N, once the first page reports pagination.totalItems the
+remaining skip_count offsets are known up front, so up to N pages are fetched
+concurrently and yielded back in order: O(pages / N x RTT) instead of
+O(pages x RTT). Without totalItems the pager falls back to sequential paging.
+Offsets step by the first page's actual size (servers cap maxItems), and a
+page shorter than requested switches back to sequential paging from its end.
+
+Works with any list wrapper accepting skip_count / max_items keywords, and
+understands pydantic list responses, raw attrs *Paging models, plain dicts,
+lazy ListViews and raw detailed Response objects.
+"""
+
+import asyncio
+import itertools
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator, List, Mapping, Optional, Tuple
+
+from .models import PagingInfo
+from .views import ListView
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def _is_unset(value: Any) -> bool:
+    # Each raw client package has its own Unset sentinel class
+    return value is None or type(value).__name__ == "Unset"
+
+
+def _field(obj: Any, name: str, key: str) -> Any:
+    """Read a field from a dict (camelCase key) or an attrs/pydantic object (snake_case name)."""
+    if _is_unset(obj):
+        return None
+    value = obj.get(key) if isinstance(obj, Mapping) else getattr(obj, name, None)
+    return None if _is_unset(value) else value
+
+
+def _unwrap(entry: Any) -> Any:
+    """Strip the {"entry": ...} wrapper of a list element."""
+    inner = _field(entry, "entry", "entry")
+    return entry if inner is None else inner
+
+
+class Page:
+    """One page of a list response."""
+
+    __slots__ = ("entries", "pagination", "skip_count", "response")
+
+    def __init__(self, entries: List[Any], pagination: PagingInfo, skip_count: int, response: Any):
+        self.entries = entries
+        self.pagination = pagination
+        self.skip_count = skip_count
+        self.response = response
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"Page(skip_count={self.skip_count}, count={len(self.entries)}, "
+            f"has_more_items={self.pagination.has_more_items})"
+        )
+
+    def has_more(self, requested: int) -> bool:
+        """Whether another page should be requested after this one."""
+        if not self.entries:
+            return False
+        if self.pagination.has_more_items is not None:
+            return self.pagination.has_more_items
+        if self.pagination.total_items is not None:
+            return self.pagination.total_items > self.skip_count + len(self.entries)
+        return len(self.entries) >= requested
+
+
+def read_page(response: Any, skip_count: int = 0) -> Page:
+    """
+    Normalize a list response into a Page.
+
+    Args:
+        response: Pydantic list response, raw *Paging model, dict, ListView or raw Response
+        skip_count: Offset the page was requested at
+
+    Returns:
+        Page: Entries (as returned, wrapper kept) plus pagination info
+
+    Raises:
+        ValueError: Failed request (no parsed result or non-2xx status)
+    """
+    if hasattr(response, "status_code") and hasattr(response, "parsed"):
+        status = int(response.status_code)
+        if not 200 <= status < 300:
+            raise ValueError(f"List request failed with HTTP {status}")
+        # Some generated list operations do not parse their 200 response
+        response = response.parsed if response.parsed is not None else json.loads(response.content)
+    if response is None:
+        raise ValueError("List request returned no result")
+    if isinstance(response, ListView):
+        return Page(response.entries, response.pagination, skip_count, response)
+
+    container = _field(response, "list_", "list")
+    if container is None:
+        container = _field(response, "list", "list")
+    entries = _field(container, "entries", "entries") or []
+    pagination = _field(container, "pagination", "pagination")
+    info = PagingInfo(
+        count=_field(pagination, "count", "count"),
+        has_more_items=_field(pagination, "has_more_items", "hasMoreItems"),
+        total_items=_field(pagination, "total_items", "totalItems"),
+        skip_count=_field(pagination, "skip_count", "skipCount"),
+        max_items=_field(pagination, "max_items", "maxItems"),
+    )
+    return Page(list(entries), info, skip_count, response)
+
+
+def _page_sizes(page_size: int, skip_count: int, limit: Optional[int]):
+    """max_items for the page at skip_count (None once limit is reached)."""
+    def size(offset: int) -> Optional[int]:
+        if limit is None:
+            return page_size
+        remaining = limit - (offset - skip_count)
+        return min(page_size, remaining) if remaining > 0 else None
+    return size
+
+
+def _plan(offset: int, total: int, size, stride: int) -> List[Tuple[int, int]]:
+    """(skip_count, max_items) of the pages left up to totalItems, at most stride entries each."""
+    plan = []
+    while offset < total:
+        max_items = size(offset)
+        if not max_items:
+            break
+        max_items = min(max_items, stride)
+        plan.append((offset, max_items))
+        offset += max_items
+    return plan
+
+
+# ==================== SYNC ====================
+
+def _threaded_pages(load, plan: List[Tuple[int, int]], parallel: int) -> Iterator[Tuple[Page, int]]:
+    """Fetch planned pages, at most `parallel` in flight; yields (page, max_items) in order."""
+    executor = ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="alfresco-pager")
+    pending = deque()
+    requests = iter(plan)
+    try:
+        for offset, max_items in itertools.islice(requests, parallel):
+            pending.append((executor.submit(load, offset, max_items), max_items))
+        while pending:
+            future, requested = pending.popleft()
+            page = future.result()
+            for offset, max_items in itertools.islice(requests, 1):
+                pending.append((executor.submit(load, offset, max_items), max_items))
+            yield page, requested
+    finally:
+        for future, _ in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_pages(
+    fetch: Callable[..., Any],
+    *args,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    skip_count: int = 0,
+    limit: Optional[int] = None,
+    prefetch: bool = False,
+    parallel: int = 1,
+    **kwargs
+) -> Iterator[Page]:
+    """
+    Yield pages of a list operation until pagination.hasMoreItems is false.
+
+    Args:
+        fetch: List function called as fetch(*args, skip_count=..., max_items=..., **kwargs)
+        page_size: max_items per request
+        skip_count: Offset of the first page
+        limit: Stop after this many entries
+        prefetch: Request the next page in a worker thread while the caller processes this one
+        parallel: Pages in flight once the first page reports totalItems (1 = sequential).
+            The remaining skip_count offsets are fetched concurrently and yielded in order.
+        **kwargs: Extra keyword arguments for fetch (include, where, order_by, ...)
+
+    Yields:
+        Page: One page per request
+    """
+    size = _page_sizes(page_size, skip_count, limit)
+
+    def load(offset: int, max_items: int) -> Page:
+        return read_page(fetch(*args, skip_count=offset, max_items=max_items, **kwargs), offset)
+
+    offset, max_items = skip_count, size(skip_count)
+    if parallel > 1 and max_items:
+        page, requested = load(offset, max_items), max_items
+        yield page
+        offset += len(page)
+        max_items = size(offset) if page.has_more(requested) else None
+        total = page.pagination.total_items
+        if max_items and total is not None:
+            # Step by what the first page returned: the server may cap maxItems
+            pages = _threaded_pages(load, _plan(offset, total, size, len(page)), parallel)
+            try:
+                for page, requested in pages:
+                    yield page
+                    if len(page) < requested:
+                        # Later offsets could skip entries: continue sequentially
+                        break
+            finally:
+                pages.close()
+            # Sequential from the last page (the list may also have grown)
+            offset = page.skip_count + len(page)
+            max_items = size(offset) if page.has_more(requested) else None
+
+    executor = None
+    if prefetch:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alfresco-pager")
+    pending = None
+    try:
+        while max_items:
+            page = pending.result() if pending is not None else load(offset, max_items)
+            pending = None
+            offset += len(page)
+            more = page.has_more(max_items)
+            max_items = size(offset) if more else None
+            if max_items and executor is not None:
+                pending = executor.submit(load, offset, max_items)
+            yield page
+    finally:
+        if executor is not None:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+
+def paginate(
+    fetch: Callable[..., Any],
+    *args,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    skip_count: int = 0,
+    limit: Optional[int] = None,
+    prefetch: bool = False,
+    parallel: int = 1,
+    unwrap: bool = True,
+    **kwargs
+) -> Iterator[Any]:
+    """
+    Yield every entry of a list operation, fetching pages lazily.
+
+    Same arguments as iter_pages(); with unwrap=True (default) the
+    {"entry": ...} wrapper of each element is removed.
+
+    Examples:
+        ```python
+        for node in paginate(client.nodes.list_children, folder_id, page_size=1000):
+            print(node["name"])
+
+        # Fetch the remaining pages 8 at a time once totalItems is known
+        for site in paginate(client.sites.list_sites, parallel=8):
+            ...
+        ```
+    """
+    pages = iter_pages(
+        fetch, *args, page_size=page_size, skip_count=skip_count, limit=limit,
+        prefetch=prefetch, parallel=parallel, **kwargs
+    )
+    for page in pages:
+        for entry in page.entries:
+            yield _unwrap(entry) if unwrap else entry
+
+
+# ==================== ASYNC ====================
+
+async def _concurrent_pages(
+    load, plan: List[Tuple[int, int]], parallel: int
+) -> AsyncIterator[Tuple[Page, int]]:
+    """Fetch planned pages, at most `parallel` in flight; yields (page, max_items) in order."""
+    pending = deque()
+    requests = iter(plan)
+    try:
+        for offset, max_items in itertools.islice(requests, parallel):
+            pending.append((asyncio.ensure_future(load(offset, max_items)), max_items))
+        while pending:
+            task, requested = pending.popleft()
+            page = await task
+            for offset, max_items in itertools.islice(requests, 1):
+                pending.append((asyncio.ensure_future(load(offset, max_items)), max_items))
+            yield page, requested
+    finally:
+        for task, _ in pending:
+            task.cancel()
+        await asyncio.gather(*(task for task, _ in pending), return_exceptions=True)
+
+
+async def aiter_pages(
+    fetch: Callable[..., Any],
+    *args,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    skip_count: int = 0,
+    limit: Optional[int] = None,
+    prefetch: bool = False,
+    parallel: int = 1,
+    **kwargs
+) -> AsyncIterator[Page]:
+    """
+    Async version of iter_pages() for async list functions.
+
+    With prefetch=True the next page is requested in a task while the caller
+    processes the current one; with parallel=N up to N pages are in flight.
+    """
+    size = _page_sizes(page_size, skip_count, limit)
+
+    async def load(offset: int, max_items: int) -> Page:
+        response = await fetch(*args, skip_count=offset, max_items=max_items, **kwargs)
+        return read_page(response, offset)
+
+    offset, max_items = skip_count, size(skip_count)
+    if parallel > 1 and max_items:
+        page, requested = await load(offset, max_items), max_items
+        yield page
+        offset += len(page)
+        max_items = size(offset) if page.has_more(requested) else None
+        total = page.pagination.total_items
+        if max_items and total is not None:
+            # Step by what the first page returned: the server may cap maxItems
+            pages = _concurrent_pages(load, _plan(offset, total, size, len(page)), parallel)
+            try:
+                async for page, requested in pages:
+                    yield page
+                    if len(page) < requested:
+                        # Later offsets could skip entries: continue sequentially
+                        break
+            finally:
+                await pages.aclose()
+            # Sequential from the last page (the list may also have grown)
+            offset = page.skip_count + len(page)
+            max_items = size(offset) if page.has_more(requested) else None
+
+    pending: Optional[asyncio.Task] = None
+    try:
+        while max_items:
+            page = await pending if pending is not None else await load(offset, max_items)
+            pending = None
+            offset += len(page)
+            more = page.has_more(max_items)
+            max_items = size(offset) if more else None
+            if max_items and prefetch:
+                pending = asyncio.ensure_future(load(offset, max_items))
+            yield page
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+
+
+async def apaginate(
+    fetch: Callable[..., Any],
+    *args,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    skip_count: int = 0,
+    limit: Optional[int] = None,
+    prefetch: bool = False,
+    parallel: int = 1,
+    unwrap: bool = True,
+    **kwargs
+) -> AsyncIterator[Any]:
+    """
+    Async version of paginate() for async list functions.
+
+    Examples:
+        ```python
+        async for node in apaginate(client.nodes.list_children_async, folder_id, prefetch=True):
+            await process(node)
+
+        async for node in apaginate(client.nodes.list_children_async, folder_id, parallel=8):
+            ...
+        ```
+    """
+    pages = aiter_pages(
+        fetch, *args, page_size=page_size, skip_count=skip_count, limit=limit,
+        prefetch=prefetch, parallel=parallel, **kwargs
+    )
+    try:
+        async for page in pages:
+            for entry in page.entries:
+                yield _unwrap(entry) if unwrap else entry
+    finally:
+        await pages.aclose()
+
+
+__all__ = [
+    'Page', 'read_page', 'DEFAULT_PAGE_SIZE',
+    'iter_pages', 'paginate', 'aiter_pages', 'apaginate',
+]
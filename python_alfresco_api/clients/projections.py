@@ -0,0 +1,187 @@
+"""
+Named projections: sparse fieldsets and include profiles.
+
+Alfresco trims responses with `fields=` (only these entry fields) and extends
+them with `include=` (properties, path, allowableOperations, ...). A
+projection names a combination of both together with the slim model the
+trimmed entries validate into, so a listing job asks for what it reads:
+
+    page = client.nodes.list_children(folder_id, projection="ids")       # fields=id
+    for node in client.nodes.iter_children(folder_id, projection="listing"):
+        print(node.entry.name, node.entry.modified_at)                   # NodeSummary
+    node = client.nodes.get(node_id, projection="full")                  # + properties, path, ...
+
+Built-in projections per resource ("node", "site", "person", "search"):
+- "ids": fields=id -> NodeId / SiteId / PersonId
+- "listing": the fields a list UI shows -> NodeSummary / SiteSummary / PersonSummary
+- "full": no field filter, every include the full model declares -> Node /
+  Site / Person / ResultNode
+
+Responses decode into Entry[model] (single entries) or EntryPaging[model]
+(lists), so `.entry` / `.list.entries` read the same as the full responses.
+Caller include/fields are merged into the projection's. Custom projections
+can be added with register_projection().
+"""
+
+import importlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+# Entry fields shown by file listings (nodes and search hits)
+_NODE_LISTING = (
+    "id", "name", "nodeType", "isFolder", "isFile", "parentId", "modifiedAt", "modifiedByUser",
+    "content"
+)
+_NODE_FULL_INCLUDE = ("aspectNames", "properties", "path", "allowableOperations", "isLocked")
+
+_NODES = "python_alfresco_api.clients.core.nodes.models"
+_SITES = "python_alfresco_api.clients.core.sites.models"
+_PEOPLE = "python_alfresco_api.clients.core.people.models"
+_CORE_MODELS = "python_alfresco_api.models.alfresco_core_models"
+_SEARCH_MODELS = "python_alfresco_api.models.alfresco_search_models"
+
+
+class Projection:
+    """
+    A named fields/include combination and the model its entries validate into.
+
+    Args:
+        name: Projection name
+        model: Entry model class, or "module:Class" (imported on first use)
+        fields: Entry fields to request (None = no filter)
+        include: Optional fields to request in addition
+    """
+
+    __slots__ = ("name", "fields", "include", "_model")
+
+    def __init__(
+        self,
+        name: str,
+        model: Union[Type[BaseModel], str],
+        fields: Optional[Iterable[str]] = None,
+        include: Iterable[str] = ()
+    ):
+        self.name = name
+        self.fields = tuple(fields) if fields is not None else None
+        self.include = tuple(include)
+        self._model = model
+
+    @property
+    def model(self) -> Type[BaseModel]:
+        """The entry model (imported on first access)."""
+        if isinstance(self._model, str):
+            module, name = self._model.split(":")
+            self._model = getattr(importlib.import_module(module), name)
+        return self._model
+
+    def params(
+        self,
+        include: Optional[Iterable[str]] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+        """
+        Merge caller include/fields into the projection's.
+
+        Returns:
+            (include, fields) for the request; None where nothing is requested.
+            Included names are added to a field filter, as Alfresco drops
+            included data that the filter does not list.
+        """
+        merged_include = _merge(self.include, include)
+        if self.fields is None and fields is None:
+            return merged_include or None, None
+        return merged_include or None, _merge(self.fields or (), fields, merged_include)
+
+    def __repr__(self) -> str:
+        return f"Projection({self.name!r}, fields={self.fields}, include={self.include})"
+
+
+def _merge(*groups: Optional[Iterable[str]]) -> List[str]:
+    merged: Dict[str, None] = {}
+    for group in groups:
+        for name in group or ():
+            merged[getattr(name, "value", name)] = None
+    return list(merged)
+
+
+PROJECTIONS: Dict[str, Dict[str, Projection]] = {
+    "node": {
+        "ids": Projection("ids", f"{_NODES}:NodeId", fields=("id",)),
+        "listing": Projection("listing", f"{_NODES}:NodeSummary", fields=_NODE_LISTING),
+        "full": Projection("full", f"{_NODES}:Node", include=_NODE_FULL_INCLUDE),
+    },
+    "site": {
+        "ids": Projection("ids", f"{_SITES}:SiteId", fields=("id",)),
+        "listing": Projection(
+            "listing", f"{_SITES}:SiteSummary",
+            fields=("id", "guid", "title", "description", "visibility")
+        ),
+        "full": Projection("full", f"{_CORE_MODELS}:Site"),
+    },
+    "person": {
+        "ids": Projection("ids", f"{_PEOPLE}:PersonId", fields=("id",)),
+        "listing": Projection(
+            "listing", f"{_PEOPLE}:PersonSummary",
+            fields=("id", "displayName", "firstName", "lastName", "email", "enabled")
+        ),
+        "full": Projection(
+            "full", f"{_CORE_MODELS}:Person", include=("properties", "aspectNames", "capabilities")
+        ),
+    },
+    "search": {
+        "ids": Projection("ids", f"{_NODES}:NodeId", fields=("id",)),
+        "listing": Projection("listing", f"{_NODES}:NodeSummary", fields=_NODE_LISTING),
+        "full": Projection(
+            "full", f"{_SEARCH_MODELS}:ResultNode", include=_NODE_FULL_INCLUDE + ("isLink",)
+        ),
+    },
+}
+
+
+def get_projection(resource: str, projection: Union[str, Projection]) -> Projection:
+    """Look up a projection by name (Projection instances are returned as is)."""
+    if isinstance(projection, Projection):
+        return projection
+    try:
+        return PROJECTIONS[resource][projection]
+    except KeyError:
+        known = sorted(PROJECTIONS.get(resource, {}))
+        raise ValueError(
+            f"Unknown {resource} projection '{projection}', expected one of {known}"
+        ) from None
+
+
+def register_projection(resource: str, projection: Projection) -> None:
+    """Add (or replace) a named projection for a resource."""
+    PROJECTIONS.setdefault(resource, {})[projection.name] = projection
+
+
+def project(
+    resource: str,
+    projection: Union[str, Projection],
+    include: Optional[Iterable[str]] = None,
+    fields: Optional[Iterable[str]] = None
+) -> Tuple[Optional[List[str]], Optional[List[str]], Type[BaseModel]]:
+    """Resolve a projection into (include, fields, entry model) for one request."""
+    selected = get_projection(resource, projection)
+    include, fields = selected.params(include, fields)
+    return include, fields, selected.model
+
+
+def entry_model(model: Type[BaseModel]) -> Any:
+    """Entry[model]: the single-entry response type for a projection's model."""
+    from .models import Entry
+    return Entry[model]
+
+
+def paging_model(model: Type[BaseModel]) -> Any:
+    """EntryPaging[model]: the list response type for a projection's model."""
+    from .models import EntryPaging
+    return EntryPaging[model]
+
+
+__all__ = [
+    'Projection', 'PROJECTIONS', 'get_projection', 'register_projection', 'project',
+    'entry_model', 'paging_model',
+]
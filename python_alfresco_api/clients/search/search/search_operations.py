@@ -6,9 +6,16 @@ separate from the __init__.py import-only structure.
 """
 
 import asyncio
-from typing import Optional, List, Union, Any, Awaitable
+from typing import Optional, List, Union, Any, Awaitable, Iterator, AsyncIterator
 from httpx import Response
 
+import attrs
+
+from ...paging import paginate, apaginate
+from ...decoding import fetch_model, afetch_model, fetch_json, afetch_json
+from ...projections import project, paging_model
+from ...views import ListView, view_class
+
 # Import required types for proper parameter handling
 from ....raw_clients.alfresco_search_client.search_client.types import UNSET, Unset
 from httpx import Response
@@ -16,6 +23,12 @@ from httpx import Response
 # Import model types for proper parameter signatures
 from ....raw_clients.alfresco_search_client.search_client.models.result_set_paging import ResultSetPaging
 from ....raw_clients.alfresco_search_client.search_client.models.search_request import SearchRequest
+from ....raw_clients.alfresco_search_client.search_client.models.request_pagination import (
+    RequestPagination,
+)
+from ....raw_clients.alfresco_search_client.search_client.models.request_include_item import (
+    RequestIncludeItem,
+)
 
 # Import from Level 3 (operation-specific models)
 from .models import SearchResponse, SearchListResponse, CreateSearchRequest
@@ -138,6 +151,180 @@ class SearchClient:
         
         return await self._search.asyncio_detailed(client=self.raw_client, body=body)  # type: ignore
 
+    # ==================== PROJECTIONS ====================
+    
+    def _project(self, body: SearchRequest, projection: Optional[str]):
+        """
+        The body with the projection's fields/include applied, and the model its hits validate into.
+        """
+        if projection is None:
+            return body, None
+        include, fields, model = project(
+            "search", projection,
+            None if isinstance(body.include, Unset) else body.include,
+            None if isinstance(body.fields, Unset) else body.fields
+        )
+        projected = attrs.evolve(
+            body,
+            include=UNSET if include is None else [RequestIncludeItem(item) for item in include],
+            fields=UNSET if fields is None else fields
+        )
+        return projected, model
+
+    # ==================== SINGLE-PASS PYDANTIC VARIANTS ====================
+    
+    def search_model(self, body: SearchRequest, projection: Optional[str] = None):
+        """
+        Search, returning a Pydantic ResultSetPaging decoded from the response body in one pass
+        (sync). projection="ids"/"listing"/"full" trims the hits.
+        """
+        from ....models.alfresco_search_models import ResultSetPaging as ResultSetPagingModel
+        
+        body, model = self._project(body, projection)
+        response_model = ResultSetPagingModel if model is None else paging_model(model)
+        return fetch_model(self._search, response_model, client=self.raw_client, body=body)
+    
+    async def search_model_async(self, body: SearchRequest, projection: Optional[str] = None):
+        """
+        Search, returning a Pydantic ResultSetPaging decoded from the response body in one pass
+        (async). projection="ids"/"listing"/"full" trims the hits.
+        """
+        from ....models.alfresco_search_models import ResultSetPaging as ResultSetPagingModel
+        
+        body, model = self._project(body, projection)
+        response_model = ResultSetPagingModel if model is None else paging_model(model)
+        return await afetch_model(self._search, response_model, client=self.raw_client, body=body)
+
+    # ==================== LAZY VIEW VARIANTS ====================
+    
+    def search_view(
+        self, body: SearchRequest, projection: Optional[str] = None
+    ) -> Optional[ListView]:
+        """
+        Search, returning a ListView of lazy ResultNode views - no validation, fields decoded on
+        access (sync).
+        """
+        from ....models.alfresco_search_models import ResultNode
+        
+        body, model = self._project(body, projection)
+        data = fetch_json(self._search, client=self.raw_client, body=body)
+        return None if data is None else ListView(data, view_class(model or ResultNode))
+    
+    async def search_view_async(
+        self, body: SearchRequest, projection: Optional[str] = None
+    ) -> Optional[ListView]:
+        """
+        Search, returning a ListView of lazy ResultNode views - no validation, fields decoded on
+        access (async).
+        """
+        from ....models.alfresco_search_models import ResultNode
+        
+        body, model = self._project(body, projection)
+        data = await afetch_json(self._search, client=self.raw_client, body=body)
+        return None if data is None else ListView(data, view_class(model or ResultNode))
+
+    # ==================== PAGINATED SEARCH ====================
+    
+    def _search_page(
+        self,
+        body: SearchRequest,
+        skip_count: int,
+        max_items: int,
+        view: bool = False,
+        projection: Optional[str] = None,
+    ):
+        # Search pages are selected in the request body, not query parameters
+        paged = attrs.evolve(
+            body, paging=RequestPagination(max_items=max_items, skip_count=skip_count)
+        )
+        if view:
+            return self.search_view(paged, projection)
+        return self.search_model(paged, projection) if projection else self.search_detailed(paged)
+    
+    async def _search_page_async(
+        self,
+        body: SearchRequest,
+        skip_count: int,
+        max_items: int,
+        view: bool = False,
+        projection: Optional[str] = None,
+    ):
+        paged = attrs.evolve(
+            body, paging=RequestPagination(max_items=max_items, skip_count=skip_count)
+        )
+        if view:
+            return await self.search_view_async(paged, projection)
+        return await (
+            self.search_model_async(paged, projection)
+            if projection
+            else self.search_detailed_async(paged)
+        )
+    
+    def iter_search(
+        self,
+        body: SearchRequest,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        parallel: int = 1,
+        view: bool = False,
+        projection: Optional[str] = None
+    ) -> Iterator[Any]:
+        """
+        Iterate over all search results, fetching pages lazily (sync).
+        
+        The body's own paging is replaced page by page. With parallel=N the
+        remaining pages are fetched N at a time once totalItems is known.
+        
+        Args:
+            body: SearchRequest (query, include, sort, filters, ...)
+            page_size: maxItems per request
+            prefetch: Fetch the next page while the caller processes this one
+            limit: Stop after this many results
+            parallel: Pages in flight after the first page
+            view: Yield lazy ResultNode views (no validation) instead of attrs ResultNode objects
+            projection: "ids", "listing" or "full" - request only those fields and yield
+                Entry[...] items of the projection's model
+        
+        Returns:
+            Iterator of ResultNode entries
+        """
+        return paginate(
+            self._search_page,
+            body,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            parallel=parallel,
+            view=view,
+            projection=projection,
+        )
+    
+    def iter_search_async(
+        self,
+        body: SearchRequest,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        parallel: int = 1,
+        view: bool = False,
+        projection: Optional[str] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over all search results, fetching pages lazily (async). Same arguments as
+        iter_search().
+        """
+        return apaginate(
+            self._search_page_async,
+            body,
+            page_size=page_size,
+            prefetch=prefetch,
+            limit=limit,
+            parallel=parallel,
+            view=view,
+            projection=projection,
+        )
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         base_url = getattr(self.parent_client._client_factory, 'base_url', 'unknown')
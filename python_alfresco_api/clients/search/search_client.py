@@ -85,7 +85,8 @@ class AlfrescoSearchClient:
             "base_url": f"{self._client_factory.base_url}/alfresco/api/-default-/public/search/versions/1",
             "token": self._client_factory.auth.get_auth_token(),
             "prefix": self._client_factory.auth.get_auth_prefix(),
-            "verify_ssl": self._client_factory.verify_ssl
+            "verify_ssl": self._client_factory.verify_ssl,
+            "httpx_args": self._client_factory.get_httpx_args()
         }
         
         # Only add timeout if specified (not None)
@@ -152,6 +153,14 @@ class AlfrescoSearchClient:
         """Search for content using ASYNC operations."""
         return await self.search.search_async(*args, **kwargs)
     
+    def iter_search(self, *args, **kwargs):
+        """Iterate over all search results, fetching pages lazily (SYNC)."""
+        return self.search.iter_search(*args, **kwargs)
+    
+    def iter_search_async(self, *args, **kwargs):
+        """Iterate over all search results, fetching pages lazily (ASYNC)."""
+        return self.search.iter_search_async(*args, **kwargs)
+    
     def __repr__(self) -> str:
         """String representation for debugging."""
         base_url = getattr(self._client_factory, 'base_url', 'unknown')
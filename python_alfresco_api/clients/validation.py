@@ -0,0 +1,184 @@
+"""
+Validation profiles for decoding server responses.
+
+The high-level response models are written for request building as much as
+for decoding: `Node` sets `validate_assignment=True`, `BaseEntry` strips
+whitespace from every string, and fields carry length constraints. When the
+data comes straight from the repository none of that protects anything.
+
+Two profiles:
+- "strict" (default): responses validate into the declared models, as before
+- "trusted": responses validate into cached subclasses of the declared models
+  with assignment validation, whitespace stripping and field constraints
+  removed (aliases and defaults kept). The subclasses are built on first use
+  with `defer_build`, so they cost nothing at import.
+
+    from python_alfresco_api.clients.validation import validation_profile
+
+    with validation_profile("trusted"):
+        node = client.nodes.get("-root-")    # a trusted Node subclass
+
+The profile is held in a ContextVar: set_validation_profile() changes it for
+the current thread / task and everything started from it. Trusted instances
+are instances of the declared model (isinstance() holds) but compare unequal
+to strict instances with the same data, as Pydantic compares exact types.
+
+TypeAdapters are built once per (type, profile) and cached.
+"""
+
+import threading
+import types
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+STRICT = "strict"
+TRUSTED = "trusted"
+PROFILES = (STRICT, TRUSTED)
+
+_TRUSTED_CONFIG = ConfigDict(
+    validate_assignment=False, str_strip_whitespace=False, defer_build=True
+)
+
+# FieldInfo attributes kept on trusted fields (everything else is validation)
+_KEPT_FIELD_ATTRIBUTES = ("alias", "validation_alias", "serialization_alias", "exclude")
+
+_profile: ContextVar[str] = ContextVar("alfresco_validation_profile", default=STRICT)
+_trusted: Dict[Type[BaseModel], Optional[Type[BaseModel]]] = {}
+# Held while trusted subclasses are built; reentrant for nested models
+_build_lock = threading.RLock()
+
+
+def _check(profile: str) -> str:
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown validation profile '{profile}', expected one of {list(PROFILES)}"
+        )
+    return profile
+
+
+def get_validation_profile() -> str:
+    """The profile used for the current context ("strict" unless changed)."""
+    return _profile.get()
+
+
+def set_validation_profile(profile: str) -> Token:
+    """Set the profile for the current context; returns a token for reset_validation_profile()."""
+    return _profile.set(_check(profile))
+
+
+def reset_validation_profile(token: Token) -> None:
+    """Restore the profile that was active before set_validation_profile()."""
+    _profile.reset(token)
+
+
+@contextmanager
+def validation_profile(profile: str) -> Iterator[None]:
+    """Use a profile inside a with block."""
+    token = set_validation_profile(profile)
+    try:
+        yield
+    finally:
+        _profile.reset(token)
+
+
+def _trusted_annotation(annotation: Any) -> Any:
+    """annotation with every BaseModel replaced by its trusted subclass."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return trusted_model(annotation)
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is None or not args:
+        return annotation
+    new_args = tuple(_trusted_annotation(arg) for arg in args)
+    if new_args == args:
+        return annotation
+    if origin is Union or origin is types.UnionType:
+        return Union[new_args]
+    return origin[new_args if len(new_args) > 1 else new_args[0]]
+
+
+def trusted_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """The (cached) trusted subclass of a response model."""
+    trusted = _trusted.get(model)
+    if trusted is not None:
+        return trusted
+    with _build_lock:
+        if model in _trusted:
+            # None only while this thread builds the model: a recursive reference
+            # keeps the original
+            return _trusted[model] or model
+        _trusted[model] = None
+        try:
+            trusted = _trusted[model] = _build_trusted(model)
+        except BaseException:
+            del _trusted[model]
+            raise
+    return trusted
+
+
+def _build_trusted(model: Type[BaseModel]) -> Type[BaseModel]:
+    annotations: Dict[str, Any] = {}
+    namespace: Dict[str, Any] = {
+        "model_config": _TRUSTED_CONFIG,
+        "__module__": model.__module__,
+        "__qualname__": model.__qualname__,
+        "__annotations__": annotations,
+    }
+    for name, info in model.model_fields.items():
+        kwargs = {
+            key: getattr(info, key)
+            for key in _KEPT_FIELD_ATTRIBUTES
+            if getattr(info, key) is not None
+        }
+        if info.default_factory is not None:
+            kwargs["default_factory"] = info.default_factory
+        elif not info.is_required():
+            kwargs["default"] = info.default
+        annotations[name] = _trusted_annotation(info.annotation)
+        namespace[name] = Field(**kwargs)
+
+    return type(model)(model.__name__, (model,), namespace)
+
+
+@lru_cache(maxsize=None)
+def _adapter(annotation: Any, profile: str) -> TypeAdapter:
+    return TypeAdapter(_trusted_annotation(annotation) if profile == TRUSTED else annotation)
+
+
+def type_adapter(annotation: Any, profile: Optional[str] = None) -> TypeAdapter:
+    """
+    The cached TypeAdapter for a type under a profile.
+
+    Args:
+        annotation: Model class or type expression (e.g. List[Node])
+        profile: "strict" or "trusted" (default: the current context's profile)
+    """
+    return _adapter(annotation, _check(profile) if profile else _profile.get())
+
+
+def validate_json(annotation: Any, data: Union[str, bytes], profile: Optional[str] = None) -> Any:
+    """Validate a JSON document into annotation under a profile."""
+    return type_adapter(annotation, profile).validate_json(data)
+
+
+def validate_python(annotation: Any, data: Any, profile: Optional[str] = None) -> Any:
+    """Validate parsed JSON (dicts / lists) into annotation under a profile."""
+    return type_adapter(annotation, profile).validate_python(data)
+
+
+__all__ = [
+    'STRICT',
+    'TRUSTED',
+    'PROFILES',
+    'get_validation_profile',
+    'set_validation_profile',
+    'reset_validation_profile',
+    'validation_profile',
+    'trusted_model',
+    'type_adapter',
+    'validate_json',
+    'validate_python',
+]
@@ -0,0 +1,207 @@
+"""
+Lazy, zero-validation views over list and search results.
+
+A crawler walking pages of 1000 children usually reads `id` and `name` only,
+yet full validation builds UserInfo / ContentInfo / PathInfo objects and
+parses two timestamps for every entry. Views skip that: they keep the parsed
+JSON dict and decode a field only when it is read.
+
+    page = client.nodes.list_children("-root-", max_items=1000, view=True)
+    for node in page.entries:          # NodeView objects
+        print(node.id, node.name)      # plain dict lookups
+        node.created_by_user.id        # nested view, built on access
+        node.created_at                # datetime, parsed on access
+        node.to_model()                # full Pydantic Node when needed
+
+Attribute names are the Pydantic model's field names (plus a snake_case
+spelling for camelCase fields, so search results read like nodes). Values are
+not validated; call to_model() for that.
+"""
+
+import re
+import types
+import typing
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from .models import PagingInfo
+from .validation import type_adapter, validate_python
+
+_DATETIME = type_adapter(datetime, "strict")
+_VIEWS: Dict[Type[BaseModel], Type["ModelView"]] = {}
+
+
+def _snake(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _decoder(annotation: Any) -> Tuple[Optional[str], Any]:
+    """How a field is decoded on access: ("view" | "list" | "datetime" | None, model)."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return _decoder(typing.get_args(annotation)[0])
+    if origin is Union or origin is types.UnionType:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _decoder(args[0]) if len(args) == 1 else (None, None)
+    if origin in (list, List):
+        args = typing.get_args(annotation)
+        kind, model = _decoder(args[0]) if args else (None, None)
+        return ("list", model) if kind == "view" else (None, None)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return "view", annotation
+    if annotation is datetime:
+        return "datetime", None
+    return None, None
+
+
+def _field_map(model: Type[BaseModel]) -> Dict[str, Tuple[str, Optional[str], Any, Any]]:
+    """attribute -> (JSON key, decoder kind, nested model, default)."""
+    fields = {}
+    for name, info in model.model_fields.items():
+        kind, nested = _decoder(info.annotation)
+        default = None if info.is_required() else info.get_default(call_default_factory=True)
+        spec = (info.alias or name, kind, nested, default)
+        fields[name] = spec
+        fields.setdefault(_snake(name), spec)
+    return fields
+
+
+class ModelView:
+    """
+    Slotted read-only accessor over the raw JSON of one Pydantic model.
+
+    Subclass with `class NodeView(ModelView, model=Node)` or use view_class(Node).
+    """
+
+    __slots__ = ("_data",)
+
+    model: Type[BaseModel]
+    _fields: Dict[str, Tuple[str, Optional[str], Any, Any]] = {}
+
+    def __init_subclass__(cls, model: Optional[Type[BaseModel]] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if model is not None:
+            cls.model = model
+            cls._fields = _field_map(model)
+            _VIEWS.setdefault(model, cls)
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            key, kind, nested, default = self._fields[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__} has no field {name!r}") from None
+        value = self._data.get(key)
+        if value is None:
+            return default
+        if kind == "view":
+            return view_class(nested)(value)
+        if kind == "list":
+            view = view_class(nested)
+            return [view(item) for item in value]
+        if kind == "datetime":
+            return _DATETIME.validate_python(value)
+        return value
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ModelView):
+            return self.model is other.model and self._data == other._data
+        return NotImplemented
+
+    __hash__ = None
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._fields))
+
+    def __repr__(self) -> str:
+        shown = ", ".join(
+            f"{key}={self._data[key]!r}" for key in ("id", "name") if key in self._data
+        )
+        return f"{type(self).__name__}({shown})"
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The underlying JSON dict."""
+        return self._data
+
+    def to_model(self) -> BaseModel:
+        """Validate into the full Pydantic model (under the current validation profile)."""
+        return validate_python(self.model, self._data)
+
+
+def view_class(model: Type[BaseModel]) -> Type[ModelView]:
+    """The (cached) view class for a Pydantic model."""
+    view = _VIEWS.get(model)
+    if view is None:
+        view = type(
+            f"{model.__name__}View",
+            (ModelView,),
+            {"__slots__": (), "__module__": __name__},
+            model=model,
+        )
+    return view
+
+
+class ListView:
+    """
+    One page of a list/search response with entries exposed as views.
+
+    Holds the parsed JSON; `entries` wraps each `{"entry": ...}` in `view`
+    (built once, on first access) and `pagination` is a PagingInfo.
+    """
+
+    __slots__ = ("_data", "_view", "_entries")
+
+    def __init__(self, data: Dict[str, Any], view: Type[ModelView]):
+        self._data = data
+        self._view = view
+        self._entries = None
+
+    def __len__(self) -> int:
+        return len(self._list.get("entries") or [])
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __repr__(self) -> str:
+        return f"ListView({self._view.__name__}, count={len(self)})"
+
+    @property
+    def _list(self) -> Dict[str, Any]:
+        return self._data.get("list") or {}
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The underlying JSON dict."""
+        return self._data
+
+    @property
+    def entries(self) -> List[ModelView]:
+        if self._entries is None:
+            view = self._view
+            self._entries = [
+                view(item.get("entry", item)) for item in self._list.get("entries") or []
+            ]
+        return self._entries
+
+    @property
+    def pagination(self) -> PagingInfo:
+        pagination = self._list.get("pagination") or {}
+        return PagingInfo(
+            count=pagination.get("count"),
+            has_more_items=pagination.get("hasMoreItems"),
+            total_items=pagination.get("totalItems"),
+            skip_count=pagination.get("skipCount"),
+            max_items=pagination.get("maxItems"),
+        )
+
+    def to_models(self) -> List[BaseModel]:
+        """Validate every entry into the full Pydantic model."""
+        return [entry.to_model() for entry in self.entries]
+
+
+__all__ = ['ModelView', 'ListView', 'view_class']
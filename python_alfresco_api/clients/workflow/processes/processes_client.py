@@ -14,9 +14,11 @@ Perfect for MCP servers and documentation generation.
 """
 
 import asyncio
-from typing import Optional, List, Union, Any, Awaitable
+from typing import Optional, List, Union, Any, Awaitable, Iterator, AsyncIterator
 from httpx import Response
 
+from ...paging import paginate, apaginate
+
 # Import required types for proper parameter handling
 from ....raw_clients.alfresco_workflow_client.workflow_client.types import UNSET, Unset
 from httpx import Response
@@ -764,6 +766,35 @@ class ProcessesClient:
         
         return await self._list_processes.asyncio(client=self.raw_client, skip_count=skip_count, max_items=max_items, properties=properties, order_by=order_by, where=where)
     
+    def iter_processes(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Any]:
+        """
+        Iterate over all processes, fetching pages lazily (sync). kwargs as for list_processes().
+        """
+        return paginate(
+            self.list_processes, page_size=page_size, prefetch=prefetch, limit=limit, **kwargs
+        )
+    
+    def iter_processes_async(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over all processes, fetching pages lazily (async). kwargs as for
+        list_processes_async().
+        """
+        return apaginate(
+            self.list_processes_async, page_size=page_size, prefetch=prefetch, limit=limit, **kwargs
+        )
+    
     def list_processes_detailed(self, skip_count: Union[Unset, Any] = UNSET, max_items: Union[Unset, Any] = UNSET, properties: Union[Unset, Any] = UNSET, order_by: Union[Unset, Any] = UNSET, where: Union[Unset, Any] = UNSET) -> Response:
         """
         List Processes operation (detailed sync).
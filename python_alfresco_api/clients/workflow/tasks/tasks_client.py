@@ -29,9 +29,11 @@ TasksClient Operations (13 operations × 4 patterns = 52 methods):
 """
 
 import asyncio
-from typing import Optional, List, Union, Any, Awaitable
+from typing import Optional, List, Union, Any, Awaitable, Iterator, AsyncIterator
 from httpx import Response
 
+from ...paging import paginate, apaginate
+
 # Import required types for proper parameter handling
 from ....raw_clients.alfresco_workflow_client.workflow_client.types import UNSET, Unset
 from httpx import Response
@@ -299,6 +301,32 @@ class TasksClient:
             raise ImportError("Raw client operation not available")
         return await self._list_tasks.asyncio(client=self.raw_client, skip_count=skip_count, max_items=max_items, properties=properties, order_by=order_by, where=where)
     
+    def iter_tasks(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Any]:
+        """Iterate over all tasks, fetching pages lazily (sync). kwargs as for list_tasks()."""
+        return paginate(
+            self.list_tasks, page_size=page_size, prefetch=prefetch, limit=limit, **kwargs
+        )
+    
+    def iter_tasks_async(
+        self,
+        page_size: int = 100,
+        prefetch: bool = False,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over all tasks, fetching pages lazily (async). kwargs as for list_tasks_async().
+        """
+        return apaginate(
+            self.list_tasks_async, page_size=page_size, prefetch=prefetch, limit=limit, **kwargs
+        )
+    
     def list_tasks_detailed(self, skip_count: Union[Unset, Any] = UNSET, max_items: Union[Unset, Any] = UNSET, properties: Union[Unset, Any] = UNSET, order_by: Union[Unset, Any] = UNSET, where: Union[Unset, Any] = UNSET) -> Response:
         """List Tasks operation (detailed sync)."""
         if not hasattr(self, '_list_tasks'):
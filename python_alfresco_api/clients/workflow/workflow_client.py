@@ -88,7 +88,8 @@ class AlfrescoWorkflowClient:
             "base_url": f"{self._client_factory.base_url}/alfresco/api/-default-/public/workflow/versions/1",
             "token": self._client_factory.auth.get_auth_token(),
             "prefix": self._client_factory.auth.get_auth_prefix(),
-            "verify_ssl": self._client_factory.verify_ssl
+            "verify_ssl": self._client_factory.verify_ssl,
+            "httpx_args": self._client_factory.get_httpx_args()
         }
         
         # Only add timeout if specified (not None)
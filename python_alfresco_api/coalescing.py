@@ -0,0 +1,214 @@
+"""
+Request coalescing - single-flight for identical concurrent GETs.
+
+Under load many callers often ask for the same resource at the same time
+(every row of a listing resolving the same person, several coroutines
+fetching the same folder). With coalescing enabled on the shared transport,
+an identical GET/HEAD that arrives while one is already in flight waits for
+that request instead of sending its own, and gets a copy of its response:
+
+    factory = ClientFactory(coalesce_requests=True)
+
+- requests are identical when method, URL (query included) and all headers
+  match, so different credentials or tickets are never shared
+- only requests that overlap in time are merged: nothing is cached once the
+  response has arrived
+- responses are shared as raw bytes; every caller gets its own
+  httpx.Response and parses it itself (parsed objects are not shared,
+  callers may mutate them)
+- bodies that are not JSON and larger than `max_body_size` (content
+  downloads) are not buffered: waiters then send their own request
+- a failed request raises the same error in every waiter
+
+Works for httpx.Client from several threads and httpx.AsyncClient
+coroutines (flights are kept per event loop).
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+import httpx
+
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+# Largest non-JSON body buffered for sharing
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+
+
+class _Snapshot:
+    """A fully read response, replayed to every caller of one flight."""
+
+    __slots__ = ("status_code", "headers", "content", "extensions")
+
+    def __init__(self, response: httpx.Response, content: bytes):
+        self.status_code = response.status_code
+        self.headers = response.headers
+        # Raw (still content-encoded) bytes: each copy decodes them itself
+        self.content = content
+        self.extensions = {
+            key: value for key, value in response.extensions.items() if key != "network_stream"
+        }
+
+    def response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.content),
+            extensions=self.extensions,
+            request=request
+        )
+
+
+def _read_raw(response: httpx.Response) -> bytes:
+    """Body of a transport response as sent (not decoded), releasing the connection."""
+    try:
+        return b"".join(response.stream)
+    finally:
+        response.close()
+
+
+async def _aread_raw(response: httpx.Response) -> bytes:
+    """Body of an async transport response as sent (not decoded), releasing the connection."""
+    try:
+        return b"".join([chunk async for chunk in response.stream])
+    finally:
+        await response.aclose()
+
+
+class _Flight:
+    """One in-flight sync request: its waiters block on `done`."""
+
+    __slots__ = ("done", "snapshot", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.snapshot: Optional[_Snapshot] = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Merges identical concurrent GET/HEAD requests into one transport call.
+
+    Args:
+        max_body_size: Largest non-JSON body (by Content-Length) buffered for sharing
+    """
+
+    def __init__(self, max_body_size: int = DEFAULT_MAX_BODY_SIZE):
+        self.max_body_size = max_body_size
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: Dict[Tuple[Any, Hashable], "asyncio.Future[Optional[_Snapshot]]"] = {}
+        self.requests = self.coalesced = 0
+
+    @staticmethod
+    def request_key(request: httpx.Request) -> Optional[Hashable]:
+        """Identity of a coalescable request, or None (non-idempotent method or a body)."""
+        if (
+            request.method not in COALESCED_METHODS
+            or request.headers.get("content-length", "0") != "0"
+        ):
+            return None
+        return request.method, str(request.url), tuple(request.headers.multi_items())
+
+    def shareable(self, response: httpx.Response) -> bool:
+        """Whether a response body is buffered and shared (JSON or small enough)."""
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return True
+        length = response.headers.get("content-length")
+        return length is not None and length.isdigit() and int(length) <= self.max_body_size
+
+    # ==================== SYNC ====================
+
+    def handle(
+        self, request: httpx.Request, send: Callable[[httpx.Request], httpx.Response]
+    ) -> httpx.Response:
+        """Send a request through send(), or wait for an identical one in flight."""
+        key = self.request_key(request)
+        if key is None:
+            return send(request)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.requests += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            if flight.snapshot is None:
+                # Not shareable (or not read): send our own
+                return send(request)
+            return flight.snapshot.response(request)
+
+        try:
+            response = send(request)
+            if self.shareable(response):
+                flight.snapshot = _Snapshot(response, _read_raw(response))
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return response if flight.snapshot is None else flight.snapshot.response(request)
+
+    # ==================== ASYNC ====================
+
+    async def ahandle(
+        self, request: httpx.Request, send: Callable[[httpx.Request], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Send a request through send() (async), or wait for an identical one in flight."""
+        key = self.request_key(request)
+        if key is None:
+            return await send(request)
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        with self._lock:
+            future = self._async_flights.get(flight_key)
+            leader = future is None
+            if leader:
+                future = self._async_flights[flight_key] = loop.create_future()
+                self.requests += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            # shield: a cancelled waiter must not cancel the flight
+            snapshot = await asyncio.shield(future)
+            if snapshot is None:
+                return await send(request)
+            return snapshot.response(request)
+
+        snapshot = None
+        try:
+            response = await send(request)
+            if self.shareable(response):
+                snapshot = _Snapshot(response, await _aread_raw(response))
+        except asyncio.CancelledError:
+            # Leader cancelled: waiters send their own request
+            future.set_result(None)
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Retrieved here so an unawaited failure is not logged by asyncio
+            future.exception()
+            raise
+        else:
+            future.set_result(snapshot)
+        finally:
+            with self._lock:
+                del self._async_flights[flight_key]
+        return response if snapshot is None else snapshot.response(request)
+
+    def __repr__(self) -> str:
+        return f"RequestCoalescer(requests={self.requests}, coalesced={self.coalesced})"
+
+
+__all__ = ['RequestCoalescer', 'COALESCED_METHODS', 'DEFAULT_MAX_BODY_SIZE']
@@ -0,0 +1,174 @@
+"""
+Pluggable JSON codec
+
+httpx parses `response.json()` and encodes `json=` request bodies with the
+standard library. For large search pages that is a measurable share of the
+CPU time per request. A JsonCodec swaps in orjson or msgspec when installed
+(pip install python-alfresco-api[performance]), with the standard library as
+the fallback:
+
+    factory = ClientFactory(json_codec="auto")     # orjson > msgspec > json (default)
+    factory = ClientFactory(json_codec="json")     # always the standard library
+
+The factory's SharedTransport hands out CodecResponse objects, so every raw
+operation's `response.json()` goes through the codec; the single-pass
+wrappers (clients/decoding.py) also encode request bodies with it.
+"""
+
+import json
+from typing import Any, Dict, Optional, Union
+
+import httpx
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+class JsonCodec:
+    """Standard library codec (compact output, like httpx's own encoder)."""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse a JSON document."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode(
+            "utf-8"
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson codec."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if not ORJSON_AVAILABLE:
+            raise ImportError("json_codec='orjson' requires orjson: pip install orjson")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+class MsgspecCodec(JsonCodec):
+    """msgspec codec (untyped decode into dicts / lists)."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("json_codec='msgspec' requires msgspec: pip install msgspec")
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+CODECS = {"json": JsonCodec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+
+STDLIB_CODEC = JsonCodec()
+
+
+def get_json_codec(codec: Union[str, JsonCodec, None] = "auto") -> JsonCodec:
+    """
+    Resolve a codec name ("auto", "orjson", "msgspec", "json") or instance.
+
+    "auto" (and None) picks orjson, then msgspec, then the standard library.
+
+    Raises:
+        ValueError: Unknown codec name
+        ImportError: The named codec's package is not installed
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None or codec == "auto":
+        if ORJSON_AVAILABLE:
+            return OrjsonCodec()
+        if MSGSPEC_AVAILABLE:
+            return MsgspecCodec()
+        return STDLIB_CODEC
+    if codec not in CODECS:
+        raise ValueError(f"Unknown json_codec '{codec}', expected 'auto' or one of {list(CODECS)}")
+    return STDLIB_CODEC if codec == "json" else CODECS[codec]()
+
+
+class CodecResponse(httpx.Response):
+    """httpx.Response whose json() parses with a JsonCodec."""
+
+    codec: JsonCodec = STDLIB_CODEC
+
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs:
+            # json.loads options (object_hook, parse_float, ...) need the standard library
+            return super().json(**kwargs)
+        return self.codec.loads(self.content)
+
+
+def wrap_response(response: httpx.Response, codec: JsonCodec) -> httpx.Response:
+    """
+    Re-issue a transport response (body not yet read) as a CodecResponse (as is for the standard
+    library).
+    """
+    if codec.name == "json":
+        return response
+    wrapped = CodecResponse(
+        response.status_code,
+        headers=response.headers,
+        stream=response.stream,
+        extensions=response.extensions,
+        request=response._request
+    )
+    wrapped.codec = codec
+    return wrapped
+
+
+def client_codec(raw_client: Any) -> JsonCodec:
+    """The codec of a raw client's shared transport (the standard library without one)."""
+    transport = (getattr(raw_client, "_httpx_args", None) or {}).get("transport")
+    return getattr(transport, "codec", STDLIB_CODEC)
+
+
+def encode_request(kwargs: Dict[str, Any], codec: Optional[JsonCodec]) -> Dict[str, Any]:
+    """
+    Encode a `json=` request body with codec (httpx.Client.request kwargs).
+
+    The body is passed on as `content=` with a JSON Content-Type; kwargs are
+    returned unchanged for the standard library codec or without a body.
+    """
+    if codec is None or codec.name == "json" or kwargs.get("json") is None:
+        return kwargs
+    kwargs = dict(kwargs)
+    headers = dict(kwargs.get("headers") or {})
+    headers.setdefault("Content-Type", "application/json")
+    kwargs["content"] = codec.dumps(kwargs.pop("json"))
+    kwargs["headers"] = headers
+    return kwargs
+
+
+__all__ = [
+    'JsonCodec', 'OrjsonCodec', 'MsgspecCodec', 'CODECS', 'STDLIB_CODEC',
+    'ORJSON_AVAILABLE', 'MSGSPEC_AVAILABLE',
+    'get_json_codec', 'CodecResponse', 'wrap_response', 'client_codec', 'encode_request',
+]
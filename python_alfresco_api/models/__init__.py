@@ -3,43 +3,342 @@ Pydantic v2 Models for Alfresco APIs
 
 Auto-generated models perfect for:
 - LLM tool interfaces
-- MCP server implementations  
+- MCP server implementations
 - Type-safe API interactions
 - Data validation and serialization
+
+Each API's model file is imported on first access to one of its classes
+(PEP 562), so `from python_alfresco_api.models import TicketBody` loads
+alfresco_auth_models only. Names defined by several API files resolve to
+the last one in auth, core, discovery, search, workflow, model, search_sql
+order.
 """
 
-# Import all models from individual API model files
-try:
-    from .alfresco_auth_models import *
-except ImportError:
-    pass
+import importlib
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
+    from .alfresco_auth_models import *
     from .alfresco_core_models import *
-except ImportError:
-    pass
-
-try:
     from .alfresco_discovery_models import *
-except ImportError:
-    pass
-
-try:
     from .alfresco_search_models import *
-except ImportError:
-    pass
-
-try:
     from .alfresco_workflow_models import *
-except ImportError:
-    pass
-
-try:
     from .alfresco_model_models import *
-except ImportError:
-    pass
-
-try:
     from .alfresco_search_sql_models import *
-except ImportError:
-    pass
+
+_MODULES = {
+    "Ticket": "alfresco_auth_models",
+    "TicketBody": "alfresco_auth_models",
+    "TicketEntry": "alfresco_auth_models",
+    "ValidTicket": "alfresco_auth_models",
+    "ValidTicketEntry": "alfresco_auth_models",
+    "ActionBodyExec": "alfresco_core_models",
+    "ActionExecResult": "alfresco_core_models",
+    "ActionExecResultEntry": "alfresco_core_models",
+    "ActionParameterDefinition": "alfresco_core_models",
+    "Activity": "alfresco_core_models",
+    "ActivityEntry": "alfresco_core_models",
+    "Association": "alfresco_core_models",
+    "AssociationBody": "alfresco_core_models",
+    "AssociationEntry": "alfresco_core_models",
+    "AssociationInfo": "alfresco_core_models",
+    "AuditApp": "alfresco_core_models",
+    "AuditAppEntry": "alfresco_core_models",
+    "AuditBodyUpdate": "alfresco_core_models",
+    "Capabilities": "alfresco_core_models",
+    "ChildAssociation": "alfresco_core_models",
+    "ChildAssociationBody": "alfresco_core_models",
+    "ChildAssociationEntry": "alfresco_core_models",
+    "ChildAssociationInfo": "alfresco_core_models",
+    "ClientBody": "alfresco_core_models",
+    "CommentBody": "alfresco_core_models",
+    "DeletedNodeBodyRestore": "alfresco_core_models",
+    "DirectAccessUrlBodyCreate": "alfresco_core_models",
+    "Status": "alfresco_core_models",
+    "Download": "alfresco_core_models",
+    "DownloadBodyCreate": "alfresco_core_models",
+    "DownloadEntry": "alfresco_core_models",
+    "Favorite": "alfresco_core_models",
+    "FavoriteBodyCreate": "alfresco_core_models",
+    "FavoriteEntry": "alfresco_core_models",
+    "FavoriteSite": "alfresco_core_models",
+    "FavoriteSiteBodyCreate": "alfresco_core_models",
+    "FavoriteSiteEntry": "alfresco_core_models",
+    "Group": "alfresco_core_models",
+    "GroupBodyCreate": "alfresco_core_models",
+    "GroupBodyUpdate": "alfresco_core_models",
+    "GroupEntry": "alfresco_core_models",
+    "MemberType": "alfresco_core_models",
+    "GroupMember": "alfresco_core_models",
+    "GroupMemberEntry": "alfresco_core_models",
+    "GroupMembershipBodyCreate": "alfresco_core_models",
+    "NetworkQuota": "alfresco_core_models",
+    "NodeBodyCopy": "alfresco_core_models",
+    "Association1": "alfresco_core_models",
+    "Lifetime": "alfresco_core_models",
+    "NodeBodyLock": "alfresco_core_models",
+    "NodeBodyMove": "alfresco_core_models",
+    "PasswordResetBody": "alfresco_core_models",
+    "AccessStatus": "alfresco_core_models",
+    "PermissionElement": "alfresco_core_models",
+    "PermissionsBody": "alfresco_core_models",
+    "PermissionsInfo": "alfresco_core_models",
+    "PersonBodyCreate": "alfresco_core_models",
+    "PersonBodyUpdate": "alfresco_core_models",
+    "PersonEntry": "alfresco_core_models",
+    "SubscriptionLevel": "alfresco_core_models",
+    "PersonNetwork": "alfresco_core_models",
+    "PersonNetworkEntry": "alfresco_core_models",
+    "List12": "alfresco_core_models",
+    "PersonNetworkPaging": "alfresco_core_models",
+    "List13": "alfresco_core_models",
+    "PersonPaging": "alfresco_core_models",
+    "Preference": "alfresco_core_models",
+    "PreferenceEntry": "alfresco_core_models",
+    "List14": "alfresco_core_models",
+    "PreferencePaging": "alfresco_core_models",
+    "Entry": "alfresco_core_models",
+    "ProbeEntry": "alfresco_core_models",
+    "Aggregate": "alfresco_core_models",
+    "Rating": "alfresco_core_models",
+    "Id": "alfresco_core_models",
+    "RatingBody": "alfresco_core_models",
+    "RatingEntry": "alfresco_core_models",
+    "List15": "alfresco_core_models",
+    "RatingPaging": "alfresco_core_models",
+    "Status1": "alfresco_core_models",
+    "Rendition": "alfresco_core_models",
+    "RenditionBodyCreate": "alfresco_core_models",
+    "RenditionEntry": "alfresco_core_models",
+    "List16": "alfresco_core_models",
+    "RenditionPaging": "alfresco_core_models",
+    "RevertBody": "alfresco_core_models",
+    "SharedLinkBodyCreate": "alfresco_core_models",
+    "SharedLinkBodyEmail": "alfresco_core_models",
+    "Role": "alfresco_core_models",
+    "Visibility": "alfresco_core_models",
+    "Site": "alfresco_core_models",
+    "Visibility1": "alfresco_core_models",
+    "SiteBodyCreate": "alfresco_core_models",
+    "Visibility2": "alfresco_core_models",
+    "SiteBodyUpdate": "alfresco_core_models",
+    "SiteContainer": "alfresco_core_models",
+    "SiteContainerEntry": "alfresco_core_models",
+    "List18": "alfresco_core_models",
+    "SiteContainerPaging": "alfresco_core_models",
+    "SiteEntry": "alfresco_core_models",
+    "SiteGroup": "alfresco_core_models",
+    "SiteGroupEntry": "alfresco_core_models",
+    "List19": "alfresco_core_models",
+    "SiteGroupPaging": "alfresco_core_models",
+    "SiteMember": "alfresco_core_models",
+    "SiteMemberEntry": "alfresco_core_models",
+    "List20": "alfresco_core_models",
+    "SiteMemberPaging": "alfresco_core_models",
+    "SiteMembershipApprovalBody": "alfresco_core_models",
+    "SiteMembershipBodyCreate": "alfresco_core_models",
+    "SiteMembershipBodyUpdate": "alfresco_core_models",
+    "SiteMembershipRejectionBody": "alfresco_core_models",
+    "SiteMembershipRequest": "alfresco_core_models",
+    "SiteMembershipRequestBodyCreate": "alfresco_core_models",
+    "SiteMembershipRequestBodyUpdate": "alfresco_core_models",
+    "SiteMembershipRequestEntry": "alfresco_core_models",
+    "List21": "alfresco_core_models",
+    "SiteMembershipRequestPaging": "alfresco_core_models",
+    "SiteMembershipRequestWithPerson": "alfresco_core_models",
+    "SiteMembershipRequestWithPersonEntry": "alfresco_core_models",
+    "List22": "alfresco_core_models",
+    "SiteMembershipRequestWithPersonPaging": "alfresco_core_models",
+    "List23": "alfresco_core_models",
+    "SitePaging": "alfresco_core_models",
+    "SiteRole": "alfresco_core_models",
+    "SiteRoleEntry": "alfresco_core_models",
+    "List24": "alfresco_core_models",
+    "SiteRolePaging": "alfresco_core_models",
+    "Tag": "alfresco_core_models",
+    "TagBody": "alfresco_core_models",
+    "TagEntry": "alfresco_core_models",
+    "List25": "alfresco_core_models",
+    "TagPaging": "alfresco_core_models",
+    "Version": "alfresco_core_models",
+    "VersionEntry": "alfresco_core_models",
+    "List26": "alfresco_core_models",
+    "VersionPaging": "alfresco_core_models",
+    "ActionDefinition": "alfresco_core_models",
+    "ActionDefinitionEntry": "alfresco_core_models",
+    "ActionDefinitionList": "alfresco_core_models",
+    "ActivityPaging": "alfresco_core_models",
+    "AuditAppPaging": "alfresco_core_models",
+    "AuditEntry": "alfresco_core_models",
+    "AuditEntryEntry": "alfresco_core_models",
+    "AuditEntryPaging": "alfresco_core_models",
+    "Comment": "alfresco_core_models",
+    "CommentEntry": "alfresco_core_models",
+    "CommentPaging": "alfresco_core_models",
+    "Definition": "alfresco_core_models",
+    "FavoritePaging": "alfresco_core_models",
+    "GroupMemberPaging": "alfresco_core_models",
+    "List8": "alfresco_core_models",
+    "GroupPaging": "alfresco_core_models",
+    "NodeAssociation": "alfresco_core_models",
+    "NodeAssociationEntry": "alfresco_core_models",
+    "List9": "alfresco_core_models",
+    "NodeAssociationPaging": "alfresco_core_models",
+    "NodeBodyCreate": "alfresco_core_models",
+    "NodeBodyUpdate": "alfresco_core_models",
+    "NodeChildAssociation": "alfresco_core_models",
+    "NodeChildAssociationEntry": "alfresco_core_models",
+    "List10": "alfresco_core_models",
+    "NodeChildAssociationPaging": "alfresco_core_models",
+    "NodeEntry": "alfresco_core_models",
+    "List11": "alfresco_core_models",
+    "NodePaging": "alfresco_core_models",
+    "SharedLink": "alfresco_core_models",
+    "SharedLinkEntry": "alfresco_core_models",
+    "List17": "alfresco_core_models",
+    "SharedLinkPaging": "alfresco_core_models",
+    "DeletedNode": "alfresco_core_models",
+    "DeletedNodeEntry": "alfresco_core_models",
+    "DeletedNodesPaging": "alfresco_core_models",
+    "EntitlementsInfo": "alfresco_discovery_models",
+    "LicenseInfo": "alfresco_discovery_models",
+    "ModuleInfo": "alfresco_discovery_models",
+    "StatusInfo": "alfresco_discovery_models",
+    "VersionInfo": "alfresco_discovery_models",
+    "RepositoryInfo": "alfresco_discovery_models",
+    "RepositoryEntry": "alfresco_discovery_models",
+    "DiscoveryEntry": "alfresco_discovery_models",
+    "ContentInfo": "alfresco_search_models",
+    "BucketInfo": "alfresco_search_models",
+    "GenericMetric": "alfresco_search_models",
+    "PathElement": "alfresco_search_models",
+    "PathInfo": "alfresco_search_models",
+    "DefaultFTSFieldOperator": "alfresco_search_models",
+    "DefaultFTSOperator": "alfresco_search_models",
+    "RequestDefaults": "alfresco_search_models",
+    "Method": "alfresco_search_models",
+    "Sort": "alfresco_search_models",
+    "RequestFacetField": "alfresco_search_models",
+    "RequestFacetFields": "alfresco_search_models",
+    "RequestFacetQuery": "alfresco_search_models",
+    "RequestFacetQueries": "alfresco_search_models",
+    "RequestFacetSet": "alfresco_search_models",
+    "RequestFields": "alfresco_search_models",
+    "RequestFilterQuery": "alfresco_search_models",
+    "RequestFilterQueries": "alfresco_search_models",
+    "FieldModel": "alfresco_search_models",
+    "RequestHighlight": "alfresco_search_models",
+    "RequestIncludeEnum": "alfresco_search_models",
+    "RequestInclude": "alfresco_search_models",
+    "RequestLimits": "alfresco_search_models",
+    "RequestLocalization": "alfresco_search_models",
+    "RequestPagination": "alfresco_search_models",
+    "RequestPivot": "alfresco_search_models",
+    "Language": "alfresco_search_models",
+    "RequestQuery": "alfresco_search_models",
+    "RequestRange": "alfresco_search_models",
+    "Locations": "alfresco_search_models",
+    "RequestScope": "alfresco_search_models",
+    "RequestSortDefinitionItem": "alfresco_search_models",
+    "RequestSortDefinition": "alfresco_search_models",
+    "RequestSpellcheck": "alfresco_search_models",
+    "RequestStats": "alfresco_search_models",
+    "RequestTemplate": "alfresco_search_models",
+    "RequestTemplates": "alfresco_search_models",
+    "ResponseConsistency": "alfresco_search_models",
+    "Bucket": "alfresco_search_models",
+    "ResultBuckets": "alfresco_search_models",
+    "FacetQuery": "alfresco_search_models",
+    "Type1": "alfresco_search_models",
+    "SpellcheckItem": "alfresco_search_models",
+    "HighlightItem": "alfresco_search_models",
+    "SearchEntry": "alfresco_search_models",
+    "UserInfo": "alfresco_search_models",
+    "GenericBucket": "alfresco_search_models",
+    "GenericFacetResponse": "alfresco_search_models",
+    "Node": "alfresco_search_models",
+    "Interval": "alfresco_search_models",
+    "RequestFacetIntervals": "alfresco_search_models",
+    "ResultNode": "alfresco_search_models",
+    "ResultSetRowEntry": "alfresco_search_models",
+    "SearchRequest": "alfresco_search_models",
+    "ResultSetContext": "alfresco_search_models",
+    "ResultSetPaging": "alfresco_search_models",
+    "CandidateType": "alfresco_workflow_models",
+    "Candidate": "alfresco_workflow_models",
+    "CandidateEntry": "alfresco_workflow_models",
+    "Company": "alfresco_workflow_models",
+    "Deployment": "alfresco_workflow_models",
+    "DeploymentEntry": "alfresco_workflow_models",
+    "ItemBody": "alfresco_workflow_models",
+    "Person": "alfresco_workflow_models",
+    "Process": "alfresco_workflow_models",
+    "ProcessBodyVariable": "alfresco_workflow_models",
+    "ProcessDefinition": "alfresco_workflow_models",
+    "ProcessDefinitionEntry": "alfresco_workflow_models",
+    "List3": "alfresco_workflow_models",
+    "ProcessDefinitionPaging": "alfresco_workflow_models",
+    "ProcessEntry": "alfresco_workflow_models",
+    "List4": "alfresco_workflow_models",
+    "ProcessPaging": "alfresco_workflow_models",
+    "State": "alfresco_workflow_models",
+    "TaskFormModel": "alfresco_workflow_models",
+    "TaskFormModelEntry": "alfresco_workflow_models",
+    "List5": "alfresco_workflow_models",
+    "TaskFormModelPaging": "alfresco_workflow_models",
+    "Variable": "alfresco_workflow_models",
+    "VariableBody": "alfresco_workflow_models",
+    "VariableEntry": "alfresco_workflow_models",
+    "List7": "alfresco_workflow_models",
+    "VariablePaging": "alfresco_workflow_models",
+    "CandidatePaging": "alfresco_workflow_models",
+    "DeploymentPaging": "alfresco_workflow_models",
+    "Item": "alfresco_workflow_models",
+    "ItemEntry": "alfresco_workflow_models",
+    "List2": "alfresco_workflow_models",
+    "ItemPaging": "alfresco_workflow_models",
+    "ProcessBody": "alfresco_workflow_models",
+    "Task": "alfresco_workflow_models",
+    "TaskBody": "alfresco_workflow_models",
+    "TaskEntry": "alfresco_workflow_models",
+    "List6": "alfresco_workflow_models",
+    "TaskPaging": "alfresco_workflow_models",
+    "AbstractClassAssociationSource": "alfresco_model_models",
+    "Constraint": "alfresco_model_models",
+    "Model": "alfresco_model_models",
+    "Property": "alfresco_model_models",
+    "AbstractClassAssociation": "alfresco_model_models",
+    "AbstractClass": "alfresco_model_models",
+    "Aspect": "alfresco_model_models",
+    "AspectEntry": "alfresco_model_models",
+    "AspectPaging": "alfresco_model_models",
+    "Type": "alfresco_model_models",
+    "TypeEntry": "alfresco_model_models",
+    "List1": "alfresco_model_models",
+    "TypePaging": "alfresco_model_models",
+    "Error1": "alfresco_search_sql_models",
+    "Error": "alfresco_search_sql_models",
+    "Pagination": "alfresco_search_sql_models",
+    "SQLResultSetRowEntry": "alfresco_search_sql_models",
+    "SQLSearchRequest": "alfresco_search_sql_models",
+    "Doc": "alfresco_search_sql_models",
+    "Docs": "alfresco_search_sql_models",
+    "List": "alfresco_search_sql_models",
+    "SQLResultSetPaging": "alfresco_search_sql_models",
+    "SolrResultSet": "alfresco_search_sql_models",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
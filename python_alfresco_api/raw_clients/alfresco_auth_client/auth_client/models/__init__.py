@@ -1,12 +1,27 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .error import Error
-from .error_error import ErrorError
-from .ticket import Ticket
-from .ticket_body import TicketBody
-from .ticket_entry import TicketEntry
-from .valid_ticket import ValidTicket
-from .valid_ticket_entry import ValidTicketEntry
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .error import Error
+    from .error_error import ErrorError
+    from .ticket import Ticket
+    from .ticket_body import TicketBody
+    from .ticket_entry import TicketEntry
+    from .valid_ticket import ValidTicket
+    from .valid_ticket_entry import ValidTicketEntry
+
+# Model modules are imported on first attribute access (PEP 562)
+_MODULES = {
+    "Error": "error",
+    "ErrorError": "error_error",
+    "Ticket": "ticket",
+    "TicketBody": "ticket_body",
+    "TicketEntry": "ticket_entry",
+    "ValidTicket": "valid_ticket",
+    "ValidTicketEntry": "valid_ticket_entry",
+}
 
 __all__ = (
     "Error",
@@ -17,3 +32,16 @@ __all__ = (
     "ValidTicket",
     "ValidTicketEntry",
 )
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
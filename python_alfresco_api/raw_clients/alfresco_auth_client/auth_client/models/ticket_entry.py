@@ -4,10 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 if TYPE_CHECKING:
     from ..models.ticket import Ticket
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Ticket
+    from ..models.ticket import Ticket
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="TicketEntry")
 
 
@@ -36,7 +48,8 @@ class TicketEntry:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.ticket import Ticket
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         entry = Ticket.from_dict(d.pop("entry"))
@@ -45,7 +58,7 @@ class TicketEntry:
             entry=entry,
         )
 
-        ticket_entry.additional_properties = d
+        ticket_entry.additional_properties = d or EMPTY_PROPERTIES
         return ticket_entry
 
     @property
@@ -56,6 +69,8 @@ class TicketEntry:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -0,0 +1,226 @@
+import datetime
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Optional, Union
+
+from ...client import AuthenticatedClient, Client
+from ...streaming import StreamingResponse, abuild_streaming_response, build_streaming_response, http_date
+from ...types import UNSET, Unset
+
+_DOCUMENTED_STATUSES = frozenset({200, 304, 400, 401, 404})
+
+
+def _get_kwargs(
+    person_id: str,
+    *,
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    placeholder: Union[Unset, bool] = True,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+    if not isinstance(if_modified_since, Unset):
+        headers["If-Modified-Since"] = http_date(if_modified_since)
+
+    params: dict[str, Any] = {}
+
+    params["attachment"] = attachment
+
+    params["placeholder"] = placeholder
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/people/{person_id}/avatar",
+        "params": params,
+    }
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def sync_detailed(
+    person_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    placeholder: Union[Unset, bool] = True,
+) -> StreamingResponse:
+    """Get avatar image
+
+     **Note:** this endpoint is available in Alfresco 5.2.2 and newer versions.
+
+    Gets the avatar image related to the person **personId**. If the person has no related avatar then
+    the **placeholder** query parameter can be optionally used to request a placeholder image to be returned.
+
+    You can use the `-me-` string in place of `<personId>` to specify the currently authenticated user.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        person_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        placeholder (Union[Unset, bool] Default: True.):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        StreamingResponse: status, headers and the unread body (close it when done)
+    """
+
+    kwargs = _get_kwargs(
+        person_id=person_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        placeholder=placeholder,
+    )
+
+    httpx_client = client.get_httpx_client()
+    response = httpx_client.send(httpx_client.build_request(**kwargs), stream=True)
+
+    return build_streaming_response(response, _DOCUMENTED_STATUSES, client.raise_on_unexpected_status)
+
+
+def sync(
+    person_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    placeholder: Union[Unset, bool] = True,
+    chunk_size: Optional[int] = None,
+) -> Optional[Iterator[bytes]]:
+    """Get avatar image
+
+     **Note:** this endpoint is available in Alfresco 5.2.2 and newer versions.
+
+    Gets the avatar image related to the person **personId**. If the person has no related avatar then
+    the **placeholder** query parameter can be optionally used to request a placeholder image to be returned.
+
+    You can use the `-me-` string in place of `<personId>` to specify the currently authenticated user.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        person_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        placeholder (Union[Unset, bool] Default: True.):
+        chunk_size (Optional[int]): Bytes per chunk (default: as received)
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Optional[Iterator[bytes]]: content chunks, or None for a documented error status
+    """
+
+    response = sync_detailed(
+        person_id=person_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        placeholder=placeholder,
+        client=client,
+    )
+    if not response.is_success:
+        response.close()
+        return None
+    return response.iter_bytes(chunk_size=chunk_size)
+
+
+async def asyncio_detailed(
+    person_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    placeholder: Union[Unset, bool] = True,
+) -> StreamingResponse:
+    """Get avatar image
+
+     **Note:** this endpoint is available in Alfresco 5.2.2 and newer versions.
+
+    Gets the avatar image related to the person **personId**. If the person has no related avatar then
+    the **placeholder** query parameter can be optionally used to request a placeholder image to be returned.
+
+    You can use the `-me-` string in place of `<personId>` to specify the currently authenticated user.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        person_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        placeholder (Union[Unset, bool] Default: True.):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        StreamingResponse: status, headers and the unread body (close it when done)
+    """
+
+    kwargs = _get_kwargs(
+        person_id=person_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        placeholder=placeholder,
+    )
+
+    httpx_client = client.get_async_httpx_client()
+    response = await httpx_client.send(httpx_client.build_request(**kwargs), stream=True)
+
+    return await abuild_streaming_response(response, _DOCUMENTED_STATUSES, client.raise_on_unexpected_status)
+
+
+async def asyncio(
+    person_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    placeholder: Union[Unset, bool] = True,
+    chunk_size: Optional[int] = None,
+) -> Optional[AsyncIterator[bytes]]:
+    """Get avatar image
+
+     **Note:** this endpoint is available in Alfresco 5.2.2 and newer versions.
+
+    Gets the avatar image related to the person **personId**. If the person has no related avatar then
+    the **placeholder** query parameter can be optionally used to request a placeholder image to be returned.
+
+    You can use the `-me-` string in place of `<personId>` to specify the currently authenticated user.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        person_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        placeholder (Union[Unset, bool] Default: True.):
+        chunk_size (Optional[int]): Bytes per chunk (default: as received)
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Optional[AsyncIterator[bytes]]: content chunks, or None for a documented error status
+    """
+
+    response = await asyncio_detailed(
+        person_id=person_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        placeholder=placeholder,
+        client=client,
+    )
+    if not response.is_success:
+        await response.aclose()
+        return None
+    return response.aiter_bytes(chunk_size=chunk_size)
@@ -0,0 +1,223 @@
+import datetime
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Optional, Union
+
+from ...client import AuthenticatedClient, Client
+from ...streaming import StreamingResponse, abuild_streaming_response, build_streaming_response, http_date
+from ...types import UNSET, Unset
+
+_DOCUMENTED_STATUSES = frozenset({200, 206, 304, 400, 404, 416, 501})
+
+
+def _get_kwargs(
+    shared_id: str,
+    *,
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    range_: Union[Unset, str] = UNSET,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+    if not isinstance(if_modified_since, Unset):
+        headers["If-Modified-Since"] = http_date(if_modified_since)
+
+    if not isinstance(range_, Unset):
+        headers["Range"] = range_
+
+    params: dict[str, Any] = {}
+
+    params["attachment"] = attachment
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/shared-links/{shared_id}/content",
+        "params": params,
+    }
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def sync_detailed(
+    shared_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    range_: Union[Unset, str] = UNSET,
+) -> StreamingResponse:
+    """Get shared link content
+
+     **Note:** this endpoint is available in Alfresco 5.2 and newer versions.
+
+    Gets the content of the file with shared link identifier **sharedId**.
+
+    **Note:** No authentication is required to call this endpoint.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        shared_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        range_ (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        StreamingResponse: status, headers and the unread body (close it when done)
+    """
+
+    kwargs = _get_kwargs(
+        shared_id=shared_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        range_=range_,
+    )
+
+    httpx_client = client.get_httpx_client()
+    response = httpx_client.send(httpx_client.build_request(**kwargs), stream=True)
+
+    return build_streaming_response(response, _DOCUMENTED_STATUSES, client.raise_on_unexpected_status)
+
+
+def sync(
+    shared_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    range_: Union[Unset, str] = UNSET,
+    chunk_size: Optional[int] = None,
+) -> Optional[Iterator[bytes]]:
+    """Get shared link content
+
+     **Note:** this endpoint is available in Alfresco 5.2 and newer versions.
+
+    Gets the content of the file with shared link identifier **sharedId**.
+
+    **Note:** No authentication is required to call this endpoint.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        shared_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        range_ (Union[Unset, str]):
+        chunk_size (Optional[int]): Bytes per chunk (default: as received)
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Optional[Iterator[bytes]]: content chunks, or None for a documented error status
+    """
+
+    response = sync_detailed(
+        shared_id=shared_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        range_=range_,
+        client=client,
+    )
+    if not response.is_success:
+        response.close()
+        return None
+    return response.iter_bytes(chunk_size=chunk_size)
+
+
+async def asyncio_detailed(
+    shared_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    range_: Union[Unset, str] = UNSET,
+) -> StreamingResponse:
+    """Get shared link content
+
+     **Note:** this endpoint is available in Alfresco 5.2 and newer versions.
+
+    Gets the content of the file with shared link identifier **sharedId**.
+
+    **Note:** No authentication is required to call this endpoint.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        shared_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        range_ (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        StreamingResponse: status, headers and the unread body (close it when done)
+    """
+
+    kwargs = _get_kwargs(
+        shared_id=shared_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        range_=range_,
+    )
+
+    httpx_client = client.get_async_httpx_client()
+    response = await httpx_client.send(httpx_client.build_request(**kwargs), stream=True)
+
+    return await abuild_streaming_response(response, _DOCUMENTED_STATUSES, client.raise_on_unexpected_status)
+
+
+async def asyncio(
+    shared_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    range_: Union[Unset, str] = UNSET,
+    chunk_size: Optional[int] = None,
+) -> Optional[AsyncIterator[bytes]]:
+    """Get shared link content
+
+     **Note:** this endpoint is available in Alfresco 5.2 and newer versions.
+
+    Gets the content of the file with shared link identifier **sharedId**.
+
+    **Note:** No authentication is required to call this endpoint.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        shared_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        range_ (Union[Unset, str]):
+        chunk_size (Optional[int]): Bytes per chunk (default: as received)
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Optional[AsyncIterator[bytes]]: content chunks, or None for a documented error status
+    """
+
+    response = await asyncio_detailed(
+        shared_id=shared_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        range_=range_,
+        client=client,
+    )
+    if not response.is_success:
+        await response.aclose()
+        return None
+    return response.aiter_bytes(chunk_size=chunk_size)
@@ -0,0 +1,256 @@
+import datetime
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Optional, Union
+
+from ...client import AuthenticatedClient, Client
+from ...streaming import StreamingResponse, abuild_streaming_response, build_streaming_response, http_date
+from ...types import UNSET, Unset
+
+_DOCUMENTED_STATUSES = frozenset({200, 206, 304, 400, 401, 403, 404, 416})
+
+
+def _get_kwargs(
+    node_id: str,
+    version_id: str,
+    rendition_id: str,
+    *,
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    range_: Union[Unset, str] = UNSET,
+    placeholder: Union[Unset, bool] = False,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+    if not isinstance(if_modified_since, Unset):
+        headers["If-Modified-Since"] = http_date(if_modified_since)
+
+    if not isinstance(range_, Unset):
+        headers["Range"] = range_
+
+    params: dict[str, Any] = {}
+
+    params["attachment"] = attachment
+
+    params["placeholder"] = placeholder
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/nodes/{node_id}/versions/{version_id}/renditions/{rendition_id}/content",
+        "params": params,
+    }
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def sync_detailed(
+    node_id: str,
+    version_id: str,
+    rendition_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    range_: Union[Unset, str] = UNSET,
+    placeholder: Union[Unset, bool] = False,
+) -> StreamingResponse:
+    """Get rendition content for a file version
+
+     **Note:** this endpoint is available in Alfresco 7.0.0 and newer versions.
+
+    Gets the rendition content for **renditionId** of version of file **nodeId** and **versionId**.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        node_id (str):
+        version_id (str):
+        rendition_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        range_ (Union[Unset, str]):
+        placeholder (Union[Unset, bool] Default: False.):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        StreamingResponse: status, headers and the unread body (close it when done)
+    """
+
+    kwargs = _get_kwargs(
+        node_id=node_id,
+        version_id=version_id,
+        rendition_id=rendition_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        range_=range_,
+        placeholder=placeholder,
+    )
+
+    httpx_client = client.get_httpx_client()
+    response = httpx_client.send(httpx_client.build_request(**kwargs), stream=True)
+
+    return build_streaming_response(response, _DOCUMENTED_STATUSES, client.raise_on_unexpected_status)
+
+
+def sync(
+    node_id: str,
+    version_id: str,
+    rendition_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    range_: Union[Unset, str] = UNSET,
+    placeholder: Union[Unset, bool] = False,
+    chunk_size: Optional[int] = None,
+) -> Optional[Iterator[bytes]]:
+    """Get rendition content for a file version
+
+     **Note:** this endpoint is available in Alfresco 7.0.0 and newer versions.
+
+    Gets the rendition content for **renditionId** of version of file **nodeId** and **versionId**.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        node_id (str):
+        version_id (str):
+        rendition_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        range_ (Union[Unset, str]):
+        placeholder (Union[Unset, bool] Default: False.):
+        chunk_size (Optional[int]): Bytes per chunk (default: as received)
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Optional[Iterator[bytes]]: content chunks, or None for a documented error status
+    """
+
+    response = sync_detailed(
+        node_id=node_id,
+        version_id=version_id,
+        rendition_id=rendition_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        range_=range_,
+        placeholder=placeholder,
+        client=client,
+    )
+    if not response.is_success:
+        response.close()
+        return None
+    return response.iter_bytes(chunk_size=chunk_size)
+
+
+async def asyncio_detailed(
+    node_id: str,
+    version_id: str,
+    rendition_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    range_: Union[Unset, str] = UNSET,
+    placeholder: Union[Unset, bool] = False,
+) -> StreamingResponse:
+    """Get rendition content for a file version
+
+     **Note:** this endpoint is available in Alfresco 7.0.0 and newer versions.
+
+    Gets the rendition content for **renditionId** of version of file **nodeId** and **versionId**.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        node_id (str):
+        version_id (str):
+        rendition_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        range_ (Union[Unset, str]):
+        placeholder (Union[Unset, bool] Default: False.):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        StreamingResponse: status, headers and the unread body (close it when done)
+    """
+
+    kwargs = _get_kwargs(
+        node_id=node_id,
+        version_id=version_id,
+        rendition_id=rendition_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        range_=range_,
+        placeholder=placeholder,
+    )
+
+    httpx_client = client.get_async_httpx_client()
+    response = await httpx_client.send(httpx_client.build_request(**kwargs), stream=True)
+
+    return await abuild_streaming_response(response, _DOCUMENTED_STATUSES, client.raise_on_unexpected_status)
+
+
+async def asyncio(
+    node_id: str,
+    version_id: str,
+    rendition_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    attachment: Union[Unset, bool] = True,
+    if_modified_since: Union[Unset, datetime.datetime] = UNSET,
+    range_: Union[Unset, str] = UNSET,
+    placeholder: Union[Unset, bool] = False,
+    chunk_size: Optional[int] = None,
+) -> Optional[AsyncIterator[bytes]]:
+    """Get rendition content for a file version
+
+     **Note:** this endpoint is available in Alfresco 7.0.0 and newer versions.
+
+    Gets the rendition content for **renditionId** of version of file **nodeId** and **versionId**.
+
+    The response body is streamed, never read into memory.
+
+    Args:
+        node_id (str):
+        version_id (str):
+        rendition_id (str):
+        attachment (Union[Unset, bool] Default: True.):
+        if_modified_since (Union[Unset, datetime.datetime]):
+        range_ (Union[Unset, str]):
+        placeholder (Union[Unset, bool] Default: False.):
+        chunk_size (Optional[int]): Bytes per chunk (default: as received)
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Optional[AsyncIterator[bytes]]: content chunks, or None for a documented error status
+    """
+
+    response = await asyncio_detailed(
+        node_id=node_id,
+        version_id=version_id,
+        rendition_id=rendition_id,
+        attachment=attachment,
+        if_modified_since=if_modified_since,
+        range_=range_,
+        placeholder=placeholder,
+        client=client,
+    )
+    if not response.is_success:
+        await response.aclose()
+        return None
+    return response.aiter_bytes(chunk_size=chunk_size)
@@ -1,198 +1,399 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .action_body_exec import ActionBodyExec
-from .action_body_exec_params import ActionBodyExecParams
-from .action_definition import ActionDefinition
-from .action_definition_entry import ActionDefinitionEntry
-from .action_definition_list import ActionDefinitionList
-from .action_definition_list_list import ActionDefinitionListList
-from .action_exec_result import ActionExecResult
-from .action_exec_result_entry import ActionExecResultEntry
-from .action_parameter_definition import ActionParameterDefinition
-from .activity import Activity
-from .activity_activity_summary import ActivityActivitySummary
-from .activity_entry import ActivityEntry
-from .activity_paging import ActivityPaging
-from .activity_paging_list import ActivityPagingList
-from .association import Association
-from .association_body import AssociationBody
-from .association_entry import AssociationEntry
-from .association_info import AssociationInfo
-from .audit_app import AuditApp
-from .audit_app_entry import AuditAppEntry
-from .audit_app_paging import AuditAppPaging
-from .audit_app_paging_list import AuditAppPagingList
-from .audit_body_update import AuditBodyUpdate
-from .audit_entry import AuditEntry
-from .audit_entry_entry import AuditEntryEntry
-from .audit_entry_paging import AuditEntryPaging
-from .audit_entry_paging_list import AuditEntryPagingList
-from .audit_entry_values import AuditEntryValues
-from .capabilities import Capabilities
-from .child_association import ChildAssociation
-from .child_association_body import ChildAssociationBody
-from .child_association_entry import ChildAssociationEntry
-from .child_association_info import ChildAssociationInfo
-from .client_body import ClientBody
-from .comment import Comment
-from .comment_body import CommentBody
-from .comment_entry import CommentEntry
-from .comment_paging import CommentPaging
-from .comment_paging_list import CommentPagingList
-from .company import Company
-from .constraint import Constraint
-from .constraint_parameters import ConstraintParameters
-from .constraint_parameters_additional_property import ConstraintParametersAdditionalProperty
-from .content_info import ContentInfo
-from .definition import Definition
-from .deleted_node import DeletedNode
-from .deleted_node_body_restore import DeletedNodeBodyRestore
-from .deleted_node_entry import DeletedNodeEntry
-from .deleted_nodes_paging import DeletedNodesPaging
-from .deleted_nodes_paging_list import DeletedNodesPagingList
-from .direct_access_url_body_create import DirectAccessUrlBodyCreate
-from .download import Download
-from .download_body_create import DownloadBodyCreate
-from .download_entry import DownloadEntry
-from .download_status import DownloadStatus
-from .error import Error
-from .error_error import ErrorError
-from .favorite import Favorite
-from .favorite_body_create import FavoriteBodyCreate
-from .favorite_body_create_target import FavoriteBodyCreateTarget
-from .favorite_entry import FavoriteEntry
-from .favorite_paging import FavoritePaging
-from .favorite_paging_list import FavoritePagingList
-from .favorite_properties import FavoriteProperties
-from .favorite_site import FavoriteSite
-from .favorite_site_body_create import FavoriteSiteBodyCreate
-from .favorite_site_entry import FavoriteSiteEntry
-from .favorite_target import FavoriteTarget
-from .group import Group
-from .group_body_create import GroupBodyCreate
-from .group_body_update import GroupBodyUpdate
-from .group_entry import GroupEntry
-from .group_member import GroupMember
-from .group_member_entry import GroupMemberEntry
-from .group_member_member_type import GroupMemberMemberType
-from .group_member_paging import GroupMemberPaging
-from .group_member_paging_list import GroupMemberPagingList
-from .group_membership_body_create import GroupMembershipBodyCreate
-from .group_membership_body_create_member_type import GroupMembershipBodyCreateMemberType
-from .group_paging import GroupPaging
-from .group_paging_list import GroupPagingList
-from .network_quota import NetworkQuota
-from .node import Node
-from .node_association import NodeAssociation
-from .node_association_entry import NodeAssociationEntry
-from .node_association_paging import NodeAssociationPaging
-from .node_association_paging_list import NodeAssociationPagingList
-from .node_body_copy import NodeBodyCopy
-from .node_body_create import NodeBodyCreate
-from .node_body_create_association import NodeBodyCreateAssociation
-from .node_body_create_properties import NodeBodyCreateProperties
-from .node_body_lock import NodeBodyLock
-from .node_body_lock_lifetime import NodeBodyLockLifetime
-from .node_body_lock_type import NodeBodyLockType
-from .node_body_move import NodeBodyMove
-from .node_body_update import NodeBodyUpdate
-from .node_body_update_properties import NodeBodyUpdateProperties
-from .node_child_association import NodeChildAssociation
-from .node_child_association_entry import NodeChildAssociationEntry
-from .node_child_association_paging import NodeChildAssociationPaging
-from .node_child_association_paging_list import NodeChildAssociationPagingList
-from .node_entry import NodeEntry
-from .node_paging import NodePaging
-from .node_paging_list import NodePagingList
-from .node_properties import NodeProperties
-from .pagination import Pagination
-from .password_reset_body import PasswordResetBody
-from .path_element import PathElement
-from .path_info import PathInfo
-from .permission_element import PermissionElement
-from .permission_element_access_status import PermissionElementAccessStatus
-from .permissions_body import PermissionsBody
-from .permissions_info import PermissionsInfo
-from .person import Person
-from .person_body_create import PersonBodyCreate
-from .person_body_create_properties import PersonBodyCreateProperties
-from .person_body_update import PersonBodyUpdate
-from .person_body_update_properties import PersonBodyUpdateProperties
-from .person_entry import PersonEntry
-from .person_network import PersonNetwork
-from .person_network_entry import PersonNetworkEntry
-from .person_network_paging import PersonNetworkPaging
-from .person_network_paging_list import PersonNetworkPagingList
-from .person_network_subscription_level import PersonNetworkSubscriptionLevel
-from .person_paging import PersonPaging
-from .person_paging_list import PersonPagingList
-from .person_properties import PersonProperties
-from .preference import Preference
-from .preference_entry import PreferenceEntry
-from .preference_paging import PreferencePaging
-from .preference_paging_list import PreferencePagingList
-from .probe_entry import ProbeEntry
-from .probe_entry_entry import ProbeEntryEntry
-from .property_ import Property
-from .rating import Rating
-from .rating_aggregate import RatingAggregate
-from .rating_body import RatingBody
-from .rating_body_id import RatingBodyId
-from .rating_entry import RatingEntry
-from .rating_paging import RatingPaging
-from .rating_paging_list import RatingPagingList
-from .rendition import Rendition
-from .rendition_body_create import RenditionBodyCreate
-from .rendition_entry import RenditionEntry
-from .rendition_paging import RenditionPaging
-from .rendition_paging_list import RenditionPagingList
-from .rendition_status import RenditionStatus
-from .revert_body import RevertBody
-from .shared_link import SharedLink
-from .shared_link_body_create import SharedLinkBodyCreate
-from .shared_link_body_email import SharedLinkBodyEmail
-from .shared_link_entry import SharedLinkEntry
-from .shared_link_paging import SharedLinkPaging
-from .shared_link_paging_list import SharedLinkPagingList
-from .shared_link_properties import SharedLinkProperties
-from .site_body_create import SiteBodyCreate
-from .site_body_create_visibility import SiteBodyCreateVisibility
-from .site_body_update import SiteBodyUpdate
-from .site_body_update_visibility import SiteBodyUpdateVisibility
-from .site_container import SiteContainer
-from .site_container_entry import SiteContainerEntry
-from .site_container_paging import SiteContainerPaging
-from .site_container_paging_list import SiteContainerPagingList
-from .site_group import SiteGroup
-from .site_group_entry import SiteGroupEntry
-from .site_group_paging import SiteGroupPaging
-from .site_group_paging_list import SiteGroupPagingList
-from .site_group_role import SiteGroupRole
-from .site_member import SiteMember
-from .site_member_entry import SiteMemberEntry
-from .site_member_paging import SiteMemberPaging
-from .site_member_paging_list import SiteMemberPagingList
-from .site_member_role import SiteMemberRole
-from .site_membership_approval_body import SiteMembershipApprovalBody
-from .site_membership_body_create import SiteMembershipBodyCreate
-from .site_membership_body_create_role import SiteMembershipBodyCreateRole
-from .site_membership_body_update import SiteMembershipBodyUpdate
-from .site_membership_body_update_role import SiteMembershipBodyUpdateRole
-from .site_membership_rejection_body import SiteMembershipRejectionBody
-from .site_membership_request_body_create import SiteMembershipRequestBodyCreate
-from .site_membership_request_body_update import SiteMembershipRequestBodyUpdate
-from .site_role_role import SiteRoleRole
-from .tag import Tag
-from .tag_body import TagBody
-from .tag_entry import TagEntry
-from .tag_paging import TagPaging
-from .tag_paging_list import TagPagingList
-from .user_info import UserInfo
-from .version import Version
-from .version_entry import VersionEntry
-from .version_paging import VersionPaging
-from .version_paging_list import VersionPagingList
-from .version_properties import VersionProperties
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .action_body_exec import ActionBodyExec
+    from .action_body_exec_params import ActionBodyExecParams
+    from .action_definition import ActionDefinition
+    from .action_definition_entry import ActionDefinitionEntry
+    from .action_definition_list import ActionDefinitionList
+    from .action_definition_list_list import ActionDefinitionListList
+    from .action_exec_result import ActionExecResult
+    from .action_exec_result_entry import ActionExecResultEntry
+    from .action_parameter_definition import ActionParameterDefinition
+    from .activity import Activity
+    from .activity_activity_summary import ActivityActivitySummary
+    from .activity_entry import ActivityEntry
+    from .activity_paging import ActivityPaging
+    from .activity_paging_list import ActivityPagingList
+    from .association import Association
+    from .association_body import AssociationBody
+    from .association_entry import AssociationEntry
+    from .association_info import AssociationInfo
+    from .audit_app import AuditApp
+    from .audit_app_entry import AuditAppEntry
+    from .audit_app_paging import AuditAppPaging
+    from .audit_app_paging_list import AuditAppPagingList
+    from .audit_body_update import AuditBodyUpdate
+    from .audit_entry import AuditEntry
+    from .audit_entry_entry import AuditEntryEntry
+    from .audit_entry_paging import AuditEntryPaging
+    from .audit_entry_paging_list import AuditEntryPagingList
+    from .audit_entry_values import AuditEntryValues
+    from .capabilities import Capabilities
+    from .child_association import ChildAssociation
+    from .child_association_body import ChildAssociationBody
+    from .child_association_entry import ChildAssociationEntry
+    from .child_association_info import ChildAssociationInfo
+    from .client_body import ClientBody
+    from .comment import Comment
+    from .comment_body import CommentBody
+    from .comment_entry import CommentEntry
+    from .comment_paging import CommentPaging
+    from .comment_paging_list import CommentPagingList
+    from .company import Company
+    from .constraint import Constraint
+    from .constraint_parameters import ConstraintParameters
+    from .constraint_parameters_additional_property import ConstraintParametersAdditionalProperty
+    from .content_info import ContentInfo
+    from .definition import Definition
+    from .deleted_node import DeletedNode
+    from .deleted_node_body_restore import DeletedNodeBodyRestore
+    from .deleted_node_entry import DeletedNodeEntry
+    from .deleted_nodes_paging import DeletedNodesPaging
+    from .deleted_nodes_paging_list import DeletedNodesPagingList
+    from .direct_access_url_body_create import DirectAccessUrlBodyCreate
+    from .download import Download
+    from .download_body_create import DownloadBodyCreate
+    from .download_entry import DownloadEntry
+    from .download_status import DownloadStatus
+    from .error import Error
+    from .error_error import ErrorError
+    from .favorite import Favorite
+    from .favorite_body_create import FavoriteBodyCreate
+    from .favorite_body_create_target import FavoriteBodyCreateTarget
+    from .favorite_entry import FavoriteEntry
+    from .favorite_paging import FavoritePaging
+    from .favorite_paging_list import FavoritePagingList
+    from .favorite_properties import FavoriteProperties
+    from .favorite_site import FavoriteSite
+    from .favorite_site_body_create import FavoriteSiteBodyCreate
+    from .favorite_site_entry import FavoriteSiteEntry
+    from .favorite_target import FavoriteTarget
+    from .group import Group
+    from .group_body_create import GroupBodyCreate
+    from .group_body_update import GroupBodyUpdate
+    from .group_entry import GroupEntry
+    from .group_member import GroupMember
+    from .group_member_entry import GroupMemberEntry
+    from .group_member_member_type import GroupMemberMemberType
+    from .group_member_paging import GroupMemberPaging
+    from .group_member_paging_list import GroupMemberPagingList
+    from .group_membership_body_create import GroupMembershipBodyCreate
+    from .group_membership_body_create_member_type import GroupMembershipBodyCreateMemberType
+    from .group_paging import GroupPaging
+    from .group_paging_list import GroupPagingList
+    from .network_quota import NetworkQuota
+    from .node import Node
+    from .node_association import NodeAssociation
+    from .node_association_entry import NodeAssociationEntry
+    from .node_association_paging import NodeAssociationPaging
+    from .node_association_paging_list import NodeAssociationPagingList
+    from .node_body_copy import NodeBodyCopy
+    from .node_body_create import NodeBodyCreate
+    from .node_body_create_association import NodeBodyCreateAssociation
+    from .node_body_create_properties import NodeBodyCreateProperties
+    from .node_body_lock import NodeBodyLock
+    from .node_body_lock_lifetime import NodeBodyLockLifetime
+    from .node_body_lock_type import NodeBodyLockType
+    from .node_body_move import NodeBodyMove
+    from .node_body_update import NodeBodyUpdate
+    from .node_body_update_properties import NodeBodyUpdateProperties
+    from .node_child_association import NodeChildAssociation
+    from .node_child_association_entry import NodeChildAssociationEntry
+    from .node_child_association_paging import NodeChildAssociationPaging
+    from .node_child_association_paging_list import NodeChildAssociationPagingList
+    from .node_entry import NodeEntry
+    from .node_paging import NodePaging
+    from .node_paging_list import NodePagingList
+    from .node_properties import NodeProperties
+    from .pagination import Pagination
+    from .password_reset_body import PasswordResetBody
+    from .path_element import PathElement
+    from .path_info import PathInfo
+    from .permission_element import PermissionElement
+    from .permission_element_access_status import PermissionElementAccessStatus
+    from .permissions_body import PermissionsBody
+    from .permissions_info import PermissionsInfo
+    from .person import Person
+    from .person_body_create import PersonBodyCreate
+    from .person_body_create_properties import PersonBodyCreateProperties
+    from .person_body_update import PersonBodyUpdate
+    from .person_body_update_properties import PersonBodyUpdateProperties
+    from .person_entry import PersonEntry
+    from .person_network import PersonNetwork
+    from .person_network_entry import PersonNetworkEntry
+    from .person_network_paging import PersonNetworkPaging
+    from .person_network_paging_list import PersonNetworkPagingList
+    from .person_network_subscription_level import PersonNetworkSubscriptionLevel
+    from .person_paging import PersonPaging
+    from .person_paging_list import PersonPagingList
+    from .person_properties import PersonProperties
+    from .preference import Preference
+    from .preference_entry import PreferenceEntry
+    from .preference_paging import PreferencePaging
+    from .preference_paging_list import PreferencePagingList
+    from .probe_entry import ProbeEntry
+    from .probe_entry_entry import ProbeEntryEntry
+    from .property_ import Property
+    from .rating import Rating
+    from .rating_aggregate import RatingAggregate
+    from .rating_body import RatingBody
+    from .rating_body_id import RatingBodyId
+    from .rating_entry import RatingEntry
+    from .rating_paging import RatingPaging
+    from .rating_paging_list import RatingPagingList
+    from .rendition import Rendition
+    from .rendition_body_create import RenditionBodyCreate
+    from .rendition_entry import RenditionEntry
+    from .rendition_paging import RenditionPaging
+    from .rendition_paging_list import RenditionPagingList
+    from .rendition_status import RenditionStatus
+    from .revert_body import RevertBody
+    from .shared_link import SharedLink
+    from .shared_link_body_create import SharedLinkBodyCreate
+    from .shared_link_body_email import SharedLinkBodyEmail
+    from .shared_link_entry import SharedLinkEntry
+    from .shared_link_paging import SharedLinkPaging
+    from .shared_link_paging_list import SharedLinkPagingList
+    from .shared_link_properties import SharedLinkProperties
+    from .site_body_create import SiteBodyCreate
+    from .site_body_create_visibility import SiteBodyCreateVisibility
+    from .site_body_update import SiteBodyUpdate
+    from .site_body_update_visibility import SiteBodyUpdateVisibility
+    from .site_container import SiteContainer
+    from .site_container_entry import SiteContainerEntry
+    from .site_container_paging import SiteContainerPaging
+    from .site_container_paging_list import SiteContainerPagingList
+    from .site_group import SiteGroup
+    from .site_group_entry import SiteGroupEntry
+    from .site_group_paging import SiteGroupPaging
+    from .site_group_paging_list import SiteGroupPagingList
+    from .site_group_role import SiteGroupRole
+    from .site_member import SiteMember
+    from .site_member_entry import SiteMemberEntry
+    from .site_member_paging import SiteMemberPaging
+    from .site_member_paging_list import SiteMemberPagingList
+    from .site_member_role import SiteMemberRole
+    from .site_membership_approval_body import SiteMembershipApprovalBody
+    from .site_membership_body_create import SiteMembershipBodyCreate
+    from .site_membership_body_create_role import SiteMembershipBodyCreateRole
+    from .site_membership_body_update import SiteMembershipBodyUpdate
+    from .site_membership_body_update_role import SiteMembershipBodyUpdateRole
+    from .site_membership_rejection_body import SiteMembershipRejectionBody
+    from .site_membership_request_body_create import SiteMembershipRequestBodyCreate
+    from .site_membership_request_body_update import SiteMembershipRequestBodyUpdate
+    from .site_role_role import SiteRoleRole
+    from .tag import Tag
+    from .tag_body import TagBody
+    from .tag_entry import TagEntry
+    from .tag_paging import TagPaging
+    from .tag_paging_list import TagPagingList
+    from .user_info import UserInfo
+    from .version import Version
+    from .version_entry import VersionEntry
+    from .version_paging import VersionPaging
+    from .version_paging_list import VersionPagingList
+    from .version_properties import VersionProperties
+
+# Model modules are imported on first attribute access (PEP 562)
+_MODULES = {
+    "ActionBodyExec": "action_body_exec",
+    "ActionBodyExecParams": "action_body_exec_params",
+    "ActionDefinition": "action_definition",
+    "ActionDefinitionEntry": "action_definition_entry",
+    "ActionDefinitionList": "action_definition_list",
+    "ActionDefinitionListList": "action_definition_list_list",
+    "ActionExecResult": "action_exec_result",
+    "ActionExecResultEntry": "action_exec_result_entry",
+    "ActionParameterDefinition": "action_parameter_definition",
+    "Activity": "activity",
+    "ActivityActivitySummary": "activity_activity_summary",
+    "ActivityEntry": "activity_entry",
+    "ActivityPaging": "activity_paging",
+    "ActivityPagingList": "activity_paging_list",
+    "Association": "association",
+    "AssociationBody": "association_body",
+    "AssociationEntry": "association_entry",
+    "AssociationInfo": "association_info",
+    "AuditApp": "audit_app",
+    "AuditAppEntry": "audit_app_entry",
+    "AuditAppPaging": "audit_app_paging",
+    "AuditAppPagingList": "audit_app_paging_list",
+    "AuditBodyUpdate": "audit_body_update",
+    "AuditEntry": "audit_entry",
+    "AuditEntryEntry": "audit_entry_entry",
+    "AuditEntryPaging": "audit_entry_paging",
+    "AuditEntryPagingList": "audit_entry_paging_list",
+    "AuditEntryValues": "audit_entry_values",
+    "Capabilities": "capabilities",
+    "ChildAssociation": "child_association",
+    "ChildAssociationBody": "child_association_body",
+    "ChildAssociationEntry": "child_association_entry",
+    "ChildAssociationInfo": "child_association_info",
+    "ClientBody": "client_body",
+    "Comment": "comment",
+    "CommentBody": "comment_body",
+    "CommentEntry": "comment_entry",
+    "CommentPaging": "comment_paging",
+    "CommentPagingList": "comment_paging_list",
+    "Company": "company",
+    "Constraint": "constraint",
+    "ConstraintParameters": "constraint_parameters",
+    "ConstraintParametersAdditionalProperty": "constraint_parameters_additional_property",
+    "ContentInfo": "content_info",
+    "Definition": "definition",
+    "DeletedNode": "deleted_node",
+    "DeletedNodeBodyRestore": "deleted_node_body_restore",
+    "DeletedNodeEntry": "deleted_node_entry",
+    "DeletedNodesPaging": "deleted_nodes_paging",
+    "DeletedNodesPagingList": "deleted_nodes_paging_list",
+    "DirectAccessUrlBodyCreate": "direct_access_url_body_create",
+    "Download": "download",
+    "DownloadBodyCreate": "download_body_create",
+    "DownloadEntry": "download_entry",
+    "DownloadStatus": "download_status",
+    "Error": "error",
+    "ErrorError": "error_error",
+    "Favorite": "favorite",
+    "FavoriteBodyCreate": "favorite_body_create",
+    "FavoriteBodyCreateTarget": "favorite_body_create_target",
+    "FavoriteEntry": "favorite_entry",
+    "FavoritePaging": "favorite_paging",
+    "FavoritePagingList": "favorite_paging_list",
+    "FavoriteProperties": "favorite_properties",
+    "FavoriteSite": "favorite_site",
+    "FavoriteSiteBodyCreate": "favorite_site_body_create",
+    "FavoriteSiteEntry": "favorite_site_entry",
+    "FavoriteTarget": "favorite_target",
+    "Group": "group",
+    "GroupBodyCreate": "group_body_create",
+    "GroupBodyUpdate": "group_body_update",
+    "GroupEntry": "group_entry",
+    "GroupMember": "group_member",
+    "GroupMemberEntry": "group_member_entry",
+    "GroupMemberMemberType": "group_member_member_type",
+    "GroupMemberPaging": "group_member_paging",
+    "GroupMemberPagingList": "group_member_paging_list",
+    "GroupMembershipBodyCreate": "group_membership_body_create",
+    "GroupMembershipBodyCreateMemberType": "group_membership_body_create_member_type",
+    "GroupPaging": "group_paging",
+    "GroupPagingList": "group_paging_list",
+    "NetworkQuota": "network_quota",
+    "Node": "node",
+    "NodeAssociation": "node_association",
+    "NodeAssociationEntry": "node_association_entry",
+    "NodeAssociationPaging": "node_association_paging",
+    "NodeAssociationPagingList": "node_association_paging_list",
+    "NodeBodyCopy": "node_body_copy",
+    "NodeBodyCreate": "node_body_create",
+    "NodeBodyCreateAssociation": "node_body_create_association",
+    "NodeBodyCreateProperties": "node_body_create_properties",
+    "NodeBodyLock": "node_body_lock",
+    "NodeBodyLockLifetime": "node_body_lock_lifetime",
+    "NodeBodyLockType": "node_body_lock_type",
+    "NodeBodyMove": "node_body_move",
+    "NodeBodyUpdate": "node_body_update",
+    "NodeBodyUpdateProperties": "node_body_update_properties",
+    "NodeChildAssociation": "node_child_association",
+    "NodeChildAssociationEntry": "node_child_association_entry",
+    "NodeChildAssociationPaging": "node_child_association_paging",
+    "NodeChildAssociationPagingList": "node_child_association_paging_list",
+    "NodeEntry": "node_entry",
+    "NodePaging": "node_paging",
+    "NodePagingList": "node_paging_list",
+    "NodeProperties": "node_properties",
+    "Pagination": "pagination",
+    "PasswordResetBody": "password_reset_body",
+    "PathElement": "path_element",
+    "PathInfo": "path_info",
+    "PermissionElement": "permission_element",
+    "PermissionElementAccessStatus": "permission_element_access_status",
+    "PermissionsBody": "permissions_body",
+    "PermissionsInfo": "permissions_info",
+    "Person": "person",
+    "PersonBodyCreate": "person_body_create",
+    "PersonBodyCreateProperties": "person_body_create_properties",
+    "PersonBodyUpdate": "person_body_update",
+    "PersonBodyUpdateProperties": "person_body_update_properties",
+    "PersonEntry": "person_entry",
+    "PersonNetwork": "person_network",
+    "PersonNetworkEntry": "person_network_entry",
+    "PersonNetworkPaging": "person_network_paging",
+    "PersonNetworkPagingList": "person_network_paging_list",
+    "PersonNetworkSubscriptionLevel": "person_network_subscription_level",
+    "PersonPaging": "person_paging",
+    "PersonPagingList": "person_paging_list",
+    "PersonProperties": "person_properties",
+    "Preference": "preference",
+    "PreferenceEntry": "preference_entry",
+    "PreferencePaging": "preference_paging",
+    "PreferencePagingList": "preference_paging_list",
+    "ProbeEntry": "probe_entry",
+    "ProbeEntryEntry": "probe_entry_entry",
+    "Property": "property_",
+    "Rating": "rating",
+    "RatingAggregate": "rating_aggregate",
+    "RatingBody": "rating_body",
+    "RatingBodyId": "rating_body_id",
+    "RatingEntry": "rating_entry",
+    "RatingPaging": "rating_paging",
+    "RatingPagingList": "rating_paging_list",
+    "Rendition": "rendition",
+    "RenditionBodyCreate": "rendition_body_create",
+    "RenditionEntry": "rendition_entry",
+    "RenditionPaging": "rendition_paging",
+    "RenditionPagingList": "rendition_paging_list",
+    "RenditionStatus": "rendition_status",
+    "RevertBody": "revert_body",
+    "SharedLink": "shared_link",
+    "SharedLinkBodyCreate": "shared_link_body_create",
+    "SharedLinkBodyEmail": "shared_link_body_email",
+    "SharedLinkEntry": "shared_link_entry",
+    "SharedLinkPaging": "shared_link_paging",
+    "SharedLinkPagingList": "shared_link_paging_list",
+    "SharedLinkProperties": "shared_link_properties",
+    "SiteBodyCreate": "site_body_create",
+    "SiteBodyCreateVisibility": "site_body_create_visibility",
+    "SiteBodyUpdate": "site_body_update",
+    "SiteBodyUpdateVisibility": "site_body_update_visibility",
+    "SiteContainer": "site_container",
+    "SiteContainerEntry": "site_container_entry",
+    "SiteContainerPaging": "site_container_paging",
+    "SiteContainerPagingList": "site_container_paging_list",
+    "SiteGroup": "site_group",
+    "SiteGroupEntry": "site_group_entry",
+    "SiteGroupPaging": "site_group_paging",
+    "SiteGroupPagingList": "site_group_paging_list",
+    "SiteGroupRole": "site_group_role",
+    "SiteMember": "site_member",
+    "SiteMemberEntry": "site_member_entry",
+    "SiteMemberPaging": "site_member_paging",
+    "SiteMemberPagingList": "site_member_paging_list",
+    "SiteMemberRole": "site_member_role",
+    "SiteMembershipApprovalBody": "site_membership_approval_body",
+    "SiteMembershipBodyCreate": "site_membership_body_create",
+    "SiteMembershipBodyCreateRole": "site_membership_body_create_role",
+    "SiteMembershipBodyUpdate": "site_membership_body_update",
+    "SiteMembershipBodyUpdateRole": "site_membership_body_update_role",
+    "SiteMembershipRejectionBody": "site_membership_rejection_body",
+    "SiteMembershipRequestBodyCreate": "site_membership_request_body_create",
+    "SiteMembershipRequestBodyUpdate": "site_membership_request_body_update",
+    "SiteRoleRole": "site_role_role",
+    "Tag": "tag",
+    "TagBody": "tag_body",
+    "TagEntry": "tag_entry",
+    "TagPaging": "tag_paging",
+    "TagPagingList": "tag_paging_list",
+    "UserInfo": "user_info",
+    "Version": "version",
+    "VersionEntry": "version_entry",
+    "VersionPaging": "version_paging",
+    "VersionPagingList": "version_paging_list",
+    "VersionProperties": "version_properties",
+}
 
 __all__ = (
     "ActionBodyExec",
@@ -389,3 +590,16 @@ __all__ = (
     "VersionPagingList",
     "VersionProperties",
 )
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.action_body_exec_params import ActionBodyExecParams
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ActionBodyExecParams
+    from ..models.action_body_exec_params import ActionBodyExecParams
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ActionBodyExec")
 
 
@@ -52,7 +62,8 @@ class ActionBodyExec:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.action_body_exec_params import ActionBodyExecParams
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         action_definition_id = d.pop("actionDefinitionId")
@@ -72,7 +83,7 @@ class ActionBodyExec:
             target_id=target_id,
         )
 
-        action_body_exec.additional_properties = d
+        action_body_exec.additional_properties = d or EMPTY_PROPERTIES
         return action_body_exec
 
     @property
@@ -83,6 +94,8 @@ class ActionBodyExec:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="ActionBodyExecParams")
 
 
@@ -24,7 +26,7 @@ class ActionBodyExecParams:
         d = dict(src_dict)
         action_body_exec_params = cls()
 
-        action_body_exec_params.additional_properties = d
+        action_body_exec_params.additional_properties = d or EMPTY_PROPERTIES
         return action_body_exec_params
 
     @property
@@ -35,6 +37,8 @@ class ActionBodyExecParams:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.action_parameter_definition import ActionParameterDefinition
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ActionParameterDefinition
+    from ..models.action_parameter_definition import ActionParameterDefinition
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ActionDefinition")
 
 
@@ -78,7 +88,8 @@ class ActionDefinition:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.action_parameter_definition import ActionParameterDefinition
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         applicable_types = cast(list[str], d.pop("applicableTypes"))
@@ -110,7 +121,7 @@ class ActionDefinition:
             title=title,
         )
 
-        action_definition.additional_properties = d
+        action_definition.additional_properties = d or EMPTY_PROPERTIES
         return action_definition
 
     @property
@@ -121,6 +132,8 @@ class ActionDefinition:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
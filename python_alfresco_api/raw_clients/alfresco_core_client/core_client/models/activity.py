@@ -4,14 +4,23 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.activity_activity_summary import ActivityActivitySummary
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ActivityActivitySummary
+    from ..models.activity_activity_summary import ActivityActivitySummary
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Activity")
 
 
@@ -80,7 +89,8 @@ class Activity:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.activity_activity_summary import ActivityActivitySummary
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         activity_type = d.pop("activityType")
@@ -103,7 +113,7 @@ class Activity:
         if isinstance(_posted_at, Unset):
             posted_at = UNSET
         else:
-            posted_at = isoparse(_posted_at)
+            posted_at = parse_datetime(_posted_at)
 
         site_id = d.pop("siteId", UNSET)
 
@@ -117,7 +127,7 @@ class Activity:
             site_id=site_id,
         )
 
-        activity.additional_properties = d
+        activity.additional_properties = d or EMPTY_PROPERTIES
         return activity
 
     @property
@@ -128,6 +138,8 @@ class Activity:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="ActivityActivitySummary")
 
 
@@ -24,7 +26,7 @@ class ActivityActivitySummary:
         d = dict(src_dict)
         activity_activity_summary = cls()
 
-        activity_activity_summary.additional_properties = d
+        activity_activity_summary.additional_properties = d or EMPTY_PROPERTIES
         return activity_activity_summary
 
     @property
@@ -35,6 +37,8 @@ class ActivityActivitySummary:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: str) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
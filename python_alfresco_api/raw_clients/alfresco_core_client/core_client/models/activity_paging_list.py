@@ -4,13 +4,24 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.activity_entry import ActivityEntry
     from ..models.pagination import Pagination
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ActivityEntry, Pagination
+    from ..models.activity_entry import ActivityEntry
+    from ..models.pagination import Pagination
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ActivityPagingList")
 
 
@@ -50,8 +61,8 @@ class ActivityPagingList:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.activity_entry import ActivityEntry
-        from ..models.pagination import Pagination
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         entries = []
@@ -73,7 +84,7 @@ class ActivityPagingList:
             pagination=pagination,
         )
 
-        activity_paging_list.additional_properties = d
+        activity_paging_list.additional_properties = d or EMPTY_PROPERTIES
         return activity_paging_list
 
     @property
@@ -84,6 +95,8 @@ class ActivityPagingList:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
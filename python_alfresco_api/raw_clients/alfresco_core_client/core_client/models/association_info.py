@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="AssociationInfo")
 
 
@@ -39,7 +41,7 @@ class AssociationInfo:
             assoc_type=assoc_type,
         )
 
-        association_info.additional_properties = d
+        association_info.additional_properties = d or EMPTY_PROPERTIES
         return association_info
 
     @property
@@ -50,6 +52,8 @@ class AssociationInfo:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,15 +4,25 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.audit_entry_values import AuditEntryValues
     from ..models.user_info import UserInfo
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, AuditEntryValues, UserInfo
+    from ..models.audit_entry_values import AuditEntryValues
+    from ..models.user_info import UserInfo
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="AuditEntry")
 
 
@@ -64,13 +74,13 @@ class AuditEntry:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.audit_entry_values import AuditEntryValues
-        from ..models.user_info import UserInfo
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         audit_application_id = d.pop("auditApplicationId")
 
-        created_at = isoparse(d.pop("createdAt"))
+        created_at = parse_datetime(d.pop("createdAt"))
 
         created_by_user = UserInfo.from_dict(d.pop("createdByUser"))
 
@@ -91,7 +101,7 @@ class AuditEntry:
             values=values,
         )
 
-        audit_entry.additional_properties = d
+        audit_entry.additional_properties = d or EMPTY_PROPERTIES
         return audit_entry
 
     @property
@@ -102,6 +112,8 @@ class AuditEntry:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="AuditEntryValues")
 
 
@@ -24,7 +26,7 @@ class AuditEntryValues:
         d = dict(src_dict)
         audit_entry_values = cls()
 
-        audit_entry_values.additional_properties = d
+        audit_entry_values.additional_properties = d or EMPTY_PROPERTIES
         return audit_entry_values
 
     @property
@@ -35,6 +37,8 @@ class AuditEntryValues:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="ClientBody")
 
 
@@ -39,7 +41,7 @@ class ClientBody:
             client=client,
         )
 
-        client_body.additional_properties = d
+        client_body.additional_properties = d or EMPTY_PROPERTIES
         return client_body
 
     @property
@@ -50,6 +52,8 @@ class ClientBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,12 +4,23 @@ from typing import TYPE_CHECKING, Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
+
+from ..types import EMPTY_PROPERTIES, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.person import Person
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Person
+    from ..models.person import Person
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Comment")
 
 
@@ -83,7 +94,8 @@ class Comment:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.person import Person
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         can_delete = d.pop("canDelete")
@@ -92,7 +104,7 @@ class Comment:
 
         content = d.pop("content")
 
-        created_at = isoparse(d.pop("createdAt"))
+        created_at = parse_datetime(d.pop("createdAt"))
 
         created_by = Person.from_dict(d.pop("createdBy"))
 
@@ -100,7 +112,7 @@ class Comment:
 
         id = d.pop("id")
 
-        modified_at = isoparse(d.pop("modifiedAt"))
+        modified_at = parse_datetime(d.pop("modifiedAt"))
 
         modified_by = Person.from_dict(d.pop("modifiedBy"))
 
@@ -119,7 +131,7 @@ class Comment:
             title=title,
         )
 
-        comment.additional_properties = d
+        comment.additional_properties = d or EMPTY_PROPERTIES
         return comment
 
     @property
@@ -130,6 +142,8 @@ class Comment:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ContentInfo")
 
@@ -68,7 +68,7 @@ class ContentInfo:
             size_in_bytes=size_in_bytes,
         )
 
-        content_info.additional_properties = d
+        content_info.additional_properties = d or EMPTY_PROPERTIES
         return content_info
 
     @property
@@ -79,6 +79,8 @@ class ContentInfo:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
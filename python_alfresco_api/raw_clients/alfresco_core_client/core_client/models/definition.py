@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.property_ import Property
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Property
+    from ..models.property_ import Property
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Definition")
 
 
@@ -42,7 +52,8 @@ class Definition:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.property_ import Property
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         properties = []
@@ -56,7 +67,7 @@ class Definition:
             properties=properties,
         )
 
-        definition.additional_properties = d
+        definition.additional_properties = d or EMPTY_PROPERTIES
         return definition
 
     @property
@@ -67,6 +78,8 @@ class Definition:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
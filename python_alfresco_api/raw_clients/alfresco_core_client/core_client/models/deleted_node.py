@@ -4,9 +4,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.content_info import ContentInfo
@@ -17,6 +16,21 @@ if TYPE_CHECKING:
     from ..models.user_info import UserInfo
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ContentInfo, Definition, NodeProperties, PathInfo, PermissionsInfo, UserInfo
+    from ..models.content_info import ContentInfo
+    from ..models.definition import Definition
+    from ..models.node_properties import NodeProperties
+    from ..models.path_info import PathInfo
+    from ..models.permissions_info import PermissionsInfo
+    from ..models.user_info import UserInfo
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="DeletedNode")
 
 
@@ -176,15 +190,11 @@ class DeletedNode:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.content_info import ContentInfo
-        from ..models.definition import Definition
-        from ..models.node_properties import NodeProperties
-        from ..models.path_info import PathInfo
-        from ..models.permissions_info import PermissionsInfo
-        from ..models.user_info import UserInfo
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
-        created_at = isoparse(d.pop("createdAt"))
+        created_at = parse_datetime(d.pop("createdAt"))
 
         created_by_user = UserInfo.from_dict(d.pop("createdByUser"))
 
@@ -194,7 +204,7 @@ class DeletedNode:
 
         is_folder = d.pop("isFolder")
 
-        modified_at = isoparse(d.pop("modifiedAt"))
+        modified_at = parse_datetime(d.pop("modifiedAt"))
 
         modified_by_user = UserInfo.from_dict(d.pop("modifiedByUser"))
 
@@ -202,7 +212,7 @@ class DeletedNode:
 
         node_type = d.pop("nodeType")
 
-        archived_at = isoparse(d.pop("archivedAt"))
+        archived_at = parse_datetime(d.pop("archivedAt"))
 
         archived_by_user = UserInfo.from_dict(d.pop("archivedByUser"))
 
@@ -278,7 +288,7 @@ class DeletedNode:
             properties=properties,
         )
 
-        deleted_node.additional_properties = d
+        deleted_node.additional_properties = d or EMPTY_PROPERTIES
         return deleted_node
 
     @property
@@ -289,6 +299,8 @@ class DeletedNode:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
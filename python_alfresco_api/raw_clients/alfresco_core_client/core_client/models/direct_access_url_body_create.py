@@ -4,9 +4,8 @@ from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 T = TypeVar("T", bound="DirectAccessUrlBodyCreate")
 
@@ -48,7 +47,7 @@ class DirectAccessUrlBodyCreate:
         if isinstance(_expires_at, Unset):
             expires_at = UNSET
         else:
-            expires_at = isoparse(_expires_at)
+            expires_at = parse_datetime(_expires_at)
 
         valid_for = d.pop("validFor", UNSET)
 
@@ -57,7 +56,7 @@ class DirectAccessUrlBodyCreate:
             valid_for=valid_for,
         )
 
-        direct_access_url_body_create.additional_properties = d
+        direct_access_url_body_create.additional_properties = d or EMPTY_PROPERTIES
         return direct_access_url_body_create
 
     @property
@@ -68,6 +67,8 @@ class DirectAccessUrlBodyCreate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -5,7 +5,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.download_status import DownloadStatus
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Download")
 
@@ -93,7 +93,7 @@ class Download:
             total_files=total_files,
         )
 
-        download.additional_properties = d
+        download.additional_properties = d or EMPTY_PROPERTIES
         return download
 
     @property
@@ -104,6 +104,8 @@ class Download:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,15 +4,25 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.favorite_properties import FavoriteProperties
     from ..models.favorite_target import FavoriteTarget
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, FavoriteProperties, FavoriteTarget
+    from ..models.favorite_properties import FavoriteProperties
+    from ..models.favorite_target import FavoriteTarget
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Favorite")
 
 
@@ -65,8 +75,8 @@ class Favorite:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.favorite_properties import FavoriteProperties
-        from ..models.favorite_target import FavoriteTarget
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         target = FavoriteTarget.from_dict(d.pop("target"))
@@ -78,7 +88,7 @@ class Favorite:
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         _properties = d.pop("properties", UNSET)
         properties: Union[Unset, FavoriteProperties]
@@ -94,7 +104,7 @@ class Favorite:
             properties=properties,
         )
 
-        favorite.additional_properties = d
+        favorite.additional_properties = d or EMPTY_PROPERTIES
         return favorite
 
     @property
@@ -105,6 +115,8 @@ class Favorite:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,10 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 if TYPE_CHECKING:
     from ..models.favorite import Favorite
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Favorite
+    from ..models.favorite import Favorite
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="FavoriteEntry")
 
 
@@ -37,7 +49,8 @@ class FavoriteEntry:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.favorite import Favorite
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         entry = Favorite.from_dict(d.pop("entry"))
@@ -46,7 +59,7 @@ class FavoriteEntry:
             entry=entry,
         )
 
-        favorite_entry.additional_properties = d
+        favorite_entry.additional_properties = d or EMPTY_PROPERTIES
         return favorite_entry
 
     @property
@@ -57,6 +70,8 @@ class FavoriteEntry:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
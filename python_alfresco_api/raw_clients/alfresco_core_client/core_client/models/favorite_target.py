@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="FavoriteTarget")
 
 
@@ -24,7 +26,7 @@ class FavoriteTarget:
         d = dict(src_dict)
         favorite_target = cls()
 
-        favorite_target.additional_properties = d
+        favorite_target.additional_properties = d or EMPTY_PROPERTIES
         return favorite_target
 
     @property
@@ -35,6 +37,8 @@ class FavoriteTarget:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Group")
 
@@ -79,7 +79,7 @@ class Group:
             zones=zones,
         )
 
-        group.additional_properties = d
+        group.additional_properties = d or EMPTY_PROPERTIES
         return group
 
     @property
@@ -90,6 +90,8 @@ class Group:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="GroupBodyUpdate")
 
 
@@ -39,7 +41,7 @@ class GroupBodyUpdate:
             display_name=display_name,
         )
 
-        group_body_update.additional_properties = d
+        group_body_update.additional_properties = d or EMPTY_PROPERTIES
         return group_body_update
 
     @property
@@ -50,6 +52,8 @@ class GroupBodyUpdate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 from ..models.group_member_member_type import GroupMemberMemberType
 
 T = TypeVar("T", bound="GroupMember")
@@ -57,7 +59,7 @@ class GroupMember:
             member_type=member_type,
         )
 
-        group_member.additional_properties = d
+        group_member.additional_properties = d or EMPTY_PROPERTIES
         return group_member
 
     @property
@@ -68,6 +70,8 @@ class GroupMember:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="NetworkQuota")
 
 
@@ -58,7 +60,7 @@ class NetworkQuota:
             usage=usage,
         )
 
-        network_quota.additional_properties = d
+        network_quota.additional_properties = d or EMPTY_PROPERTIES
         return network_quota
 
     @property
@@ -69,6 +71,8 @@ class NetworkQuota:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,9 +4,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.association_info import AssociationInfo
@@ -18,6 +17,22 @@ if TYPE_CHECKING:
     from ..models.user_info import UserInfo
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, AssociationInfo, ContentInfo, Definition, NodeProperties, PathInfo, PermissionsInfo, UserInfo
+    from ..models.association_info import AssociationInfo
+    from ..models.content_info import ContentInfo
+    from ..models.definition import Definition
+    from ..models.node_properties import NodeProperties
+    from ..models.path_info import PathInfo
+    from ..models.permissions_info import PermissionsInfo
+    from ..models.user_info import UserInfo
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="NodeAssociation")
 
 
@@ -175,16 +190,11 @@ class NodeAssociation:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.association_info import AssociationInfo
-        from ..models.content_info import ContentInfo
-        from ..models.definition import Definition
-        from ..models.node_properties import NodeProperties
-        from ..models.path_info import PathInfo
-        from ..models.permissions_info import PermissionsInfo
-        from ..models.user_info import UserInfo
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
-        created_at = isoparse(d.pop("createdAt"))
+        created_at = parse_datetime(d.pop("createdAt"))
 
         created_by_user = UserInfo.from_dict(d.pop("createdByUser"))
 
@@ -194,7 +204,7 @@ class NodeAssociation:
 
         is_folder = d.pop("isFolder")
 
-        modified_at = isoparse(d.pop("modifiedAt"))
+        modified_at = parse_datetime(d.pop("modifiedAt"))
 
         modified_by_user = UserInfo.from_dict(d.pop("modifiedByUser"))
 
@@ -280,7 +290,7 @@ class NodeAssociation:
             association=association,
         )
 
-        node_association.additional_properties = d
+        node_association.additional_properties = d or EMPTY_PROPERTIES
         return node_association
 
     @property
@@ -291,6 +301,8 @@ class NodeAssociation:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
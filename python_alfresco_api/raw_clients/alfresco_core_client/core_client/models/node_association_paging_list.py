@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.node import Node
@@ -12,6 +12,18 @@ if TYPE_CHECKING:
     from ..models.pagination import Pagination
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Node, NodeAssociationEntry, Pagination
+    from ..models.node import Node
+    from ..models.node_association_entry import NodeAssociationEntry
+    from ..models.pagination import Pagination
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="NodeAssociationPagingList")
 
 
@@ -59,9 +71,8 @@ class NodeAssociationPagingList:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.node import Node
-        from ..models.node_association_entry import NodeAssociationEntry
-        from ..models.pagination import Pagination
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         entries = []
@@ -91,7 +102,7 @@ class NodeAssociationPagingList:
             source=source,
         )
 
-        node_association_paging_list.additional_properties = d
+        node_association_paging_list.additional_properties = d or EMPTY_PROPERTIES
         return node_association_paging_list
 
     @property
@@ -102,6 +113,8 @@ class NodeAssociationPagingList:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="NodeBodyCopy")
 
@@ -52,7 +52,7 @@ class NodeBodyCopy:
             name=name,
         )
 
-        node_body_copy.additional_properties = d
+        node_body_copy.additional_properties = d or EMPTY_PROPERTIES
         return node_body_copy
 
     @property
@@ -63,6 +63,8 @@ class NodeBodyCopy:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
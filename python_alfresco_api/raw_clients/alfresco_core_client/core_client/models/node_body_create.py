@@ -6,7 +6,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from .. import types
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.association_body import AssociationBody
@@ -17,6 +17,21 @@ if TYPE_CHECKING:
     from ..models.permissions_body import PermissionsBody
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, AssociationBody, ChildAssociationBody, Definition, NodeBodyCreateAssociation, NodeBodyCreateProperties, PermissionsBody
+    from ..models.association_body import AssociationBody
+    from ..models.child_association_body import ChildAssociationBody
+    from ..models.definition import Definition
+    from ..models.node_body_create_association import NodeBodyCreateAssociation
+    from ..models.node_body_create_properties import NodeBodyCreateProperties
+    from ..models.permissions_body import PermissionsBody
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="NodeBodyCreate")
 
 
@@ -165,12 +180,8 @@ class NodeBodyCreate:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.association_body import AssociationBody
-        from ..models.child_association_body import ChildAssociationBody
-        from ..models.definition import Definition
-        from ..models.node_body_create_association import NodeBodyCreateAssociation
-        from ..models.node_body_create_properties import NodeBodyCreateProperties
-        from ..models.permissions_body import PermissionsBody
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         name = d.pop("name")
@@ -236,7 +247,7 @@ class NodeBodyCreate:
             targets=targets,
         )
 
-        node_body_create.additional_properties = d
+        node_body_create.additional_properties = d or EMPTY_PROPERTIES
         return node_body_create
 
     @property
@@ -247,6 +258,8 @@ class NodeBodyCreate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="NodeBodyCreateProperties")
 
 
@@ -24,7 +26,7 @@ class NodeBodyCreateProperties:
         d = dict(src_dict)
         node_body_create_properties = cls()
 
-        node_body_create_properties.additional_properties = d
+        node_body_create_properties.additional_properties = d or EMPTY_PROPERTIES
         return node_body_create_properties
 
     @property
@@ -35,6 +37,8 @@ class NodeBodyCreateProperties:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
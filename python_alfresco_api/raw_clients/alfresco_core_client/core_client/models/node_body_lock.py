@@ -6,7 +6,7 @@ from attrs import field as _attrs_field
 
 from ..models.node_body_lock_lifetime import NodeBodyLockLifetime
 from ..models.node_body_lock_type import NodeBodyLockType
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="NodeBodyLock")
 
@@ -73,7 +73,7 @@ class NodeBodyLock:
             type_=type_,
         )
 
-        node_body_lock.additional_properties = d
+        node_body_lock.additional_properties = d or EMPTY_PROPERTIES
         return node_body_lock
 
     @property
@@ -84,6 +84,8 @@ class NodeBodyLock:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,13 +4,24 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.node_body_update_properties import NodeBodyUpdateProperties
     from ..models.permissions_body import PermissionsBody
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, NodeBodyUpdateProperties, PermissionsBody
+    from ..models.node_body_update_properties import NodeBodyUpdateProperties
+    from ..models.permissions_body import PermissionsBody
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="NodeBodyUpdate")
 
 
@@ -69,8 +80,8 @@ class NodeBodyUpdate:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.node_body_update_properties import NodeBodyUpdateProperties
-        from ..models.permissions_body import PermissionsBody
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         aspect_names = cast(list[str], d.pop("aspectNames", UNSET))
@@ -101,7 +112,7 @@ class NodeBodyUpdate:
             properties=properties,
         )
 
-        node_body_update.additional_properties = d
+        node_body_update.additional_properties = d or EMPTY_PROPERTIES
         return node_body_update
 
     @property
@@ -112,6 +123,8 @@ class NodeBodyUpdate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
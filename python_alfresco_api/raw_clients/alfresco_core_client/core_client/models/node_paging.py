@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.node_paging_list import NodePagingList
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, NodePagingList
+    from ..models.node_paging_list import NodePagingList
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="NodePaging")
 
 
@@ -38,7 +48,8 @@ class NodePaging:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.node_paging_list import NodePagingList
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         _list_ = d.pop("list", UNSET)
@@ -52,7 +63,7 @@ class NodePaging:
             list_=list_,
         )
 
-        node_paging.additional_properties = d
+        node_paging.additional_properties = d or EMPTY_PROPERTIES
         return node_paging
 
     @property
@@ -63,6 +74,8 @@ class NodePaging:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
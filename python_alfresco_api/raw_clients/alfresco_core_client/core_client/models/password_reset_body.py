@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="PasswordResetBody")
 
 
@@ -55,7 +57,7 @@ class PasswordResetBody:
             password=password,
         )
 
-        password_reset_body.additional_properties = d
+        password_reset_body.additional_properties = d or EMPTY_PROPERTIES
         return password_reset_body
 
     @property
@@ -66,6 +68,8 @@ class PasswordResetBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
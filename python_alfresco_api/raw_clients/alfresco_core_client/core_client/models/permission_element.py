@@ -5,7 +5,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.permission_element_access_status import PermissionElementAccessStatus
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="PermissionElement")
 
@@ -65,7 +65,7 @@ class PermissionElement:
             name=name,
         )
 
-        permission_element.additional_properties = d
+        permission_element.additional_properties = d or EMPTY_PROPERTIES
         return permission_element
 
     @property
@@ -76,6 +76,8 @@ class PermissionElement:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
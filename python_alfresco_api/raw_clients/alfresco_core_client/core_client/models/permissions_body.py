@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.permission_element import PermissionElement
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, PermissionElement
+    from ..models.permission_element import PermissionElement
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="PermissionsBody")
 
 
@@ -47,7 +57,8 @@ class PermissionsBody:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.permission_element import PermissionElement
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         is_inheritance_enabled = d.pop("isInheritanceEnabled", UNSET)
@@ -64,7 +75,7 @@ class PermissionsBody:
             locally_set=locally_set,
         )
 
-        permissions_body.additional_properties = d
+        permissions_body.additional_properties = d or EMPTY_PROPERTIES
         return permissions_body
 
     @property
@@ -75,6 +86,8 @@ class PermissionsBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,9 +4,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.capabilities import Capabilities
@@ -14,6 +13,18 @@ if TYPE_CHECKING:
     from ..models.person_properties import PersonProperties
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Capabilities, Company, PersonProperties
+    from ..models.capabilities import Capabilities
+    from ..models.company import Company
+    from ..models.person_properties import PersonProperties
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Person")
 
 
@@ -175,9 +186,8 @@ class Person:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.capabilities import Capabilities
-        from ..models.company import Company
-        from ..models.person_properties import PersonProperties
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         email = d.pop("email")
@@ -238,7 +248,7 @@ class Person:
         if isinstance(_status_updated_at, Unset):
             status_updated_at = UNSET
         else:
-            status_updated_at = isoparse(_status_updated_at)
+            status_updated_at = parse_datetime(_status_updated_at)
 
         telephone = d.pop("telephone", UNSET)
 
@@ -269,7 +279,7 @@ class Person:
             user_status=user_status,
         )
 
-        person.additional_properties = d
+        person.additional_properties = d or EMPTY_PROPERTIES
         return person
 
     @property
@@ -280,6 +290,8 @@ class Person:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,13 +4,24 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.company import Company
     from ..models.person_body_update_properties import PersonBodyUpdateProperties
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Company, PersonBodyUpdateProperties
+    from ..models.company import Company
+    from ..models.person_body_update_properties import PersonBodyUpdateProperties
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="PersonBodyUpdate")
 
 
@@ -151,8 +162,8 @@ class PersonBodyUpdate:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.company import Company
-        from ..models.person_body_update_properties import PersonBodyUpdateProperties
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         aspect_names = cast(list[str], d.pop("aspectNames", UNSET))
@@ -225,7 +236,7 @@ class PersonBodyUpdate:
             user_status=user_status,
         )
 
-        person_body_update.additional_properties = d
+        person_body_update.additional_properties = d or EMPTY_PROPERTIES
         return person_body_update
 
     @property
@@ -236,6 +247,8 @@ class PersonBodyUpdate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,15 +4,24 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
 from ..models.person_network_subscription_level import PersonNetworkSubscriptionLevel
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.network_quota import NetworkQuota
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, NetworkQuota
+    from ..models.network_quota import NetworkQuota
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="PersonNetwork")
 
 
@@ -88,7 +97,8 @@ class PersonNetwork:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.network_quota import NetworkQuota
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         id = d.pop("id")
@@ -100,7 +110,7 @@ class PersonNetwork:
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         home_network = d.pop("homeNetwork", UNSET)
 
@@ -130,7 +140,7 @@ class PersonNetwork:
             subscription_level=subscription_level,
         )
 
-        person_network.additional_properties = d
+        person_network.additional_properties = d or EMPTY_PROPERTIES
         return person_network
 
     @property
@@ -141,6 +151,8 @@ class PersonNetwork:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
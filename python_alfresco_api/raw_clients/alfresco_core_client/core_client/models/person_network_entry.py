@@ -4,10 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 if TYPE_CHECKING:
     from ..models.person_network import PersonNetwork
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, PersonNetwork
+    from ..models.person_network import PersonNetwork
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="PersonNetworkEntry")
 
 
@@ -38,7 +50,8 @@ class PersonNetworkEntry:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.person_network import PersonNetwork
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         entry = PersonNetwork.from_dict(d.pop("entry"))
@@ -47,7 +60,7 @@ class PersonNetworkEntry:
             entry=entry,
         )
 
-        person_network_entry.additional_properties = d
+        person_network_entry.additional_properties = d or EMPTY_PROPERTIES
         return person_network_entry
 
     @property
@@ -58,6 +71,8 @@ class PersonNetworkEntry:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,14 +4,23 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.rating_aggregate import RatingAggregate
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, RatingAggregate
+    from ..models.rating_aggregate import RatingAggregate
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Rating")
 
 
@@ -63,7 +72,8 @@ class Rating:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.rating_aggregate import RatingAggregate
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         aggregate = RatingAggregate.from_dict(d.pop("aggregate"))
@@ -77,7 +87,7 @@ class Rating:
         if isinstance(_rated_at, Unset):
             rated_at = UNSET
         else:
-            rated_at = isoparse(_rated_at)
+            rated_at = parse_datetime(_rated_at)
 
         rating = cls(
             aggregate=aggregate,
@@ -86,7 +96,7 @@ class Rating:
             rated_at=rated_at,
         )
 
-        rating.additional_properties = d
+        rating.additional_properties = d or EMPTY_PROPERTIES
         return rating
 
     @property
@@ -97,6 +107,8 @@ class Rating:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
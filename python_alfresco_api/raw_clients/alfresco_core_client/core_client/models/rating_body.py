@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 from ..models.rating_body_id import RatingBodyId
 
 T = TypeVar("T", bound="RatingBody")
@@ -50,7 +52,7 @@ class RatingBody:
             my_rating=my_rating,
         )
 
-        rating_body.additional_properties = d
+        rating_body.additional_properties = d or EMPTY_PROPERTIES
         return rating_body
 
     @property
@@ -61,6 +63,8 @@ class RatingBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
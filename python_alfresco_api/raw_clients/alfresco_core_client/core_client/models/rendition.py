@@ -5,12 +5,22 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.rendition_status import RenditionStatus
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.content_info import ContentInfo
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ContentInfo
+    from ..models.content_info import ContentInfo
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Rendition")
 
 
@@ -53,7 +63,8 @@ class Rendition:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.content_info import ContentInfo
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         _content = d.pop("content", UNSET)
@@ -78,7 +89,7 @@ class Rendition:
             status=status,
         )
 
-        rendition.additional_properties = d
+        rendition.additional_properties = d or EMPTY_PROPERTIES
         return rendition
 
     @property
@@ -89,6 +100,8 @@ class Rendition:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
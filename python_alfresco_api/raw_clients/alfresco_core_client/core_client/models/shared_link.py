@@ -4,9 +4,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.content_info import ContentInfo
@@ -15,6 +14,19 @@ if TYPE_CHECKING:
     from ..models.user_info import UserInfo
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ContentInfo, PathInfo, SharedLinkProperties, UserInfo
+    from ..models.content_info import ContentInfo
+    from ..models.path_info import PathInfo
+    from ..models.shared_link_properties import SharedLinkProperties
+    from ..models.user_info import UserInfo
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="SharedLink")
 
 
@@ -157,10 +169,8 @@ class SharedLink:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.content_info import ContentInfo
-        from ..models.path_info import PathInfo
-        from ..models.shared_link_properties import SharedLinkProperties
-        from ..models.user_info import UserInfo
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         allowable_operations = cast(list[str], d.pop("allowableOperations", UNSET))
@@ -183,7 +193,7 @@ class SharedLink:
         if isinstance(_expires_at, Unset):
             expires_at = UNSET
         else:
-            expires_at = isoparse(_expires_at)
+            expires_at = parse_datetime(_expires_at)
 
         id = d.pop("id", UNSET)
 
@@ -194,7 +204,7 @@ class SharedLink:
         if isinstance(_modified_at, Unset):
             modified_at = UNSET
         else:
-            modified_at = isoparse(_modified_at)
+            modified_at = parse_datetime(_modified_at)
 
         _modified_by_user = d.pop("modifiedByUser", UNSET)
         modified_by_user: Union[Unset, UserInfo]
@@ -249,7 +259,7 @@ class SharedLink:
             title=title,
         )
 
-        shared_link.additional_properties = d
+        shared_link.additional_properties = d or EMPTY_PROPERTIES
         return shared_link
 
     @property
@@ -260,6 +270,8 @@ class SharedLink:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,9 +4,8 @@ from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 T = TypeVar("T", bound="SharedLinkBodyCreate")
 
@@ -52,14 +51,14 @@ class SharedLinkBodyCreate:
         if isinstance(_expires_at, Unset):
             expires_at = UNSET
         else:
-            expires_at = isoparse(_expires_at)
+            expires_at = parse_datetime(_expires_at)
 
         shared_link_body_create = cls(
             node_id=node_id,
             expires_at=expires_at,
         )
 
-        shared_link_body_create.additional_properties = d
+        shared_link_body_create.additional_properties = d or EMPTY_PROPERTIES
         return shared_link_body_create
 
     @property
@@ -70,6 +69,8 @@ class SharedLinkBodyCreate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,10 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 if TYPE_CHECKING:
     from ..models.shared_link_paging_list import SharedLinkPagingList
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, SharedLinkPagingList
+    from ..models.shared_link_paging_list import SharedLinkPagingList
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="SharedLinkPaging")
 
 
@@ -36,7 +48,8 @@ class SharedLinkPaging:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.shared_link_paging_list import SharedLinkPagingList
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         list_ = SharedLinkPagingList.from_dict(d.pop("list"))
@@ -45,7 +58,7 @@ class SharedLinkPaging:
             list_=list_,
         )
 
-        shared_link_paging.additional_properties = d
+        shared_link_paging.additional_properties = d or EMPTY_PROPERTIES
         return shared_link_paging
 
     @property
@@ -56,6 +69,8 @@ class SharedLinkPaging:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
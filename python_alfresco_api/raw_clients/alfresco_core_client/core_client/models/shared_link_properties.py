@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="SharedLinkProperties")
 
 
@@ -27,7 +29,7 @@ class SharedLinkProperties:
         d = dict(src_dict)
         shared_link_properties = cls()
 
-        shared_link_properties.additional_properties = d
+        shared_link_properties.additional_properties = d or EMPTY_PROPERTIES
         return shared_link_properties
 
     @property
@@ -38,6 +40,8 @@ class SharedLinkProperties:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
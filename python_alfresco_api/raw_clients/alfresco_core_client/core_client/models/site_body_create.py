@@ -5,7 +5,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.site_body_create_visibility import SiteBodyCreateVisibility
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="SiteBodyCreate")
 
@@ -68,7 +68,7 @@ class SiteBodyCreate:
             id=id,
         )
 
-        site_body_create.additional_properties = d
+        site_body_create.additional_properties = d or EMPTY_PROPERTIES
         return site_body_create
 
     @property
@@ -79,6 +79,8 @@ class SiteBodyCreate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -5,7 +5,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.site_body_update_visibility import SiteBodyUpdateVisibility
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="SiteBodyUpdate")
 
@@ -65,7 +65,7 @@ class SiteBodyUpdate:
             visibility=visibility,
         )
 
-        site_body_update.additional_properties = d
+        site_body_update.additional_properties = d or EMPTY_PROPERTIES
         return site_body_update
 
     @property
@@ -76,6 +76,8 @@ class SiteBodyUpdate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="SiteContainer")
 
 
@@ -47,7 +49,7 @@ class SiteContainer:
             id=id,
         )
 
-        site_container.additional_properties = d
+        site_container.additional_properties = d or EMPTY_PROPERTIES
         return site_container
 
     @property
@@ -58,6 +60,8 @@ class SiteContainer:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
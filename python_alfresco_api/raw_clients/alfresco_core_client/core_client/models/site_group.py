@@ -4,12 +4,24 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 from ..models.site_group_role import SiteGroupRole
 
 if TYPE_CHECKING:
     from ..models.group_member import GroupMember
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, GroupMember
+    from ..models.group_member import GroupMember
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="SiteGroup")
 
 
@@ -48,7 +60,8 @@ class SiteGroup:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.group_member import GroupMember
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         group = GroupMember.from_dict(d.pop("group"))
@@ -63,7 +76,7 @@ class SiteGroup:
             role=role,
         )
 
-        site_group.additional_properties = d
+        site_group.additional_properties = d or EMPTY_PROPERTIES
         return site_group
 
     @property
@@ -74,6 +87,8 @@ class SiteGroup:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -5,12 +5,22 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.site_member_role import SiteMemberRole
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.person import Person
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Person
+    from ..models.person import Person
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="SiteMember")
 
 
@@ -55,7 +65,8 @@ class SiteMember:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.person import Person
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         id = d.pop("id")
@@ -73,7 +84,7 @@ class SiteMember:
             is_member_of_group=is_member_of_group,
         )
 
-        site_member.additional_properties = d
+        site_member.additional_properties = d or EMPTY_PROPERTIES
         return site_member
 
     @property
@@ -84,6 +95,8 @@ class SiteMember:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 from ..models.site_membership_body_create_role import SiteMembershipBodyCreateRole
 
 T = TypeVar("T", bound="SiteMembershipBodyCreate")
@@ -49,7 +51,7 @@ class SiteMembershipBodyCreate:
             role=role,
         )
 
-        site_membership_body_create.additional_properties = d
+        site_membership_body_create.additional_properties = d or EMPTY_PROPERTIES
         return site_membership_body_create
 
     @property
@@ -60,6 +62,8 @@ class SiteMembershipBodyCreate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 from ..models.site_membership_body_update_role import SiteMembershipBodyUpdateRole
 
 T = TypeVar("T", bound="SiteMembershipBodyUpdate")
@@ -41,7 +43,7 @@ class SiteMembershipBodyUpdate:
             role=role,
         )
 
-        site_membership_body_update.additional_properties = d
+        site_membership_body_update.additional_properties = d or EMPTY_PROPERTIES
         return site_membership_body_update
 
     @property
@@ -52,6 +54,8 @@ class SiteMembershipBodyUpdate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
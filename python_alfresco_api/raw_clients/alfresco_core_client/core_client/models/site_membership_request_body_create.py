@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="SiteMembershipRequestBodyCreate")
 
@@ -71,7 +71,7 @@ class SiteMembershipRequestBodyCreate:
             title=title,
         )
 
-        site_membership_request_body_create.additional_properties = d
+        site_membership_request_body_create.additional_properties = d or EMPTY_PROPERTIES
         return site_membership_request_body_create
 
     @property
@@ -82,6 +82,8 @@ class SiteMembershipRequestBodyCreate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
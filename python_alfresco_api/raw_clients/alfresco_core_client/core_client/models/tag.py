@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Tag")
 
@@ -58,7 +58,7 @@ class Tag:
             count=count,
         )
 
-        tag.additional_properties = d
+        tag.additional_properties = d or EMPTY_PROPERTIES
         return tag
 
     @property
@@ -69,6 +69,8 @@ class Tag:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="TagBody")
 
 
@@ -39,7 +41,7 @@ class TagBody:
             tag=tag,
         )
 
-        tag_body.additional_properties = d
+        tag_body.additional_properties = d or EMPTY_PROPERTIES
         return tag_body
 
     @property
@@ -50,6 +52,8 @@ class TagBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
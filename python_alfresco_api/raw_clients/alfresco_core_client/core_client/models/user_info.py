@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="UserInfo")
 
 
@@ -47,7 +49,7 @@ class UserInfo:
             id=id,
         )
 
-        user_info.additional_properties = d
+        user_info.additional_properties = d or EMPTY_PROPERTIES
         return user_info
 
     @property
@@ -58,6 +60,8 @@ class UserInfo:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,9 +4,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.content_info import ContentInfo
@@ -14,6 +13,18 @@ if TYPE_CHECKING:
     from ..models.version_properties import VersionProperties
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ContentInfo, UserInfo, VersionProperties
+    from ..models.content_info import ContentInfo
+    from ..models.user_info import UserInfo
+    from ..models.version_properties import VersionProperties
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Version")
 
 
@@ -103,9 +114,8 @@ class Version:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.content_info import ContentInfo
-        from ..models.user_info import UserInfo
-        from ..models.version_properties import VersionProperties
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         id = d.pop("id")
@@ -114,7 +124,7 @@ class Version:
 
         is_folder = d.pop("isFolder")
 
-        modified_at = isoparse(d.pop("modifiedAt"))
+        modified_at = parse_datetime(d.pop("modifiedAt"))
 
         modified_by_user = UserInfo.from_dict(d.pop("modifiedByUser"))
 
@@ -154,7 +164,7 @@ class Version:
             version_comment=version_comment,
         )
 
-        version.additional_properties = d
+        version.additional_properties = d or EMPTY_PROPERTIES
         return version
 
     @property
@@ -165,6 +175,8 @@ class Version:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -0,0 +1,114 @@
+"""Contains the streamed response type for binary endpoints"""
+
+import datetime
+from collections.abc import AsyncIterator, Iterator, MutableMapping
+from email.utils import format_datetime
+from http import HTTPStatus
+from typing import Optional
+
+import httpx
+from attrs import define
+
+from . import errors
+
+
+def http_date(value: datetime.datetime) -> str:
+    """Format a datetime as an HTTP date (If-Modified-Since). Naive values are local time."""
+    return format_datetime(value.astimezone(datetime.timezone.utc), usegmt=True)
+
+
+@define
+class StreamingResponse:
+    """A response from a binary endpoint whose body has not been read yet
+
+    Iterate the body with iter_bytes() / aiter_bytes() (which close the response
+    when exhausted), or use the response as a (async) context manager.
+    """
+
+    status_code: HTTPStatus
+    headers: MutableMapping[str, str]
+    response: httpx.Response
+
+    @property
+    def is_success(self) -> bool:
+        """True for 200 (full content) and 206 (partial content)"""
+        return self.status_code in (HTTPStatus.OK, HTTPStatus.PARTIAL_CONTENT)
+
+    @property
+    def content_length(self) -> Optional[int]:
+        length = self.headers.get("Content-Length")
+        return int(length) if length is not None and length.isdigit() else None
+
+    @property
+    def content_type(self) -> Optional[str]:
+        return self.headers.get("Content-Type")
+
+    def raise_for_status(self) -> "StreamingResponse":
+        self.response.raise_for_status()
+        return self
+
+    def iter_bytes(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        try:
+            yield from self.response.iter_bytes(chunk_size=chunk_size)
+        finally:
+            self.response.close()
+
+    async def aiter_bytes(self, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self.response.aiter_bytes(chunk_size=chunk_size):
+                yield chunk
+        finally:
+            await self.response.aclose()
+
+    def read(self) -> bytes:
+        try:
+            return self.response.read()
+        finally:
+            self.response.close()
+
+    async def aread(self) -> bytes:
+        try:
+            return await self.response.aread()
+        finally:
+            await self.response.aclose()
+
+    def close(self) -> None:
+        self.response.close()
+
+    async def aclose(self) -> None:
+        await self.response.aclose()
+
+    def __enter__(self) -> "StreamingResponse":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "StreamingResponse":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+
+def build_streaming_response(
+    response: httpx.Response, documented: frozenset[int], raise_on_unexpected_status: bool
+) -> StreamingResponse:
+    if raise_on_unexpected_status and response.status_code not in documented:
+        content = response.read()
+        response.close()
+        raise errors.UnexpectedStatus(response.status_code, content)
+    return StreamingResponse(status_code=HTTPStatus(response.status_code), headers=response.headers, response=response)
+
+
+async def abuild_streaming_response(
+    response: httpx.Response, documented: frozenset[int], raise_on_unexpected_status: bool
+) -> StreamingResponse:
+    if raise_on_unexpected_status and response.status_code not in documented:
+        content = await response.aread()
+        await response.aclose()
+        raise errors.UnexpectedStatus(response.status_code, content)
+    return StreamingResponse(status_code=HTTPStatus(response.status_code), headers=response.headers, response=response)
+
+
+__all__ = ["StreamingResponse", "abuild_streaming_response", "build_streaming_response", "http_date"]
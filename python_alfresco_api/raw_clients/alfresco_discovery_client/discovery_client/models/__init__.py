@@ -1,15 +1,33 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .discovery_entry import DiscoveryEntry
-from .entitlements_info import EntitlementsInfo
-from .error import Error
-from .error_error import ErrorError
-from .license_info import LicenseInfo
-from .module_info import ModuleInfo
-from .repository_entry import RepositoryEntry
-from .repository_info import RepositoryInfo
-from .status_info import StatusInfo
-from .version_info import VersionInfo
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .discovery_entry import DiscoveryEntry
+    from .entitlements_info import EntitlementsInfo
+    from .error import Error
+    from .error_error import ErrorError
+    from .license_info import LicenseInfo
+    from .module_info import ModuleInfo
+    from .repository_entry import RepositoryEntry
+    from .repository_info import RepositoryInfo
+    from .status_info import StatusInfo
+    from .version_info import VersionInfo
+
+# Model modules are imported on first attribute access (PEP 562)
+_MODULES = {
+    "DiscoveryEntry": "discovery_entry",
+    "EntitlementsInfo": "entitlements_info",
+    "Error": "error",
+    "ErrorError": "error_error",
+    "LicenseInfo": "license_info",
+    "ModuleInfo": "module_info",
+    "RepositoryEntry": "repository_entry",
+    "RepositoryInfo": "repository_info",
+    "StatusInfo": "status_info",
+    "VersionInfo": "version_info",
+}
 
 __all__ = (
     "DiscoveryEntry",
@@ -23,3 +41,16 @@ __all__ = (
     "StatusInfo",
     "VersionInfo",
 )
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="EntitlementsInfo")
 
@@ -66,7 +66,7 @@ class EntitlementsInfo:
             max_users=max_users,
         )
 
-        entitlements_info.additional_properties = d
+        entitlements_info.additional_properties = d or EMPTY_PROPERTIES
         return entitlements_info
 
     @property
@@ -77,6 +77,8 @@ class EntitlementsInfo:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,14 +4,23 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.entitlements_info import EntitlementsInfo
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, EntitlementsInfo
+    from ..models.entitlements_info import EntitlementsInfo
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="LicenseInfo")
 
 
@@ -68,14 +77,15 @@ class LicenseInfo:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.entitlements_info import EntitlementsInfo
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
-        expires_at = isoparse(d.pop("expiresAt"))
+        expires_at = parse_datetime(d.pop("expiresAt"))
 
         holder = d.pop("holder")
 
-        issued_at = isoparse(d.pop("issuedAt"))
+        issued_at = parse_datetime(d.pop("issuedAt"))
 
         mode = d.pop("mode")
 
@@ -97,7 +107,7 @@ class LicenseInfo:
             entitlements=entitlements,
         )
 
-        license_info.additional_properties = d
+        license_info.additional_properties = d or EMPTY_PROPERTIES
         return license_info
 
     @property
@@ -108,6 +118,8 @@ class LicenseInfo:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,9 +4,8 @@ from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 T = TypeVar("T", bound="ModuleInfo")
 
@@ -88,7 +87,7 @@ class ModuleInfo:
         if isinstance(_install_date, Unset):
             install_date = UNSET
         else:
-            install_date = isoparse(_install_date)
+            install_date = parse_datetime(_install_date)
 
         install_state = d.pop("installState", UNSET)
 
@@ -111,7 +110,7 @@ class ModuleInfo:
             version_min=version_min,
         )
 
-        module_info.additional_properties = d
+        module_info.additional_properties = d or EMPTY_PROPERTIES
         return module_info
 
     @property
@@ -122,6 +121,8 @@ class ModuleInfo:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
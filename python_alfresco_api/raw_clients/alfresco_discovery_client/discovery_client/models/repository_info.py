@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.license_info import LicenseInfo
@@ -13,6 +13,19 @@ if TYPE_CHECKING:
     from ..models.version_info import VersionInfo
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, LicenseInfo, ModuleInfo, StatusInfo, VersionInfo
+    from ..models.license_info import LicenseInfo
+    from ..models.module_info import ModuleInfo
+    from ..models.status_info import StatusInfo
+    from ..models.version_info import VersionInfo
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="RepositoryInfo")
 
 
@@ -75,10 +88,8 @@ class RepositoryInfo:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.license_info import LicenseInfo
-        from ..models.module_info import ModuleInfo
-        from ..models.status_info import StatusInfo
-        from ..models.version_info import VersionInfo
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         edition = d.pop("edition")
@@ -112,7 +123,7 @@ class RepositoryInfo:
             modules=modules,
         )
 
-        repository_info.additional_properties = d
+        repository_info.additional_properties = d or EMPTY_PROPERTIES
         return repository_info
 
     @property
@@ -123,6 +134,8 @@ class RepositoryInfo:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="StatusInfo")
 
 
@@ -63,7 +65,7 @@ class StatusInfo:
             is_thumbnail_generation_enabled=is_thumbnail_generation_enabled,
         )
 
-        status_info.additional_properties = d
+        status_info.additional_properties = d or EMPTY_PROPERTIES
         return status_info
 
     @property
@@ -74,6 +76,8 @@ class StatusInfo:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
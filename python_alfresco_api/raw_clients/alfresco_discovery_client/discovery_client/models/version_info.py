@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="VersionInfo")
 
 
@@ -87,7 +89,7 @@ class VersionInfo:
             schema=schema,
         )
 
-        version_info.additional_properties = d
+        version_info.additional_properties = d or EMPTY_PROPERTIES
         return version_info
 
     @property
@@ -98,6 +100,8 @@ class VersionInfo:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -1,16 +1,35 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .abstract_class import AbstractClass
-from .abstract_class_association import AbstractClassAssociation
-from .abstract_class_association_source import AbstractClassAssociationSource
-from .constraint import Constraint
-from .constraint_parameters import ConstraintParameters
-from .constraint_parameters_additional_property import ConstraintParametersAdditionalProperty
-from .error import Error
-from .error_error import ErrorError
-from .model import Model
-from .pagination import Pagination
-from .property_ import Property
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .abstract_class import AbstractClass
+    from .abstract_class_association import AbstractClassAssociation
+    from .abstract_class_association_source import AbstractClassAssociationSource
+    from .constraint import Constraint
+    from .constraint_parameters import ConstraintParameters
+    from .constraint_parameters_additional_property import ConstraintParametersAdditionalProperty
+    from .error import Error
+    from .error_error import ErrorError
+    from .model import Model
+    from .pagination import Pagination
+    from .property_ import Property
+
+# Model modules are imported on first attribute access (PEP 562)
+_MODULES = {
+    "AbstractClass": "abstract_class",
+    "AbstractClassAssociation": "abstract_class_association",
+    "AbstractClassAssociationSource": "abstract_class_association_source",
+    "Constraint": "constraint",
+    "ConstraintParameters": "constraint_parameters",
+    "ConstraintParametersAdditionalProperty": "constraint_parameters_additional_property",
+    "Error": "error",
+    "ErrorError": "error_error",
+    "Model": "model",
+    "Pagination": "pagination",
+    "Property": "property_",
+}
 
 __all__ = (
     "AbstractClass",
@@ -25,3 +44,16 @@ __all__ = (
     "Pagination",
     "Property",
 )
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
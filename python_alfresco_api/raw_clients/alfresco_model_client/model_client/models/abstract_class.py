@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.abstract_class_association import AbstractClassAssociation
@@ -12,6 +12,18 @@ if TYPE_CHECKING:
     from ..models.property_ import Property
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, AbstractClassAssociation, Model, Property
+    from ..models.abstract_class_association import AbstractClassAssociation
+    from ..models.model import Model
+    from ..models.property_ import Property
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="AbstractClass")
 
 
@@ -113,9 +125,8 @@ class AbstractClass:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.abstract_class_association import AbstractClassAssociation
-        from ..models.model import Model
-        from ..models.property_ import Property
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         id = d.pop("id")
@@ -169,7 +180,7 @@ class AbstractClass:
             properties=properties,
         )
 
-        abstract_class.additional_properties = d
+        abstract_class.additional_properties = d or EMPTY_PROPERTIES
         return abstract_class
 
     @property
@@ -180,6 +191,8 @@ class AbstractClass:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.abstract_class_association_source import AbstractClassAssociationSource
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, AbstractClassAssociationSource
+    from ..models.abstract_class_association_source import AbstractClassAssociationSource
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="AbstractClassAssociation")
 
 
@@ -78,7 +88,8 @@ class AbstractClassAssociation:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.abstract_class_association_source import AbstractClassAssociationSource
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         id = d.pop("id")
@@ -115,7 +126,7 @@ class AbstractClassAssociation:
             title=title,
         )
 
-        abstract_class_association.additional_properties = d
+        abstract_class_association.additional_properties = d or EMPTY_PROPERTIES
         return abstract_class_association
 
     @property
@@ -126,6 +137,8 @@ class AbstractClassAssociation:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="AbstractClassAssociationSource")
 
@@ -75,7 +75,7 @@ class AbstractClassAssociationSource:
             role=role,
         )
 
-        abstract_class_association_source.additional_properties = d
+        abstract_class_association_source.additional_properties = d or EMPTY_PROPERTIES
         return abstract_class_association_source
 
     @property
@@ -86,6 +86,8 @@ class AbstractClassAssociationSource:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
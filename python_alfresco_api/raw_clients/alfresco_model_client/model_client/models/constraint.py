@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.constraint_parameters import ConstraintParameters
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ConstraintParameters
+    from ..models.constraint_parameters import ConstraintParameters
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Constraint")
 
 
@@ -64,7 +74,8 @@ class Constraint:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.constraint_parameters import ConstraintParameters
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         id = d.pop("id")
@@ -90,7 +101,7 @@ class Constraint:
             type_=type_,
         )
 
-        constraint.additional_properties = d
+        constraint.additional_properties = d or EMPTY_PROPERTIES
         return constraint
 
     @property
@@ -101,6 +112,8 @@ class Constraint:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,10 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 if TYPE_CHECKING:
     from ..models.constraint_parameters_additional_property import ConstraintParametersAdditionalProperty
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ConstraintParametersAdditionalProperty
+    from ..models.constraint_parameters_additional_property import ConstraintParametersAdditionalProperty
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ConstraintParameters")
 
 
@@ -26,7 +38,8 @@ class ConstraintParameters:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.constraint_parameters_additional_property import ConstraintParametersAdditionalProperty
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         constraint_parameters = cls()
@@ -37,7 +50,7 @@ class ConstraintParameters:
 
             additional_properties[prop_name] = additional_property
 
-        constraint_parameters.additional_properties = additional_properties
+        constraint_parameters.additional_properties = additional_properties or EMPTY_PROPERTIES
         return constraint_parameters
 
     @property
@@ -48,6 +61,8 @@ class ConstraintParameters:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: "ConstraintParametersAdditionalProperty") -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
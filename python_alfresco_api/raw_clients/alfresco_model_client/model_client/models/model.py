@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Model")
 
@@ -77,7 +77,7 @@ class Model:
             namespace_uri=namespace_uri,
         )
 
-        model.additional_properties = d
+        model.additional_properties = d or EMPTY_PROPERTIES
         return model
 
     @property
@@ -88,6 +88,8 @@ class Model:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
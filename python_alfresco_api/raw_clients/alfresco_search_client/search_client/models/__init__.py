@@ -1,65 +1,133 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .content_info import ContentInfo
-from .error import Error
-from .error_error import ErrorError
-from .generic_bucket import GenericBucket
-from .generic_bucket_bucket_info import GenericBucketBucketInfo
-from .generic_bucket_display import GenericBucketDisplay
-from .generic_bucket_facets_item import GenericBucketFacetsItem
-from .generic_facet_response import GenericFacetResponse
-from .generic_metric import GenericMetric
-from .generic_metric_value import GenericMetricValue
-from .node import Node
-from .node_properties import NodeProperties
-from .pagination import Pagination
-from .path_element import PathElement
-from .path_info import PathInfo
-from .request_defaults import RequestDefaults
-from .request_defaults_default_fts_field_operator import RequestDefaultsDefaultFTSFieldOperator
-from .request_defaults_default_fts_operator import RequestDefaultsDefaultFTSOperator
-from .request_facet_field import RequestFacetField
-from .request_facet_field_method import RequestFacetFieldMethod
-from .request_facet_field_sort import RequestFacetFieldSort
-from .request_facet_fields import RequestFacetFields
-from .request_facet_intervals import RequestFacetIntervals
-from .request_facet_intervals_intervals_item import RequestFacetIntervalsIntervalsItem
-from .request_facet_queries_item import RequestFacetQueriesItem
-from .request_facet_set import RequestFacetSet
-from .request_filter_queries_item import RequestFilterQueriesItem
-from .request_highlight import RequestHighlight
-from .request_highlight_fields_item import RequestHighlightFieldsItem
-from .request_include_item import RequestIncludeItem
-from .request_limits import RequestLimits
-from .request_localization import RequestLocalization
-from .request_pagination import RequestPagination
-from .request_pivot import RequestPivot
-from .request_query import RequestQuery
-from .request_query_language import RequestQueryLanguage
-from .request_range import RequestRange
-from .request_scope import RequestScope
-from .request_scope_locations import RequestScopeLocations
-from .request_sort_definition_item import RequestSortDefinitionItem
-from .request_sort_definition_item_type import RequestSortDefinitionItemType
-from .request_spellcheck import RequestSpellcheck
-from .request_stats import RequestStats
-from .request_templates_item import RequestTemplatesItem
-from .response_consistency import ResponseConsistency
-from .result_buckets import ResultBuckets
-from .result_buckets_buckets_item import ResultBucketsBucketsItem
-from .result_buckets_buckets_item_display import ResultBucketsBucketsItemDisplay
-from .result_node import ResultNode
-from .result_set_context import ResultSetContext
-from .result_set_context_facet_queries_item import ResultSetContextFacetQueriesItem
-from .result_set_context_spellcheck_item import ResultSetContextSpellcheckItem
-from .result_set_context_spellcheck_item_type import ResultSetContextSpellcheckItemType
-from .result_set_paging import ResultSetPaging
-from .result_set_paging_list import ResultSetPagingList
-from .result_set_row_entry import ResultSetRowEntry
-from .search_entry import SearchEntry
-from .search_entry_highlight_item import SearchEntryHighlightItem
-from .search_request import SearchRequest
-from .user_info import UserInfo
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .content_info import ContentInfo
+    from .error import Error
+    from .error_error import ErrorError
+    from .generic_bucket import GenericBucket
+    from .generic_bucket_bucket_info import GenericBucketBucketInfo
+    from .generic_bucket_display import GenericBucketDisplay
+    from .generic_bucket_facets_item import GenericBucketFacetsItem
+    from .generic_facet_response import GenericFacetResponse
+    from .generic_metric import GenericMetric
+    from .generic_metric_value import GenericMetricValue
+    from .node import Node
+    from .node_properties import NodeProperties
+    from .pagination import Pagination
+    from .path_element import PathElement
+    from .path_info import PathInfo
+    from .request_defaults import RequestDefaults
+    from .request_defaults_default_fts_field_operator import RequestDefaultsDefaultFTSFieldOperator
+    from .request_defaults_default_fts_operator import RequestDefaultsDefaultFTSOperator
+    from .request_facet_field import RequestFacetField
+    from .request_facet_field_method import RequestFacetFieldMethod
+    from .request_facet_field_sort import RequestFacetFieldSort
+    from .request_facet_fields import RequestFacetFields
+    from .request_facet_intervals import RequestFacetIntervals
+    from .request_facet_intervals_intervals_item import RequestFacetIntervalsIntervalsItem
+    from .request_facet_queries_item import RequestFacetQueriesItem
+    from .request_facet_set import RequestFacetSet
+    from .request_filter_queries_item import RequestFilterQueriesItem
+    from .request_highlight import RequestHighlight
+    from .request_highlight_fields_item import RequestHighlightFieldsItem
+    from .request_include_item import RequestIncludeItem
+    from .request_limits import RequestLimits
+    from .request_localization import RequestLocalization
+    from .request_pagination import RequestPagination
+    from .request_pivot import RequestPivot
+    from .request_query import RequestQuery
+    from .request_query_language import RequestQueryLanguage
+    from .request_range import RequestRange
+    from .request_scope import RequestScope
+    from .request_scope_locations import RequestScopeLocations
+    from .request_sort_definition_item import RequestSortDefinitionItem
+    from .request_sort_definition_item_type import RequestSortDefinitionItemType
+    from .request_spellcheck import RequestSpellcheck
+    from .request_stats import RequestStats
+    from .request_templates_item import RequestTemplatesItem
+    from .response_consistency import ResponseConsistency
+    from .result_buckets import ResultBuckets
+    from .result_buckets_buckets_item import ResultBucketsBucketsItem
+    from .result_buckets_buckets_item_display import ResultBucketsBucketsItemDisplay
+    from .result_node import ResultNode
+    from .result_set_context import ResultSetContext
+    from .result_set_context_facet_queries_item import ResultSetContextFacetQueriesItem
+    from .result_set_context_spellcheck_item import ResultSetContextSpellcheckItem
+    from .result_set_context_spellcheck_item_type import ResultSetContextSpellcheckItemType
+    from .result_set_paging import ResultSetPaging
+    from .result_set_paging_list import ResultSetPagingList
+    from .result_set_row_entry import ResultSetRowEntry
+    from .search_entry import SearchEntry
+    from .search_entry_highlight_item import SearchEntryHighlightItem
+    from .search_request import SearchRequest
+    from .user_info import UserInfo
+
+# Model modules are imported on first attribute access (PEP 562)
+_MODULES = {
+    "ContentInfo": "content_info",
+    "Error": "error",
+    "ErrorError": "error_error",
+    "GenericBucket": "generic_bucket",
+    "GenericBucketBucketInfo": "generic_bucket_bucket_info",
+    "GenericBucketDisplay": "generic_bucket_display",
+    "GenericBucketFacetsItem": "generic_bucket_facets_item",
+    "GenericFacetResponse": "generic_facet_response",
+    "GenericMetric": "generic_metric",
+    "GenericMetricValue": "generic_metric_value",
+    "Node": "node",
+    "NodeProperties": "node_properties",
+    "Pagination": "pagination",
+    "PathElement": "path_element",
+    "PathInfo": "path_info",
+    "RequestDefaults": "request_defaults",
+    "RequestDefaultsDefaultFTSFieldOperator": "request_defaults_default_fts_field_operator",
+    "RequestDefaultsDefaultFTSOperator": "request_defaults_default_fts_operator",
+    "RequestFacetField": "request_facet_field",
+    "RequestFacetFieldMethod": "request_facet_field_method",
+    "RequestFacetFieldSort": "request_facet_field_sort",
+    "RequestFacetFields": "request_facet_fields",
+    "RequestFacetIntervals": "request_facet_intervals",
+    "RequestFacetIntervalsIntervalsItem": "request_facet_intervals_intervals_item",
+    "RequestFacetQueriesItem": "request_facet_queries_item",
+    "RequestFacetSet": "request_facet_set",
+    "RequestFilterQueriesItem": "request_filter_queries_item",
+    "RequestHighlight": "request_highlight",
+    "RequestHighlightFieldsItem": "request_highlight_fields_item",
+    "RequestIncludeItem": "request_include_item",
+    "RequestLimits": "request_limits",
+    "RequestLocalization": "request_localization",
+    "RequestPagination": "request_pagination",
+    "RequestPivot": "request_pivot",
+    "RequestQuery": "request_query",
+    "RequestQueryLanguage": "request_query_language",
+    "RequestRange": "request_range",
+    "RequestScope": "request_scope",
+    "RequestScopeLocations": "request_scope_locations",
+    "RequestSortDefinitionItem": "request_sort_definition_item",
+    "RequestSortDefinitionItemType": "request_sort_definition_item_type",
+    "RequestSpellcheck": "request_spellcheck",
+    "RequestStats": "request_stats",
+    "RequestTemplatesItem": "request_templates_item",
+    "ResponseConsistency": "response_consistency",
+    "ResultBuckets": "result_buckets",
+    "ResultBucketsBucketsItem": "result_buckets_buckets_item",
+    "ResultBucketsBucketsItemDisplay": "result_buckets_buckets_item_display",
+    "ResultNode": "result_node",
+    "ResultSetContext": "result_set_context",
+    "ResultSetContextFacetQueriesItem": "result_set_context_facet_queries_item",
+    "ResultSetContextSpellcheckItem": "result_set_context_spellcheck_item",
+    "ResultSetContextSpellcheckItemType": "result_set_context_spellcheck_item_type",
+    "ResultSetPaging": "result_set_paging",
+    "ResultSetPagingList": "result_set_paging_list",
+    "ResultSetRowEntry": "result_set_row_entry",
+    "SearchEntry": "search_entry",
+    "SearchEntryHighlightItem": "search_entry_highlight_item",
+    "SearchRequest": "search_request",
+    "UserInfo": "user_info",
+}
 
 __all__ = (
     "ContentInfo",
@@ -123,3 +191,16 @@ __all__ = (
     "SearchRequest",
     "UserInfo",
 )
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
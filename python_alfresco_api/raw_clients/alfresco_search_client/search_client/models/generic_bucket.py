@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.generic_bucket_bucket_info import GenericBucketBucketInfo
@@ -13,6 +13,19 @@ if TYPE_CHECKING:
     from ..models.generic_metric import GenericMetric
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, GenericBucketBucketInfo, GenericBucketDisplay, GenericBucketFacetsItem, GenericMetric
+    from ..models.generic_bucket_bucket_info import GenericBucketBucketInfo
+    from ..models.generic_bucket_display import GenericBucketDisplay
+    from ..models.generic_bucket_facets_item import GenericBucketFacetsItem
+    from ..models.generic_metric import GenericMetric
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="GenericBucket")
 
 
@@ -84,10 +97,8 @@ class GenericBucket:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.generic_bucket_bucket_info import GenericBucketBucketInfo
-        from ..models.generic_bucket_display import GenericBucketDisplay
-        from ..models.generic_bucket_facets_item import GenericBucketFacetsItem
-        from ..models.generic_metric import GenericMetric
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         _bucket_info = d.pop("bucketInfo", UNSET)
@@ -131,7 +142,7 @@ class GenericBucket:
             metrics=metrics,
         )
 
-        generic_bucket.additional_properties = d
+        generic_bucket.additional_properties = d or EMPTY_PROPERTIES
         return generic_bucket
 
     @property
@@ -142,6 +153,8 @@ class GenericBucket:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="GenericBucketBucketInfo")
 
@@ -67,7 +67,7 @@ class GenericBucketBucketInfo:
             start_inclusive=start_inclusive,
         )
 
-        generic_bucket_bucket_info.additional_properties = d
+        generic_bucket_bucket_info.additional_properties = d or EMPTY_PROPERTIES
         return generic_bucket_bucket_info
 
     @property
@@ -78,6 +78,8 @@ class GenericBucketBucketInfo:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
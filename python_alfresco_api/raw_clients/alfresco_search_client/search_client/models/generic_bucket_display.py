@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="GenericBucketDisplay")
 
 
@@ -24,7 +26,7 @@ class GenericBucketDisplay:
         d = dict(src_dict)
         generic_bucket_display = cls()
 
-        generic_bucket_display.additional_properties = d
+        generic_bucket_display.additional_properties = d or EMPTY_PROPERTIES
         return generic_bucket_display
 
     @property
@@ -35,6 +37,8 @@ class GenericBucketDisplay:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
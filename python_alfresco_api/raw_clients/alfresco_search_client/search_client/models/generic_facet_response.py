@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.generic_bucket import GenericBucket
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, GenericBucket
+    from ..models.generic_bucket import GenericBucket
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="GenericFacetResponse")
 
 
@@ -53,7 +63,8 @@ class GenericFacetResponse:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.generic_bucket import GenericBucket
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         buckets = []
@@ -73,7 +84,7 @@ class GenericFacetResponse:
             type_=type_,
         )
 
-        generic_facet_response.additional_properties = d
+        generic_facet_response.additional_properties = d or EMPTY_PROPERTIES
         return generic_facet_response
 
     @property
@@ -84,6 +95,8 @@ class GenericFacetResponse:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.generic_metric_value import GenericMetricValue
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, GenericMetricValue
+    from ..models.generic_metric_value import GenericMetricValue
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="GenericMetric")
 
 
@@ -45,7 +55,8 @@ class GenericMetric:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.generic_metric_value import GenericMetricValue
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         type_ = d.pop("type", UNSET)
@@ -62,7 +73,7 @@ class GenericMetric:
             value=value,
         )
 
-        generic_metric.additional_properties = d
+        generic_metric.additional_properties = d or EMPTY_PROPERTIES
         return generic_metric
 
     @property
@@ -73,6 +84,8 @@ class GenericMetric:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -6,7 +6,7 @@ from attrs import field as _attrs_field
 
 from ..models.request_defaults_default_fts_field_operator import RequestDefaultsDefaultFTSFieldOperator
 from ..models.request_defaults_default_fts_operator import RequestDefaultsDefaultFTSOperator
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestDefaults")
 
@@ -106,7 +106,7 @@ class RequestDefaults:
             text_attributes=text_attributes,
         )
 
-        request_defaults.additional_properties = d
+        request_defaults.additional_properties = d or EMPTY_PROPERTIES
         return request_defaults
 
     @property
@@ -117,6 +117,8 @@ class RequestDefaults:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -6,7 +6,7 @@ from attrs import field as _attrs_field
 
 from ..models.request_facet_field_method import RequestFacetFieldMethod
 from ..models.request_facet_field_sort import RequestFacetFieldSort
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestFacetField")
 
@@ -152,7 +152,7 @@ class RequestFacetField:
             sort=sort,
         )
 
-        request_facet_field.additional_properties = d
+        request_facet_field.additional_properties = d or EMPTY_PROPERTIES
         return request_facet_field
 
     @property
@@ -163,6 +163,8 @@ class RequestFacetField:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.request_facet_field import RequestFacetField
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, RequestFacetField
+    from ..models.request_facet_field import RequestFacetField
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="RequestFacetFields")
 
 
@@ -45,7 +55,8 @@ class RequestFacetFields:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.request_facet_field import RequestFacetField
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         facets = []
@@ -59,7 +70,7 @@ class RequestFacetFields:
             facets=facets,
         )
 
-        request_facet_fields.additional_properties = d
+        request_facet_fields.additional_properties = d or EMPTY_PROPERTIES
         return request_facet_fields
 
     @property
@@ -70,6 +81,8 @@ class RequestFacetFields:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,13 +4,24 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.request_facet_intervals_intervals_item import RequestFacetIntervalsIntervalsItem
     from ..models.request_facet_set import RequestFacetSet
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, RequestFacetIntervalsIntervalsItem, RequestFacetSet
+    from ..models.request_facet_intervals_intervals_item import RequestFacetIntervalsIntervalsItem
+    from ..models.request_facet_set import RequestFacetSet
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="RequestFacetIntervals")
 
 
@@ -54,8 +65,8 @@ class RequestFacetIntervals:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.request_facet_intervals_intervals_item import RequestFacetIntervalsIntervalsItem
-        from ..models.request_facet_set import RequestFacetSet
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         intervals = []
@@ -77,7 +88,7 @@ class RequestFacetIntervals:
             sets=sets,
         )
 
-        request_facet_intervals.additional_properties = d
+        request_facet_intervals.additional_properties = d or EMPTY_PROPERTIES
         return request_facet_intervals
 
     @property
@@ -88,6 +99,8 @@ class RequestFacetIntervals:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
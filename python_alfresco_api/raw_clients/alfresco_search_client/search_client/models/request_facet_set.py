@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestFacetSet")
 
@@ -78,7 +78,7 @@ class RequestFacetSet:
             start_inclusive=start_inclusive,
         )
 
-        request_facet_set.additional_properties = d
+        request_facet_set.additional_properties = d or EMPTY_PROPERTIES
         return request_facet_set
 
     @property
@@ -89,6 +89,8 @@ class RequestFacetSet:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
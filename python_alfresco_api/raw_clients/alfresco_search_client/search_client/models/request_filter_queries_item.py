@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestFilterQueriesItem")
 
@@ -52,7 +52,7 @@ class RequestFilterQueriesItem:
             tags=tags,
         )
 
-        request_filter_queries_item.additional_properties = d
+        request_filter_queries_item.additional_properties = d or EMPTY_PROPERTIES
         return request_filter_queries_item
 
     @property
@@ -63,6 +63,8 @@ class RequestFilterQueriesItem:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
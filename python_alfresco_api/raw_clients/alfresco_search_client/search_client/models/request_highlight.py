@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.request_highlight_fields_item import RequestHighlightFieldsItem
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, RequestHighlightFieldsItem
+    from ..models.request_highlight_fields_item import RequestHighlightFieldsItem
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="RequestHighlight")
 
 
@@ -88,7 +98,8 @@ class RequestHighlight:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.request_highlight_fields_item import RequestHighlightFieldsItem
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         fields = []
@@ -123,7 +134,7 @@ class RequestHighlight:
             use_phrase_highlighter=use_phrase_highlighter,
         )
 
-        request_highlight.additional_properties = d
+        request_highlight.additional_properties = d or EMPTY_PROPERTIES
         return request_highlight
 
     @property
@@ -134,6 +145,8 @@ class RequestHighlight:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
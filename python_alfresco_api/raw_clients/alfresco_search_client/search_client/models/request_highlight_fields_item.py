@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestHighlightFieldsItem")
 
@@ -84,7 +84,7 @@ class RequestHighlightFieldsItem:
             snippet_count=snippet_count,
         )
 
-        request_highlight_fields_item.additional_properties = d
+        request_highlight_fields_item.additional_properties = d or EMPTY_PROPERTIES
         return request_highlight_fields_item
 
     @property
@@ -95,6 +95,8 @@ class RequestHighlightFieldsItem:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
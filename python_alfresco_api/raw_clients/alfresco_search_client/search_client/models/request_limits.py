@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestLimits")
 
@@ -51,7 +51,7 @@ class RequestLimits:
             permission_evaluation_time=permission_evaluation_time,
         )
 
-        request_limits.additional_properties = d
+        request_limits.additional_properties = d or EMPTY_PROPERTIES
         return request_limits
 
     @property
@@ -62,6 +62,8 @@ class RequestLimits:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
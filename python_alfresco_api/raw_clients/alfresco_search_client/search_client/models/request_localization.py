@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestLocalization")
 
@@ -53,7 +53,7 @@ class RequestLocalization:
             timezone=timezone,
         )
 
-        request_localization.additional_properties = d
+        request_localization.additional_properties = d or EMPTY_PROPERTIES
         return request_localization
 
     @property
@@ -64,6 +64,8 @@ class RequestLocalization:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
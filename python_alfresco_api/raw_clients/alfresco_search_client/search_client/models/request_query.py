@@ -5,7 +5,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.request_query_language import RequestQueryLanguage
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestQuery")
 
@@ -69,7 +69,7 @@ class RequestQuery:
             user_query=user_query,
         )
 
-        request_query.additional_properties = d
+        request_query.additional_properties = d or EMPTY_PROPERTIES
         return request_query
 
     @property
@@ -80,6 +80,8 @@ class RequestQuery:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
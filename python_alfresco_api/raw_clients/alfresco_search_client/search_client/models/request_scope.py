@@ -5,7 +5,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.request_scope_locations import RequestScopeLocations
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestScope")
 
@@ -48,7 +48,7 @@ class RequestScope:
             locations=locations,
         )
 
-        request_scope.additional_properties = d
+        request_scope.additional_properties = d or EMPTY_PROPERTIES
         return request_scope
 
     @property
@@ -59,6 +59,8 @@ class RequestScope:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
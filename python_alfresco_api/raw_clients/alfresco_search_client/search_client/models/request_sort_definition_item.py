@@ -5,7 +5,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.request_sort_definition_item_type import RequestSortDefinitionItemType
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestSortDefinitionItem")
 
@@ -67,7 +67,7 @@ class RequestSortDefinitionItem:
             type_=type_,
         )
 
-        request_sort_definition_item.additional_properties = d
+        request_sort_definition_item.additional_properties = d or EMPTY_PROPERTIES
         return request_sort_definition_item
 
     @property
@@ -78,6 +78,8 @@ class RequestSortDefinitionItem:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
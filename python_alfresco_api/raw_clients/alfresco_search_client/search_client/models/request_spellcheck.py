@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestSpellcheck")
 
@@ -41,7 +41,7 @@ class RequestSpellcheck:
             query=query,
         )
 
-        request_spellcheck.additional_properties = d
+        request_spellcheck.additional_properties = d or EMPTY_PROPERTIES
         return request_spellcheck
 
     @property
@@ -52,6 +52,8 @@ class RequestSpellcheck:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
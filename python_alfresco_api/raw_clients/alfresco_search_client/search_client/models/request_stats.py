@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RequestStats")
 
@@ -182,7 +182,7 @@ class RequestStats:
             sum_of_squares=sum_of_squares,
         )
 
-        request_stats.additional_properties = d
+        request_stats.additional_properties = d or EMPTY_PROPERTIES
         return request_stats
 
     @property
@@ -193,6 +193,8 @@ class RequestStats:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
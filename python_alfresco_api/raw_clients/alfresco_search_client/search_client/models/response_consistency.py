@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ResponseConsistency")
 
@@ -40,7 +40,7 @@ class ResponseConsistency:
             last_tx_id=last_tx_id,
         )
 
-        response_consistency.additional_properties = d
+        response_consistency.additional_properties = d or EMPTY_PROPERTIES
         return response_consistency
 
     @property
@@ -51,6 +51,8 @@ class ResponseConsistency:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
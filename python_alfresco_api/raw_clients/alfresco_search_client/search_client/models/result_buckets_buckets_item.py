@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.result_buckets_buckets_item_display import ResultBucketsBucketsItemDisplay
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ResultBucketsBucketsItemDisplay
+    from ..models.result_buckets_buckets_item_display import ResultBucketsBucketsItemDisplay
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ResultBucketsBucketsItem")
 
 
@@ -56,7 +66,8 @@ class ResultBucketsBucketsItem:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.result_buckets_buckets_item_display import ResultBucketsBucketsItemDisplay
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         count = d.pop("count", UNSET)
@@ -79,7 +90,7 @@ class ResultBucketsBucketsItem:
             label=label,
         )
 
-        result_buckets_buckets_item.additional_properties = d
+        result_buckets_buckets_item.additional_properties = d or EMPTY_PROPERTIES
         return result_buckets_buckets_item
 
     @property
@@ -90,6 +101,8 @@ class ResultBucketsBucketsItem:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,6 +4,8 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 T = TypeVar("T", bound="ResultBucketsBucketsItemDisplay")
 
 
@@ -24,7 +26,7 @@ class ResultBucketsBucketsItemDisplay:
         d = dict(src_dict)
         result_buckets_buckets_item_display = cls()
 
-        result_buckets_buckets_item_display.additional_properties = d
+        result_buckets_buckets_item_display.additional_properties = d or EMPTY_PROPERTIES
         return result_buckets_buckets_item_display
 
     @property
@@ -35,6 +37,8 @@ class ResultBucketsBucketsItemDisplay:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
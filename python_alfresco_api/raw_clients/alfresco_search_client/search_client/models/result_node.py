@@ -4,9 +4,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.content_info import ContentInfo
@@ -16,6 +15,20 @@ if TYPE_CHECKING:
     from ..models.user_info import UserInfo
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ContentInfo, NodeProperties, PathInfo, SearchEntry, UserInfo
+    from ..models.content_info import ContentInfo
+    from ..models.node_properties import NodeProperties
+    from ..models.path_info import PathInfo
+    from ..models.search_entry import SearchEntry
+    from ..models.user_info import UserInfo
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ResultNode")
 
 
@@ -179,14 +192,11 @@ class ResultNode:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.content_info import ContentInfo
-        from ..models.node_properties import NodeProperties
-        from ..models.path_info import PathInfo
-        from ..models.search_entry import SearchEntry
-        from ..models.user_info import UserInfo
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
-        created_at = isoparse(d.pop("createdAt"))
+        created_at = parse_datetime(d.pop("createdAt"))
 
         created_by_user = UserInfo.from_dict(d.pop("createdByUser"))
 
@@ -196,7 +206,7 @@ class ResultNode:
 
         is_folder = d.pop("isFolder")
 
-        modified_at = isoparse(d.pop("modifiedAt"))
+        modified_at = parse_datetime(d.pop("modifiedAt"))
 
         modified_by_user = UserInfo.from_dict(d.pop("modifiedByUser"))
 
@@ -240,7 +250,7 @@ class ResultNode:
         if isinstance(_archived_at, Unset):
             archived_at = UNSET
         else:
-            archived_at = isoparse(_archived_at)
+            archived_at = parse_datetime(_archived_at)
 
         _archived_by_user = d.pop("archivedByUser", UNSET)
         archived_by_user: Union[Unset, UserInfo]
@@ -285,7 +295,7 @@ class ResultNode:
             version_label=version_label,
         )
 
-        result_node.additional_properties = d
+        result_node.additional_properties = d or EMPTY_PROPERTIES
         return result_node
 
     @property
@@ -296,6 +306,8 @@ class ResultNode:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
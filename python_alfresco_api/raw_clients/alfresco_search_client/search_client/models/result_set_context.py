@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.generic_facet_response import GenericFacetResponse
@@ -15,6 +15,21 @@ if TYPE_CHECKING:
     from ..models.search_request import SearchRequest
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, GenericFacetResponse, ResponseConsistency, ResultBuckets, ResultSetContextFacetQueriesItem, ResultSetContextSpellcheckItem, SearchRequest
+    from ..models.generic_facet_response import GenericFacetResponse
+    from ..models.response_consistency import ResponseConsistency
+    from ..models.result_buckets import ResultBuckets
+    from ..models.result_set_context_facet_queries_item import ResultSetContextFacetQueriesItem
+    from ..models.result_set_context_spellcheck_item import ResultSetContextSpellcheckItem
+    from ..models.search_request import SearchRequest
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ResultSetContext")
 
 
@@ -102,12 +117,8 @@ class ResultSetContext:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.generic_facet_response import GenericFacetResponse
-        from ..models.response_consistency import ResponseConsistency
-        from ..models.result_buckets import ResultBuckets
-        from ..models.result_set_context_facet_queries_item import ResultSetContextFacetQueriesItem
-        from ..models.result_set_context_spellcheck_item import ResultSetContextSpellcheckItem
-        from ..models.search_request import SearchRequest
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         _consistency = d.pop("consistency", UNSET)
@@ -161,7 +172,7 @@ class ResultSetContext:
             spellcheck=spellcheck,
         )
 
-        result_set_context.additional_properties = d
+        result_set_context.additional_properties = d or EMPTY_PROPERTIES
         return result_set_context
 
     @property
@@ -172,6 +183,8 @@ class ResultSetContext:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ResultSetContextFacetQueriesItem")
 
@@ -57,7 +57,7 @@ class ResultSetContextFacetQueriesItem:
             label=label,
         )
 
-        result_set_context_facet_queries_item.additional_properties = d
+        result_set_context_facet_queries_item.additional_properties = d or EMPTY_PROPERTIES
         return result_set_context_facet_queries_item
 
     @property
@@ -68,6 +68,8 @@ class ResultSetContextFacetQueriesItem:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
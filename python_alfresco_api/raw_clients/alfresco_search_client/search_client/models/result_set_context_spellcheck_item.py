@@ -5,7 +5,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.result_set_context_spellcheck_item_type import ResultSetContextSpellcheckItemType
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ResultSetContextSpellcheckItem")
 
@@ -58,7 +58,7 @@ class ResultSetContextSpellcheckItem:
             type_=type_,
         )
 
-        result_set_context_spellcheck_item.additional_properties = d
+        result_set_context_spellcheck_item.additional_properties = d or EMPTY_PROPERTIES
         return result_set_context_spellcheck_item
 
     @property
@@ -69,6 +69,8 @@ class ResultSetContextSpellcheckItem:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.result_set_paging_list import ResultSetPagingList
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ResultSetPagingList
+    from ..models.result_set_paging_list import ResultSetPagingList
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ResultSetPaging")
 
 
@@ -39,7 +49,8 @@ class ResultSetPaging:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.result_set_paging_list import ResultSetPagingList
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         _list_ = d.pop("list", UNSET)
@@ -53,7 +64,7 @@ class ResultSetPaging:
             list_=list_,
         )
 
-        result_set_paging.additional_properties = d
+        result_set_paging.additional_properties = d or EMPTY_PROPERTIES
         return result_set_paging
 
     @property
@@ -64,6 +75,8 @@ class ResultSetPaging:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.pagination import Pagination
@@ -12,6 +12,18 @@ if TYPE_CHECKING:
     from ..models.result_set_row_entry import ResultSetRowEntry
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Pagination, ResultSetContext, ResultSetRowEntry
+    from ..models.pagination import Pagination
+    from ..models.result_set_context import ResultSetContext
+    from ..models.result_set_row_entry import ResultSetRowEntry
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ResultSetPagingList")
 
 
@@ -59,9 +71,8 @@ class ResultSetPagingList:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.pagination import Pagination
-        from ..models.result_set_context import ResultSetContext
-        from ..models.result_set_row_entry import ResultSetRowEntry
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         _context = d.pop("context", UNSET)
@@ -91,7 +102,7 @@ class ResultSetPagingList:
             pagination=pagination,
         )
 
-        result_set_paging_list.additional_properties = d
+        result_set_paging_list.additional_properties = d or EMPTY_PROPERTIES
         return result_set_paging_list
 
     @property
@@ -102,6 +113,8 @@ class ResultSetPagingList:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,10 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 if TYPE_CHECKING:
     from ..models.result_node import ResultNode
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ResultNode
+    from ..models.result_node import ResultNode
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ResultSetRowEntry")
 
 
@@ -37,7 +49,8 @@ class ResultSetRowEntry:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.result_node import ResultNode
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         entry = ResultNode.from_dict(d.pop("entry"))
@@ -46,7 +59,7 @@ class ResultSetRowEntry:
             entry=entry,
         )
 
-        result_set_row_entry.additional_properties = d
+        result_set_row_entry.additional_properties = d or EMPTY_PROPERTIES
         return result_set_row_entry
 
     @property
@@ -57,6 +70,8 @@ class ResultSetRowEntry:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
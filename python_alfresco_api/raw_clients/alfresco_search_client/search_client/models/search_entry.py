@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.search_entry_highlight_item import SearchEntryHighlightItem
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, SearchEntryHighlightItem
+    from ..models.search_entry_highlight_item import SearchEntryHighlightItem
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="SearchEntry")
 
 
@@ -48,7 +58,8 @@ class SearchEntry:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.search_entry_highlight_item import SearchEntryHighlightItem
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         highlight = []
@@ -65,7 +76,7 @@ class SearchEntry:
             score=score,
         )
 
-        search_entry.additional_properties = d
+        search_entry.additional_properties = d or EMPTY_PROPERTIES
         return search_entry
 
     @property
@@ -76,6 +87,8 @@ class SearchEntry:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
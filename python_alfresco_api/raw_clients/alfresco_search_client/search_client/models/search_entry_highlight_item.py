@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="SearchEntryHighlightItem")
 
@@ -51,7 +51,7 @@ class SearchEntryHighlightItem:
             snippets=snippets,
         )
 
-        search_entry_highlight_item.additional_properties = d
+        search_entry_highlight_item.additional_properties = d or EMPTY_PROPERTIES
         return search_entry_highlight_item
 
     @property
@@ -62,6 +62,8 @@ class SearchEntryHighlightItem:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
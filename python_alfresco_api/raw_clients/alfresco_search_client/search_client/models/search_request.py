@@ -5,7 +5,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.request_include_item import RequestIncludeItem
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.request_defaults import RequestDefaults
@@ -27,6 +27,32 @@ if TYPE_CHECKING:
     from ..models.request_templates_item import RequestTemplatesItem
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, RequestDefaults, RequestFacetFields, RequestFacetIntervals, RequestFacetQueriesItem, RequestFilterQueriesItem, RequestHighlight, RequestLimits, RequestLocalization, RequestPagination, RequestPivot, RequestQuery, RequestRange, RequestScope, RequestSortDefinitionItem, RequestSpellcheck, RequestStats, RequestTemplatesItem
+    from ..models.request_defaults import RequestDefaults
+    from ..models.request_facet_fields import RequestFacetFields
+    from ..models.request_facet_intervals import RequestFacetIntervals
+    from ..models.request_facet_queries_item import RequestFacetQueriesItem
+    from ..models.request_filter_queries_item import RequestFilterQueriesItem
+    from ..models.request_highlight import RequestHighlight
+    from ..models.request_limits import RequestLimits
+    from ..models.request_localization import RequestLocalization
+    from ..models.request_pagination import RequestPagination
+    from ..models.request_pivot import RequestPivot
+    from ..models.request_query import RequestQuery
+    from ..models.request_range import RequestRange
+    from ..models.request_scope import RequestScope
+    from ..models.request_sort_definition_item import RequestSortDefinitionItem
+    from ..models.request_spellcheck import RequestSpellcheck
+    from ..models.request_stats import RequestStats
+    from ..models.request_templates_item import RequestTemplatesItem
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="SearchRequest")
 
 
@@ -257,23 +283,8 @@ class SearchRequest:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.request_defaults import RequestDefaults
-        from ..models.request_facet_fields import RequestFacetFields
-        from ..models.request_facet_intervals import RequestFacetIntervals
-        from ..models.request_facet_queries_item import RequestFacetQueriesItem
-        from ..models.request_filter_queries_item import RequestFilterQueriesItem
-        from ..models.request_highlight import RequestHighlight
-        from ..models.request_limits import RequestLimits
-        from ..models.request_localization import RequestLocalization
-        from ..models.request_pagination import RequestPagination
-        from ..models.request_pivot import RequestPivot
-        from ..models.request_query import RequestQuery
-        from ..models.request_range import RequestRange
-        from ..models.request_scope import RequestScope
-        from ..models.request_sort_definition_item import RequestSortDefinitionItem
-        from ..models.request_spellcheck import RequestSpellcheck
-        from ..models.request_stats import RequestStats
-        from ..models.request_templates_item import RequestTemplatesItem
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         query = RequestQuery.from_dict(d.pop("query"))
@@ -432,7 +443,7 @@ class SearchRequest:
             templates=templates,
         )
 
-        search_request.additional_properties = d
+        search_request.additional_properties = d or EMPTY_PROPERTIES
         return search_request
 
     @property
@@ -443,6 +454,8 @@ class SearchRequest:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
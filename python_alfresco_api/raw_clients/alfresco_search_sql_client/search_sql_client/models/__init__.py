@@ -1,14 +1,31 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .docs_item import DocsItem
-from .error import Error
-from .error_error import ErrorError
-from .pagination import Pagination
-from .solr_result_set import SolrResultSet
-from .sql_result_set_paging import SQLResultSetPaging
-from .sql_result_set_paging_list import SQLResultSetPagingList
-from .sql_result_set_row_entry import SQLResultSetRowEntry
-from .sql_search_request import SQLSearchRequest
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .docs_item import DocsItem
+    from .error import Error
+    from .error_error import ErrorError
+    from .pagination import Pagination
+    from .solr_result_set import SolrResultSet
+    from .sql_result_set_paging import SQLResultSetPaging
+    from .sql_result_set_paging_list import SQLResultSetPagingList
+    from .sql_result_set_row_entry import SQLResultSetRowEntry
+    from .sql_search_request import SQLSearchRequest
+
+# Model modules are imported on first attribute access (PEP 562)
+_MODULES = {
+    "DocsItem": "docs_item",
+    "Error": "error",
+    "ErrorError": "error_error",
+    "Pagination": "pagination",
+    "SolrResultSet": "solr_result_set",
+    "SQLResultSetPaging": "sql_result_set_paging",
+    "SQLResultSetPagingList": "sql_result_set_paging_list",
+    "SQLResultSetRowEntry": "sql_result_set_row_entry",
+    "SQLSearchRequest": "sql_search_request",
+}
 
 __all__ = (
     "DocsItem",
@@ -21,3 +38,16 @@ __all__ = (
     "SQLResultSetRowEntry",
     "SQLSearchRequest",
 )
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
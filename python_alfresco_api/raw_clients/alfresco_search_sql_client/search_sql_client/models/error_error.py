@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ErrorError")
 
@@ -84,7 +84,7 @@ class ErrorError:
             status_code=status_code,
         )
 
-        error_error.additional_properties = d
+        error_error.additional_properties = d or EMPTY_PROPERTIES
         return error_error
 
     @property
@@ -95,6 +95,8 @@ class ErrorError:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
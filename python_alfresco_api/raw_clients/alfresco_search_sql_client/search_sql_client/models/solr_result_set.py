@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.docs_item import DocsItem
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, DocsItem
+    from ..models.docs_item import DocsItem
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="SolrResultSet")
 
 
@@ -43,7 +53,8 @@ class SolrResultSet:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.docs_item import DocsItem
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         result_set = []
@@ -57,7 +68,7 @@ class SolrResultSet:
             result_set=result_set,
         )
 
-        solr_result_set.additional_properties = d
+        solr_result_set.additional_properties = d or EMPTY_PROPERTIES
         return solr_result_set
 
     @property
@@ -68,6 +79,8 @@ class SolrResultSet:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="SQLSearchRequest")
 
@@ -88,7 +88,7 @@ class SQLSearchRequest:
             timezone=timezone,
         )
 
-        sql_search_request.additional_properties = d
+        sql_search_request.additional_properties = d or EMPTY_PROPERTIES
         return sql_search_request
 
     @property
@@ -99,6 +99,8 @@ class SQLSearchRequest:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -1,5 +1,7 @@
 """Contains some shared types for properties"""
 
+import datetime
+import sys
 from collections.abc import Mapping, MutableMapping
 from http import HTTPStatus
 from typing import IO, BinaryIO, Generic, Literal, Optional, TypeVar, Union
@@ -51,4 +53,47 @@ class Response(Generic[T]):
     parsed: Optional[T]
 
 
-__all__ = ["UNSET", "File", "FileTypes", "RequestFiles", "Response", "Unset"]
+class EmptyProperties(dict):
+    """Shared read-only `additional_properties` of decoded models without extra keys."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("EMPTY_PROPERTIES is shared and read-only; use model[key] = value")
+
+    def __delitem__(self, key):
+        raise KeyError(key)
+
+    __setitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+
+EMPTY_PROPERTIES = EmptyProperties()
+
+
+if sys.version_info >= (3, 11):
+    _fromisoformat = datetime.datetime.fromisoformat
+else:
+    def _fromisoformat(value: str) -> datetime.datetime:
+        # Python 3.10 needs the offset as +HH:MM
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        elif len(value) > 10 and value[-5] in "+-":
+            value = value[:-2] + ":" + value[-2:]
+        return datetime.datetime.fromisoformat(value)
+
+
+def parse_datetime(value: str) -> datetime.datetime:
+    """
+    Parse an API timestamp (`2024-01-01T10:00:00.000+0000`).
+
+    Uses datetime.fromisoformat(); values it rejects fall back to dateutil's isoparse().
+    """
+    try:
+        return _fromisoformat(value)
+    except ValueError:
+        from dateutil.parser import isoparse
+
+        return isoparse(value)
+
+
+__all__ = ["EMPTY_PROPERTIES", "EmptyProperties", "UNSET", "File", "FileTypes", "RequestFiles", "Response", "Unset", "parse_datetime"]
@@ -1,50 +1,103 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .candidate import Candidate
-from .candidate_candidate_type import CandidateCandidateType
-from .candidate_entry import CandidateEntry
-from .candidate_paging import CandidatePaging
-from .candidate_paging_list import CandidatePagingList
-from .company import Company
-from .deployment import Deployment
-from .deployment_entry import DeploymentEntry
-from .deployment_paging import DeploymentPaging
-from .deployment_paging_list import DeploymentPagingList
-from .error import Error
-from .error_error import ErrorError
-from .item import Item
-from .item_body import ItemBody
-from .item_entry import ItemEntry
-from .item_paging import ItemPaging
-from .item_paging_list import ItemPagingList
-from .pagination import Pagination
-from .person import Person
-from .process import Process
-from .process_body import ProcessBody
-from .process_body_variable import ProcessBodyVariable
-from .process_definition import ProcessDefinition
-from .process_definition_entry import ProcessDefinitionEntry
-from .process_definition_paging import ProcessDefinitionPaging
-from .process_definition_paging_list import ProcessDefinitionPagingList
-from .process_entry import ProcessEntry
-from .process_paging import ProcessPaging
-from .process_paging_list import ProcessPagingList
-from .task import Task
-from .task_body import TaskBody
-from .task_body_state import TaskBodyState
-from .task_entry import TaskEntry
-from .task_form_model import TaskFormModel
-from .task_form_model_entry import TaskFormModelEntry
-from .task_form_model_paging import TaskFormModelPaging
-from .task_form_model_paging_list import TaskFormModelPagingList
-from .task_paging import TaskPaging
-from .task_paging_list import TaskPagingList
-from .task_state import TaskState
-from .variable import Variable
-from .variable_body import VariableBody
-from .variable_entry import VariableEntry
-from .variable_paging import VariablePaging
-from .variable_paging_list import VariablePagingList
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .candidate import Candidate
+    from .candidate_candidate_type import CandidateCandidateType
+    from .candidate_entry import CandidateEntry
+    from .candidate_paging import CandidatePaging
+    from .candidate_paging_list import CandidatePagingList
+    from .company import Company
+    from .deployment import Deployment
+    from .deployment_entry import DeploymentEntry
+    from .deployment_paging import DeploymentPaging
+    from .deployment_paging_list import DeploymentPagingList
+    from .error import Error
+    from .error_error import ErrorError
+    from .item import Item
+    from .item_body import ItemBody
+    from .item_entry import ItemEntry
+    from .item_paging import ItemPaging
+    from .item_paging_list import ItemPagingList
+    from .pagination import Pagination
+    from .person import Person
+    from .process import Process
+    from .process_body import ProcessBody
+    from .process_body_variable import ProcessBodyVariable
+    from .process_definition import ProcessDefinition
+    from .process_definition_entry import ProcessDefinitionEntry
+    from .process_definition_paging import ProcessDefinitionPaging
+    from .process_definition_paging_list import ProcessDefinitionPagingList
+    from .process_entry import ProcessEntry
+    from .process_paging import ProcessPaging
+    from .process_paging_list import ProcessPagingList
+    from .task import Task
+    from .task_body import TaskBody
+    from .task_body_state import TaskBodyState
+    from .task_entry import TaskEntry
+    from .task_form_model import TaskFormModel
+    from .task_form_model_entry import TaskFormModelEntry
+    from .task_form_model_paging import TaskFormModelPaging
+    from .task_form_model_paging_list import TaskFormModelPagingList
+    from .task_paging import TaskPaging
+    from .task_paging_list import TaskPagingList
+    from .task_state import TaskState
+    from .variable import Variable
+    from .variable_body import VariableBody
+    from .variable_entry import VariableEntry
+    from .variable_paging import VariablePaging
+    from .variable_paging_list import VariablePagingList
+
+# Model modules are imported on first attribute access (PEP 562)
+_MODULES = {
+    "Candidate": "candidate",
+    "CandidateCandidateType": "candidate_candidate_type",
+    "CandidateEntry": "candidate_entry",
+    "CandidatePaging": "candidate_paging",
+    "CandidatePagingList": "candidate_paging_list",
+    "Company": "company",
+    "Deployment": "deployment",
+    "DeploymentEntry": "deployment_entry",
+    "DeploymentPaging": "deployment_paging",
+    "DeploymentPagingList": "deployment_paging_list",
+    "Error": "error",
+    "ErrorError": "error_error",
+    "Item": "item",
+    "ItemBody": "item_body",
+    "ItemEntry": "item_entry",
+    "ItemPaging": "item_paging",
+    "ItemPagingList": "item_paging_list",
+    "Pagination": "pagination",
+    "Person": "person",
+    "Process": "process",
+    "ProcessBody": "process_body",
+    "ProcessBodyVariable": "process_body_variable",
+    "ProcessDefinition": "process_definition",
+    "ProcessDefinitionEntry": "process_definition_entry",
+    "ProcessDefinitionPaging": "process_definition_paging",
+    "ProcessDefinitionPagingList": "process_definition_paging_list",
+    "ProcessEntry": "process_entry",
+    "ProcessPaging": "process_paging",
+    "ProcessPagingList": "process_paging_list",
+    "Task": "task",
+    "TaskBody": "task_body",
+    "TaskBodyState": "task_body_state",
+    "TaskEntry": "task_entry",
+    "TaskFormModel": "task_form_model",
+    "TaskFormModelEntry": "task_form_model_entry",
+    "TaskFormModelPaging": "task_form_model_paging",
+    "TaskFormModelPagingList": "task_form_model_paging_list",
+    "TaskPaging": "task_paging",
+    "TaskPagingList": "task_paging_list",
+    "TaskState": "task_state",
+    "Variable": "variable",
+    "VariableBody": "variable_body",
+    "VariableEntry": "variable_entry",
+    "VariablePaging": "variable_paging",
+    "VariablePagingList": "variable_paging_list",
+}
 
 __all__ = (
     "Candidate",
@@ -93,3 +146,16 @@ __all__ = (
     "VariablePaging",
     "VariablePagingList",
 )
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,7 +5,7 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.candidate_candidate_type import CandidateCandidateType
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Candidate")
 
@@ -57,7 +57,7 @@ class Candidate:
             candidate_type=candidate_type,
         )
 
-        candidate.additional_properties = d
+        candidate.additional_properties = d or EMPTY_PROPERTIES
         return candidate
 
     @property
@@ -68,6 +68,8 @@ class Candidate:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
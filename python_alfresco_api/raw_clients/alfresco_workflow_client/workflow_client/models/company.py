@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="Company")
 
@@ -102,7 +102,7 @@ class Company:
             telephone=telephone,
         )
 
-        company.additional_properties = d
+        company.additional_properties = d or EMPTY_PROPERTIES
         return company
 
     @property
@@ -113,6 +113,8 @@ class Company:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
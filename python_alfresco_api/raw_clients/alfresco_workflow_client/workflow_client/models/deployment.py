@@ -4,9 +4,8 @@ from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 T = TypeVar("T", bound="Deployment")
 
@@ -85,7 +84,7 @@ class Deployment:
         if isinstance(_deployed_at, Unset):
             deployed_at = UNSET
         else:
-            deployed_at = isoparse(_deployed_at)
+            deployed_at = parse_datetime(_deployed_at)
 
         name = d.pop("name", UNSET)
 
@@ -96,7 +95,7 @@ class Deployment:
             name=name,
         )
 
-        deployment.additional_properties = d
+        deployment.additional_properties = d or EMPTY_PROPERTIES
         return deployment
 
     @property
@@ -107,6 +106,8 @@ class Deployment:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
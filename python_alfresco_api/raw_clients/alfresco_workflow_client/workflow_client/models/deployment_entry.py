@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.deployment import Deployment
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Deployment
+    from ..models.deployment import Deployment
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="DeploymentEntry")
 
 
@@ -56,7 +66,8 @@ class DeploymentEntry:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.deployment import Deployment
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         _entry = d.pop("entry", UNSET)
@@ -70,7 +81,7 @@ class DeploymentEntry:
             entry=entry,
         )
 
-        deployment_entry.additional_properties = d
+        deployment_entry.additional_properties = d or EMPTY_PROPERTIES
         return deployment_entry
 
     @property
@@ -81,6 +92,8 @@ class DeploymentEntry:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,10 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES
+
 if TYPE_CHECKING:
     from ..models.error_error import ErrorError
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ErrorError
+    from ..models.error_error import ErrorError
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Error")
 
 
@@ -36,7 +48,8 @@ class Error:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.error_error import ErrorError
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         error = ErrorError.from_dict(d.pop("error"))
@@ -45,7 +58,7 @@ class Error:
             error=error,
         )
 
-        error.additional_properties = d
+        error.additional_properties = d or EMPTY_PROPERTIES
         return error
 
     @property
@@ -56,6 +69,8 @@ class Error:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,14 +4,23 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.person import Person
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Person
+    from ..models.person import Person
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Item")
 
 
@@ -113,7 +122,8 @@ class Item:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.person import Person
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         _created_at = d.pop("createdAt", UNSET)
@@ -121,7 +131,7 @@ class Item:
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         _created_by = d.pop("createdBy", UNSET)
         created_by: Union[Unset, Person]
@@ -143,7 +153,7 @@ class Item:
         if isinstance(_modified_at, Unset):
             modified_at = UNSET
         else:
-            modified_at = isoparse(_modified_at)
+            modified_at = parse_datetime(_modified_at)
 
         _modified_by = d.pop("modifiedBy", UNSET)
         modified_by: Union[Unset, Person]
@@ -175,7 +185,7 @@ class Item:
             value=value,
         )
 
-        item.additional_properties = d
+        item.additional_properties = d or EMPTY_PROPERTIES
         return item
 
     @property
@@ -186,6 +196,8 @@ class Item:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
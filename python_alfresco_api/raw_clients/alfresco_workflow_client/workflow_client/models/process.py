@@ -4,9 +4,8 @@ from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 T = TypeVar("T", bound="Process")
 
@@ -123,7 +122,7 @@ class Process:
         if isinstance(_ended_at, Unset):
             ended_at = UNSET
         else:
-            ended_at = isoparse(_ended_at)
+            ended_at = parse_datetime(_ended_at)
 
         process_definition_id = d.pop("processDefinitionId", UNSET)
 
@@ -136,7 +135,7 @@ class Process:
         if isinstance(_started_at, Unset):
             started_at = UNSET
         else:
-            started_at = isoparse(_started_at)
+            started_at = parse_datetime(_started_at)
 
         process = cls(
             id=id,
@@ -151,7 +150,7 @@ class Process:
             started_at=started_at,
         )
 
-        process.additional_properties = d
+        process.additional_properties = d or EMPTY_PROPERTIES
         return process
 
     @property
@@ -162,6 +161,8 @@ class Process:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="ProcessBodyVariable")
 
@@ -58,7 +58,7 @@ class ProcessBodyVariable:
             bpm_workflow_priority=bpm_workflow_priority,
         )
 
-        process_body_variable.additional_properties = d
+        process_body_variable.additional_properties = d or EMPTY_PROPERTIES
         return process_body_variable
 
     @property
@@ -69,6 +69,8 @@ class ProcessBodyVariable:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
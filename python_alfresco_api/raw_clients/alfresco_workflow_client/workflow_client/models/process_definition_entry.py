@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.process_definition import ProcessDefinition
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, ProcessDefinition
+    from ..models.process_definition import ProcessDefinition
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="ProcessDefinitionEntry")
 
 
@@ -40,7 +50,8 @@ class ProcessDefinitionEntry:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.process_definition import ProcessDefinition
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         _entry = d.pop("entry", UNSET)
@@ -54,7 +65,7 @@ class ProcessDefinitionEntry:
             entry=entry,
         )
 
-        process_definition_entry.additional_properties = d
+        process_definition_entry.additional_properties = d or EMPTY_PROPERTIES
         return process_definition_entry
 
     @property
@@ -65,6 +76,8 @@ class ProcessDefinitionEntry:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,15 +4,24 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
 from ..models.task_state import TaskState
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.variable import Variable
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Variable
+    from ..models.variable import Variable
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="Task")
 
 
@@ -145,7 +154,8 @@ class Task:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.variable import Variable
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         id = d.pop("id")
@@ -161,7 +171,7 @@ class Task:
         if isinstance(_due_at, Unset):
             due_at = UNSET
         else:
-            due_at = isoparse(_due_at)
+            due_at = parse_datetime(_due_at)
 
         duration_in_ms = d.pop("durationInMs", UNSET)
 
@@ -170,7 +180,7 @@ class Task:
         if isinstance(_ended_at, Unset):
             ended_at = UNSET
         else:
-            ended_at = isoparse(_ended_at)
+            ended_at = parse_datetime(_ended_at)
 
         form_resource_key = d.pop("formResourceKey", UNSET)
 
@@ -189,7 +199,7 @@ class Task:
         if isinstance(_started_at, Unset):
             started_at = UNSET
         else:
-            started_at = isoparse(_started_at)
+            started_at = parse_datetime(_started_at)
 
         _state = d.pop("state", UNSET)
         state: Union[Unset, TaskState]
@@ -224,7 +234,7 @@ class Task:
             variables=variables,
         )
 
-        task.additional_properties = d
+        task.additional_properties = d or EMPTY_PROPERTIES
         return task
 
     @property
@@ -235,6 +245,8 @@ class Task:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,15 +4,24 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
 from ..models.task_body_state import TaskBodyState
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset, parse_datetime
 
 if TYPE_CHECKING:
     from ..models.variable import Variable
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, Variable
+    from ..models.variable import Variable
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="TaskBody")
 
 
@@ -85,7 +94,8 @@ class TaskBody:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.variable import Variable
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         description = d.pop("description", UNSET)
@@ -95,7 +105,7 @@ class TaskBody:
         if isinstance(_due_at, Unset):
             due_at = UNSET
         else:
-            due_at = isoparse(_due_at)
+            due_at = parse_datetime(_due_at)
 
         name = d.pop("name", UNSET)
 
@@ -127,7 +137,7 @@ class TaskBody:
             variables=variables,
         )
 
-        task_body.additional_properties = d
+        task_body.additional_properties = d or EMPTY_PROPERTIES
         return task_body
 
     @property
@@ -138,6 +148,8 @@ class TaskBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
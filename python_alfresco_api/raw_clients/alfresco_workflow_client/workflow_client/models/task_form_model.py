@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Union, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="TaskFormModel")
 
@@ -96,7 +96,7 @@ class TaskFormModel:
             title=title,
         )
 
-        task_form_model.additional_properties = d
+        task_form_model.additional_properties = d or EMPTY_PROPERTIES
         return task_form_model
 
     @property
@@ -107,6 +107,8 @@ class TaskFormModel:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
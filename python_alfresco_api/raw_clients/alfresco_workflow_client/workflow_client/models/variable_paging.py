@@ -4,12 +4,22 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.variable_paging_list import VariablePagingList
 
 
+_MODELS_IMPORTED = False
+
+
+def _import_models() -> None:
+    """Bind the model classes used below (on first use: models reference each other)."""
+    global _MODELS_IMPORTED, VariablePagingList
+    from ..models.variable_paging_list import VariablePagingList
+    _MODELS_IMPORTED = True
+
+
 T = TypeVar("T", bound="VariablePaging")
 
 
@@ -38,7 +48,8 @@ class VariablePaging:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.variable_paging_list import VariablePagingList
+        if not _MODELS_IMPORTED:
+            _import_models()
 
         d = dict(src_dict)
         _list_ = d.pop("list", UNSET)
@@ -52,7 +63,7 @@ class VariablePaging:
             list_=list_,
         )
 
-        variable_paging.additional_properties = d
+        variable_paging.additional_properties = d or EMPTY_PROPERTIES
         return variable_paging
 
     @property
@@ -63,6 +74,8 @@ class VariablePaging:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
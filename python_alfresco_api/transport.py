@@ -0,0 +1,247 @@
+"""
+Shared HTTP Transport
+
+Provides a single connection pool per Alfresco host that every raw client
+created by ClientFactory sits on top of. Each raw client keeps its own
+httpx.Client / httpx.AsyncClient (base URL, headers, timeout), but all of
+them hand their requests to the same underlying transport, so TCP and TLS
+connections are reused across core, search, workflow, etc. calls.
+
+With a non-stdlib JSON codec, responses are handed out as CodecResponse
+objects, so `response.json()` parses with it (see json_codec.py). With
+coalesce=True identical concurrent GETs share one request (see coalescing.py).
+
+Async connections belong to the event loop that opened them, so the async
+side keeps one pool per running loop (each asyncio.run() call, the bulk
+executor's loop thread, ...). A loop's pool is closed when the loop shuts
+down its async generators (asyncio.run() does), or by close() / aclose().
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import AsyncGenerator, List, Optional, Tuple, Union
+
+import httpx
+
+from .coalescing import RequestCoalescer
+from .json_codec import JsonCodec, STDLIB_CODEC, wrap_response
+
+
+class SharedTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Connection pool shared by all raw clients of one ClientFactory.
+
+    The generated raw clients pass ``httpx_args`` to both ``httpx.Client`` and
+    ``httpx.AsyncClient``, so this transport implements both the sync and the
+    async transport interfaces, delegating to a lazily created
+    ``httpx.HTTPTransport`` and to one ``httpx.AsyncHTTPTransport`` per event
+    loop respectively.
+
+    Closing an individual raw client does NOT close the pool - the owning
+    ClientFactory closes it via close() / aclose().
+    """
+
+    def __init__(
+        self,
+        verify_ssl: Union[bool, str] = True,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        codec: JsonCodec = STDLIB_CODEC,
+        coalesce: bool = False
+    ):
+        """
+        Initialize shared transport.
+
+        Args:
+            verify_ssl: SSL verification - True, False, or path to certificate bundle
+            max_connections: Maximum concurrent connections to the host (None = unlimited)
+            max_keepalive_connections: Maximum idle connections kept open (None = unlimited)
+            keepalive_expiry: Seconds an idle connection is kept alive (None = forever)
+            http2: Enable HTTP/2 (requires the 'h2' package: pip install httpx[http2])
+            codec: JSON codec used by the responses' json()
+            coalesce: Merge identical concurrent GET/HEAD requests into one
+        """
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "http2=True requires the 'h2' package. "
+                    "Install it with: pip install httpx[http2]"
+                ) from None
+
+        self.verify_ssl = verify_ssl
+        self.http2 = http2
+        self.codec = codec
+        self.coalescer: Optional[RequestCoalescer] = RequestCoalescer() if coalesce else None
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+
+        self._lock = threading.Lock()
+        self._sync_transport: Optional[httpx.BaseTransport] = None
+        # Transport used on every event loop instead of the per-loop pools (use_transport())
+        self._async_transport: Optional[httpx.AsyncBaseTransport] = None
+        self._async_pools: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]"
+        ) = weakref.WeakKeyDictionary()
+        # One _close_with_loop() generator parked on each loop that sent requests
+        self._loop_closers: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGenerator[None, None]]"
+        ) = weakref.WeakKeyDictionary()
+
+    def use_transport(
+        self,
+        transport: httpx.BaseTransport,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None
+    ) -> None:
+        """
+        Send requests through the given transport instead of the connection pools.
+
+        Meant for in-process servers such as httpx.MockTransport (tests,
+        scripts/benchmarks/mock_alfresco.py). The transport serves the async
+        clients too unless async_transport is given.
+
+        Args:
+            transport: Sync transport (used for async requests as well if it is
+                an AsyncBaseTransport)
+            async_transport: Transport for async requests
+        """
+        if async_transport is None and isinstance(transport, httpx.AsyncBaseTransport):
+            async_transport = transport
+        with self._lock:
+            self._sync_transport = transport
+            self._async_transport = async_transport
+
+    @property
+    def sync_transport(self) -> httpx.BaseTransport:
+        """Get the pooled sync transport, creating it on first use."""
+        if self._sync_transport is None:
+            with self._lock:
+                if self._sync_transport is None:
+                    self._sync_transport = httpx.HTTPTransport(
+                        verify=self.verify_ssl,
+                        http2=self.http2,
+                        limits=self.limits
+                    )
+        return self._sync_transport
+
+    @property
+    def async_transport(self) -> httpx.AsyncBaseTransport:
+        """Get the running event loop's async pool, creating it on first use."""
+        if self._async_transport is not None:
+            return self._async_transport
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._async_pools.get(loop)
+            if transport is None:
+                transport = self._async_pools[loop] = httpx.AsyncHTTPTransport(
+                    verify=self.verify_ssl,
+                    http2=self.http2,
+                    limits=self.limits
+                )
+        return transport
+
+    async def _loop_transport(self) -> httpx.AsyncBaseTransport:
+        """Get the running loop's async pool, arranging for it to close with the loop."""
+        transport = self.async_transport
+        if transport is self._async_transport:
+            return transport
+        loop = asyncio.get_running_loop()
+        closer = None
+        with self._lock:
+            if loop not in self._loop_closers:
+                closer = self._loop_closers[loop] = self._close_with_loop()
+        if closer is not None:
+            await closer.asend(None)
+        return transport
+
+    async def _close_with_loop(self) -> AsyncGenerator[None, None]:
+        """
+        Close the loop's pool once the loop shuts down.
+
+        The generator stays suspended at its yield until loop.shutdown_asyncgens()
+        resumes it. A loop closed without that step stays referenced here (its
+        pool is still closed by close() / aclose()).
+        """
+        try:
+            yield
+        finally:
+            loop = asyncio.get_running_loop()
+            with self._lock:
+                transport = self._async_pools.pop(loop, None)
+                # The generator's finalizer references the loop
+                self._loop_closers.pop(loop, None)
+            if transport is not None:
+                await transport.aclose()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request over the shared sync connection pool."""
+        if self.coalescer is not None:
+            return wrap_response(
+                self.coalescer.handle(request, self.sync_transport.handle_request), self.codec
+            )
+        return wrap_response(self.sync_transport.handle_request(request), self.codec)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request over the shared async connection pool."""
+        if self.coalescer is not None:
+            transport = await self._loop_transport()
+            response = await self.coalescer.ahandle(request, transport.handle_async_request)
+            return wrap_response(response, self.codec)
+        transport = await self._loop_transport()
+        return wrap_response(await transport.handle_async_request(request), self.codec)
+
+    def close(self) -> None:
+        """No-op: individual clients must not close the shared pool."""
+
+    async def aclose(self) -> None:
+        """No-op: individual clients must not close the shared pool."""
+
+    def close_pool(self) -> None:
+        """Close the sync and all async connection pools (called by the owning factory)."""
+        with self._lock:
+            transport, self._sync_transport = self._sync_transport, None
+        if transport is not None:
+            transport.close()
+        for loop, pool in self._take_async_pools():
+            self._close_on_loop(loop, pool)
+
+    async def aclose_pool(self) -> None:
+        """Close the sync and all async connection pools (called by the owning factory)."""
+        running = asyncio.get_running_loop()
+        for loop, pool in self._take_async_pools():
+            if loop is running:
+                await pool.aclose()
+            else:
+                self._close_on_loop(loop, pool)
+        self.close_pool()
+
+    def _take_async_pools(self) -> List[Tuple[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]]:
+        """Remove and return all per-loop async pools."""
+        with self._lock:
+            pools = list(self._async_pools.items())
+            self._async_pools.clear()
+        return pools
+
+    @staticmethod
+    def _close_on_loop(loop: asyncio.AbstractEventLoop, pool: httpx.AsyncHTTPTransport) -> None:
+        """Close an async pool on the loop its connections belong to."""
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(pool.aclose(), loop)
+        elif not loop.is_closed():
+            loop.run_until_complete(pool.aclose())
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"SharedTransport(http2={self.http2}, codec={self.codec.name}, "
+            f"coalesce={self.coalescer is not None}, "
+            f"max_connections={self.limits.max_connections}, "
+            f"max_keepalive_connections={self.limits.max_keepalive_connections})"
+        )
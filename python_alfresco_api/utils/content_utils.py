@@ -6,6 +6,7 @@ that MCP servers and other applications need, using authenticated HTTP client
 patterns that won't be overwritten by codegen.
 """
 
+import io
 import os
 import tempfile
 import mimetypes
@@ -14,6 +15,13 @@ from pathlib import Path
 import base64
 
 from python_alfresco_api.clients.core import AlfrescoCoreClient
+from python_alfresco_api.clients.core.content.cache import client_content_cache
+from python_alfresco_api.clients.core.content.download_content import (
+    DEFAULT_CHUNK_SIZE, ProgressCallback, download_content
+)
+from python_alfresco_api.clients.core.content.upload_content import (
+    upload_content_detailed, replace_content_detailed
+)
 
 
 def upload_file(
@@ -23,11 +31,16 @@ def upload_file(
     filename: Optional[str] = None,
     description: Optional[str] = None,
     properties: Optional[Dict[str, Any]] = None,
-    auto_rename: bool = True
+    auto_rename: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress_callback: Optional[ProgressCallback] = None
 ) -> Any:
     """
     Upload a file to Alfresco repository using authenticated HTTP client.
     
+    The file is streamed in chunks, so memory use does not depend on the
+    file size.
+    
     Args:
         core_client: The v1.1 hierarchical core client
         file_path: Path to the file to upload
@@ -36,6 +49,8 @@ def upload_file(
         description: Optional file description
         properties: Optional additional properties
         auto_rename: Whether to auto-rename if name conflicts exist
+        chunk_size: Bytes per streamed chunk (default: 1 MiB)
+        progress_callback: Called as progress_callback(bytes_uploaded, total_bytes)
         
     Returns:
         Upload response from Alfresco API
@@ -62,42 +77,18 @@ def upload_file(
     if not file_path_obj.is_file():
         raise ValueError(f"Path is not a file: {file_path}")
     
-    # Use filename or derive from path
-    upload_filename = filename or file_path_obj.name
-    
-    # Read file content
-    with open(file_path_obj, 'rb') as f:
-        content = f.read()
-    
-    # Get authenticated HTTP client
-    http_client = core_client._get_raw_client().get_httpx_client()
-    
-    # Prepare multipart data (proven working approach from mcp-tools)
-    files = {
-        'filedata': (upload_filename, content, _guess_mime_type(upload_filename)),
-        'name': (None, upload_filename),
-        'nodeType': (None, 'cm:content'),
-        'relativePath': (None, '')
-    }
-    
-    # Add optional fields
-    if description:
-        files['description'] = (None, description)
-    
-    if auto_rename:
-        files['autoRename'] = (None, 'true')
-    
-    # Add properties
-    if properties:
-        for key, value in properties.items():
-            files[key] = (None, str(value))
-    
-    # Build URL for upload
-    base_url = core_client._client_factory.base_url
-    url = f"{base_url}/alfresco/api/-default-/public/alfresco/versions/1/nodes/{parent_id}/children"
-    
-    # Upload file
-    response = http_client.post(url, files=files)
+    # Stream multipart upload
+    response = upload_content_detailed(
+        core_client,
+        file_path_obj,
+        parent_id=parent_id,
+        filename=filename or file_path_obj.name,
+        description=description,
+        properties=properties,
+        auto_rename=auto_rename,
+        chunk_size=chunk_size,
+        progress_callback=progress_callback
+    )
     response.raise_for_status()
     
     return response.json()
@@ -107,16 +98,27 @@ def download_file(
     core_client: AlfrescoCoreClient,
     node_id: str,
     output_path: Optional[Union[str, Path]] = None,
-    as_attachment: bool = False
+    as_attachment: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress_callback: Optional[ProgressCallback] = None,
+    resume: bool = False
 ) -> Union[bytes, str]:
     """
     Download a file from Alfresco repository.
     
+    When output_path is given the content is streamed to disk in chunks, so
+    memory use does not depend on the file size. With the factory's content
+    cache enabled (ClientFactory(content_cache=True)) unchanged content is
+    revalidated with a conditional GET and served from disk.
+    
     Args:
         core_client: The v1.1 hierarchical core client
         node_id: ID of the file node to download
         output_path: Optional path to save file (if None, return content)
         as_attachment: Whether to download as attachment
+        chunk_size: Bytes per streamed chunk (default: 1 MiB)
+        progress_callback: Called as progress_callback(bytes_downloaded, total_bytes)
+        resume: Continue a partial download already at output_path (HTTP Range)
         
     Returns:
         File content as bytes if output_path is None, otherwise path where saved
@@ -128,36 +130,32 @@ def download_file(
         >>> # Download to file
         >>> path = download_file(core_client, "file-123", "local_file.pdf")
     """
-    # Get authenticated HTTP client
-    http_client = core_client._get_raw_client().get_httpx_client()
-    
-    # Build URL for download
-    base_url = core_client._client_factory.base_url
-    url = f"{base_url}/alfresco/api/-default-/public/alfresco/versions/1/nodes/{node_id}/content"
-    
-    # Add attachment parameter if needed
-    params = {}
-    if as_attachment:
-        params['attachment'] = 'true'
-    
-    # Download file
-    response = http_client.get(url, params=params)
-    response.raise_for_status()
-    
-    content = response.content
-    
     if output_path:
-        # Save to file
-        output_path_obj = Path(output_path)
-        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path_obj, 'wb') as f:
-            f.write(content)
-        
-        return str(output_path_obj)
+        # Stream to file
+        result = download_content(
+            core_client,
+            node_id,
+            output_path,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            attachment=as_attachment,
+            resume=resume,
+            cache=client_content_cache(core_client)
+        )
+        return result.file_path
     else:
         # Return content
-        return content
+        buffer = io.BytesIO()
+        download_content(
+            core_client,
+            node_id,
+            buffer,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            attachment=as_attachment,
+            cache=client_content_cache(core_client)
+        )
+        return buffer.getvalue()
 
 
 def update_content(
@@ -166,7 +164,9 @@ def update_content(
     file_path: Union[str, Path, bytes],
     major_version: bool = False,
     comment: Optional[str] = None,
-    filename: Optional[str] = None
+    filename: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress_callback: Optional[ProgressCallback] = None
 ) -> Any:
     """
     Update content of an existing file.
@@ -178,6 +178,8 @@ def update_content(
         major_version: Whether to create major version
         comment: Optional version comment
         filename: Optional filename (for bytes content)
+        chunk_size: Bytes per streamed chunk (default: 1 MiB)
+        progress_callback: Called as progress_callback(bytes_uploaded, total_bytes)
         
     Returns:
         Update response from Alfresco API
@@ -198,43 +200,27 @@ def update_content(
     # Handle different content types
     if isinstance(file_path, bytes):
         # Direct bytes content
-        content = file_path
+        source = io.BytesIO(file_path)
         if not filename:
             filename = f"updated_content_{node_id}"
     else:
-        # File path (str or Path)
-        file_path_obj = Path(str(file_path))
-        if not file_path_obj.exists():
+        # File path (str or Path), streamed from disk
+        source = Path(str(file_path))
+        if not source.exists():
             raise FileNotFoundError(f"File does not exist: {file_path}")
         
-        with open(file_path_obj, 'rb') as f:
-            content = f.read()
-        
-        filename = filename or file_path_obj.name
-    
-    # Get authenticated HTTP client
-    http_client = core_client._get_raw_client().get_httpx_client()
-    
-    # Build URL for content update
-    base_url = core_client._client_factory.base_url
-    url = f"{base_url}/alfresco/api/-default-/public/alfresco/versions/1/nodes/{node_id}/content"
-    
-    # Prepare parameters
-    params = {}
-    if major_version:
-        params['majorVersion'] = 'true'
-    if comment:
-        params['comment'] = comment
-    
-    # Prepare content with proper MIME type
-    mime_type = _guess_mime_type(filename)
+        filename = filename or source.name
     
-    # Update content using PUT
-    response = http_client.put(
-        url, 
-        content=content,
-        params=params,
-        headers={'Content-Type': mime_type}
+    # Update content using a streamed PUT
+    response = replace_content_detailed(
+        core_client,
+        node_id,
+        source,
+        major_version=major_version,
+        comment=comment,
+        content_type=_guess_mime_type(filename),
+        chunk_size=chunk_size,
+        progress_callback=progress_callback
     )
     response.raise_for_status()
     
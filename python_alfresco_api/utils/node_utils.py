@@ -20,7 +20,8 @@ def browse_repository(
     parent_id: str = "-my-",
     max_items: int = 100,
     skip_count: int = 0,
-    include_properties: bool = True
+    include_properties: bool = True,
+    projection: Optional[str] = None
 ) -> Any:
     """
     Browse repository contents (list folders/files).
@@ -30,7 +31,9 @@ def browse_repository(
         parent_id: Parent node ID (default: '-my-' for user's home)
         max_items: Maximum number of items to return
         skip_count: Number of items to skip for pagination
-        include_properties: Whether to include node properties
+        include_properties: Whether to include node properties, path and allowable operations
+        projection: Named fields/include profile ("ids", "listing", "full"), e.g.
+            "listing" to fetch only what a folder listing shows
         
     Returns:
         List of child nodes from the Alfresco API
@@ -44,7 +47,9 @@ def browse_repository(
     return core_client.nodes.list_children(
         node_id=parent_id,
         max_items=max_items,
-        skip_count=skip_count
+        skip_count=skip_count,
+        include=include_list or None,
+        projection=projection
     )
 
 
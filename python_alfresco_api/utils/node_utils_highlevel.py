@@ -223,15 +223,20 @@ def get_node_path_highlevel(
 def bulk_delete_nodes_highlevel(
     core_client: AlfrescoCoreClient,
     node_ids: List[str],
-    permanent: bool = False
+    permanent: bool = False,
+    concurrency: int = 16
 ) -> Dict[str, bool]:
     """
-    Delete multiple nodes using V1.1 hierarchical methods.
+    Delete multiple nodes concurrently using V1.1 hierarchical methods.
+    
+    Runs on client.nodes.bulk: requests share pooled connections, at most
+    `concurrency` are in flight, and transient failures are retried.
     
     Args:
         core_client: The V1.1 hierarchical core client
         node_ids: List of node IDs to delete
         permanent: Whether to permanently delete
+        concurrency: Maximum number of deletes in flight
         
     Returns:
         Dictionary mapping node_id to success status
@@ -244,19 +249,13 @@ def bulk_delete_nodes_highlevel(
         ... )
         >>> print(results)  # {"doc-123": True, "doc-456": True, "folder-789": False}
     """
-    results = {}
+    report = core_client.nodes.bulk.delete(node_ids, permanent=permanent, concurrency=concurrency)
     
-    for node_id in node_ids:
-        try:
-            delete_node_highlevel(
-                core_client=core_client,
-                node_id=node_id,
-                permanent=permanent
-            )
-            results[node_id] = True
-        except Exception as e:
-            print(f"Failed to delete {node_id}: {e}")
-            results[node_id] = False
+    results = {}
+    for item in report.items:
+        if not item.success:
+            print(f"Failed to delete {item.node_id}: {item.error}")
+        results[item.node_id] = item.success
     
     return results
 
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Timestamp parsing benchmark: dateutil isoparse() vs types.parse_datetime().
+
+Measures on Alfresco timestamps (`2024-03-01T10:30:00.123+0000`):
+- per value: dateutil's isoparse(), the raw clients' parse_datetime()
+  (datetime.fromisoformat()), and Pydantic's datetime validation (the
+  high-level models parse timestamps in pydantic-core)
+- AuditEntryPaging.from_dict() on one audit log page, with each parser
+- the Pydantic AuditEntryPaging model on the same page
+
+Usage:
+    python scripts/benchmarks/bench_datetime.py [--entries 10000] [--repeat 5]
+"""
+import argparse
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import payloads
+from dateutil.parser import isoparse
+from pydantic import TypeAdapter
+
+from python_alfresco_api.models.alfresco_core_models import (
+    AuditEntryPaging as PydanticAuditEntryPaging,
+)
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.models import (
+    AuditEntryPaging,
+    audit_entry,
+)
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.types import parse_datetime
+
+
+def best_of(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    entries = [payloads.audit_entry(i) for i in range(args.entries)]
+    values = [entry["createdAt"] for entry in entries]
+    page = payloads.paging(entries)
+    adapter = TypeAdapter(datetime)
+
+    print(f"{args.entries} audit entries, best of {args.repeat}")
+    print("per timestamp (us):")
+    for name, parse in (
+        ("isoparse", isoparse),
+        ("parse_datetime", parse_datetime),
+        ("pydantic", adapter.validate_python),
+    ):
+        elapsed = best_of(lambda: [parse(value) for value in values], args.repeat)
+        print(f"  {name:<20} {elapsed / args.entries * 1e6:>8.2f}")
+
+    print("AuditEntryPaging page (ms):")
+    for name, parse in (("isoparse", isoparse), ("parse_datetime", parse_datetime)):
+        audit_entry.parse_datetime = parse
+        elapsed = best_of(lambda: AuditEntryPaging.from_dict(page), args.repeat)
+        print(f"  {'raw ' + name:<20} {elapsed * 1000:>8.2f}")
+    audit_entry.parse_datetime = parse_datetime
+    elapsed = best_of(lambda: PydanticAuditEntryPaging.model_validate(page), args.repeat)
+    print(f"  {'pydantic':<20} {elapsed * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
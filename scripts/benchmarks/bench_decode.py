@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Decode benchmark: attrs round trip vs single-pass model_validate_json.
+
+Measures the per-entry cost of turning a 1000-entry node children page
+(and single node responses) into the high-level Pydantic models:
+- attrs path: json.loads -> attrs from_dict (isoparse) -> to_dict -> model_validate
+- single pass: model_validate_json(response.content)
+- lazy views: json.loads -> ListView, reading only id and name
+
+Usage:
+    python scripts/benchmarks/bench_decode.py [--entries 1000] [--repeat 5]
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import payloads
+
+from python_alfresco_api.clients.core.nodes.models import Node, NodeListResponse, NodeResponse
+from python_alfresco_api.clients.views import ListView, view_class
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.models import (
+    NodeChildAssociationPaging,
+    NodeEntry,
+)
+
+def best_of(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page = payloads.page_bytes(payloads.node, args.entries)
+    nodes = [payloads.entry_bytes(payloads.node, i) for i in range(args.entries)]
+
+    cases = {
+        "children page, attrs round trip": lambda: NodeListResponse.model_validate(
+            NodeChildAssociationPaging.from_dict(json.loads(page)).to_dict()
+        ),
+        "children page, model_validate_json": lambda: NodeListResponse.model_validate_json(page),
+        "children page, Node per entry": lambda: [
+            Node.model_validate(item["entry"])
+            for item in NodeListResponse.model_validate_json(page).list["entries"]
+        ],
+        "children page, lazy views (id, name)": lambda: [
+            (node.id, node.name) for node in ListView(json.loads(page), view_class(Node)).entries
+        ],
+        "node responses, attrs round trip": lambda: [
+            NodeResponse.model_validate(NodeEntry.from_dict(json.loads(body)).to_dict())
+            for body in nodes
+        ],
+        "node responses, model_validate_json": lambda: [
+            NodeResponse.model_validate_json(body) for body in nodes
+        ],
+    }
+
+    print(f"{args.entries} entries, best of {args.repeat}")
+    print(f"{'case':<40} {'total ms':>10} {'us/entry':>10}")
+    results = {}
+    for name, func in cases.items():
+        elapsed = best_of(func, args.repeat)
+        results[name] = elapsed
+        print(f"{name:<40} {elapsed * 1000:>10.2f} {elapsed / args.entries * 1e6:>10.2f}")
+
+    for kind in ("children page", "node responses"):
+        speedup = results[f"{kind}, attrs round trip"] / results[f"{kind}, model_validate_json"]
+        print(f"{kind}: {speedup:.1f}x faster single pass")
+
+
+if __name__ == "__main__":
+    main()
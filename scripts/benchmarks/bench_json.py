@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+JSON codec benchmark: stdlib json vs orjson vs msgspec on search pages.
+
+Measures, per available codec (json_codec.py):
+- loads: parsing a ResultSetPaging body (search hits plus facet context)
+- raw parse: loads + the generated attrs ResultSetPaging.from_dict(), i.e.
+  what every raw search operation does with `response.json()`
+- dumps: encoding a SearchRequest body (`body.to_dict()`)
+
+Usage:
+    python scripts/benchmarks/bench_json.py [--entries 1000] [--facets 20] [--repeat 7]
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import payloads
+
+from python_alfresco_api.json_codec import CODECS, get_json_codec
+from python_alfresco_api.raw_clients.alfresco_search_client.search_client.models import (
+    ResultSetPaging,
+    SearchRequest,
+)
+
+def search_page(entries: int, facets: int) -> bytes:
+    page = payloads.paging([payloads.search_hit(i) for i in range(entries)], total=entries * 10)
+    page["list"]["context"] = {
+        "consistency": {"lastTxId": 123456},
+        "facetsFields": [
+            {
+                "label": f"cm:facet{f}",
+                "buckets": [
+                    {
+                        "label": f"value-{f}-{b}",
+                        "filterQuery": f"cm:facet{f}:\"value-{b}\"",
+                        "count": 100 - b,
+                    }
+                    for b in range(10)
+                ],
+            }
+            for f in range(facets)
+        ],
+    }
+    return json.dumps(page).encode()
+
+
+def search_body() -> dict:
+    body = SearchRequest.from_dict({
+        "query": {"query": "TYPE:'cm:content' AND cm:name:report*", "language": "afts"},
+        "paging": {"maxItems": 100, "skipCount": 0},
+        "include": ["properties", "aspectNames", "path"],
+        "fields": list(payloads.node(0)),
+        "sort": [{"type": "FIELD", "field": "cm:modified", "ascending": False}],
+        "facetFields": {"facets": [{"field": f"cm:facet{f}", "mincount": 1} for f in range(20)]},
+    })
+    return body.to_dict()
+
+
+def best_of(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--facets", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    page = search_page(args.entries, args.facets)
+    body = search_body()
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    print(
+        f"search page: {args.entries} hits, {args.facets} facets, "
+        f"{len(page) / 1024:.0f} KiB; best of {args.repeat}"
+    )
+    print(f"{'codec':<10} {'loads ms':>10} {'raw parse ms':>14} {'dumps us':>10}")
+    results = {}
+    for codec in codecs:
+        loads = best_of(lambda: codec.loads(page), args.repeat)
+        parse = best_of(lambda: ResultSetPaging.from_dict(codec.loads(page)), args.repeat)
+        dumps = best_of(lambda: [codec.dumps(body) for _ in range(100)], args.repeat) / 100
+        results[codec.name] = loads
+        print(f"{codec.name:<10} {loads * 1000:>10.2f} {parse * 1000:>14.2f} {dumps * 1e6:>10.1f}")
+
+    for name, elapsed in results.items():
+        if name != "json":
+            print(f"{name}: loads {results['json'] / elapsed:.2f}x json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Raw attrs model benchmark: from_dict() cost and memory per Node.
+
+Measures the generated core models (raw_clients/.../models) on synthetic
+node entries (scripts/code-gen/optimize_raw_models.py rewrites them):
+- NodePaging.from_dict() on one page of --entries nodes
+- Node.from_dict() per entry
+- retained memory per Node (tracemalloc), nested UserInfo / ContentInfo included
+
+Usage:
+    python scripts/benchmarks/bench_raw_models.py [--entries 10000] [--repeat 5] [--json]
+"""
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import payloads
+
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.models.node import Node
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.models.node_paging import (
+    NodePaging,
+)
+
+def best_of(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def bytes_per_node(entries) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [Node.from_dict(entry) for entry in entries]
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # The list itself is not part of the per-node cost
+    return (retained - sys.getsizeof(nodes)) / len(nodes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    entries = [payloads.node(i) for i in range(args.entries)]
+    page = payloads.paging(entries)
+
+    results = {
+        "NodePaging.from_dict ms": best_of(lambda: NodePaging.from_dict(page), args.repeat) * 1000,
+        "Node.from_dict us": best_of(
+            lambda: [Node.from_dict(entry) for entry in entries], args.repeat
+        )
+        / args.entries
+        * 1e6,
+        "bytes per Node": bytes_per_node(entries),
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{args.entries} nodes, best of {args.repeat}")
+    for name, value in results.items():
+        print(f"{name:<26} {value:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
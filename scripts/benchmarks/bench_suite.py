@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite with stored baselines.
+
+Replaces scripts/testing/test_performance.py, which timed a warm, in-process
+factory creation. Every measurement here runs without an Alfresco server:
+
+- import: fresh-interpreter import time per subpackage (median of --repeat runs)
+- first-call: fresh interpreter, import + factory + create_*_client() + first
+  request per client family (httpx.MockTransport), plus a warm second call
+- decode: entries/second per response type for the attrs path
+  (json.loads + from_dict) and the Pydantic path (model_validate_json)
+- memory: bytes retained per 1k decoded entries (tracemalloc) for raw JSON,
+  attrs, Pydantic and lazy views
+
+Results are compared against scripts/benchmarks/baselines.json; a metric
+worse than the baseline by more than --threshold is reported as a regression
+(exit status 1 with --check). Baselines are machine-specific: re-save them
+on the machine that runs the comparison (e.g. the release host).
+
+Usage:
+    python scripts/benchmarks/bench_suite.py                   # run + compare
+    python scripts/benchmarks/bench_suite.py --save            # store new baselines
+    python scripts/benchmarks/bench_suite.py --only import,decode --check
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCH_DIR.parents[1]
+BASELINES = BENCH_DIR / "baselines.json"
+
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+import payloads
+
+GROUPS = ("import", "first-call", "decode", "memory")
+ENTRIES = 1000
+
+IMPORT_TARGETS = (
+    "python_alfresco_api",
+    "python_alfresco_api.client_factory",
+    "python_alfresco_api.models",
+    "python_alfresco_api.models.alfresco_core_models",
+    "python_alfresco_api.clients.auth",
+    "python_alfresco_api.clients.core",
+    "python_alfresco_api.clients.discovery",
+    "python_alfresco_api.clients.search",
+    "python_alfresco_api.clients.workflow",
+    "python_alfresco_api.clients.model",
+    "python_alfresco_api.clients.search_sql",
+    "python_alfresco_api.raw_clients.alfresco_core_client.core_client.models",
+    "python_alfresco_api.raw_clients.alfresco_core_client.core_client.api.nodes.get_node",
+)
+
+# family -> (raw operation module, first call). Calls go through the created
+# client's raw_client, so every family is timed the same way
+RAW = "python_alfresco_api.raw_clients.alfresco_{family}_client.{family}_client"
+FIRST_CALLS = {
+    "auth": (
+        "api.authentication.validate_ticket",
+        "operation.sync_detailed(client=client.raw_client)",
+    ),
+    "core": ("api.nodes.get_node", "operation.sync_detailed('-root-', client=client.raw_client)"),
+    "discovery": (
+        "api.discovery.get_repository_information",
+        "operation.sync_detailed(client=client.raw_client)",
+    ),
+    "search": (
+        "api.search.search",
+        "operation.sync_detailed(client=client.raw_client, "
+        "body=models.SearchRequest(query=models.RequestQuery(query='benchmark')))",
+    ),
+    "workflow": (
+        "api.process_definitions.get_process_definition",
+        "operation.sync_detailed('benchmark', client=client.raw_client)",
+    ),
+    "model": ("api.aspects.list_aspects", "operation.sync_detailed(client=client.raw_client)"),
+    "search_sql": (
+        "api.sql.search",
+        "operation.sync_detailed(client=client.raw_client, "
+        "body=models.SQLSearchRequest(stmt='select * from alfresco'))",
+    ),
+}
+
+FIRST_CALL_SCRIPT = '''
+import time
+start = time.perf_counter()
+import httpx
+from python_alfresco_api import ClientFactory
+imported = time.perf_counter()
+
+def handler(request):
+    return httpx.Response(404, json={{"error": {{
+        "errorKey": "benchmark", "statusCode": 404, "briefSummary": "benchmark",
+        "stackTrace": "", "descriptionURL": "",
+    }}}})
+
+factory = ClientFactory(
+    base_url="http://localhost:8080", username="admin", password="admin", load_env=False
+)
+factory.transport.use_transport(httpx.MockTransport(handler))
+client = factory.create_{family}_client()
+created = time.perf_counter()
+import importlib
+operation = importlib.import_module("{raw}.{operation}")
+models = importlib.import_module("{raw}.models")
+{call}
+first = time.perf_counter()
+{call}
+second = time.perf_counter()
+print(imported - start, created - imported, first - created, second - first)
+'''
+
+
+class Metric:
+    """One measured value and which direction is better."""
+
+    __slots__ = ("name", "value", "unit", "better")
+
+    def __init__(self, name: str, value: float, unit: str, better: str = "lower"):
+        self.name = name
+        self.value = value
+        self.unit = unit
+        self.better = better
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"value": round(self.value, 3), "unit": self.unit, "better": self.better}
+
+
+def _python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=PROJECT_ROOT, check=True
+    )
+    return result.stdout
+
+
+# ---------------------------------------------------------------- groups
+
+
+def bench_imports(repeat: int) -> List[Metric]:
+    metrics = []
+    for target in IMPORT_TARGETS:
+        code = (
+            f"import time; t = time.perf_counter(); import {target}; print(time.perf_counter() - t)"
+        )
+        samples = [float(_python(code)) for _ in range(repeat)]
+        metrics.append(Metric(f"import.{target}", statistics.median(samples) * 1000, "ms"))
+    return metrics
+
+
+def bench_first_calls(repeat: int) -> List[Metric]:
+    metrics = []
+    for family, (operation, call) in FIRST_CALLS.items():
+        code = FIRST_CALL_SCRIPT.format(
+            family=family, raw=RAW.format(family=family), operation=operation, call=call
+        )
+        samples = [[float(value) for value in _python(code).split()] for _ in range(repeat)]
+        imported, created, first, second = (
+            statistics.median(column) * 1000 for column in zip(*samples)
+        )
+        metrics += [
+            Metric(f"first-call.{family}.create_client", created, "ms"),
+            Metric(f"first-call.{family}.first_call", first, "ms"),
+            Metric(f"first-call.{family}.warm_call", second, "ms"),
+        ]
+    return metrics
+
+
+def _decoders() -> List[Tuple[str, bytes, int, Callable[[bytes], Any], Callable[[bytes], Any]]]:
+    """(response type, body, entries, attrs decoder or None, pydantic decoder)."""
+    from python_alfresco_api.clients.core.nodes.models import NodeListResponse, NodeResponse
+    from python_alfresco_api.models import alfresco_core_models as core_models
+    from python_alfresco_api.models import alfresco_search_models as search_models
+    from python_alfresco_api.raw_clients.alfresco_core_client.core_client import models as raw_core
+    from python_alfresco_api.raw_clients.alfresco_search_client.search_client import (
+        models as raw_search,
+    )
+
+    def attrs(model):
+        return lambda body: model.from_dict(json.loads(body))
+
+    return [
+        (
+            "NodeEntry",
+            payloads.entry_bytes(payloads.node),
+            1,
+            attrs(raw_core.NodeEntry),
+            NodeResponse.model_validate_json,
+        ),
+        (
+            "NodeChildAssociationPaging",
+            payloads.page_bytes(payloads.node, ENTRIES),
+            ENTRIES,
+            attrs(raw_core.NodeChildAssociationPaging),
+            NodeListResponse.model_validate_json,
+        ),
+        # The raw client has no SitePaging model (list_sites does not parse its body)
+        (
+            "SitePaging",
+            payloads.page_bytes(payloads.site, ENTRIES),
+            ENTRIES,
+            None,
+            core_models.SitePaging.model_validate_json,
+        ),
+        (
+            "PersonPaging",
+            payloads.page_bytes(payloads.person, ENTRIES),
+            ENTRIES,
+            attrs(raw_core.PersonPaging),
+            core_models.PersonPaging.model_validate_json,
+        ),
+        (
+            "ResultSetPaging",
+            payloads.page_bytes(payloads.search_hit, ENTRIES),
+            ENTRIES,
+            attrs(raw_search.ResultSetPaging),
+            search_models.ResultSetPaging.model_validate_json,
+        ),
+    ]
+
+
+def bench_decode(repeat: int) -> List[Metric]:
+    metrics = []
+    for name, body, entries, attrs_decode, pydantic_decode in _decoders():
+        number = max(1, 10000 // entries)
+        for path, decode in (("attrs", attrs_decode), ("pydantic", pydantic_decode)):
+            if decode is None:
+                continue
+            best = min(timeit.repeat(lambda: decode(body), number=number, repeat=repeat)) / number
+            metrics.append(
+                Metric(f"decode.{name}.{path}", entries / best, "entries/s", better="higher")
+            )
+    return metrics
+
+
+def _retained(build: Callable[[], Any]) -> int:
+    """Bytes still allocated while the built object is alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        after = tracemalloc.get_traced_memory()[0]
+        del kept
+    finally:
+        tracemalloc.stop()
+    return after - before
+
+
+def bench_memory(repeat: int) -> List[Metric]:
+    from python_alfresco_api.clients.core.nodes.models import Node
+    from python_alfresco_api.clients.views import ListView, view_class
+    from python_alfresco_api.raw_clients.alfresco_core_client.core_client.models import (
+        NodeChildAssociationPaging,
+    )
+
+    body = payloads.page_bytes(payloads.node, ENTRIES)
+    builds = {
+        "json": lambda: json.loads(body),
+        "attrs": lambda: NodeChildAssociationPaging.from_dict(json.loads(body)),
+        "pydantic": lambda: [
+            Node.model_validate(item["entry"]) for item in json.loads(body)["list"]["entries"]
+        ],
+        "views": lambda: ListView(json.loads(body), view_class(Node)).entries,
+    }
+    # Warm up class/schema caches so they are not charged to the first build
+    for build in builds.values():
+        build()
+    scale = 1000 / ENTRIES
+    return [
+        Metric(
+            f"memory.node_page.{name}",
+            min(_retained(build) for _ in range(repeat)) * scale / 1024,
+            "KiB/1k",
+        )
+        for name, build in builds.items()
+    ]
+
+
+BENCHMARKS = {
+    "import": bench_imports,
+    "first-call": bench_first_calls,
+    "decode": bench_decode,
+    "memory": bench_memory,
+}
+
+
+# ---------------------------------------------------------------- report
+
+
+def compare(metrics: List[Metric], baselines: Dict[str, Any], threshold: float) -> List[str]:
+    """Print the comparison table; returns the names of regressed metrics."""
+    regressions = []
+    width = max([len(metric.name) for metric in metrics] + [6])
+    print(f"{'metric':<{width}} {'unit':>10} {'baseline':>12} {'current':>12} {'change':>8}")
+    for metric in metrics:
+        base = baselines.get(metric.name)
+        if base is None:
+            print(
+                f"{metric.name:<{width}} {metric.unit:>10} {'-':>12} "
+                f"{metric.value:>12.2f} {'new':>8}"
+            )
+            continue
+        change = (metric.value - base["value"]) / base["value"] if base["value"] else 0.0
+        worse = change > threshold if metric.better == "lower" else change < -threshold
+        flag = "  REGRESSION" if worse else ""
+        print(
+            f"{metric.name:<{width}} {metric.unit:>10} {base['value']:>12.2f} "
+            f"{metric.value:>12.2f} {change:>+8.1%}{flag}"
+        )
+        if worse:
+            regressions.append(metric.name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--only", default=",".join(GROUPS), help=f"Comma-separated groups ({', '.join(GROUPS)})"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per measurement (median / best of)"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Relative change reported as a regression"
+    )
+    parser.add_argument("--baselines", type=Path, default=BASELINES, help="Baseline JSON file")
+    parser.add_argument(
+        "--save", action="store_true", help="Store the results as the new baselines"
+    )
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 on regressions")
+    args = parser.parse_args()
+
+    groups = [group.strip() for group in args.only.split(",") if group.strip()]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown groups: {', '.join(sorted(unknown))}")
+
+    metrics: List[Metric] = []
+    for group in groups:
+        print(f"running {group} benchmarks...", file=sys.stderr)
+        metrics += BENCHMARKS[group](args.repeat)
+
+    stored = json.loads(args.baselines.read_text()) if args.baselines.exists() else {"metrics": {}}
+    regressions = compare(metrics, stored["metrics"], args.threshold)
+
+    if args.save:
+        stored["metrics"].update({metric.name: metric.to_dict() for metric in metrics})
+        stored["environment"] = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        }
+        args.baselines.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        print(f"\nSaved {len(metrics)} baselines to {args.baselines}")
+    elif regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+
+    return 1 if args.check and regressions and not args.save else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
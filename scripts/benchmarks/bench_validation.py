@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Validation profile benchmark: strict vs trusted decoding throughput.
+
+Measures entries/second for the hot response models under both validation
+profiles (clients/validation.py):
+- strict: the declared models (validate_assignment, str_strip_whitespace,
+  field constraints), via the cached TypeAdapter
+- trusted: the cached trusted subclasses (no assignment validation, no
+  whitespace stripping, no constraints)
+- Model.model_validate_json, to show the cached adapter adds no overhead
+
+Also reports the one-off cost of building a trusted model on first use.
+
+Usage:
+    python scripts/benchmarks/bench_validation.py [--entries 1000] [--repeat 7]
+"""
+import argparse
+import json
+import sys
+import time
+import timeit
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import payloads
+
+from python_alfresco_api.clients.core.nodes.models import Node, NodeResponse
+from python_alfresco_api.clients.validation import trusted_model, type_adapter
+from python_alfresco_api.models.alfresco_search_models import ResultSetPaging
+
+
+def best_of(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    type_adapter(NodeResponse, "trusted").validate_json(payloads.entry_bytes(payloads.node))
+    print(
+        "trusted NodeResponse first use (build + validate): "
+        f"{(time.perf_counter() - started) * 1000:.1f} ms"
+    )
+
+    nodes = [payloads.entry_bytes(payloads.node, i) for i in range(args.entries)]
+    node_list = json.dumps([payloads.node(i) for i in range(args.entries)]).encode()
+    search_page = payloads.page_bytes(payloads.search_hit, args.entries)
+
+    cases = {}
+    for profile in ("strict", "trusted"):
+        response_adapter = type_adapter(NodeResponse, profile)
+        list_adapter = type_adapter(List[Node], profile)
+        search_adapter = type_adapter(ResultSetPaging, profile)
+        cases[f"node responses, {profile}"] = lambda adapter=response_adapter: [
+            adapter.validate_json(body) for body in nodes
+        ]
+        cases[f"List[Node] json, {profile}"] = lambda adapter=list_adapter: adapter.validate_json(
+            node_list
+        )
+        cases[f"search page, {profile}"] = lambda adapter=search_adapter: adapter.validate_json(
+            search_page
+        )
+    cases["node responses, model_validate_json"] = lambda: [
+        NodeResponse.model_validate_json(body) for body in nodes
+    ]
+    cases["node responses, trusted model_validate_json"] = lambda model=trusted_model(
+        NodeResponse
+    ): [model.model_validate_json(body) for body in nodes]
+
+    print(f"{args.entries} entries, best of {args.repeat}")
+    print(f"{'case':<45} {'total ms':>10} {'entries/s':>12}")
+    results = {}
+    for name, func in cases.items():
+        elapsed = best_of(func, args.repeat)
+        results[name] = elapsed
+        print(f"{name:<45} {elapsed * 1000:>10.2f} {args.entries / elapsed:>12.0f}")
+
+    for kind in ("node responses", "List[Node] json", "search page"):
+        speedup = results[f"{kind}, strict"] / results[f"{kind}, trusted"]
+        print(f"{kind}: trusted {speedup:.2f}x strict")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Load driver for the client against the spec-driven mock server.
+
+Runs the same workload (get N nodes by id) through each execution path of
+the client and reports throughput and p50/p99 latency per path:
+
+- sync: one request at a time (nodes.get)
+- threads: nodes.get from a thread pool of --concurrency workers
+- async: nodes.get_async, --concurrency requests in flight
+- bulk: nodes.bulk.get with --concurrency (per-item latency includes retries)
+- paging: nodes.iter_children over --total-items children with
+  --concurrency pages in flight (one sample per page: the time between
+  pages reaching the caller)
+
+The mock server (mock_alfresco.py) adds --latency ms per request (with
+--jitter) and fails --error-rate of requests with 500/503, so retry paths
+and tail latency can be exercised without an Alfresco server.
+
+Usage:
+    python scripts/benchmarks/load_driver.py --requests 500 --latency 20 --concurrency 16
+    python scripts/benchmarks/load_driver.py --scenarios async,bulk --error-rate 0.02
+    python scripts/benchmarks/load_driver.py --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCH_DIR.parents[1]
+
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+from mock_alfresco import MockAlfresco
+from python_alfresco_api.client_factory import ClientFactory
+
+SCENARIOS = ("sync", "threads", "async", "bulk", "paging")
+
+
+class Result:
+    """Samples of one scenario run."""
+
+    __slots__ = ("scenario", "latencies", "errors", "elapsed")
+
+    def __init__(self, scenario: str):
+        self.scenario = scenario
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.elapsed = 0.0
+
+    def percentile(self, percent: int) -> Optional[float]:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else None
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[percent - 1]
+
+    def as_dict(self) -> Dict[str, float]:
+        count = len(self.latencies)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "seconds": round(self.elapsed, 4),
+            "throughput": round(count / self.elapsed, 1) if self.elapsed else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 2) if count else None,
+            "p99_ms": round(self.percentile(99) * 1000, 2) if count else None,
+        }
+
+
+def _timed_call(result: Result, call: Callable[[], object]) -> None:
+    started = time.perf_counter()
+    try:
+        call()
+    except Exception:
+        result.errors += 1
+    result.latencies.append(time.perf_counter() - started)
+
+
+def run_sync(core, node_ids: List[str], concurrency: int) -> Result:
+    result = Result("sync")
+    for node_id in node_ids:
+        _timed_call(result, lambda: core.nodes.get(node_id))
+    return result
+
+
+def run_threads(core, node_ids: List[str], concurrency: int) -> Result:
+    result = Result("threads")
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(
+            pool.map(lambda node_id: _timed_call(result, lambda: core.nodes.get(node_id)), node_ids)
+        )
+    return result
+
+
+def run_async(core, node_ids: List[str], concurrency: int) -> Result:
+    result = Result("async")
+
+    async def main() -> None:
+        slots = asyncio.Semaphore(concurrency)
+
+        async def one(node_id: str) -> None:
+            async with slots:
+                started = time.perf_counter()
+                try:
+                    await core.nodes.get_async(node_id)
+                except Exception:
+                    result.errors += 1
+                result.latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(one(node_id) for node_id in node_ids))
+
+    asyncio.run(main())
+    return result
+
+
+def run_bulk(core, node_ids: List[str], concurrency: int) -> Result:
+    result = Result("bulk")
+    report = core.nodes.bulk.get(node_ids, concurrency=concurrency)
+    for item in report.items:
+        result.latencies.append(item.elapsed)
+        result.errors += not item.success
+    return result
+
+
+def run_paging(core, node_ids: List[str], concurrency: int) -> Result:
+    result = Result("paging")
+    started = time.perf_counter()
+    try:
+        for index, _ in enumerate(
+            core.nodes.iter_children("-root-", page_size=100, parallel=concurrency)
+        ):
+            if index % 100 == 0:
+                now = time.perf_counter()
+                result.latencies.append(now - started)
+                started = now
+    except Exception:
+        result.errors += 1
+    return result
+
+
+RUNNERS = {
+    "sync": run_sync,
+    "threads": run_threads,
+    "async": run_async,
+    "bulk": run_bulk,
+    "paging": run_paging,
+}
+
+
+def drive(
+    server: MockAlfresco, scenarios: List[str], requests: int, concurrency: int
+) -> Dict[str, Dict[str, float]]:
+    """Run each scenario against server; returns {scenario: summary}."""
+    factory = ClientFactory(
+        base_url="http://localhost:8080", username="admin", password="admin", load_env=False
+    )
+    server.install(factory)
+    core = factory.create_core_client()
+    # Warm up the client and the server's payload cache outside the timings
+    core.nodes.get("warm-up")
+
+    node_ids = [f"5f4e3d2c-1b0a-4f9e-8d7c-{i:012d}" for i in range(requests)]
+    summaries = {}
+    for scenario in scenarios:
+        started = time.perf_counter()
+        result = RUNNERS[scenario](core, node_ids, concurrency)
+        result.elapsed = time.perf_counter() - started
+        summaries[scenario] = result.as_dict()
+    return summaries
+
+
+def report(summaries: Dict[str, Dict[str, float]]) -> None:
+    print(
+        f"{'scenario':<10} {'requests':>9} {'errors':>7} {'seconds':>9} {'req/s':>10} "
+        f"{'p50 ms':>9} {'p99 ms':>9}"
+    )
+    for scenario, summary in summaries.items():
+        print(
+            f"{scenario:<10} {summary['requests']:>9} {summary['errors']:>7} "
+            f"{summary['seconds']:>9.3f} {summary['throughput']:>10.1f} "
+            f"{summary['p50_ms'] or 0:>9.2f} {summary['p99_ms'] or 0:>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Drive sync/async/bulk client paths against the mock Alfresco server"
+    )
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated subset of {','.join(SCENARIOS)}",
+    )
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="Workers / requests in flight")
+    parser.add_argument(
+        "--latency", type=float, default=10.0, help="Server latency per request in ms"
+    )
+    parser.add_argument("--jitter", type=float, default=0.2, help="Uniform +/- latency fraction")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of requests failed with 500/503"
+    )
+    parser.add_argument(
+        "--total-items", type=int, default=1000, help="Children listed by the paging scenario"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default=None, help="Also write the summaries to this file")
+    args = parser.parse_args()
+
+    scenarios = [name for name in args.scenarios.split(",") if name]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    server = MockAlfresco(
+        latency=args.latency / 1000, jitter=args.jitter, error_rate=args.error_rate,
+        total_items=args.total_items, apis=("core",), seed=args.seed,
+    )
+    summaries = drive(server, scenarios, args.requests, args.concurrency)
+    report(summaries)
+    if args.json:
+        Path(args.json).write_text(json.dumps(summaries, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+"""
+Local mock Alfresco server generated from the OpenAPI specs.
+
+Every operation in openapi/openapi3/*.yaml is routed under its server base
+path (e.g. /alfresco/api/-default-/public/alfresco/versions/1). Responses
+are synthesized from the operation's success schema ($ref / allOf resolved),
+with realistic values for the common Alfresco fields: uuid ids, Alfresco
+timestamps, users, content info. List operations honour skipCount/maxItems
+(query string, or the `paging` object of search bodies) over a configurable
+collection size, single-entry responses echo the path id and scalar fields
+of the request body, and binary content endpoints return a byte payload
+with single-range support.
+
+Latency (with jitter) and an error rate are configurable, so the same
+server drives both correctness checks and load tests. It runs in-process
+as an httpx transport (sync and async) or as an ASGI app:
+
+    server = MockAlfresco(latency=0.02, error_rate=0.01)
+    factory = ClientFactory(base_url="http://localhost:8080", username="admin", password="admin")
+    server.install(factory)
+    factory.create_core_client().nodes.get("-root-")
+
+    uvicorn mock_alfresco:app    # same server over a real socket
+"""
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import httpx
+import yaml
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+SPECS_DIR = Path(__file__).resolve().parents[2] / "openapi" / "openapi3"
+
+TIMESTAMP = "2024-01-15T10:30:00.000+0000"
+MAX_DEPTH = 6
+
+# Fields Alfresco only returns when asked for with ?include= (or a search body include)
+INCLUDE_ONLY = frozenset({
+    "allowableOperations", "association", "isLink", "isFavorite", "isLocked",
+    "path", "permissions", "definition", "source",
+})
+
+# Realistic values for string fields, by property name
+STRING_VALUES = {
+    "name": "document-{i}.txt",
+    "nodeType": "cm:content",
+    "mimeType": "text/plain",
+    "mimeTypeName": "Plain Text",
+    "encoding": "UTF-8",
+    "displayName": "User {i}",
+    "firstName": "User",
+    "lastName": "{i}",
+    "email": "user{i}@example.com",
+    "title": "Title {i}",
+    "description": "Description {i}",
+    "aspectNames": "cm:auditable",
+    "visibility": "PUBLIC",
+    "role": "SiteConsumer",
+    "assocType": "cm:contains",
+}
+
+
+def _uuid(i: int) -> str:
+    return f"5f4e3d2c-1b0a-4f9e-8d7c-{i:012d}"
+
+
+class Operation:
+    """One routed operation: method, compiled path and success response."""
+
+    __slots__ = (
+        "api",
+        "operation_id",
+        "method",
+        "template",
+        "pattern",
+        "params",
+        "status",
+        "schema",
+        "media_type",
+    )
+
+    def __init__(
+        self, api: str, method: str, base_path: str, template: str, spec_operation: Dict[str, Any]
+    ):
+        self.api = api
+        self.operation_id = spec_operation.get("operationId", f"{method} {template}")
+        self.method = method.upper()
+        self.template = template
+        self.params = re.findall(r"{([^}]+)}", template)
+        regex = re.sub(r"\\{[^}]+\\}", "([^/]+)", re.escape(base_path.rstrip("/") + template))
+        self.pattern = re.compile(regex + "$")
+        successes = sorted(
+            code for code in spec_operation.get("responses", {}) if str(code).startswith("2")
+        )
+        self.status = int(successes[0]) if successes else 200
+        response = spec_operation["responses"][successes[0]] if successes else {}
+        content = response.get("content") or {}
+        self.media_type = next(iter(content), None)
+        self.schema = content[self.media_type].get("schema") if self.media_type else None
+
+
+class MockAlfresco:
+    """
+    Spec-driven mock Alfresco server.
+
+    Args:
+        latency: Mean seconds added to every response
+        jitter: Uniform +/- fraction of latency (0.2 = 20%)
+        total_items: Size of every list collection
+        page_size: maxItems when a list request does not send one
+        error_rate: Probability (0-1) of answering with one of error_statuses
+        error_statuses: Statuses used for injected errors
+        content_size: Bytes returned by binary content endpoints
+        apis: Spec names to load (default: all, e.g. ("core", "search"))
+        seed: Seed for latency jitter and error injection
+        specs_dir: Directory holding the alfresco-*.yaml specs
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        total_items: int = 250,
+        page_size: int = 100,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 503),
+        content_size: int = 64 * 1024,
+        apis: Optional[Sequence[str]] = None,
+        seed: int = 0,
+        specs_dir: Path = SPECS_DIR,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.total_items = total_items
+        self.page_size = page_size
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.content_size = content_size
+        self.stats: Counter = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._entries: Dict[Tuple[str, str, int, FrozenSet[str]], Any] = {}
+        self.operations: List[Operation] = []
+        for spec_file in sorted(Path(specs_dir).glob("alfresco-*.yaml")):
+            api = spec_file.stem[len("alfresco-"):]
+            if apis is None or api in apis:
+                self._load(api, yaml.load(spec_file.read_text(encoding="utf-8"), Loader=_Loader))
+        # Literal segments before parameters: /people/-me- style routes win
+        self.operations.sort(key=lambda operation: len(operation.params))
+
+    def _load(self, api: str, spec: Dict[str, Any]) -> None:
+        self._schemas[api] = spec.get("components", {}).get("schemas", {})
+        base_path = urlparse(spec["servers"][0]["url"]).path
+        for template, item in spec.get("paths", {}).items():
+            for method, spec_operation in item.items():
+                if method in ("get", "post", "put", "delete", "patch"):
+                    self.operations.append(
+                        Operation(api, method, base_path, template, spec_operation)
+                    )
+
+    # -- routing -----------------------------------------------------------
+
+    def match(self, method: str, path: str) -> Tuple[Optional[Operation], Dict[str, str]]:
+        """Find the operation serving method + path, with its path parameters."""
+        for operation in self.operations:
+            if operation.method != method:
+                continue
+            found = operation.pattern.match(path)
+            if found:
+                return operation, dict(zip(operation.params, found.groups()))
+        return None, {}
+
+    # -- schema faking -----------------------------------------------------
+
+    def _resolve(self, api: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        while "$ref" in schema:
+            schema = self._schemas[api][schema["$ref"].rsplit("/", 1)[-1]]
+        if "allOf" in schema:
+            merged: Dict[str, Any] = {"type": "object", "properties": {}}
+            for part in schema["allOf"]:
+                part = self._resolve(api, part)
+                merged["properties"].update(part.get("properties", {}))
+            return merged
+        return schema
+
+    def fake(
+        self, api: str, schema: Dict[str, Any], index: int = 0, name: str = "", depth: int = 0,
+        include: FrozenSet[str] = frozenset()
+    ) -> Any:
+        """Build a value matching schema; index varies ids and names between entries."""
+        schema = self._resolve(api, schema)
+        if "enum" in schema:
+            return schema["enum"][0]
+        kind = schema.get("type", "object" if "properties" in schema else "string")
+        if kind == "object":
+            if depth >= MAX_DEPTH:
+                return {}
+            if name == "properties" and "properties" not in schema:
+                return {"cm:title": f"Title {index}", "cm:description": f"Description {index}"}
+            return {
+                key: self.fake(api, value, index, key, depth + 1, include)
+                for key, value in schema.get("properties", {}).items()
+                if key not in INCLUDE_ONLY or key in include
+            }
+        if kind == "array":
+            if depth >= MAX_DEPTH or "items" not in schema:
+                return []
+            return [self.fake(api, schema["items"], index, name, depth + 1, include)]
+        if kind == "boolean":
+            return name in ("isFile", "enabled")
+        if kind == "integer":
+            return 1024 + index if name == "sizeInBytes" else schema.get("default", index)
+        if kind == "number":
+            return 1.0
+        return self._fake_string(schema, index, name)
+
+    @staticmethod
+    def _fake_string(schema: Dict[str, Any], index: int, name: str) -> str:
+        fmt = schema.get("format")
+        if fmt == "date-time":
+            return TIMESTAMP
+        if fmt == "date":
+            return TIMESTAMP[:10]
+        if name == "id" or name.endswith("Id"):
+            return _uuid(index)
+        if name in STRING_VALUES:
+            return STRING_VALUES[name].format(i=index)
+        return str(schema.get("default", f"{name or 'value'}-{index}"))
+
+    @staticmethod
+    def _list_schema(schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The entries item schema if schema is an Alfresco paging response."""
+        entries = schema.get("properties", {}).get("list", {}).get("properties", {}).get("entries")
+        return entries.get("items") if entries else None
+
+    def _entry(
+        self, operation: Operation, schema: Dict[str, Any], index: int, include: FrozenSet[str]
+    ) -> Any:
+        key = (operation.api, operation.operation_id, index, include)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = self.fake(
+                operation.api, schema, index, depth=1, include=include
+            )
+        return entry
+
+    # -- responses ---------------------------------------------------------
+
+    def _error(self, status: int, summary: str) -> httpx.Response:
+        return httpx.Response(status, json={"error": {
+            "errorKey": "framework.exception.ApiDefault",
+            "statusCode": status,
+            "briefSummary": summary,
+            "stackTrace": "For security reasons the stack trace is no longer displayed",
+            "descriptionURL": "https://api-explorer.alfresco.com",
+        }})
+
+    @staticmethod
+    def _include(request: httpx.Request, body: Any) -> FrozenSet[str]:
+        if isinstance(body, dict) and isinstance(body.get("include"), list):
+            return frozenset(body["include"])
+        return frozenset(
+            name
+            for value in request.url.params.get_list("include")
+            for name in value.split(",")
+            if name
+        )
+
+    def _paging(self, request: httpx.Request, body: Any) -> Tuple[int, int]:
+        paging = body.get("paging") if isinstance(body, dict) else None
+        if isinstance(paging, dict):
+            return int(paging.get("skipCount", 0)), int(paging.get("maxItems", self.page_size))
+        params = request.url.params
+        return int(params.get("skipCount", 0)), int(params.get("maxItems", self.page_size))
+
+    def _content(self, request: httpx.Request, operation: Operation) -> httpx.Response:
+        data = (b"alfresco mock content " * (self.content_size // 22 + 1))[:self.content_size]
+        headers = {"Content-Type": operation.media_type or "application/octet-stream"}
+        found = re.match(r"bytes=(\d*)-(\d*)$", request.headers.get("Range", ""))
+        if found:
+            start = int(found.group(1) or 0)
+            end = min(int(found.group(2) or len(data) - 1), len(data) - 1)
+            if start >= len(data):
+                return self._error(416, "Range Not Satisfiable")
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+            return httpx.Response(206, content=data[start:end + 1], headers=headers)
+        return httpx.Response(operation.status, content=data, headers=headers)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        """Build the response for request, without latency."""
+        operation, path_params = self.match(request.method, request.url.path)
+        if operation is None:
+            self.stats["not_found"] += 1
+            return self._error(404, f"No operation for {request.method} {request.url.path}")
+        self.stats[operation.operation_id] += 1
+        with self._lock:
+            inject = self.error_rate and self._random.random() < self.error_rate
+            status = self._random.choice(self.error_statuses) if inject else None
+        if inject:
+            self.stats["errors"] += 1
+            return self._error(status, "Injected error")
+
+        if operation.schema is None:
+            return httpx.Response(operation.status)
+        schema = self._resolve(operation.api, operation.schema)
+        if schema.get("format") == "binary":
+            return self._content(request, operation)
+
+        body = None
+        if request.content and request.headers.get("Content-Type", "").startswith(
+            "application/json"
+        ):
+            body = json.loads(request.content)
+
+        include = self._include(request, body)
+        item_schema = self._list_schema(schema)
+        if item_schema is not None:
+            skip, size = self._paging(request, body)
+            indexes = range(skip, min(skip + size, self.total_items))
+            payload = {"list": {
+                "pagination": {
+                    "count": len(indexes),
+                    "hasMoreItems": skip + len(indexes) < self.total_items,
+                    "totalItems": self.total_items,
+                    "skipCount": skip,
+                    "maxItems": size,
+                },
+                "entries": [self._entry(operation, item_schema, i, include) for i in indexes],
+            }}
+            return httpx.Response(operation.status, json=payload)
+
+        payload = self.fake(operation.api, schema, include=include)
+        entry = payload.get("entry") if isinstance(payload, dict) else None
+        if isinstance(entry, dict):
+            if path_params and "id" in entry:
+                entry["id"] = list(path_params.values())[-1]
+            if isinstance(body, dict):
+                entry.update(
+                    {
+                        key: value
+                        for key, value in body.items()
+                        if key in entry and not isinstance(value, (dict, list))
+                    }
+                )
+        return httpx.Response(operation.status, json=payload)
+
+    def _delay(self) -> float:
+        if not self.latency:
+            return 0.0
+        with self._lock:
+            return self.latency * (1 + self._random.uniform(-self.jitter, self.jitter))
+
+    # -- transports --------------------------------------------------------
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Sync handler for httpx.MockTransport."""
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+        return self.respond(request)
+
+    async def ahandle(self, request: httpx.Request) -> httpx.Response:
+        """Async handler for httpx.MockTransport."""
+        delay = self._delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return self.respond(request)
+
+    def install(self, factory) -> "MockAlfresco":
+        """Route a ClientFactory's shared transport to this server."""
+        factory.transport.use_transport(
+            httpx.MockTransport(self.handle), httpx.MockTransport(self.ahandle)
+        )
+        return self
+
+    async def __call__(self, scope, receive, send) -> None:
+        """ASGI entry point."""
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        url = httpx.URL(path=scope["path"], query=scope.get("query_string", b""))
+        headers = [
+            (key.decode("latin-1"), value.decode("latin-1"))
+            for key, value in scope.get("headers", [])
+        ]
+        response = await self.ahandle(
+            httpx.Request(scope["method"], url, headers=headers, content=body)
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [
+                    (key.encode("latin-1"), value.encode("latin-1"))
+                    for key, value in response.headers.items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.content})
+
+
+app = MockAlfresco()
@@ -0,0 +1,107 @@
+"""
+Synthetic Alfresco response payloads shared by the benchmarks.
+
+Shapes follow the REST API responses (camelCase keys, `{"entry": ...}`
+wrappers, `list.pagination`), with enough fields populated that every
+decoder does realistic work (nested users, content info, timestamps).
+"""
+
+import json
+from typing import Any, Callable, Dict, List
+
+
+def node(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"5f4e3d2c-1b0a-4f9e-8d7c-{i:012d}",
+        "name": f"document-{i}.pdf",
+        "nodeType": "cm:content",
+        "isFile": True,
+        "isFolder": False,
+        "parentId": "8a7b6c5d-4e3f-4a1b-9c8d-7e6f5a4b3c2d",
+        "createdAt": "2024-01-15T10:30:00.000+0000",
+        "modifiedAt": "2024-03-01T16:45:12.345+0000",
+        "createdByUser": {"id": "admin", "displayName": "Administrator"},
+        "modifiedByUser": {"id": "jdoe", "displayName": "John Doe"},
+        "content": {
+            "mimeType": "application/pdf",
+            "mimeTypeName": "Adobe PDF Document",
+            "sizeInBytes": 52340 + i,
+            "encoding": "UTF-8",
+        },
+        "aspectNames": ["cm:titled", "cm:auditable", "cm:versionable"],
+        "properties": {
+            "cm:title": f"Document {i}",
+            "cm:versionLabel": "1.0",
+            "cm:versionType": "MAJOR",
+        },
+    }
+
+
+def site(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"site-{i}",
+        "guid": f"b4cff62a-664d-4d45-9302-{i:012d}",
+        "title": f"Site {i}",
+        "description": f"Collaboration site number {i}",
+        "visibility": "PUBLIC",
+        "preset": "site-dashboard",
+        "role": "SiteManager",
+    }
+
+
+def person(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"user{i}",
+        "firstName": "User",
+        "lastName": f"Number {i}",
+        "displayName": f"User Number {i}",
+        "email": f"user{i}@example.com",
+        "enabled": True,
+        "emailNotificationsEnabled": True,
+        "company": {"organization": "Example Corp"},
+        "capabilities": {"isAdmin": False, "isGuest": False, "isMutable": True},
+    }
+
+
+def audit_entry(i: int) -> Dict[str, Any]:
+    return {
+        "id": str(1000 + i),
+        "auditApplicationId": "alfresco-access",
+        "createdAt": (
+            f"2024-03-01T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}"
+            f".{i % 1000:03d}+0000"
+        ),
+        "createdByUser": {"id": "admin", "displayName": "Administrator"},
+        "values": {
+            "/alfresco-access/transaction/action": "READ",
+            "/alfresco-access/transaction/path": f"/app:company_home/cm:doc-{i}",
+        },
+    }
+
+
+def search_hit(i: int) -> Dict[str, Any]:
+    return dict(node(i), search={"score": 1.0 / (i + 1)})
+
+
+def paging(entries: List[Dict[str, Any]], total: int = None) -> Dict[str, Any]:
+    total = len(entries) if total is None else total
+    return {
+        "list": {
+            "pagination": {
+                "count": len(entries),
+                "hasMoreItems": len(entries) < total,
+                "totalItems": total,
+                "skipCount": 0,
+                "maxItems": len(entries),
+            },
+            "entries": [{"entry": entry} for entry in entries],
+        }
+    }
+
+
+def page_bytes(factory: Callable[[int], Dict[str, Any]], count: int) -> bytes:
+    return json.dumps(paging([factory(i) for i in range(count)])).encode()
+
+
+def entry_bytes(factory: Callable[[int], Dict[str, Any]], i: int = 0) -> bytes:
+    return json.dumps({"entry": factory(i)}).encode()
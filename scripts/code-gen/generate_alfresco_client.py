@@ -23,6 +23,8 @@ STEP 1: Data Model Generation
 STEP 2: HTTP Client Code Generation  
 - openapi-python-client for HTTP clients with async support
 - Generates professional API clients with type safety
+- Binary GET endpoints (content, renditions, avatars) emitted as streaming
+  functions by generate_binary_operations.py
 - Output: python_alfresco_api/raw_clients/*/
 
 STEP 3: Unified Package Creation
@@ -47,6 +49,10 @@ from typing import List, Dict, Any
 import yaml
 import json
 
+from generate_binary_operations import BinaryOperationGenerator
+from generate_lazy_inits import make_pydantic_models_lazy, make_raw_models_lazy
+from optimize_raw_models import optimize_raw_models
+
 class AlfrescoHybridPipeline:
     """
     Complete pipeline for generating Alfresco clients with hybrid approach.
@@ -249,6 +255,20 @@ class AlfrescoHybridPipeline:
                     print(f"      {api_count} API endpoints, {model_count} model files")
                     if config_file.exists():
                         print(f"      Package name: {api_name}_client (short names!)")
+                    
+                    # Binary endpoints skipped by openapi-python-client (streaming functions)
+                    binary_ops = BinaryOperationGenerator(spec_path, package_dir).generate()
+                    if binary_ops:
+                        print(f"      {len(binary_ops)} streaming binary endpoints")
+                    
+                    # models/__init__.py imports each model module on first access
+                    if make_raw_models_lazy(package_dir):
+                        print(f"      Lazy models/__init__.py (PEP 562)")
+                    
+                    # Cheaper from_dict(): first-use model imports, shared empty additional_properties
+                    optimized = optimize_raw_models(package_dir)
+                    if optimized:
+                        print(f"      {optimized} model files optimized")
                 
                 success_count += 1
                 
@@ -308,26 +328,74 @@ Generated using the proven hybrid approach:
 datamodel-code-generator + openapi-python-client
 """
 
-from .client_factory import ClientFactory
-from .auth_util import AuthUtil
-
-# Individual clients
-from .clients.auth_client import AlfrescoAuthClient
-from .clients.core_client import AlfrescoCoreClient  
-from .clients.discovery_client import AlfrescoDiscoveryClient
-from .clients.search_client import AlfrescoSearchClient
-from .clients.workflow_client import AlfrescoWorkflowClient
-from .clients.model_client import AlfrescoModelClient
-from .clients.search_sql_client import AlfrescoSearchSqlClient
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client_factory import ClientFactory
+    from .auth_util import AuthUtil, OAuth2AuthUtil
+    from .clients.auth import AlfrescoAuthClient
+    from .clients.core import AlfrescoCoreClient
+    from .clients.discovery import AlfrescoDiscoveryClient
+    from .clients.search import AlfrescoSearchClient
+    from .clients.workflow import AlfrescoWorkflowClient
+    from .clients.model import AlfrescoModelClient
+    from .clients.search_sql import AlfrescoSearchSqlClient
+    from .models import *
+    from .clients.conversion_utils import pydantic_to_attrs_dict, attrs_to_pydantic, create_converter_pair
+    from . import raw_clients
+
+# Exports are imported on first access (PEP 562): `import python_alfresco_api`
+# loads no client, model or httpx code until a name is used
+_EXPORTS = {
+    # Factory & utilities
+    "ClientFactory": ".client_factory",
+    "AuthUtil": ".auth_util",
+    "OAuth2AuthUtil": ".auth_util",
+
+    # Individual clients - V1.1 hierarchical structure
+    "AlfrescoAuthClient": ".clients.auth",
+    "AlfrescoCoreClient": ".clients.core",
+    "AlfrescoDiscoveryClient": ".clients.discovery",
+    "AlfrescoSearchClient": ".clients.search",
+    "AlfrescoWorkflowClient": ".clients.workflow",
+    "AlfrescoModelClient": ".clients.model",
+    "AlfrescoSearchSqlClient": ".clients.search_sql",
+
+    # Conversion utilities for Pydantic <-> attrs model transformation
+    "pydantic_to_attrs_dict": ".clients.conversion_utils",
+    "attrs_to_pydantic": ".clients.conversion_utils",
+    "create_converter_pair": ".clients.conversion_utils",
+}
+
+# Subpackages exposed as attributes
+_SUBMODULES = {"models", "raw_clients", "clients"}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif not name.startswith("_") and name in importlib.import_module(".models", __name__).__all__:
+        # Pydantic models for LLM integration (formerly `from .models import *`)
+        value = getattr(importlib.import_module(".models", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
 
-# Pydantic models for LLM integration
-from .models import *
 
 __version__ = "1.0.0"
 __all__ = [
     # Factory & utilities
     "ClientFactory",
     "AuthUtil",
+    "OAuth2AuthUtil",
     
     # Individual clients
     "AlfrescoAuthClient",
@@ -336,7 +404,15 @@ __all__ = [
     "AlfrescoSearchClient",
     "AlfrescoWorkflowClient", 
     "AlfrescoModelClient",
-    "AlfrescoSearchSqlClient"
+    "AlfrescoSearchSqlClient",
+    
+    # Conversion utilities
+    "pydantic_to_attrs_dict",
+    "attrs_to_pydantic", 
+    "create_converter_pair",
+    
+    # Raw clients
+    "raw_clients"
 ]
 '''
         
@@ -351,56 +427,8 @@ __all__ = [
     # REMOVED: _create_individual_client_wrapper() - Helper function for client wrapper creation
     
     def _create_models_init(self):
-        """Create models package __init__.py"""
-        models_init_content = '''"""
-Pydantic v2 Models for Alfresco APIs
-
-Auto-generated models perfect for:
-- LLM tool interfaces
-- MCP server implementations  
-- Type-safe API interactions
-- Data validation and serialization
-"""
-
-# Import all models from individual API model files
-try:
-    from .alfresco_auth_models import *
-except ImportError:
-    pass
-
-try:
-    from .alfresco_core_models import *
-except ImportError:
-    pass
-
-try:
-    from .alfresco_discovery_models import *
-except ImportError:
-    pass
-
-try:
-    from .alfresco_search_models import *
-except ImportError:
-    pass
-
-try:
-    from .alfresco_workflow_models import *
-except ImportError:
-    pass
-
-try:
-    from .alfresco_model_models import *
-except ImportError:
-    pass
-
-try:
-    from .alfresco_search_sql_models import *
-except ImportError:
-    pass
-'''
-        
-        with open(self.output_dir / "models" / "__init__.py", "w", encoding='utf-8') as f:
-            f.write(models_init_content)
+        """Create models package __init__.py (lazy PEP 562 exports of every generated class)"""
+        make_pydantic_models_lazy(self.output_dir / "models")
     
     def _create_setup_py(self):
         """Create setup.py for the package"""
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Binary Operation Generator - streaming raw functions for binary endpoints
+
+openapi-python-client skips GET operations whose responses are binary streams
+(node content, renditions, version content, shared link content, avatars)
+because their error responses declare an application/octet-stream Error
+schema. This step runs after openapi-python-client and emits those operations
+into the raw client packages using the same module layout:
+
+    api/<tag>/<operation>.py: _get_kwargs, sync_detailed, sync, asyncio_detailed, asyncio
+
+Unlike JSON operations the response body is never read into memory:
+- sync_detailed / asyncio_detailed return a StreamingResponse (status, headers,
+  open body) that the caller iterates and closes
+- sync / asyncio return an iterator / async iterator of content chunks (None for
+  documented error statuses) that closes the response when exhausted
+
+Usage:
+    python scripts/code-gen/generate_binary_operations.py
+    python scripts/code-gen/generate_binary_operations.py --api core
+"""
+
+import argparse
+import re
+import textwrap
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+SUCCESS_STATUSES = (200, 206)
+
+STREAMING_MODULE = '''"""Contains the streamed response type for binary endpoints"""
+
+import datetime
+from collections.abc import AsyncIterator, Iterator, MutableMapping
+from email.utils import format_datetime
+from http import HTTPStatus
+from typing import Optional
+
+import httpx
+from attrs import define
+
+from . import errors
+
+
+def http_date(value: datetime.datetime) -> str:
+    """Format a datetime as an HTTP date (If-Modified-Since). Naive values are local time."""
+    return format_datetime(value.astimezone(datetime.timezone.utc), usegmt=True)
+
+
+@define
+class StreamingResponse:
+    """A response from a binary endpoint whose body has not been read yet
+
+    Iterate the body with iter_bytes() / aiter_bytes() (which close the response
+    when exhausted), or use the response as a (async) context manager.
+    """
+
+    status_code: HTTPStatus
+    headers: MutableMapping[str, str]
+    response: httpx.Response
+
+    @property
+    def is_success(self) -> bool:
+        """True for 200 (full content) and 206 (partial content)"""
+        return self.status_code in (HTTPStatus.OK, HTTPStatus.PARTIAL_CONTENT)
+
+    @property
+    def content_length(self) -> Optional[int]:
+        length = self.headers.get("Content-Length")
+        return int(length) if length is not None and length.isdigit() else None
+
+    @property
+    def content_type(self) -> Optional[str]:
+        return self.headers.get("Content-Type")
+
+    def raise_for_status(self) -> "StreamingResponse":
+        self.response.raise_for_status()
+        return self
+
+    def iter_bytes(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        try:
+            yield from self.response.iter_bytes(chunk_size=chunk_size)
+        finally:
+            self.response.close()
+
+    async def aiter_bytes(self, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self.response.aiter_bytes(chunk_size=chunk_size):
+                yield chunk
+        finally:
+            await self.response.aclose()
+
+    def read(self) -> bytes:
+        try:
+            return self.response.read()
+        finally:
+            self.response.close()
+
+    async def aread(self) -> bytes:
+        try:
+            return await self.response.aread()
+        finally:
+            await self.response.aclose()
+
+    def close(self) -> None:
+        self.response.close()
+
+    async def aclose(self) -> None:
+        await self.response.aclose()
+
+    def __enter__(self) -> "StreamingResponse":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "StreamingResponse":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+
+def build_streaming_response(
+    response: httpx.Response, documented: frozenset[int], raise_on_unexpected_status: bool
+) -> StreamingResponse:
+    if raise_on_unexpected_status and response.status_code not in documented:
+        content = response.read()
+        response.close()
+        raise errors.UnexpectedStatus(response.status_code, content)
+    return StreamingResponse(status_code=HTTPStatus(response.status_code), headers=response.headers, response=response)
+
+
+async def abuild_streaming_response(
+    response: httpx.Response, documented: frozenset[int], raise_on_unexpected_status: bool
+) -> StreamingResponse:
+    if raise_on_unexpected_status and response.status_code not in documented:
+        content = await response.aread()
+        await response.aclose()
+        raise errors.UnexpectedStatus(response.status_code, content)
+    return StreamingResponse(status_code=HTTPStatus(response.status_code), headers=response.headers, response=response)
+
+
+__all__ = ["StreamingResponse", "abuild_streaming_response", "build_streaming_response", "http_date"]
+'''
+
+# Python names that openapi-python-client suffixes with "_"
+RESERVED_NAMES = {"range", "type", "id", "format", "filter", "input", "list", "dict", "hash", "max", "min"}
+
+
+def snake_case(name: str) -> str:
+    """nodeId -> node_id, If-Modified-Since -> if_modified_since, Range -> range_"""
+    name = re.sub(r"[^0-9a-zA-Z]+", "_", name)
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).lower().strip("_")
+    return f"{name}_" if name in RESERVED_NAMES else name
+
+
+class BinaryParameter:
+    """One path/query/header parameter of a binary operation."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.name = spec["name"]
+        self.location = spec["in"]
+        self.required = spec.get("required", False) or self.location == "path"
+        self.description = spec.get("description", "")
+        schema = spec.get("schema", {})
+        self.format = schema.get("format")
+        self.default = schema.get("default")
+        self.python_name = snake_case(self.name)
+        self.python_type = {
+            "boolean": "bool", "integer": "int", "number": "float"
+        }.get(schema.get("type"), "datetime.datetime" if self.format == "date-time" else "str")
+
+    def signature(self) -> str:
+        if self.required:
+            return f"{self.python_name}: {self.python_type}"
+        default = "UNSET" if self.default is None else repr(self.default)
+        return f"{self.python_name}: Union[Unset, {self.python_type}] = {default}"
+
+    def doc(self) -> str:
+        if self.required:
+            type_doc = self.python_type
+        else:
+            type_doc = f"Union[Unset, {self.python_type}]"
+            if self.default is not None:
+                type_doc += f" Default: {self.default!r}."
+        return f"{self.python_name} ({type_doc}):"
+
+
+class BinaryOperation:
+    """A GET operation whose successful response is a binary stream."""
+
+    def __init__(self, path: str, spec: Dict[str, Any], parameters: List[BinaryParameter]):
+        self.path = path
+        self.operation_id = spec["operationId"]
+        self.module_name = snake_case(self.operation_id)
+        self.tag = snake_case(spec.get("tags", ["default"])[0])
+        self.summary = spec.get("summary", self.operation_id)
+        self.description = spec.get("description", "").strip()
+        self.parameters = parameters
+        self.documented = sorted(int(code) for code in spec["responses"] if code.isdigit())
+
+    @property
+    def path_parameters(self) -> List[BinaryParameter]:
+        return [p for p in self.parameters if p.location == "path"]
+
+    @property
+    def optional_parameters(self) -> List[BinaryParameter]:
+        return [p for p in self.parameters if p.location != "path"]
+
+    def _signature(self, client: bool, extra: str = "") -> str:
+        lines = [f"    {p.signature()}," for p in self.path_parameters]
+        lines.append("    *,")
+        if client:
+            lines.append("    client: Union[AuthenticatedClient, Client],")
+        lines.extend(f"    {p.signature()}," for p in self.optional_parameters)
+        if extra:
+            lines.append(f"    {extra},")
+        return "\n".join(lines)
+
+    def _call_arguments(self, indent: str) -> str:
+        names = [p.python_name for p in self.parameters]
+        return "\n".join(f"{indent}{name}={name}," for name in names)
+
+    def _docstring(self, returns: str, extra_args: str = "") -> str:
+        description = textwrap.indent(self.description, "    ").lstrip() if self.description else ""
+        args = "\n".join(f"        {p.doc()}" for p in self.parameters)
+        if extra_args:
+            args += f"\n        {extra_args}"
+        body = f'    """{self.summary}\n\n'
+        if description:
+            body += f"     {description}\n\n"
+        body += (
+            "    The response body is streamed, never read into memory.\n\n"
+            f"    Args:\n{args}\n\n"
+            "    Raises:\n"
+            "        errors.UnexpectedStatus: If the server returns an undocumented status code and "
+            "Client.raise_on_unexpected_status is True.\n"
+            "        httpx.TimeoutException: If the request takes longer than Client.timeout.\n\n"
+            f"    Returns:\n        {returns}\n"
+            '    """'
+        )
+        return body
+
+    def _get_kwargs(self) -> str:
+        lines = ["def _get_kwargs(", self._signature(client=False), ") -> dict[str, Any]:"]
+        headers = [p for p in self.parameters if p.location == "header"]
+        query = [p for p in self.parameters if p.location == "query"]
+
+        if headers:
+            lines.append("    headers: dict[str, Any] = {}")
+            for p in headers:
+                value = f"http_date({p.python_name})" if p.format == "date-time" else p.python_name
+                lines.append(f"    if not isinstance({p.python_name}, Unset):")
+                lines.append(f'        headers["{p.name}"] = {value}')
+                lines.append("")
+
+        if query:
+            lines.append("    params: dict[str, Any] = {}")
+            lines.append("")
+            for p in query:
+                lines.append(f'    params["{p.name}"] = {p.python_name}')
+                lines.append("")
+            lines.append("    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}")
+            lines.append("")
+
+        url = re.sub(r"\{(\w+)\}", lambda m: "{" + snake_case(m.group(1)) + "}", self.path)
+        lines.append("    _kwargs: dict[str, Any] = {")
+        lines.append('        "method": "get",')
+        lines.append(f'        "url": f"{url}",')
+        if query:
+            lines.append('        "params": params,')
+        lines.append("    }")
+        lines.append("")
+        if headers:
+            lines.append('    _kwargs["headers"] = headers')
+        lines.append("    return _kwargs")
+        return "\n".join(lines)
+
+    def render(self) -> str:
+        uses_datetime = any(p.python_type == "datetime.datetime" for p in self.parameters)
+        imports = [
+            "import datetime\n" if uses_datetime else "",
+            "from collections.abc import AsyncIterator, Iterator\n",
+            "from typing import Any, Optional, Union\n\n",
+            "from ...client import AuthenticatedClient, Client\n",
+            "from ...streaming import StreamingResponse, abuild_streaming_response, build_streaming_response"
+            + (", http_date" if uses_datetime else "") + "\n",
+            "from ...types import UNSET, Unset\n",
+        ]
+        documented = ", ".join(str(code) for code in self.documented)
+        call = self._call_arguments("        ")
+        chunk_arg = "chunk_size: Optional[int] = None"
+        chunk_doc = "chunk_size (Optional[int]): Bytes per chunk (default: as received)"
+
+        return f'''{"".join(imports)}
+_DOCUMENTED_STATUSES = frozenset({{{documented}}})
+
+
+{self._get_kwargs()}
+
+
+def sync_detailed(
+{self._signature(client=True)}
+) -> StreamingResponse:
+{self._docstring("StreamingResponse: status, headers and the unread body (close it when done)")}
+
+    kwargs = _get_kwargs(
+{call}
+    )
+
+    httpx_client = client.get_httpx_client()
+    response = httpx_client.send(httpx_client.build_request(**kwargs), stream=True)
+
+    return build_streaming_response(response, _DOCUMENTED_STATUSES, client.raise_on_unexpected_status)
+
+
+def sync(
+{self._signature(client=True, extra=chunk_arg)}
+) -> Optional[Iterator[bytes]]:
+{self._docstring("Optional[Iterator[bytes]]: content chunks, or None for a documented error status", chunk_doc)}
+
+    response = sync_detailed(
+{call}
+        client=client,
+    )
+    if not response.is_success:
+        response.close()
+        return None
+    return response.iter_bytes(chunk_size=chunk_size)
+
+
+async def asyncio_detailed(
+{self._signature(client=True)}
+) -> StreamingResponse:
+{self._docstring("StreamingResponse: status, headers and the unread body (close it when done)")}
+
+    kwargs = _get_kwargs(
+{call}
+    )
+
+    httpx_client = client.get_async_httpx_client()
+    response = await httpx_client.send(httpx_client.build_request(**kwargs), stream=True)
+
+    return await abuild_streaming_response(response, _DOCUMENTED_STATUSES, client.raise_on_unexpected_status)
+
+
+async def asyncio(
+{self._signature(client=True, extra=chunk_arg)}
+) -> Optional[AsyncIterator[bytes]]:
+{self._docstring("Optional[AsyncIterator[bytes]]: content chunks, or None for a documented error status", chunk_doc)}
+
+    response = await asyncio_detailed(
+{call}
+        client=client,
+    )
+    if not response.is_success:
+        await response.aclose()
+        return None
+    return response.aiter_bytes(chunk_size=chunk_size)
+'''
+
+
+class BinaryOperationGenerator:
+    """Emit streaming raw functions for the binary GET operations of one spec."""
+
+    def __init__(self, spec_path: Path, package_dir: Path):
+        self.spec_path = Path(spec_path)
+        self.package_dir = Path(package_dir)
+        with open(self.spec_path, "r", encoding="utf-8") as f:
+            self.spec = yaml.safe_load(f)
+
+    def _resolve(self, parameter: Dict[str, Any]) -> Dict[str, Any]:
+        if "$ref" in parameter:
+            name = parameter["$ref"].split("/")[-1]
+            return self.spec["components"]["parameters"][name]
+        return parameter
+
+    @staticmethod
+    def _is_binary(response: Optional[Dict[str, Any]]) -> bool:
+        content = (response or {}).get("content", {})
+        return any(media.get("schema", {}).get("format") == "binary" for media in content.values())
+
+    def operations(self) -> List[BinaryOperation]:
+        """Find GET operations whose 200 response is a binary stream."""
+        found = []
+        for path, item in self.spec.get("paths", {}).items():
+            spec = item.get("get")
+            if spec and self._is_binary(spec.get("responses", {}).get("200")):
+                parameters = [BinaryParameter(self._resolve(p)) for p in spec.get("parameters", [])]
+                found.append(BinaryOperation(path, spec, parameters))
+        return found
+
+    def generate(self) -> List[Path]:
+        """Write streaming.py and one module per binary operation."""
+        operations = self.operations()
+        if not operations:
+            return []
+
+        (self.package_dir / "streaming.py").write_text(STREAMING_MODULE, encoding="utf-8")
+        written = []
+        for operation in operations:
+            tag_dir = self.package_dir / "api" / operation.tag
+            tag_dir.mkdir(parents=True, exist_ok=True)
+            init_file = tag_dir / "__init__.py"
+            if not init_file.exists():
+                init_file.write_text('"""Contains endpoint functions for accessing the API"""\n', encoding="utf-8")
+            module = tag_dir / f"{operation.module_name}.py"
+            module.write_text(operation.render(), encoding="utf-8")
+            written.append(module)
+        return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate streaming raw functions for binary endpoints")
+    parser.add_argument("--api", default="core", help="API name (core, auth, ...)")
+    parser.add_argument("--project-root", default=".", help="Project root directory")
+    args = parser.parse_args()
+
+    root = Path(args.project_root)
+    spec_path = root / "openapi" / "openapi3" / f"alfresco-{args.api.replace('_', '-')}.yaml"
+    package_dir = root / "python_alfresco_api" / "raw_clients" / f"alfresco_{args.api}_client" / f"{args.api}_client"
+
+    written = BinaryOperationGenerator(spec_path, package_dir).generate()
+    print(f"Generated {len(written)} binary operations for {args.api.upper()}")
+    for module in written:
+        print(f"   {module.relative_to(root)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Lazy Init Generator - PEP 562 package __init__ files for generated models
+
+openapi-python-client writes a models/__init__.py that imports every model
+module (~190 attrs modules for core), and the Pydantic models package
+star-imports all seven datamodel-codegen files (~350 classes). Importing any
+one model paid for all of them.
+
+This step rewrites those __init__ files to export the same names through a
+module-level __getattr__ (PEP 562): the owning module is imported on first
+attribute access and cached in the package globals. The original imports are
+kept under `if TYPE_CHECKING:` for type checkers and IDEs.
+
+Usage:
+    python scripts/code-gen/generate_lazy_inits.py
+    python scripts/code-gen/generate_lazy_inits.py --api core
+"""
+
+import argparse
+import ast
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+# Order of the former star imports: a class defined by several API files
+# resolves to the last one, exactly as before
+PYDANTIC_MODEL_FILES = (
+    "alfresco_auth_models",
+    "alfresco_core_models",
+    "alfresco_discovery_models",
+    "alfresco_search_models",
+    "alfresco_workflow_models",
+    "alfresco_model_models",
+    "alfresco_search_sql_models",
+)
+
+LAZY_ACCESSORS = '''
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+'''
+
+
+def _mapping(modules: Dict[str, str]) -> str:
+    lines = "".join(f'    "{name}": "{module}",\n' for name, module in modules.items())
+    return "_MODULES = {\n" + lines + "}\n"
+
+
+def _names(names: Sequence[str], indent: str = "    ") -> str:
+    return "".join(f'{indent}"{name}",\n' for name in names)
+
+
+def render_raw_models_init(source: str) -> str:
+    """Rewrite an openapi-python-client models/__init__.py as a lazy package."""
+    tree = ast.parse(source)
+    docstring = ast.get_docstring(tree) or "Contains all the data models used in inputs/outputs"
+    modules: Dict[str, str] = {}
+    exports: List[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module:
+            for alias in node.names:
+                modules[alias.asname or alias.name] = node.module
+        elif isinstance(node, ast.Assign) and any(getattr(target, "id", None) == "__all__" for target in node.targets):
+            exports = list(ast.literal_eval(node.value))
+    exports = exports or list(modules)
+
+    type_checking = "".join(f"    from .{module} import {name}\n" for name, module in modules.items())
+    return (
+        f'"""{docstring}"""\n\n'
+        "import importlib\n"
+        "from typing import TYPE_CHECKING\n\n"
+        "if TYPE_CHECKING:\n"
+        f"{type_checking}\n"
+        "# Model modules are imported on first attribute access (PEP 562)\n"
+        f"{_mapping(modules)}\n"
+        f"__all__ = (\n{_names(exports)})\n"
+        f"{LAZY_ACCESSORS}"
+    )
+
+
+def render_pydantic_models_init(models_dir: Path) -> str:
+    """Render the Pydantic models/__init__.py exporting every generated class lazily."""
+    modules: Dict[str, str] = {}
+    present = []
+    for module in PYDANTIC_MODEL_FILES:
+        path = models_dir / f"{module}.py"
+        if not path.exists():
+            continue
+        present.append(module)
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and not node.name.startswith("_"):
+                # Re-insert so the last API file wins and ordering follows it
+                modules.pop(node.name, None)
+                modules[node.name] = module
+
+    type_checking = "".join(f"    from .{module} import *\n" for module in present)
+    return (
+        '"""\n'
+        "Pydantic v2 Models for Alfresco APIs\n\n"
+        "Auto-generated models perfect for:\n"
+        "- LLM tool interfaces\n"
+        "- MCP server implementations\n"
+        "- Type-safe API interactions\n"
+        "- Data validation and serialization\n\n"
+        "Each API's model file is imported on first access to one of its classes\n"
+        "(PEP 562), so `from python_alfresco_api.models import TicketBody` loads\n"
+        "alfresco_auth_models only. Names defined by several API files resolve to\n"
+        "the last one in auth, core, discovery, search, workflow, model, search_sql\n"
+        "order.\n"
+        '"""\n\n'
+        "import importlib\n"
+        "from typing import TYPE_CHECKING\n\n"
+        "if TYPE_CHECKING:\n"
+        f"{type_checking}\n"
+        f"{_mapping(modules)}\n"
+        "__all__ = list(_MODULES)\n"
+        f"{LAZY_ACCESSORS}"
+    )
+
+
+def make_raw_models_lazy(package_dir: Path) -> bool:
+    """Rewrite <package_dir>/models/__init__.py in place; False if absent."""
+    init_file = package_dir / "models" / "__init__.py"
+    if not init_file.exists():
+        return False
+    source = init_file.read_text(encoding="utf-8")
+    if "def __getattr__" in source:
+        return True
+    init_file.write_text(render_raw_models_init(source), encoding="utf-8")
+    return True
+
+
+def make_pydantic_models_lazy(models_dir: Path) -> None:
+    """Write <models_dir>/__init__.py."""
+    (models_dir / "__init__.py").write_text(render_pydantic_models_init(models_dir), encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate lazy (PEP 562) models/__init__.py files")
+    parser.add_argument("--api", default=None, help="Only this raw client (core, auth, ...); default: all")
+    parser.add_argument("--project-root", default=".", help="Project root directory")
+    args = parser.parse_args()
+
+    package = Path(args.project_root) / "python_alfresco_api"
+    raw_dirs = sorted((package / "raw_clients").glob("alfresco_*_client/*_client"))
+    if args.api:
+        raw_dirs = [path for path in raw_dirs if path.name == f"{args.api}_client"]
+    for package_dir in raw_dirs:
+        if make_raw_models_lazy(package_dir):
+            print(f"   lazy: {package_dir.relative_to(package)}/models/__init__.py")
+    if not args.api:
+        make_pydantic_models_lazy(package / "models")
+        print("   lazy: models/__init__.py")
+
+
+if __name__ == "__main__":
+    main()
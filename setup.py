@@ -34,6 +34,7 @@ extras_require = {
     'performance': [
         'ujson>=5.7.0',
         'orjson>=3.8.0',
+        'msgspec>=0.18.0',
     ],
     'oauth': [
         'requests-oauthlib>=1.3.0',
@@ -3,6 +3,7 @@ Pytest configuration and fixtures for Alfresco API testing.
 
 Provides:
 - Mock Alfresco server fixtures
+- ClientFactory instances answered in-process (mock_factory)
 - Test client fixtures
 - Configuration fixtures
 """
@@ -12,6 +13,8 @@ from unittest.mock import Mock, patch
 from typing import Dict, Any
 import asyncio
 
+import httpx
+
 # Test configuration
 TEST_CONFIG = {
     'host': 'http://localhost:8080',
@@ -72,6 +75,37 @@ def mock_alfresco_server():
     
     return mock_server
 
+@pytest.fixture
+def mock_factory():
+    """
+    Build ClientFactory instances whose requests are answered by a handler
+    through httpx.MockTransport, so no live Alfresco server is required.
+
+        factory = mock_factory(handler)                   # handler(request) -> httpx.Response
+        factory = mock_factory(handler, async_handler)    # separate coroutine for async clients
+        factory = mock_factory(handler, ticket_auth=True) # other ClientFactory options
+
+    A sync handler serves the async clients too; a coroutine handler only
+    serves async ones.
+    """
+    from python_alfresco_api import ClientFactory
+
+    def make(handler, async_handler=None, **kwargs):
+        options = {
+            'base_url': TEST_CONFIG['host'],
+            'username': TEST_CONFIG['username'],
+            'password': TEST_CONFIG['password'],
+            'load_env': False,
+        }
+        options.update(kwargs)
+        factory = ClientFactory(**options)
+        factory.transport.use_transport(
+            httpx.MockTransport(handler),
+            httpx.MockTransport(async_handler) if async_handler is not None else None
+        )
+        return factory
+    return make
+
 @pytest.fixture
 def test_client_config():
     """Test client configuration."""
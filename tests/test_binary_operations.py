@@ -0,0 +1,165 @@
+"""
+Tests for the generated streaming raw operations of binary endpoints
+(node content, renditions, version content, shared link content, avatars).
+"""
+
+import datetime
+import importlib
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add the project root to the path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts" / "code-gen"))
+
+from generate_binary_operations import BinaryOperationGenerator
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client import (
+    AuthenticatedClient,
+    errors,
+)
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.api.nodes import (
+    get_node_content,
+)
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.api.people import (
+    get_avatar_image,
+)
+
+CORE_PACKAGE = (
+    PROJECT_ROOT / "python_alfresco_api" / "raw_clients" / "alfresco_core_client" / "core_client"
+)
+CORE_SPEC = PROJECT_ROOT / "openapi" / "openapi3" / "alfresco-core.yaml"
+BLOCK = bytes(range(256)) * 64
+
+BINARY_MODULES = [
+    "nodes.get_node_content",
+    "renditions.get_rendition_content",
+    "versions.get_version_content",
+    "versions.get_version_rendition_content",
+    "shared_links.get_shared_link_content",
+    "shared_links.get_shared_link_rendition_content",
+    "people.get_avatar_image",
+    "trashcan.get_deleted_node_content",
+    "trashcan.get_archived_node_rendition_content",
+]
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def raw_client(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "missing" in request.url.path:
+            return httpx.Response(404)
+        if "teapot" in request.url.path:
+            return httpx.Response(418, content=b"unexpected")
+
+        def body():
+            for _ in range(4):
+                yield BLOCK
+        return httpx.Response(200, headers={"Content-Type": "image/png"}, content=body())
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        async def body():
+            for _ in range(4):
+                yield BLOCK
+        return httpx.Response(200, headers={"Content-Type": "image/png"}, content=body())
+
+    return AuthenticatedClient(
+        base_url="http://localhost:8080/alfresco/api/-default-/public/alfresco/versions/1",
+        token="dGVzdA==",
+        prefix="Basic",
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    ).set_async_httpx_client(
+        httpx.AsyncClient(
+            base_url="http://localhost:8080/alfresco/api/-default-/public/alfresco/versions/1",
+            transport=httpx.MockTransport(async_handler),
+        )
+    )
+
+
+class TestGeneratedModules:
+    """Test that the codegen step emits every binary operation."""
+
+    @pytest.mark.parametrize("module", BINARY_MODULES)
+    def test_module_has_all_variants(self, module):
+        operation = importlib.import_module(
+            f"python_alfresco_api.raw_clients.alfresco_core_client.core_client.api.{module}"
+        )
+        for name in ("sync", "sync_detailed", "asyncio", "asyncio_detailed"):
+            assert callable(getattr(operation, name))
+
+    def test_generated_code_is_up_to_date(self, tmp_path):
+        written = BinaryOperationGenerator(CORE_SPEC, tmp_path).generate()
+
+        assert len(written) == len(BINARY_MODULES)
+        assert (tmp_path / "streaming.py").read_text() == (
+            CORE_PACKAGE / "streaming.py"
+        ).read_text()
+        for module in written:
+            relative = module.relative_to(tmp_path)
+            assert module.read_text() == (CORE_PACKAGE / relative).read_text(), relative
+
+
+class TestStreamingOperations:
+    """Test request building and streamed responses."""
+
+    def test_sync_detailed_streams_body(self, raw_client, requests):
+        with get_node_content.sync_detailed(
+            "file-1", client=raw_client, attachment=False
+        ) as response:
+            assert response.status_code == 200
+            assert response.content_type == "image/png"
+            assert not response.response.is_stream_consumed
+            chunks = list(response.iter_bytes(chunk_size=4096))
+
+        assert b"".join(chunks) == BLOCK * 4
+        assert all(len(chunk) <= 4096 for chunk in chunks)
+        assert requests[0].url.path.endswith("/nodes/file-1/content")
+        assert requests[0].url.params["attachment"] == "false"
+
+    def test_sync_returns_iterator(self, raw_client):
+        chunks = get_node_content.sync("file-1", client=raw_client)
+        assert b"".join(chunks) == BLOCK * 4
+
+    def test_headers_are_sent(self, raw_client, requests):
+        since = datetime.datetime(2024, 3, 1, 12, 30, tzinfo=datetime.timezone.utc)
+        get_node_content.sync_detailed(
+            "file-1", client=raw_client, if_modified_since=since, range_="bytes=0-99"
+        ).close()
+
+        assert requests[0].headers["If-Modified-Since"] == "Fri, 01 Mar 2024 12:30:00 GMT"
+        assert requests[0].headers["Range"] == "bytes=0-99"
+
+    def test_documented_error_returns_none(self, raw_client):
+        assert get_avatar_image.sync("missing", client=raw_client) is None
+        with get_avatar_image.sync_detailed("missing", client=raw_client) as response:
+            assert response.status_code == 404
+            assert not response.is_success
+
+    def test_unexpected_status_raises(self, raw_client):
+        raw_client.raise_on_unexpected_status = True
+        with pytest.raises(errors.UnexpectedStatus) as exc_info:
+            get_node_content.sync_detailed("teapot", client=raw_client)
+        assert exc_info.value.content == b"unexpected"
+
+    @pytest.mark.asyncio
+    async def test_asyncio_variants(self, raw_client, requests):
+        async with await get_avatar_image.asyncio_detailed("admin", client=raw_client) as response:
+            assert response.status_code == 200
+            data = b"".join([chunk async for chunk in response.aiter_bytes()])
+        assert data == BLOCK * 4
+        assert requests[0].url.params["placeholder"] == "true"
+
+        chunks = await get_node_content.asyncio("file-1", client=raw_client, chunk_size=1000)
+        data = b"".join([chunk async for chunk in chunks])
+        assert data == BLOCK * 4
@@ -0,0 +1,280 @@
+"""
+Tests for the disk content cache (clients/core/content/cache.py): conditional
+GETs with the stored ETag / Last-Modified, 304s served from disk, LRU
+eviction by size.
+"""
+
+import asyncio
+import io
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.client_factory import ClientFactory
+from python_alfresco_api.clients.core.content import ContentCache, cache_key
+from python_alfresco_api.utils import content_utils
+
+LAST_MODIFIED = "Thu, 01 Feb 2024 10:00:00 GMT"
+CORE_URL = "http://localhost:8080/alfresco/api/-default-/public/alfresco/versions/1/"
+
+
+def _key(node_id):
+    return cache_key(CORE_URL, node_id)
+
+
+@pytest.fixture
+def server():
+    """Mock server state: requests seen and the current body / ETag per node."""
+    return {
+        "requests": [],
+        "files": {
+            "file-1": (b"%PDF-1.7 first version" * 100, '"v1"'),
+            "file-2": (b"x" * 1000, '"w1"'),
+        },
+        "validators": True,
+    }
+
+
+def _respond(server, request: httpx.Request) -> httpx.Response:
+    server["requests"].append(request)
+    node_id = request.url.path.split("/nodes/")[1].split("/")[0]
+    if node_id not in server["files"]:
+        return httpx.Response(404, json={"error": {"statusCode": 404}})
+    body, etag = server["files"][node_id]
+    headers = {"Content-Type": "application/pdf"}
+    if server["validators"]:
+        headers.update({"ETag": etag, "Last-Modified": LAST_MODIFIED})
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=headers)
+    headers["Content-Length"] = str(len(body))
+    return httpx.Response(200, headers=headers, content=body)
+
+
+@pytest.fixture
+def make_client(server, tmp_path, mock_factory):
+    def make(**kwargs):
+        kwargs.setdefault("content_cache", ContentCache(tmp_path / "cache"))
+        return mock_factory(
+            lambda request: _respond(server, request), **kwargs
+        ).create_core_client()
+    return make
+
+
+class TestDownloadFile:
+    """Test ContentClient.download_file() through the cache."""
+
+    def test_second_download_revalidated(self, make_client, server, tmp_path):
+        content = make_client().content
+
+        first = content.download_file("file-1", tmp_path / "a.pdf")
+        second = content.download_file("file-1", tmp_path / "b.pdf")
+
+        assert not first.from_cache
+        assert second.from_cache
+        assert (tmp_path / "b.pdf").read_bytes() == server["files"]["file-1"][0]
+        assert second.file_size == len(server["files"]["file-1"][0])
+        assert second.content_type == "application/pdf"
+        conditional = server["requests"][1].headers
+        assert conditional["If-None-Match"] == '"v1"'
+        assert conditional["If-Modified-Since"] == LAST_MODIFIED
+
+        stats = content.cache.stats()
+        assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_changed_content_replaced(self, make_client, server, tmp_path):
+        content = make_client().content
+        content.download_file("file-1", tmp_path / "a.pdf")
+        server["files"]["file-1"] = (b"second version", '"v2"')
+
+        result = content.download_file("file-1", tmp_path / "b.pdf")
+        assert not result.from_cache
+        assert (tmp_path / "b.pdf").read_bytes() == b"second version"
+
+        result = content.download_file("file-1", tmp_path / "c.pdf")
+        assert result.from_cache
+        assert (tmp_path / "c.pdf").read_bytes() == b"second version"
+
+    def test_sink_and_progress(self, make_client, server, tmp_path):
+        content = make_client().content
+        content.download_file("file-1", tmp_path / "a.pdf")
+        progress = []
+        sink = io.BytesIO()
+
+        result = content.download_file(
+            "file-1",
+            sink,
+            chunk_size=500,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert result.from_cache
+        assert sink.getvalue() == server["files"]["file-1"][0]
+        assert progress[-1] == (2200, 2200)
+        assert len(progress) == 5
+
+    def test_sendfile_fallback(self, make_client, server, tmp_path, monkeypatch):
+        content = make_client().content
+        content.download_file("file-1", tmp_path / "a.pdf")
+
+        def unsupported(*args):
+            raise OSError("sendfile not supported")
+
+        monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+        assert content.download_file("file-1", tmp_path / "b.pdf").from_cache
+        assert (tmp_path / "b.pdf").read_bytes() == server["files"]["file-1"][0]
+
+    def test_without_validators_not_stored(self, make_client, server, tmp_path):
+        server["validators"] = False
+        content = make_client().content
+
+        content.download_file("file-1", tmp_path / "a.pdf")
+        content.download_file("file-1", tmp_path / "b.pdf")
+
+        assert "If-None-Match" not in server["requests"][1].headers
+        assert content.cache.stats().stores == 0
+
+    def test_resume_bypasses_cache(self, make_client, server, tmp_path):
+        content = make_client().content
+        content.download_file("file-1", tmp_path / "a.pdf")
+
+        content.download_file("file-1", tmp_path / "b.pdf", resume=True)
+
+        assert "If-None-Match" not in server["requests"][1].headers
+
+    def test_error_not_stored(self, make_client, server, tmp_path):
+        content = make_client().content
+
+        with pytest.raises(httpx.HTTPStatusError):
+            content.download_file("missing", tmp_path / "a.pdf")
+        assert content.cache.stats().stores == 0
+
+    def test_async(self, make_client, server, tmp_path):
+        content = make_client().content
+
+        async def run():
+            await content.download_file_async("file-1", tmp_path / "a.pdf")
+            to_path = await content.download_file_async("file-1", tmp_path / "b.pdf")
+            sink = io.BytesIO()
+            to_sink = await content.download_file_async("file-1", sink)
+            return to_path, to_sink, sink
+
+        to_path, to_sink, sink = asyncio.run(run())
+        assert to_path.from_cache and to_sink.from_cache
+        assert (tmp_path / "b.pdf").read_bytes() == sink.getvalue() == server["files"]["file-1"][0]
+        assert len(server["requests"]) == 3
+
+    def test_shared_across_processes(self, make_client, server, tmp_path):
+        make_client().content.download_file("file-1", tmp_path / "a.pdf")
+
+        # A new cache on the same directory (e.g. another worker)
+        content = make_client(content_cache=tmp_path / "cache").content
+        assert content.download_file("file-1", tmp_path / "b.pdf").from_cache
+
+    def test_keyed_by_server(self, make_client, server, tmp_path):
+        cache = ContentCache(tmp_path / "cache")
+        make_client(content_cache=cache).content.download_file("file-1", tmp_path / "a.pdf")
+
+        # Same node id on another repository
+        other = make_client(base_url="http://other:8080", content_cache=cache).content
+        assert not other.download_file("file-1", tmp_path / "b.pdf").from_cache
+        assert "If-None-Match" not in server["requests"][1].headers
+        assert cache.open(
+            cache_key(
+                "http://other:8080/alfresco/api/-default-/public/alfresco/versions/1/", "file-1"
+            )
+        )
+
+    def test_disabled_by_default(self, server, tmp_path):
+        factory = ClientFactory(
+            base_url="http://localhost:8080", username="admin", password="admin", load_env=False
+        )
+
+        assert factory.create_core_client().content.cache is None
+        assert factory.get_config_info()["content_cache"] is None
+
+
+class TestContentUtils:
+    """Test utils.content_utils.download_file() through the factory's cache."""
+
+    def test_download_to_memory_and_path(self, make_client, server, tmp_path):
+        core = make_client()
+
+        assert content_utils.download_file(core, "file-1") == server["files"]["file-1"][0]
+        path = content_utils.download_file(core, "file-1", tmp_path / "a.pdf")
+
+        assert (tmp_path / "a.pdf").read_bytes() == server["files"]["file-1"][0]
+        assert path == str(tmp_path / "a.pdf")
+        assert server["requests"][1].headers["If-None-Match"] == '"v1"'
+        assert core.content.cache.stats().hits == 1
+
+
+class TestEviction:
+    """Test the size bound."""
+
+    def test_least_recently_used_evicted(self, make_client, server, tmp_path):
+        server["files"]["file-3"] = (b"y" * 1000, '"z1"')
+        cache = ContentCache(tmp_path / "cache", max_size=2500)
+        content = make_client(content_cache=cache).content
+
+        content.download_file("file-2", tmp_path / "2")
+        os.utime(cache._path(_key("file-2")), (1, 1))
+        content.download_file("file-1", tmp_path / "1")
+
+        # file-1 (2200 bytes) + file-2 > 2500: file-2 went
+        assert cache.open(_key("file-2")) is None
+        with cache.open(_key("file-1")) as entry:
+            assert entry.size == 2200
+        assert cache.stats().evictions == 1
+        assert cache.stats().size <= 2500
+
+    def test_replaced_entry_counted_once(self, make_client, server, tmp_path):
+        cache = ContentCache(tmp_path / "cache", max_size=100_000)
+        content = make_client(content_cache=cache).content
+        content.download_file("file-1", tmp_path / "1")
+        size = cache.stats().size
+
+        server["files"]["file-1"] = (b"z" * 2200, '"v2"')
+        content.download_file("file-1", tmp_path / "2")
+        server["files"]["file-1"] = (b"z" * 2200, '"v3"')
+        content.download_file("file-1", tmp_path / "3")
+
+        assert cache.stats().size == size
+        assert cache.stats().evictions == 0
+
+    def test_too_large_not_stored(self, make_client, server, tmp_path):
+        cache = ContentCache(tmp_path / "cache", max_size=1024)
+        content = make_client(content_cache=cache).content
+
+        content.download_file("file-1", tmp_path / "1")
+
+        assert cache.open(_key("file-1")) is None
+        assert not (tmp_path / "cache").exists()
+
+    def test_unknown_length_dropped_past_max_size(self, tmp_path):
+        cache = ContentCache(tmp_path / "cache", max_size=1024)
+        pending = cache.begin("file-1", {"ETag": '"v1"'})
+
+        pending.write(b"x" * 1000)
+        pending.write(b"x" * 1000)
+        pending.commit()
+
+        assert cache.open(_key("file-1")) is None
+        assert list((tmp_path / "cache").iterdir()) == []
+
+    def test_invalidate_and_clear(self, make_client, server, tmp_path):
+        cache = ContentCache(tmp_path / "cache")
+        content = make_client(content_cache=cache).content
+        content.download_file("file-1", tmp_path / "1")
+        content.download_file("file-2", tmp_path / "2")
+
+        assert cache.invalidate(_key("file-1"))
+        assert not cache.invalidate(_key("file-1"))
+        cache.clear()
+        assert cache.open(_key("file-2")) is None
+        assert cache.stats().size == 0
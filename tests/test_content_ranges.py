@@ -0,0 +1,249 @@
+"""
+Tests for HTTP Range downloads: resume from a partial file and concurrent
+segmented downloads.
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.clients.core.content import download_content_segmented_async
+from python_alfresco_api.utils import content_utils
+
+CONTENT = os.urandom(300_000)
+
+
+def _parse_range(value: str, total: int):
+    start, _, end = value.replace("bytes=", "").partition("-")
+    return int(start), min(int(end) if end else total - 1, total - 1)
+
+
+class RangeServer:
+    """Serves CONTENT honouring Range headers, with optional failures."""
+
+    def __init__(self):
+        self.ranges = True
+        self.drop_once = set()  # range starts whose first response drops mid-stream
+        self.requests = []
+
+    def _reply(self, request: httpx.Request, stream_factory):
+        self.requests.append(request.headers.get("Range"))
+        total = len(CONTENT)
+        value = request.headers.get("Range")
+        if not value or not self.ranges:
+            return httpx.Response(
+                200, headers={"Content-Length": str(total)}, content=stream_factory(CONTENT, False)
+            )
+        start, end = _parse_range(value, total)
+        if start >= total:
+            return httpx.Response(416, headers={"Content-Range": f"bytes */{total}"})
+        drop = start in self.drop_once and end - start > 1
+        self.drop_once.discard(start)
+        headers = {
+            "Content-Range": f"bytes {start}-{end}/{total}",
+            "Content-Length": str(end - start + 1),
+            "Content-Type": "application/zip"
+        }
+        return httpx.Response(
+            206, headers=headers, content=stream_factory(CONTENT[start : end + 1], drop)
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        def stream(data, drop):
+            yield data[:len(data) // 2]
+            if drop:
+                raise httpx.ReadError("connection reset")
+            yield data[len(data) // 2:]
+        return self._reply(request, stream)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        async def stream(data, drop):
+            yield data[:len(data) // 2]
+            if drop:
+                raise httpx.ReadError("connection reset")
+            yield data[len(data) // 2:]
+        return self._reply(request, stream)
+
+
+@pytest.fixture
+def server():
+    return RangeServer()
+
+
+@pytest.fixture
+def core_client(server, mock_factory):
+    return mock_factory(server.handler, server.async_handler).create_core_client()
+
+
+class TestResume:
+    """Test resuming a partial download."""
+
+    def test_resume_appends_missing_bytes(self, core_client, server, tmp_path):
+        target = tmp_path / "archive.zip"
+        target.write_bytes(CONTENT[:100_000])
+        progress = []
+
+        result = core_client.content.download_file(
+            "file-1",
+            target,
+            resume=True,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert server.requests == ["bytes=100000-"]
+        assert target.read_bytes() == CONTENT
+        assert result.resumed_from == 100_000
+        assert result.file_size == len(CONTENT)
+        assert progress[-1] == (len(CONTENT), len(CONTENT))
+
+    def test_resume_complete_file(self, core_client, tmp_path):
+        target = tmp_path / "archive.zip"
+        target.write_bytes(CONTENT)
+
+        result = core_client.content.download_file("file-1", target, resume=True)
+
+        assert target.read_bytes() == CONTENT
+        assert result.file_size == len(CONTENT)
+
+    def test_resume_without_range_support_restarts(self, core_client, server, tmp_path):
+        server.ranges = False
+        target = tmp_path / "archive.zip"
+        target.write_bytes(b"stale partial data")
+
+        result = content_utils.download_file(core_client, "file-1", target, resume=True)
+
+        assert result == str(target)
+        assert target.read_bytes() == CONTENT
+
+    def test_no_range_without_resume(self, core_client, server, tmp_path):
+        target = tmp_path / "archive.zip"
+        target.write_bytes(CONTENT[:10])
+
+        core_client.content.download_file("file-1", target)
+
+        assert server.requests == [None]
+        assert target.read_bytes() == CONTENT
+
+    @pytest.mark.asyncio
+    async def test_resume_async(self, core_client, server, tmp_path):
+        target = tmp_path / "archive.zip"
+        target.write_bytes(CONTENT[:250_000])
+
+        result = await core_client.content.download_file_async("file-1", target, resume=True)
+
+        assert server.requests == ["bytes=250000-"]
+        assert target.read_bytes() == CONTENT
+        assert result.resumed_from == 250_000
+
+
+class TestSegmented:
+    """Test concurrent segmented downloads."""
+
+    @pytest.mark.asyncio
+    async def test_segments_written_at_offsets(self, core_client, server, tmp_path):
+        target = tmp_path / "out" / "archive.zip"
+        progress = []
+
+        result = await core_client.content.download_file_async(
+            "file-1", target, segments=4, chunk_size=50_000,
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        assert target.read_bytes() == CONTENT
+        assert result.file_size == len(CONTENT)
+        assert result.content_type == "application/zip"
+        assert server.requests[0] == "bytes=0-0"
+        assert sorted(server.requests[1:]) == sorted([
+            "bytes=0-74999", "bytes=75000-149999", "bytes=150000-224999", "bytes=225000-299999"
+        ])
+        assert progress[-1] == (len(CONTENT), len(CONTENT))
+
+    @pytest.mark.asyncio
+    async def test_segment_retries_from_last_byte(self, core_client, server, tmp_path):
+        target = tmp_path / "archive.zip"
+        server.drop_once = {150_000}
+
+        await download_content_segmented_async(
+            core_client, "file-1", target, segments=2, chunk_size=10_000
+        )
+
+        assert target.read_bytes() == CONTENT
+        # Half the segment (75000 bytes) arrived; the 7 full chunks written are not re-fetched
+        assert server.requests[-1] == "bytes=220000-299999"
+
+    @pytest.mark.asyncio
+    async def test_segment_gives_up_after_max_retries(self, core_client, server, tmp_path):
+        target = tmp_path / "archive.zip"
+        original = server._reply
+
+        def always_drop(request, stream_factory):
+            if request.headers.get("Range") != "bytes=0-0":
+                server.drop_once.add(_parse_range(request.headers["Range"], len(CONTENT))[0])
+            return original(request, stream_factory)
+
+        server._reply = always_drop
+        with pytest.raises(httpx.ReadError):
+            await download_content_segmented_async(
+                core_client, "file-1", target, segments=1, max_retries=2
+            )
+        assert len(server.requests) == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_segment_stops_the_others(self, mock_factory, tmp_path):
+        closed = []
+
+        async def stalled(data):
+            try:
+                yield data[:1000]
+                await asyncio.sleep(30)
+                yield data[1000:]
+            finally:
+                closed.append(True)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            start, end = _parse_range(request.headers["Range"], len(CONTENT))
+            if request.headers["Range"] == "bytes=0-0":
+                return httpx.Response(206, headers={"Content-Range": f"bytes 0-0/{len(CONTENT)}"})
+            if start == 0:
+                await asyncio.sleep(0.05)  # let the other segments start writing
+                return httpx.Response(500, json={"error": {"statusCode": 500}})
+            headers = {"Content-Range": f"bytes {start}-{end}/{len(CONTENT)}"}
+            return httpx.Response(206, headers=headers, content=stalled(CONTENT[start:end + 1]))
+
+        client = mock_factory(handler, handler).create_core_client()
+        with pytest.raises(httpx.HTTPStatusError):
+            await asyncio.wait_for(
+                download_content_segmented_async(
+                    client, "file-1", tmp_path / "archive.zip", segments=4, chunk_size=1000
+                ),
+                timeout=5,
+            )
+
+        # The other three segments were cancelled (and their streams closed) first
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        assert len(closed) == 3
+
+    @pytest.mark.asyncio
+    async def test_small_file_uses_one_segment(self, core_client, server, tmp_path):
+        target = tmp_path / "archive.zip"
+
+        await download_content_segmented_async(core_client, "file-1", target, segments=8)
+
+        assert server.requests == ["bytes=0-0", "bytes=0-299999"]
+        assert target.read_bytes() == CONTENT
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_range_support(self, core_client, server, tmp_path):
+        server.ranges = False
+        target = tmp_path / "archive.zip"
+
+        result = await download_content_segmented_async(core_client, "file-1", target, segments=4)
+
+        assert target.read_bytes() == CONTENT
+        assert result.file_size == len(CONTENT)
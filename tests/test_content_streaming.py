@@ -0,0 +1,173 @@
+"""
+Tests for streaming content download (ContentClient.download_file and
+utils.content_utils.download_file).
+"""
+
+import io
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.clients.core.content import iter_content, aiter_content
+from python_alfresco_api.utils import content_utils
+
+CONTENT_URL = "http://localhost:8080/alfresco/api/-default-/public/alfresco/versions/1/nodes/file-1/content"
+BLOCK = bytes(range(256)) * 256  # 64 KiB
+SINCE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _body_size(blocks: int) -> int:
+    return len(BLOCK) * blocks
+
+
+def _sync_body(blocks: int):
+    for _ in range(blocks):
+        yield BLOCK
+
+
+async def _async_body(blocks: int):
+    for _ in range(blocks):
+        yield BLOCK
+
+
+@pytest.fixture
+def core_client(mock_factory):
+    blocks = {"count": 16}
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if str(request.url).split("?")[0] != CONTENT_URL:
+            return httpx.Response(404, json={"error": {"statusCode": 404}})
+        if "If-Modified-Since" in request.headers:
+            return httpx.Response(304)
+        headers = {
+            "Content-Type": "application/pdf",
+            "Content-Length": str(_body_size(blocks["count"])),
+        }
+        return httpx.Response(200, headers=headers, content=_sync_body(blocks["count"]))
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "If-Modified-Since" in request.headers:
+            return httpx.Response(304)
+        headers = {
+            "Content-Type": "application/pdf",
+            "Content-Length": str(_body_size(blocks["count"])),
+        }
+        return httpx.Response(200, headers=headers, content=_async_body(blocks["count"]))
+
+    client = mock_factory(handler, async_handler).create_core_client()
+    client.test_blocks = blocks
+    client.test_requests = requests
+    return client
+
+
+class TestStreamingDownload:
+    """Test that downloads are streamed chunk by chunk."""
+
+    def test_download_file_to_path(self, core_client, tmp_path):
+        target = tmp_path / "out" / "report.pdf"
+        progress = []
+
+        result = core_client.content.download_file(
+            "file-1",
+            target,
+            chunk_size=100_000,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert target.read_bytes() == BLOCK * 16
+        assert result.file_size == _body_size(16)
+        assert result.file_path == str(target)
+        assert result.content_type == "application/pdf"
+        assert progress[-1] == (_body_size(16), _body_size(16))
+        assert all(b - a <= 100_000 for (a, _), (b, _) in zip([(0, 0)] + progress, progress))
+
+    def test_download_file_to_sink(self, core_client):
+        sink = io.BytesIO()
+        result = core_client.content.download_file("file-1", sink)
+        assert sink.getvalue() == BLOCK * 16
+        assert result.file_path is None
+
+    def test_peak_memory_independent_of_size(self, core_client, tmp_path):
+        core_client.test_blocks["count"] = 1024  # 64 MiB
+        tracemalloc.start()
+        try:
+            core_client.content.download_file("file-1", tmp_path / "big.bin", chunk_size=256 * 1024)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert (tmp_path / "big.bin").stat().st_size == _body_size(1024)
+        assert peak < 8 * 1024 * 1024
+
+    def test_error_status_raises(self, core_client, tmp_path):
+        with pytest.raises(httpx.HTTPStatusError):
+            core_client.content.download_file("missing", tmp_path / "x")
+
+    def test_not_modified_since(self, core_client, tmp_path):
+        target = tmp_path / "report.pdf"
+
+        result = core_client.content.download_file("file-1", target, if_modified_since=SINCE)
+
+        assert result.not_modified
+        assert result.file_size == 0
+        assert not target.exists()
+        assert list(iter_content(core_client, "file-1", if_modified_since=SINCE)) == []
+
+    def test_iter_content_chunk_size(self, core_client):
+        chunks = list(iter_content(core_client, "file-1", chunk_size=50_000))
+        assert b"".join(chunks) == BLOCK * 16
+        assert max(len(c) for c in chunks) == 50_000
+
+    def test_attachment_param(self, core_client):
+        content_utils.download_file(core_client, "file-1", as_attachment=True)
+        assert core_client.test_requests[-1].url.params["attachment"] == "true"
+
+    def test_content_utils_download(self, core_client, tmp_path):
+        assert content_utils.download_file(core_client, "file-1") == BLOCK * 16
+
+        path = content_utils.download_file(core_client, "file-1", tmp_path / "u.pdf")
+        assert path == str(tmp_path / "u.pdf")
+        assert (tmp_path / "u.pdf").read_bytes() == BLOCK * 16
+
+    @pytest.mark.asyncio
+    async def test_download_file_async(self, core_client, tmp_path):
+        progress = []
+
+        async def on_progress(done, total):
+            progress.append(done)
+
+        result = await core_client.content.download_file_async(
+            "file-1", tmp_path / "a.pdf", progress_callback=on_progress
+        )
+
+        assert (tmp_path / "a.pdf").read_bytes() == BLOCK * 16
+        assert result.file_size == _body_size(16)
+        assert progress[-1] == _body_size(16)
+
+    @pytest.mark.asyncio
+    async def test_aiter_content(self, core_client):
+        chunks = [chunk async for chunk in aiter_content(core_client, "file-1", chunk_size=65536)]
+        assert b"".join(chunks) == BLOCK * 16
+
+    @pytest.mark.asyncio
+    async def test_not_modified_since_async(self, core_client, tmp_path):
+        target = tmp_path / "report.pdf"
+
+        result = await core_client.content.download_file_async(
+            "file-1", target, if_modified_since=SINCE
+        )
+
+        assert result.not_modified
+        assert not target.exists()
+        chunks = [c async for c in aiter_content(core_client, "file-1", if_modified_since=SINCE)]
+        assert chunks == []
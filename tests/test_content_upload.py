@@ -0,0 +1,386 @@
+"""
+Tests for streaming content upload (ContentClient.upload_file / update_content
+and utils.content_utils).
+"""
+
+import base64
+import hashlib
+import io
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.client_factory import ClientFactory
+from python_alfresco_api.clients.core.content import (
+    upload_content_async, upload_content_detailed, replace_content_async, replace_content_detailed
+)
+from python_alfresco_api.utils import content_utils
+
+API_URL = "http://localhost:8080/alfresco/api/-default-/public/alfresco/versions/1"
+BLOCK = bytes(range(256)) * 256  # 64 KiB
+
+
+def _entry(name: str) -> dict:
+    return {
+        "entry": {
+            "id": "node-1",
+            "name": name,
+            "nodeType": "cm:content",
+            "isFile": True,
+            "isFolder": False,
+            "createdAt": "2024-01-01T00:00:00.000+0000",
+            "modifiedAt": "2024-01-01T00:00:00.000+0000"
+        }
+    }
+
+
+def _multipart_file(request: httpx.Request, body: bytes) -> bytes:
+    """Extract the filedata part from a multipart body."""
+    boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+    for part in body.split(b"--" + boundary):
+        if b'name="filedata"' in part:
+            return part.split(b"\r\n\r\n", 1)[1][:-2]
+    raise AssertionError("no filedata part")
+
+
+class StreamingMockTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Like httpx.MockTransport, but does not read() the request body first."""
+
+    def __init__(self, handler, async_handler):
+        self.handler = handler
+        self.async_handler = async_handler
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.handler(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.async_handler(request)
+
+
+@pytest.fixture
+def core_client():
+    received = {}
+
+    def record(request: httpx.Request, size: int, digest: str, body: bytes) -> httpx.Response:
+        received.update(request=request, size=size, sha256=digest, body=body)
+        if "status" in received:
+            return httpx.Response(
+                received["status"], json={"error": {"statusCode": received["status"]}}
+            )
+        name = request.url.params.get("name") or "uploaded"
+        if b'name="name"' in body:
+            name = body.split(b'name="name"\r\n\r\n', 1)[1].split(b"\r\n", 1)[0].decode()
+        return httpx.Response(201 if request.method == "POST" else 200, json=_entry(name))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Consume the streamed body without keeping it when it is large
+        hasher, size, kept = hashlib.sha256(), 0, []
+        for chunk in request.stream:
+            hasher.update(chunk)
+            size += len(chunk)
+            if size <= 1024 * 1024:
+                kept.append(chunk)
+        return record(request, size, hasher.hexdigest(), b"".join(kept))
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        hasher, size, kept = hashlib.sha256(), 0, []
+        async for chunk in request.stream:
+            hasher.update(chunk)
+            size += len(chunk)
+            if size <= 1024 * 1024:
+                kept.append(chunk)
+        return record(request, size, hasher.hexdigest(), b"".join(kept))
+
+    factory = ClientFactory(
+        base_url="http://localhost:8080", username="admin", password="admin", load_env=False
+    )
+    factory.transport.use_transport(StreamingMockTransport(handler, async_handler))
+    client = factory.create_core_client()
+    client.test_received = received
+    return client
+
+
+class TestStreamingUpload:
+    """Test that uploads are streamed chunk by chunk."""
+
+    def test_upload_file_multipart(self, core_client, tmp_path):
+        source = tmp_path / "report.pdf"
+        source.write_bytes(BLOCK * 4)
+        progress = []
+
+        result = core_client.content.upload_file(
+            source,
+            parent_id="folder-1",
+            properties={"cm:title": "Q4"},
+            chunk_size=100_000,
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        request = core_client.test_received["request"]
+        body = core_client.test_received["body"]
+        assert request.method == "POST"
+        assert str(request.url) == f"{API_URL}/nodes/folder-1/children"
+        assert request.headers["Content-Length"] == str(len(body))
+        assert "transfer-encoding" not in request.headers
+        assert _multipart_file(request, body) == BLOCK * 4
+        assert b'name="cm:title"\r\n\r\nQ4' in body
+        assert b'name="autoRename"\r\n\r\ntrue' in body
+        assert b"Content-Type: application/pdf" in body
+
+        assert result.entry.name == "report.pdf"
+        assert result.file_size == len(BLOCK) * 4
+        assert result.checksum == hashlib.sha256(BLOCK * 4).hexdigest()
+        assert progress[-1] == (len(BLOCK) * 4, len(BLOCK) * 4)
+        assert all(done <= 100_000 * (i + 1) for i, (done, _) in enumerate(progress))
+
+    def test_update_content_put(self, core_client):
+        result = core_client.content.update_content(
+            "node-1", io.BytesIO(BLOCK), major_version=True, comment="v2", name="new.txt"
+        )
+
+        request = core_client.test_received["request"]
+        assert request.method == "PUT"
+        assert request.url.path.endswith("/nodes/node-1/content")
+        assert request.url.params["majorVersion"] == "true"
+        assert request.url.params["comment"] == "v2"
+        assert request.headers["Content-Type"] == "text/plain"
+        assert core_client.test_received["body"] == BLOCK
+        assert result.checksum == hashlib.sha256(BLOCK).hexdigest()
+        assert result.file_size == len(BLOCK)
+
+    def test_checksum_algorithm_and_disabled(self, core_client):
+        result = core_client.content.update_content("node-1", io.BytesIO(BLOCK), checksum="md5")
+        assert result.checksum == hashlib.md5(BLOCK).hexdigest()
+
+        result = core_client.content.update_content("node-1", io.BytesIO(BLOCK), checksum=None)
+        assert result.checksum is None
+
+    def test_large_upload_memory_is_bounded(self, core_client, tmp_path):
+        source = tmp_path / "big.bin"
+        with open(source, "wb") as f:
+            for _ in range(1024):  # 64 MiB
+                f.write(BLOCK)
+
+        tracemalloc.start()
+        try:
+            result = core_client.content.update_content("node-1", source)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert core_client.test_received["size"] == len(BLOCK) * 1024
+        assert result.file_size == len(BLOCK) * 1024
+        assert peak < 8 * 1024 * 1024
+
+    def test_multipart_names_are_escaped(self, core_client):
+        upload_content_detailed(
+            core_client,
+            io.BytesIO(BLOCK),
+            filename='evil"\r\n--x.txt',
+            properties={"cm:title\r\nX-Injected: 1": "title"},
+        )
+
+        request, body = core_client.test_received["request"], core_client.test_received["body"]
+        boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+        # name, nodeType, autoRename, cm:title, filedata (+ preamble and closing delimiter)
+        assert len(body.split(b"--" + boundary)) == 7
+        assert b'name="cm:title%0D%0AX-Injected: 1"\r\n\r\ntitle\r\n' in body
+        assert b'name="filedata"; filename="evil%22%0D%0A--x.txt"\r\n' in body
+        assert _multipart_file(request, body) == BLOCK
+
+    def test_detailed_rejects_unknown_arguments(self, core_client):
+        response = replace_content_detailed(
+            core_client, "node-1", io.BytesIO(BLOCK), major_version=True
+        )
+        assert response.status_code == 200
+        assert core_client.test_received["request"].url.params["majorVersion"] == "true"
+
+        with pytest.raises(TypeError):
+            replace_content_detailed(core_client, "node-1", io.BytesIO(BLOCK), majorVersion=True)
+        with pytest.raises(TypeError):
+            upload_content_detailed(core_client, io.BytesIO(BLOCK), file_name="doc.bin")
+
+    def test_error_status_raises(self, core_client):
+        core_client.test_received["status"] = 409
+        with pytest.raises(httpx.HTTPStatusError):
+            core_client.content.update_content("node-1", io.BytesIO(b"data"))
+
+
+class TestStreamingUploadAsync:
+    """Test async upload sources."""
+
+    @pytest.mark.asyncio
+    async def test_upload_file_async_from_path(self, core_client, tmp_path):
+        source = tmp_path / "notes.txt"
+        source.write_bytes(BLOCK * 2)
+
+        result = await core_client.content.upload_file_async(source, chunk_size=10_000)
+
+        request = core_client.test_received["request"]
+        body = core_client.test_received["body"]
+        assert request.headers["Content-Length"] == str(len(body))
+        assert _multipart_file(request, body) == BLOCK * 2
+        assert result.checksum == hashlib.sha256(BLOCK * 2).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_upload_from_async_iterator(self, core_client):
+        async def chunks():
+            for _ in range(3):
+                yield BLOCK
+
+        progress = []
+
+        async def on_progress(done, total):
+            progress.append((done, total))
+
+        result = await upload_content_async(
+            core_client, chunks(), filename="stream.bin", progress_callback=on_progress
+        )
+
+        request = core_client.test_received["request"]
+        assert request.headers.get("Transfer-Encoding") == "chunked"
+        assert _multipart_file(request, core_client.test_received["body"]) == BLOCK * 3
+        assert result.file_name == "stream.bin"
+        assert result.file_size == len(BLOCK) * 3
+        assert progress[-1] == (len(BLOCK) * 3, None)
+
+    @pytest.mark.asyncio
+    async def test_replace_from_async_reader(self, core_client):
+        class AsyncReader:
+            def __init__(self, data):
+                self.buffer = io.BytesIO(data)
+
+            async def read(self, size):
+                return self.buffer.read(size)
+
+        result = await replace_content_async(
+            core_client, "node-1", AsyncReader(BLOCK), chunk_size=4096
+        )
+
+        assert core_client.test_received["body"] == BLOCK
+        assert result.checksum == hashlib.sha256(BLOCK).hexdigest()
+
+
+class TestAuthRetry:
+    """Test uploads resent by the ticket auth flow after a 401."""
+
+    @pytest.fixture
+    def ticket_client(self, monkeypatch):
+        state = {"issued": 0, "attempts": []}
+
+        def issue():
+            state["issued"] += 1
+            auth_util.ticket = f"TICKET_{state['issued']}"
+            auth_util.ticket_expires = datetime.now() + timedelta(hours=1)
+            auth_util._authenticated = True
+            return True
+
+        def respond(request: httpx.Request, body: bytes) -> httpx.Response:
+            state["attempts"].append(body)
+            expected = base64.b64encode(f"TICKET_{state['issued']}".encode()).decode()
+            if request.headers.get("Authorization") != f"Basic {expected}":
+                return httpx.Response(401, json={})
+            return httpx.Response(200, json=_entry("doc.bin"))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return respond(request, b"".join(request.stream))
+
+        async def async_handler(request: httpx.Request) -> httpx.Response:
+            return respond(request, b"".join([chunk async for chunk in request.stream]))
+
+        factory = ClientFactory(
+            base_url="http://localhost:8080",
+            username="admin",
+            password="admin",
+            load_env=False,
+            ticket_auth=True,
+        )
+        auth_util = factory.auth_flow.auth_util
+        monkeypatch.setattr(auth_util, "authenticate_sync", issue)
+        factory.transport.use_transport(StreamingMockTransport(handler, async_handler))
+        client = factory.create_core_client()
+        issue()
+        # The server dropped the session: the first attempt gets a 401
+        state["issued"] += 1
+        return client, state
+
+    def test_path_resent_after_401(self, ticket_client, tmp_path):
+        client, state = ticket_client
+        source = tmp_path / "doc.bin"
+        source.write_bytes(BLOCK * 3)
+        progress = []
+
+        result = client.content.update_content(
+            "node-1",
+            source,
+            chunk_size=50_000,
+            progress_callback=lambda done, total: progress.append(done),
+        )
+
+        assert state["attempts"] == [BLOCK * 3, BLOCK * 3]
+        assert result.file_size == len(BLOCK) * 3
+        assert result.checksum == hashlib.sha256(BLOCK * 3).hexdigest()
+        assert progress.count(len(BLOCK) * 3) == 2
+
+    def test_file_object_resent_from_its_position(self, ticket_client):
+        client, state = ticket_client
+        source = io.BytesIO(b"header" + BLOCK)
+        source.seek(6)
+
+        result = client.content.update_content("node-1", source)
+
+        assert state["attempts"] == [BLOCK, BLOCK]
+        assert result.checksum == hashlib.sha256(BLOCK).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_async_upload_resent_after_401(self, ticket_client, tmp_path):
+        client, state = ticket_client
+        source = tmp_path / "doc.bin"
+        source.write_bytes(BLOCK * 2)
+
+        result = await client.content.upload_file_async(source, parent_id="folder-1")
+
+        first, second = state["attempts"]
+        assert first == second and BLOCK * 2 in second
+        assert result.file_size == len(BLOCK) * 2
+
+    @pytest.mark.asyncio
+    async def test_async_iterable_not_replayable(self, ticket_client):
+        client, _ = ticket_client
+
+        async def chunks():
+            yield BLOCK
+
+        with pytest.raises(httpx.StreamConsumed):
+            await replace_content_async(client, "node-1", chunks(), name="doc.bin")
+
+
+class TestContentUtilsUpload:
+    """Test utils.content_utils uploads use the streaming path."""
+
+    def test_upload_file_returns_json(self, core_client, tmp_path):
+        source = tmp_path / "data.csv"
+        source.write_bytes(b"a,b\n1,2\n")
+
+        result = content_utils.upload_file(core_client, source, description="Monthly")
+
+        body = core_client.test_received["body"]
+        assert result["entry"]["name"] == "data.csv"
+        assert b'name="cm:description"\r\n\r\nMonthly' in body
+        assert _multipart_file(core_client.test_received["request"], body) == b"a,b\n1,2\n"
+
+    def test_update_content_from_bytes(self, core_client):
+        result = content_utils.update_content(
+            core_client, "node-1", b"new content", filename="doc.txt"
+        )
+
+        assert result["entry"]["id"] == "node-1"
+        assert core_client.test_received["body"] == b"new content"
+        assert core_client.test_received["request"].headers["Content-Type"] == "text/plain"
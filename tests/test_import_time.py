@@ -0,0 +1,109 @@
+"""
+Import-time regression tests for the lazy (PEP 562) package exports.
+
+Each check runs in a fresh interpreter (`python -X importtime`) so modules
+already imported by the test session do not hide eager imports.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Add the project root to the path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+import python_alfresco_api
+from python_alfresco_api import models
+
+# Cumulative microseconds `import python_alfresco_api` may take (was ~1.2s eager)
+IMPORT_BUDGET_US = 100_000
+
+
+def _run(code: str):
+    """
+    Run code in a fresh interpreter.
+
+    Returns:
+        ({module: cumulative_us} from -X importtime, set of loaded python_alfresco_api modules)
+    """
+    # importtime does not time importlib.import_module() calls, so the lazily
+    # loaded modules are read from sys.modules
+    code += (
+        "\nimport sys; "
+        "print('\\n'.join(m for m in sys.modules if m.startswith('python_alfresco_api')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=PROJECT_ROOT, check=True
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        timings[module.strip()] = int(cumulative)
+    return timings, set(result.stdout.split())
+
+
+class TestImportBudget:
+    """Test that importing the package stays cheap."""
+
+    def test_package_import_budget(self):
+        timings, loaded = _run("import python_alfresco_api")
+
+        assert timings["python_alfresco_api"] < IMPORT_BUDGET_US
+        assert loaded == {"python_alfresco_api"}
+        assert "httpx" not in timings
+        assert "pydantic" not in timings
+
+    def test_one_pydantic_model_loads_one_file(self):
+        _, loaded = _run("from python_alfresco_api.models import TicketBody")
+
+        assert {
+            module for module in loaded if module.startswith("python_alfresco_api.models.")
+        } == {"python_alfresco_api.models.alfresco_auth_models"}
+
+    def test_one_raw_model_loads_few_modules(self):
+        _, loaded = _run(
+            "from python_alfresco_api.raw_clients.alfresco_core_client.core_client.models "
+            "import NodeEntry"
+        )
+
+        prefix = "python_alfresco_api.raw_clients.alfresco_core_client.core_client.models."
+        # NodeEntry and the models it references, not all ~190 modules
+        assert 0 < len([module for module in loaded if module.startswith(prefix)]) < 30
+
+
+class TestLazyExports:
+    """Test the lazy exports resolve to the same objects as before."""
+
+    def test_top_level_names(self):
+        from python_alfresco_api.client_factory import ClientFactory
+        from python_alfresco_api.clients.core import AlfrescoCoreClient
+
+        assert python_alfresco_api.ClientFactory is ClientFactory
+        assert python_alfresco_api.AlfrescoCoreClient is AlfrescoCoreClient
+        assert set(python_alfresco_api.__all__) <= set(dir(python_alfresco_api))
+
+    def test_models_last_file_wins(self):
+        from python_alfresco_api.models.alfresco_search_sql_models import Error
+
+        assert models.Error is Error
+        assert python_alfresco_api.Error is Error
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from python_alfresco_api.models import *", namespace)
+        assert "NodeBodyCreate" in namespace and "SearchRequest" in namespace
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError):
+            python_alfresco_api.NotAModel
+        with pytest.raises(ImportError):
+            exec(
+                "from python_alfresco_api.raw_clients.alfresco_core_client.core_client.models "
+                "import NotAModel"
+            )
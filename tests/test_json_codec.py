@@ -0,0 +1,173 @@
+"""
+Tests for the pluggable JSON codec (json_codec.py) and its use by the
+shared transport and the single-pass wrappers.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.json_codec import (
+    CodecResponse, JsonCodec, ORJSON_AVAILABLE, STDLIB_CODEC, encode_request, get_json_codec
+)
+from python_alfresco_api.raw_clients.alfresco_search_client.search_client.models import (
+    RequestQuery,
+    SearchRequest,
+)
+
+PAGE = {
+    "list": {
+        "pagination": {
+            "count": 1,
+            "hasMoreItems": False,
+            "totalItems": 1,
+            "skipCount": 0,
+            "maxItems": 100,
+        },
+        "entries": [
+            {
+                "entry": {
+                    "id": "node-1",
+                    "name": "résumé.pdf",
+                    "nodeType": "cm:content",
+                    "isFile": True,
+                    "isFolder": False,
+                    "createdAt": "2024-01-01T10:00:00.000+0000",
+                    "modifiedAt": "2024-02-01T10:00:00.000+0000",
+                    "createdByUser": {"id": "admin", "displayName": "Administrator"},
+                    "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+                }
+            }
+        ],
+    }
+}
+
+
+class CountingCodec(JsonCodec):
+    """Standard library codec that records its calls."""
+
+    name = "counting"
+
+    def __init__(self):
+        self.calls = []
+
+    def loads(self, data):
+        self.calls.append("loads")
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.calls.append("dumps")
+        return super().dumps(obj)
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def make_factory(requests, mock_factory):
+    """Factory using the given codec, answering every request with PAGE."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=PAGE)
+
+    return lambda codec: mock_factory(handler, json_codec=codec)
+
+
+class TestCodecSelection:
+    """Test codec resolution."""
+
+    def test_auto(self):
+        expected = "orjson" if ORJSON_AVAILABLE else get_json_codec("auto").name
+        assert get_json_codec().name == expected
+        assert get_json_codec(None).name == expected
+
+    def test_stdlib_and_instances(self):
+        codec = CountingCodec()
+
+        assert get_json_codec("json") is STDLIB_CODEC
+        assert get_json_codec(codec) is codec
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            get_json_codec("simplejson")
+
+    @pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_orjson_round_trip(self):
+        codec = get_json_codec("orjson")
+
+        assert codec.loads(codec.dumps(PAGE)) == PAGE
+        assert codec.dumps({"a": "é"}) == STDLIB_CODEC.dumps({"a": "é"})
+
+
+class TestEncodeRequest:
+    """Test JSON request bodies are re-routed through the codec."""
+
+    def test_encodes_body(self):
+        kwargs = encode_request(
+            {"method": "post", "url": "/search", "json": {"query": {"query": "x"}}}, CountingCodec()
+        )
+
+        assert "json" not in kwargs
+        assert json.loads(kwargs["content"]) == {"query": {"query": "x"}}
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    def test_unchanged_without_body_or_for_stdlib(self):
+        get = {"method": "get", "url": "/nodes/x"}
+        post = {"method": "post", "url": "/search", "json": {}}
+
+        assert encode_request(get, CountingCodec()) is get
+        assert encode_request(post, STDLIB_CODEC) is post
+
+
+class TestClients:
+    """Test the factory's codec is used for parsing and request bodies."""
+
+    def test_raw_operations_parse_with_codec(self, make_factory):
+        codec = CountingCodec()
+        core = make_factory(codec).create_core_client()
+
+        response = core.raw_client.get_httpx_client().get("/nodes/x/children")
+        assert isinstance(response, CodecResponse)
+        assert response.json() == PAGE
+        assert codec.calls == ["loads"]
+
+        # Generated operations parse through response.json()
+        result = core.nodes.list_children_detailed("x")
+        assert result.parsed.list_.entries[0].entry.name == "résumé.pdf"
+        assert codec.calls == ["loads", "loads"]
+
+    def test_search_body_encoded_with_codec(self, make_factory, requests):
+        codec = CountingCodec()
+        search = make_factory(codec).create_search_client().search
+
+        page = search.search_view(SearchRequest(query=RequestQuery(query="report")))
+        assert codec.calls == ["dumps", "loads"]
+        assert json.loads(requests[-1].content)["query"]["query"] == "report"
+        assert requests[-1].headers["Content-Type"] == "application/json"
+        assert page.entries[0].name == "résumé.pdf"
+
+    def test_async(self, make_factory):
+        codec = CountingCodec()
+        search = make_factory(codec).create_search_client().search
+
+        page = asyncio.run(
+            search.search_model_async(SearchRequest(query=RequestQuery(query="report")))
+        )
+        assert page.list.entries[0].entry.id == "node-1"
+        assert codec.calls == ["dumps"]
+
+    def test_stdlib_responses_unwrapped(self, make_factory):
+        core = make_factory("json").create_core_client()
+
+        response = core.raw_client.get_httpx_client().get("/nodes/x/children")
+        assert type(response) is httpx.Response
+        assert core.nodes.list_children("x").list["entries"][0]["entry"]["id"] == "node-1"
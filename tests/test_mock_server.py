@@ -0,0 +1,186 @@
+"""
+Tests for the spec-driven mock Alfresco server used by the load driver
+(scripts/benchmarks/mock_alfresco.py), installed in-process as the
+factory's transport.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add the project root and the benchmarks directory to the path
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'scripts', 'benchmarks'))
+
+from mock_alfresco import MockAlfresco
+from python_alfresco_api.client_factory import ClientFactory
+from python_alfresco_api.raw_clients.alfresco_search_client.search_client.models import (
+    RequestQuery,
+    SearchRequest,
+)
+
+CORE = "http://localhost:8080/alfresco/api/-default-/public/alfresco/versions/1"
+
+
+@pytest.fixture(scope="module")
+def server():
+    return MockAlfresco(total_items=25)
+
+
+@pytest.fixture
+def factory(server):
+    factory = ClientFactory(
+        base_url="http://localhost:8080", username="admin", password="admin", load_env=False
+    )
+    server.install(factory)
+    return factory
+
+
+class TestRouting:
+    """Test spec operations are routed and answered."""
+
+    def test_every_operation_answers(self, server):
+        for operation in server.operations:
+            path = operation.pattern.pattern.rstrip("$").replace("([^/]+)", "x").replace("\\", "")
+            response = server.respond(httpx.Request(operation.method, f"http://localhost{path}"))
+
+            assert server.match(operation.method, path)[0] is operation
+            assert 200 <= response.status_code < 300, operation.operation_id
+
+    def test_literal_route_wins(self, server):
+        operation, params = server.match(
+            "GET", "/alfresco/api/-default-/public/alfresco/versions/1/nodes/abc/children"
+        )
+
+        assert operation.operation_id == "listNodeChildren"
+        assert params == {"nodeId": "abc"}
+
+    def test_unknown_path(self, server):
+        response = server.respond(httpx.Request("GET", "http://localhost/not/alfresco"))
+
+        assert response.status_code == 404
+        assert response.json()["error"]["statusCode"] == 404
+
+
+class TestPayloads:
+    """Test synthesized payloads."""
+
+    def test_list_paging(self, server):
+        response = server.respond(
+            httpx.Request("GET", f"{CORE}/nodes/abc/children?skipCount=20&maxItems=10")
+        )
+        pagination = response.json()["list"]["pagination"]
+
+        assert pagination == {
+            "count": 5,
+            "hasMoreItems": False,
+            "totalItems": 25,
+            "skipCount": 20,
+            "maxItems": 10,
+        }
+        assert len(response.json()["list"]["entries"]) == 5
+
+    def test_include_only_fields(self, server):
+        plain = server.respond(httpx.Request("GET", f"{CORE}/nodes/abc")).json()["entry"]
+        included = server.respond(
+            httpx.Request("GET", f"{CORE}/nodes/abc?include=path,isLocked")
+        ).json()["entry"]
+
+        assert "path" not in plain and "permissions" not in plain
+        assert "path" in included and "isLocked" in included and "permissions" not in included
+        assert plain["createdAt"] == "2024-01-15T10:30:00.000+0000"
+
+    def test_echoes_path_id_and_body(self, server):
+        response = server.respond(
+            httpx.Request("PUT", f"{CORE}/nodes/abc", json={"name": "renamed.txt"})
+        )
+
+        assert response.json()["entry"]["id"] == "abc"
+        assert response.json()["entry"]["name"] == "renamed.txt"
+
+    def test_content_range(self):
+        server = MockAlfresco(content_size=100, apis=("core",))
+
+        full = server.respond(httpx.Request("GET", f"{CORE}/nodes/abc/content"))
+        part = server.respond(
+            httpx.Request("GET", f"{CORE}/nodes/abc/content", headers={"Range": "bytes=10-19"})
+        )
+
+        assert len(full.content) == 100
+        assert part.status_code == 206
+        assert part.content == full.content[10:20]
+        assert part.headers["Content-Range"] == "bytes 10-19/100"
+
+
+class TestInjection:
+    """Test latency and error injection."""
+
+    def test_error_rate(self):
+        server = MockAlfresco(error_rate=1.0, error_statuses=(503,), apis=("core",))
+        response = server.handle(httpx.Request("GET", f"{CORE}/nodes/abc"))
+
+        assert response.status_code == 503
+        assert server.stats["errors"] == 1
+
+    def test_latency(self):
+        server = MockAlfresco(latency=0.05, apis=("core",))
+
+        async def timed():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await asyncio.gather(
+                *(server.ahandle(httpx.Request("GET", f"{CORE}/nodes/abc")) for _ in range(5))
+            )
+            return loop.time() - started
+
+        # Concurrent async requests overlap their latency
+        assert 0.05 <= asyncio.run(timed()) < 0.2
+
+    def test_asgi(self, server):
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/alfresco/api/-default-/public/alfresco/versions/1/nodes/abc",
+            "query_string": b"",
+            "headers": [],
+        }
+        asyncio.run(server(scope, receive, send))
+
+        assert sent[0]["status"] == 200
+        assert json.loads(sent[1]["body"])["entry"]["id"] == "abc"
+
+
+class TestClients:
+    """Test the clients decode the mock responses."""
+
+    def test_nodes(self, factory):
+        core = factory.create_core_client()
+
+        assert core.nodes.get("abc").entry.id == "abc"
+        assert len(list(core.nodes.iter_children("abc", page_size=10))) == 25
+
+    def test_bulk_records_elapsed(self, factory):
+        report = factory.create_core_client().nodes.bulk.get(["a", "b", "c"])
+
+        assert [item.result.entry.id for item in report.items] == ["a", "b", "c"]
+        assert all(item.elapsed > 0 for item in report.items)
+
+    def test_search(self, factory):
+        result = factory.create_search_client().search.search(
+            SearchRequest(query=RequestQuery(query="doc"))
+        )
+
+        assert len(result.list_.entries) == 25
@@ -0,0 +1,228 @@
+"""
+Tests for the model dictionary (clients/model/dictionary.py): pulling types
+and aspects into a memory-mapped file, reusing it across instances and
+rebuilding it when the repository version changes.
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.clients.model import ModelDictionary
+from python_alfresco_api.clients.model.dictionary import MAGIC, default_cache_path, server_key
+
+TYPES = [
+    {
+        "id": "cm:cmobject",
+        "title": "Object",
+        "properties": [{"id": "cm:name", "dataType": "d:text", "isMandatory": True}],
+    },
+    {
+        "id": "cm:content",
+        "title": "Content",
+        "parentId": "cm:cmobject",
+        "properties": [
+            {"id": "cm:name", "dataType": "d:text", "isMandatory": True},
+            {"id": "cm:content", "dataType": "d:content"},
+        ],
+    },
+    {"id": "cm:folder", "title": "Folder", "parentId": "cm:cmobject", "properties": []},
+]
+ASPECTS = [
+    {
+        "id": "cm:titled",
+        "title": "Titled",
+        "properties": [
+            {"id": "cm:title", "dataType": "d:mltext"},
+            {"id": "cm:description", "dataType": "d:mltext"},
+        ],
+    },
+    {
+        "id": "cm:versionable",
+        "title": "Versionable",
+        "properties": [{"id": "cm:versionLabel", "dataType": "d:text"}],
+    },
+]
+
+
+def _page(definitions, skip, size):
+    entries = definitions[skip:skip + size]
+    return {"list": {
+        "pagination": {"count": len(entries), "hasMoreItems": skip + size < len(definitions),
+                       "totalItems": len(definitions), "skipCount": skip, "maxItems": size},
+        "entries": [{"entry": definition} for definition in entries],
+    }}
+
+
+@pytest.fixture
+def server():
+    """Mock server state: requests seen, repository version and definitions."""
+    return {"requests": [], "version": "23.2.0", "types": list(TYPES), "aspects": list(ASPECTS)}
+
+
+@pytest.fixture
+def model(server, monkeypatch, mock_factory):
+    # Two definitions per page to exercise paging
+    monkeypatch.setattr("python_alfresco_api.clients.model.dictionary.PAGE_SIZE", 2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        server["requests"].append(request)
+        path = request.url.path
+        if path.endswith("/discovery"):
+            return httpx.Response(
+                200,
+                json={
+                    "entry": {
+                        "repository": {
+                            "id": "repo-1",
+                            "edition": "Community",
+                            "version": {
+                                "major": "23",
+                                "minor": "2",
+                                "patch": "0",
+                                "display": server["version"],
+                                "schema": 19000,
+                            },
+                        }
+                    }
+                },
+            )
+        kind = path.rsplit("/", 1)[-1]
+        if server[kind] is None:
+            return httpx.Response(500, json={"error": {"briefSummary": "unavailable"}})
+        skip, size = int(request.url.params["skipCount"]), int(request.url.params["maxItems"])
+        return httpx.Response(200, json=_page(server[kind], skip, size))
+
+    return mock_factory(handler).create_model_client()
+
+
+def _paths(server):
+    return [request.url.path.rsplit("/", 1)[-1] for request in server["requests"]]
+
+
+class TestModelDictionary:
+    """Test pulling, lookups and reuse of the dictionary file."""
+
+    def test_first_load_pulls_everything(self, model, server, tmp_path):
+        dictionary = ModelDictionary(model, path=tmp_path / "model.dict")
+
+        assert dictionary.get_type("cm:content")["title"] == "Content"
+        assert dictionary.get_aspect("cm:titled")["title"] == "Titled"
+        assert dictionary.get_type("cm:titled") is None
+        assert len(dictionary) == 5
+        assert "cm:versionable" in dictionary
+        assert dictionary.type_names() == ["cm:cmobject", "cm:content", "cm:folder"]
+        assert [aspect["id"] for aspect in dictionary.iter_aspects()] == [
+            "cm:titled",
+            "cm:versionable",
+        ]
+        assert dictionary.server == "repo-1/23.2.0 (schema 19000)"
+
+        assert _paths(server) == ["discovery", "types", "types", "aspects"]
+        types_request = server["requests"][1]
+        assert types_request.url.params.get_list("include") == [
+            "properties",
+            "mandatoryAspects",
+            "associations",
+        ]
+        assert (tmp_path / "model.dict").read_bytes().startswith(MAGIC)
+
+    def test_get_property(self, model, tmp_path):
+        dictionary = ModelDictionary(model, path=tmp_path / "model.dict")
+
+        assert dictionary.get_property("cm:title")["dataType"] == "d:mltext"
+        assert dictionary.get_property("cm:name")["isMandatory"] is True
+        assert dictionary.get_property("cm:missing") is None
+
+    def test_reused_across_instances(self, model, server, tmp_path):
+        ModelDictionary(model, path=tmp_path / "model.dict").load()
+        server["requests"].clear()
+
+        dictionary = ModelDictionary(model, path=tmp_path / "model.dict")
+        assert dictionary.get_type("cm:folder")["id"] == "cm:folder"
+        assert _paths(server) == ["discovery"]
+
+    def test_definitions_decoded_once(self, model, tmp_path):
+        dictionary = ModelDictionary(model, path=tmp_path / "model.dict")
+
+        assert dictionary.get_type("cm:content") is dictionary.get_type("cm:content")
+
+    def test_no_version_check(self, model, server, tmp_path):
+        ModelDictionary(model, path=tmp_path / "model.dict").load()
+        server["requests"].clear()
+        server["version"] = "25.1.0"
+
+        dictionary = ModelDictionary(model, path=tmp_path / "model.dict", check_version=False)
+        assert len(dictionary) == 5
+        assert server["requests"] == []
+
+    def test_new_version_rebuilds(self, model, server, tmp_path):
+        ModelDictionary(model, path=tmp_path / "model.dict").load()
+        server["requests"].clear()
+        server["version"] = "25.1.0"
+        server["aspects"].append({"id": "acme:audited", "properties": []})
+
+        dictionary = ModelDictionary(model, path=tmp_path / "model.dict")
+        assert dictionary.get_aspect("acme:audited") is not None
+        assert dictionary.server == "repo-1/25.1.0 (schema 19000)"
+        assert _paths(server)[0] == "discovery" and "aspects" in _paths(server)
+
+    def test_refresh(self, model, server, tmp_path):
+        dictionary = ModelDictionary(model, path=tmp_path / "model.dict")
+        dictionary.get_type("cm:content")
+        server["types"].append({"id": "acme:invoice", "parentId": "cm:content", "properties": []})
+
+        assert dictionary.get_type("acme:invoice") is None
+        dictionary.refresh()
+        assert dictionary.get_type("acme:invoice")["parentId"] == "cm:content"
+
+    @pytest.mark.parametrize("content", [b"", b"garbage\n", MAGIC + b"{not json\n"])
+    def test_corrupt_file_rebuilt(self, model, tmp_path, content):
+        path = tmp_path / "model.dict"
+        path.write_bytes(content)
+
+        assert len(ModelDictionary(model, path=path)) == 5
+
+    def test_failed_pull_raises(self, model, server, tmp_path):
+        server["types"] = None
+
+        with pytest.raises(httpx.HTTPStatusError):
+            ModelDictionary(model, path=tmp_path / "model.dict").load()
+        assert not (tmp_path / "model.dict").exists()
+
+    def test_async(self, model, server, tmp_path):
+        dictionary = ModelDictionary(model, path=tmp_path / "model.dict")
+
+        asyncio.run(dictionary.load_async())
+
+        assert dictionary.get_aspect("cm:titled") is not None
+        assert _paths(server) == ["discovery", "types", "types", "aspects"]
+
+    def test_model_client_property(self, model, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        dictionary = model.dictionary
+        assert dictionary is model.dictionary
+        assert dictionary.path == tmp_path / "python-alfresco-api" / "model-localhost_8080.dict"
+        assert dictionary.get_type("cm:content") is not None
+        assert dictionary.path.exists()
+
+
+def test_helpers():
+    assert server_key(None) is None
+    assert (
+        server_key(
+            {"entry": {"repository": {"id": "r", "version": {"display": "7.4", "schema": 1}}}}
+        )
+        == "r/7.4 (schema 1)"
+    )
+    assert (
+        default_cache_path("https://acme.example.com:8443/").name
+        == "model-acme.example.com_8443.dict"
+    )
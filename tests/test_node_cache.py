@@ -0,0 +1,284 @@
+"""
+Tests for the node metadata cache (clients/core/nodes/cache.py): LRU + TTL
+eviction, invalidation by nodes client mutations and statistics.
+"""
+
+import asyncio
+import io
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.client_factory import ClientFactory
+from python_alfresco_api.clients.core.nodes import NodeCache, UpdateNodeRequest
+from python_alfresco_api.clients.core.nodes.cache import cache_key
+from python_alfresco_api.clients.validation import validation_profile
+from python_alfresco_api.utils import content_utils
+
+
+def _node(node_id, modified_at="2024-02-01T10:00:00.000+0000"):
+    return {
+        "id": node_id, "name": f"{node_id}.pdf", "nodeType": "cm:content",
+        "isFile": True, "isFolder": False, "parentId": "folder-1",
+        "createdAt": "2024-01-01T10:00:00.000+0000", "modifiedAt": modified_at,
+        "createdByUser": {"id": "admin", "displayName": "Administrator"},
+        "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def server():
+    """Mock server state: requests seen and the current modifiedAt per node."""
+    return {"requests": [], "modified": {}}
+
+
+@pytest.fixture
+def factory(server, mock_factory):
+    def handler(request: httpx.Request) -> httpx.Response:
+        server["requests"].append(request)
+        node_id = request.url.path.split("/nodes/")[1].split("/")[0]
+        if node_id == "-root-":
+            node_id = "root-id"
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        if request.method in ("PUT", "POST"):
+            server["modified"][node_id] = "2024-03-01T10:00:00.000+0000"
+        modified = server["modified"].get(node_id, "2024-02-01T10:00:00.000+0000")
+        return httpx.Response(200, json={"entry": _node(node_id, modified)})
+
+    return mock_factory(handler, node_cache=True)
+
+
+def _gets(server):
+    return [request for request in server["requests"] if request.method == "GET"]
+
+
+class TestNodeCache:
+    """Test the cache on its own."""
+
+    def test_lru_eviction(self):
+        cache = NodeCache(maxsize=2)
+        cache.put(("a",), 1)
+        cache.put(("b",), 2)
+        cache.get(("a",))
+        cache.put(("c",), 3)
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == 1
+        assert cache.stats().evictions == 1
+
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = NodeCache(ttl=10, clock=clock)
+        cache.put(("a",), 1)
+
+        clock.now += 9
+        assert cache.get(("a",)) == 1
+        clock.now += 1
+        assert cache.get(("a",)) is None
+        assert cache.stats().expirations == 1
+        assert len(cache) == 0
+
+    def test_key(self):
+        assert cache_key("n", ["path", "properties"]) == cache_key("n", ["properties", "path"])
+        assert cache_key("n", fields=["id"]) != cache_key("n")
+        strict = cache_key("n")
+        with validation_profile("trusted"):
+            assert cache_key("n") != strict
+
+    def test_put_skipped_after_invalidation(self):
+        cache = NodeCache()
+        generation = cache.generation()
+        cache.invalidate("a")
+
+        cache.put(("a",), 1, generation)
+        assert cache.get(("a",)) is None
+
+        cache.put(("a",), 1, cache.generation())
+        cache.put(("b",), 2, generation)
+        assert cache.get(("a",)) == 1
+        assert cache.get(("b",)) == 2
+
+    def test_pruned_generations_are_stale(self):
+        cache = NodeCache(maxsize=2)
+        generation = cache.generation()
+        for node_id in ("x", "y", "z"):
+            cache.invalidate(node_id)
+
+        # "x" was pruned from the invalidation record: any older fetch is refused
+        cache.put(("b",), 2, generation)
+        assert cache.get(("b",)) is None
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            NodeCache(maxsize=0)
+
+
+class TestNodesClient:
+    """Test nodes.get() through the cache."""
+
+    def test_repeated_get(self, factory, server):
+        nodes = factory.create_core_client().nodes
+
+        first = nodes.get("node-1")
+        assert nodes.get("node-1") == first
+        assert len(_gets(server)) == 1
+
+        stats = nodes.cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_hits_are_copies(self, factory, server):
+        nodes = factory.create_core_client().nodes
+
+        first = nodes.get("node-1")
+        first.entry.name = "changed.pdf"
+        second = nodes.get("node-1")
+        second.entry.name = "other.pdf"
+
+        assert nodes.get("node-1").entry.name == "node-1.pdf"
+        assert len(_gets(server)) == 1
+
+    def test_invalidated_during_fetch_not_stored(self, mock_factory):
+        state = {"gets": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            state["gets"] += 1
+            if state["gets"] == 1:
+                # An update lands while this response is on its way
+                state["nodes"].cache.invalidate("node-1")
+            return httpx.Response(200, json={"entry": _node("node-1")})
+
+        nodes = state["nodes"] = mock_factory(handler, node_cache=True).create_core_client().nodes
+
+        nodes.get("node-1")
+        assert len(nodes.cache) == 0
+        nodes.get("node-1")
+        nodes.get("node-1")
+        assert state["gets"] == 2
+
+    def test_variants_cached_separately(self, factory, server):
+        nodes = factory.create_core_client().nodes
+
+        nodes.get("node-1")
+        nodes.get("node-1", include=["path"])
+        nodes.get("node-1", projection="ids")
+        nodes.get("node-1", include=["path"])
+
+        assert len(_gets(server)) == 3
+
+    def test_bypass(self, factory, server):
+        nodes = factory.create_core_client().nodes
+
+        nodes.get("node-1", relative_path="Documents")
+        nodes.get("node-1", relative_path="Documents")
+
+        assert len(_gets(server)) == 2
+        assert len(nodes.cache) == 0
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda nodes: nodes.update("node-1", UpdateNodeRequest(name="renamed.pdf")),
+            lambda nodes: nodes.delete("node-1"),
+            lambda nodes: nodes.lock("node-1"),
+            lambda nodes: nodes.update_content("node-1", b"new content"),
+            lambda nodes: nodes.parent_client.content.update_content(
+                "node-1", io.BytesIO(b"new content")
+            ),
+            lambda nodes: asyncio.run(
+                nodes.parent_client.content.update_content_async("node-1", io.BytesIO(b"new"))
+            ),
+            lambda nodes: content_utils.update_content(
+                nodes.parent_client, "node-1", b"new content"
+            ),
+        ],
+    )
+    def test_mutations_invalidate(self, factory, server, mutate):
+        nodes = factory.create_core_client().nodes
+        nodes.get("node-1")
+        nodes.get("node-1", include=["path"])
+        nodes.get("node-2")
+
+        mutate(nodes)
+
+        assert len(nodes.cache) == 1
+        nodes.get("node-1")
+        assert len(_gets(server)) == 4
+
+    def test_alias_invalidated_by_id(self, factory, server):
+        nodes = factory.create_core_client().nodes
+        nodes.get("-root-")
+
+        nodes.update("root-id", UpdateNodeRequest(name="Company Home"))
+
+        assert len(nodes.cache) == 0
+
+    def test_newer_modified_at_drops_variants(self, factory, server):
+        nodes = factory.create_core_client().nodes
+        nodes.get("node-1")
+        # Changed by someone else
+        server["modified"]["node-1"] = "2024-03-01T10:00:00.000+0000"
+
+        nodes.get("node-1", include=["path"])
+
+        assert len(nodes.cache) == 1
+        assert nodes.cache.stats().invalidations == 1
+
+    def test_async(self, factory, server):
+        nodes = factory.create_core_client().nodes
+
+        async def run():
+            await nodes.get_async("node-1")
+            await nodes.get_async("node-1")
+            await nodes.delete_async("node-1")
+            await nodes.get_async("node-1")
+
+        asyncio.run(run())
+        assert len(_gets(server)) == 2
+
+    def test_bulk_invalidates(self, factory, server):
+        nodes = factory.create_core_client().nodes
+        nodes.get("node-1")
+        nodes.get("node-2")
+
+        report = nodes.bulk.delete(["node-1"])
+
+        assert report.ok
+        assert nodes.cache.invalidate("node-1") == 0
+        assert len(nodes.cache) == 1
+
+    def test_disabled_by_default(self):
+        factory = ClientFactory(
+            base_url="http://localhost:8080", username="admin", password="admin", load_env=False
+        )
+
+        assert factory.create_core_client().nodes.cache is None
+        assert factory.get_config_info()["node_cache"] is None
+
+    def test_shared_by_core_clients(self):
+        cache = NodeCache(maxsize=10)
+        factory = ClientFactory(
+            base_url="http://localhost:8080",
+            username="admin",
+            password="admin",
+            load_env=False,
+            node_cache=cache,
+        )
+
+        assert factory.create_core_client().nodes.cache is cache
+        assert factory.create_core_client().nodes.cache is cache
+        assert "maxsize=10" in factory.get_config_info()["node_cache"]
@@ -0,0 +1,174 @@
+"""
+Tests for the path resolver (clients/core/nodes/paths.py): the trie of
+resolved segments, partial resolution of uncached remainders and
+invalidation by moves, renames and deletes.
+"""
+
+import asyncio
+import io
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.clients.core.nodes import MoveNodeRequest, UpdateNodeRequest
+from python_alfresco_api.clients.core.nodes.paths import PathResolver, split_path
+
+# path -> node id ("" is Company Home)
+TREE = {
+    "": "root-id",
+    "Sites": "sites-id",
+    "Sites/finance": "finance-id",
+    "Sites/finance/documentLibrary": "doclib-id",
+    "Sites/finance/documentLibrary/2024": "2024-id",
+    "Sites/finance/documentLibrary/2024/Q3": "q3-id",
+    "Sites/finance/documentLibrary/2024/Q4": "q4-id",
+}
+
+
+def _name(path):
+    return path.rsplit("/", 1)[-1] if path else "Company Home"
+
+
+def _entry(path):
+    segments = split_path(path)
+    ancestors = ["/".join(segments[:i]) for i in range(len(segments))]
+    return {
+        "id": TREE[path], "name": _name(path), "nodeType": "cm:folder",
+        "isFile": False, "isFolder": True,
+        "createdAt": "2024-01-01T10:00:00.000+0000", "modifiedAt": "2024-02-01T10:00:00.000+0000",
+        "createdByUser": {"id": "admin", "displayName": "Administrator"},
+        "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+        "path": {"name": "/" + "/".join(_name(a) for a in ancestors),
+                 "elements": [{"id": TREE[a], "name": _name(a)} for a in ancestors]},
+    }
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def nodes(requests, mock_factory):
+    paths = {node_id: path for path, node_id in TREE.items()}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        node_id = request.url.path.split("/nodes/")[1].split("/")[0]
+        base = paths["root-id" if node_id == "-root-" else node_id]
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        path = "/".join(split_path(base + "/" + request.url.params.get("relativePath", "")))
+        if path not in TREE:
+            return httpx.Response(404, json={"error": {"briefSummary": "not found"}})
+        return httpx.Response(200, json={"entry": _entry(path)})
+
+    return mock_factory(handler).create_core_client().nodes
+
+
+class TestResolve:
+    """Test path resolution through the trie."""
+
+    def test_cached_after_first_lookup(self, nodes, requests):
+        assert nodes.resolve_path("Sites/finance/documentLibrary/2024/Q3") == "q3-id"
+        assert nodes.resolve_path("/Sites/finance/documentLibrary/2024/Q3/") == "q3-id"
+
+        assert len(requests) == 1
+        assert requests[0].url.params["relativePath"] == "Sites/finance/documentLibrary/2024/Q3"
+        assert requests[0].url.params.get_list("include") == ["path"]
+        # Intermediate folders came from the path elements
+        assert len(nodes.paths) == 5
+        assert nodes.resolve_path("Sites/finance") == "finance-id"
+        assert len(requests) == 1
+
+    def test_only_remainder_requested(self, nodes, requests):
+        nodes.resolve_path("Sites/finance/documentLibrary/2024/Q3")
+
+        assert nodes.resolve_path("Sites/finance/documentLibrary/2024/Q4") == "q4-id"
+        assert requests[-1].url.path.endswith("/nodes/2024-id")
+        assert requests[-1].url.params["relativePath"] == "Q4"
+
+    def test_base_and_empty_path(self, nodes, requests):
+        assert nodes.resolve_path("documentLibrary/2024", base_id="finance-id") == "2024-id"
+        assert nodes.resolve_path("", base_id="finance-id") == "finance-id"
+        assert len(requests) == 1
+
+    def test_not_found(self, nodes):
+        with pytest.raises(ValueError):
+            nodes.resolve_path("Sites/missing")
+        assert len(nodes.paths) == 0
+
+    def test_get_by_path(self, nodes, requests):
+        node = nodes.get_by_path("Sites/finance")
+        nodes.get_by_path("Sites/finance")
+
+        assert node.entry.id == "finance-id"
+        assert [request.url.params.get("relativePath") for request in requests] == [
+            "Sites/finance",
+            None,
+            None,
+        ]
+
+    def test_async(self, nodes, requests):
+        async def run():
+            first = await nodes.resolve_path_async("Sites/finance/documentLibrary")
+            second = await nodes.resolve_path_async("Sites/finance/documentLibrary")
+            node = await nodes.get_by_path_async("Sites/finance/documentLibrary")
+            return first, second, node
+
+        first, second, node = asyncio.run(run())
+        assert first == second == node.entry.id == "doclib-id"
+        assert len(requests) == 2
+
+    def test_ttl(self, nodes, requests):
+        now = [0.0]
+        nodes._paths = PathResolver(nodes, ttl=10, clock=lambda: now[0])
+        nodes.resolve_path("Sites/finance")
+
+        now[0] = 11
+        nodes.resolve_path("Sites/finance")
+        assert len(requests) == 2
+
+    def test_max_nodes(self, nodes):
+        nodes._paths = PathResolver(nodes, max_nodes=3)
+        nodes.resolve_path("Sites/finance/documentLibrary/2024")
+
+        assert len(nodes.paths) == 0
+
+
+class TestInvalidation:
+    """Test moves, renames and deletes through the client drop subtrees."""
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda nodes: nodes.move("finance-id", MoveNodeRequest(target_parent_id="sites-id")),
+            lambda nodes: nodes.update("finance-id", UpdateNodeRequest(name="accounting")),
+            lambda nodes: nodes.delete("finance-id"),
+            lambda nodes: nodes.bulk.delete(["finance-id"]),
+            lambda nodes: nodes.parent_client.content.update_content(
+                "finance-id", io.BytesIO(b"x"), name="accounting"
+            ),
+        ],
+    )
+    def test_subtree_dropped(self, nodes, requests, mutate):
+        nodes.resolve_path("Sites/finance/documentLibrary/2024/Q3")
+
+        mutate(nodes)
+
+        assert len(nodes.paths) == 1
+        nodes.resolve_path("Sites/finance/documentLibrary")
+        assert requests[-1].url.path.endswith("/nodes/sites-id")
+        assert requests[-1].url.params["relativePath"] == "finance/documentLibrary"
+
+    def test_lock_keeps_paths(self, nodes):
+        nodes.resolve_path("Sites/finance/documentLibrary")
+
+        nodes.lock("doclib-id")
+
+        assert len(nodes.paths) == 3
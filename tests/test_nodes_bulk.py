@@ -0,0 +1,186 @@
+"""
+Tests for the bulk node executor (client.nodes.bulk): concurrency limit,
+per-item retry, streaming results and the per-item report.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.clients.core.nodes import BulkReport, CopyNodeRequest, UpdateNodeRequest
+from python_alfresco_api.utils.node_utils_highlevel import bulk_delete_nodes_highlevel
+
+
+def _entry(node_id: str, name: str = "doc.txt") -> dict:
+    return {
+        "entry": {
+            "id": node_id,
+            "name": name,
+            "nodeType": "cm:content",
+            "isFile": True,
+            "isFolder": False,
+            "createdAt": "2024-01-01T00:00:00.000+0000",
+            "modifiedAt": "2024-01-01T00:00:00.000+0000",
+            "createdByUser": {"id": "admin", "displayName": "Administrator"},
+            "modifiedByUser": {"id": "admin", "displayName": "Administrator"}
+        }
+    }
+
+
+class NodeServer:
+    """Fake nodes endpoint tracking in-flight requests, with scripted failures."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.requests = []
+        self.failures = {}  # node_id -> list of statuses (or "reset") to return first
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        node_id = request.url.path.split("/nodes/")[1].split("/")[0]
+        self.requests.append((request.method, node_id))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            scripted = self.failures.get(node_id)
+            if scripted:
+                failure = scripted.pop(0)
+                if failure == "reset":
+                    raise httpx.ConnectError("connection reset")
+                if failure == "timeout":
+                    raise httpx.ReadTimeout("read timed out")
+                error = {"error": {"statusCode": failure, "briefSummary": f"failure {failure}"}}
+                return httpx.Response(failure, json=error)
+            if request.method == "DELETE":
+                return httpx.Response(204)
+            name = json.loads(request.content)["name"] if request.method == "PUT" else "doc.txt"
+            return httpx.Response(200, json=_entry(node_id, name))
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def server():
+    return NodeServer()
+
+
+@pytest.fixture
+def core_client(server, mock_factory):
+    # Async handler: the sync bulk methods run on the executor's event loop too
+    client = mock_factory(server.handler).create_core_client()
+    client.nodes.bulk.retry_backoff = 0.001
+    return client
+
+
+class TestBulkAsync:
+    """Test the async executor."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, core_client, server):
+        node_ids = [f"node-{i}" for i in range(50)]
+
+        report = await core_client.nodes.bulk.delete_async(node_ids, concurrency=5)
+
+        assert report.ok
+        assert report.total == 50
+        assert server.peak == 5
+        assert [item.index for item in report.items] == list(range(50))
+        assert all(item.status_code == 204 and item.result is None for item in report.items)
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_failures(self, core_client, server):
+        server.failures = {"node-1": [503, "reset"], "node-2": [404], "node-3": [500] * 10}
+
+        report = await core_client.nodes.bulk.get_async(["node-0", "node-1", "node-2", "node-3"])
+
+        node_0, node_1, node_2, node_3 = report.items
+        assert node_0.success and node_0.attempts == 1
+        assert node_0.result.entry.id == "node-0"
+        assert node_1.success and node_1.attempts == 3
+        assert not node_2.success and node_2.attempts == 1
+        assert node_2.status_code == 404
+        assert node_2.error == "HTTP 404: failure 404"
+        assert not node_3.success and node_3.attempts == 4  # 1 + max_retries
+        assert [item.node_id for item in report.failed] == ["node-2", "node-3"]
+        assert not report.ok
+
+    @pytest.mark.asyncio
+    async def test_unsafe_operations_not_resent(self, core_client, server):
+        server.failures = {"node-0": ["timeout"], "node-1": [503], "node-2": ["reset", 429]}
+        items = [(f"node-{i}", CopyNodeRequest(target_parent_id="folder-1")) for i in range(3)]
+
+        report = await core_client.nodes.bulk.copy_async(items)
+
+        node_0, node_1, node_2 = report.items
+        # The copy may have run: a timeout or 5xx is not resent
+        assert not node_0.success and node_0.attempts == 1
+        assert node_0.error.startswith("ReadTimeout")
+        assert not node_1.success and node_1.attempts == 1
+        # Never reached the server / throttled: retried
+        assert node_2.success and node_2.attempts == 3
+        assert [node_id for _, node_id in server.requests].count("node-0") == 1
+
+    @pytest.mark.asyncio
+    async def test_streams_results_as_completed(self, core_client, server):
+        server.failures = {"node-0": [503]}
+        seen = []
+
+        async for item in core_client.nodes.bulk.stream_async(
+            "get", (f"node-{i}" for i in range(3))
+        ):
+            seen.append(item.node_id)
+
+        # The retried item arrives last
+        assert sorted(seen) == ["node-0", "node-1", "node-2"]
+        assert seen[-1] == "node-0"
+
+    @pytest.mark.asyncio
+    async def test_update_from_mapping(self, core_client, server):
+        requests = {f"node-{i}": UpdateNodeRequest(name=f"renamed-{i}.txt") for i in range(3)}
+
+        report = await core_client.nodes.bulk.update_async(requests)
+
+        assert report.ok
+        assert [item.result.entry.name for item in report.items] == [
+            "renamed-0.txt",
+            "renamed-1.txt",
+            "renamed-2.txt",
+        ]
+        assert {method for method, _ in server.requests} == {"PUT"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_operation(self, core_client):
+        with pytest.raises(ValueError):
+            await core_client.nodes.bulk.run_async("purge", ["node-0"])
+
+
+class TestBulkSync:
+    """Test the sync facade on the private event loop."""
+
+    def test_sync_report(self, core_client, server):
+        report = core_client.nodes.bulk.delete(
+            [f"node-{i}" for i in range(20)], permanent=True, concurrency=4
+        )
+
+        assert isinstance(report, BulkReport)
+        assert report.ok
+        assert server.peak == 4
+
+    def test_sync_stream(self, core_client):
+        items = list(core_client.nodes.bulk.stream("get", ["node-0", "node-1"]))
+        assert sorted(item.node_id for item in items) == ["node-0", "node-1"]
+
+    def test_bulk_delete_nodes_highlevel(self, core_client, server):
+        server.failures = {"node-1": [403]}
+
+        results = bulk_delete_nodes_highlevel(core_client, ["node-0", "node-1", "node-2"])
+
+        assert results == {"node-0": True, "node-1": False, "node-2": True}
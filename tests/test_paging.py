@@ -0,0 +1,361 @@
+"""
+Tests for auto-pagination of list operations (clients/paging.py and the
+iter_* client methods).
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.clients.paging import apaginate, iter_pages, paginate, read_page
+from python_alfresco_api.raw_clients.alfresco_search_client.search_client.models import (
+    RequestQuery,
+    SearchRequest,
+)
+
+def _listing(entries, skip_count, total, has_more=True):
+    pagination = {"count": len(entries), "skipCount": skip_count, "maxItems": 100}
+    if total is not None:
+        pagination["totalItems"] = total
+    if has_more:
+        pagination["hasMoreItems"] = skip_count + len(entries) < total
+    return {"list": {"pagination": pagination, "entries": [{"entry": entry} for entry in entries]}}
+
+
+class ListServer:
+    """Serves TOTAL children / groups / sites, honouring skipCount and maxItems."""
+
+    def __init__(self, total=50):
+        self.total = total
+        self.requests = []
+        self.has_more = True
+        self.delay = 0
+        self.max_items_cap = None
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _reply(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            paging = json.loads(request.content)["paging"]
+            skip, size = paging["skipCount"], paging["maxItems"]
+        else:
+            skip = int(request.url.params.get("skipCount", 0))
+            size = int(request.url.params.get("maxItems", 100))
+        self.requests.append((skip, size))
+        if self.max_items_cap is not None:
+            size = min(size, self.max_items_cap)
+        path = request.url.path
+        if path.endswith("/groups"):
+            entries = [
+                {"id": f"GROUP_{i}", "displayName": f"Group {i}", "isRoot": True}
+                for i in range(self.total)
+            ]
+        elif path.endswith("/sites"):
+            entries = [
+                {"id": f"site-{i}", "title": f"Site {i}", "visibility": "PUBLIC"}
+                for i in range(self.total)
+            ]
+        else:
+            entries = [
+                {
+                    "id": f"node-{i}",
+                    "name": f"doc-{i}.txt",
+                    "nodeType": "cm:content",
+                    "isFile": True,
+                    "isFolder": False,
+                    "createdAt": "2024-01-01T00:00:00.000+0000",
+                    "modifiedAt": "2024-01-01T00:00:00.000+0000",
+                    "createdByUser": {"id": "admin", "displayName": "Administrator"},
+                    "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+                }
+                for i in range(self.total)
+            ]
+        return httpx.Response(
+            200, json=_listing(entries[skip : skip + size], skip, self.total, self.has_more)
+        )
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _exit(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self._enter()
+        try:
+            time.sleep(self.delay)
+            return self._reply(request)
+        finally:
+            self._exit()
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self._enter()
+        try:
+            await asyncio.sleep(self.delay)
+            return self._reply(request)
+        finally:
+            self._exit()
+
+
+@pytest.fixture
+def server():
+    return ListServer()
+
+
+@pytest.fixture
+def core_client(server, mock_factory):
+    return mock_factory(server.handler, server.async_handler).create_core_client()
+
+
+@pytest.fixture
+def search_client(server, mock_factory):
+    return mock_factory(server.handler, server.async_handler).create_search_client()
+
+
+class TestReadPage:
+    """Test response normalization."""
+
+    def test_dict_response(self):
+        page = read_page(_listing([{"id": "a"}], 10, 11), skip_count=10)
+        assert page.entries == [{"entry": {"id": "a"}}]
+        assert page.pagination.total_items == 11
+        assert not page.has_more(100)
+
+    def test_failed_request(self):
+        with pytest.raises(ValueError):
+            read_page(None)
+
+
+class TestPaginate:
+    """Test the sync pager."""
+
+    def test_iter_children_all_pages(self, core_client, server):
+        names = [node["name"] for node in core_client.nodes.iter_children("folder-1", page_size=7)]
+
+        assert names == [f"doc-{i}.txt" for i in range(50)]
+        assert server.requests == [(skip, 7) for skip in range(0, 50, 7)]
+
+    def test_limit(self, core_client, server):
+        nodes = list(core_client.nodes.iter_children("folder-1", page_size=20, limit=30))
+
+        assert len(nodes) == 30
+        assert server.requests == [(0, 20), (20, 10)]
+
+    def test_total_items_without_has_more(self, core_client, server):
+        server.has_more = False
+        assert len(list(core_client.nodes.iter_children("folder-1", page_size=15))) == 50
+
+    def test_raw_attrs_pages(self, core_client, server):
+        groups = list(core_client.groups.iter_groups(page_size=12))
+
+        assert [group.id for group in groups] == [f"GROUP_{i}" for i in range(50)]
+        assert len(server.requests) == 5
+
+    def test_detailed_response_pages(self, core_client, server):
+        sites = list(core_client.sites.iter_sites(page_size=25, where="(visibility='PUBLIC')"))
+        assert [site["id"] for site in sites] == [f"site-{i}" for i in range(50)]
+
+    def test_prefetch_overlaps_processing(self):
+        calls = []
+
+        def fetch(skip_count, max_items):
+            calls.append(skip_count)
+            entries = [{"n": n} for n in range(skip_count, min(skip_count + max_items, 30))]
+            return _listing(entries, skip_count, 30)
+
+        pages = iter_pages(fetch, page_size=10, prefetch=True)
+        first = next(pages)
+        deadline = time.monotonic() + 2
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        # Page 2 was requested while the caller still holds page 1
+        assert first.skip_count == 0
+        assert calls == [0, 10]
+        assert [page.skip_count for page in pages] == [10, 20]
+        assert calls == [0, 10, 20]
+
+    def test_unwrap_false(self):
+        def fetch(skip_count, max_items):
+            return _listing([{"id": "a"}], skip_count, 1)
+
+        assert list(paginate(fetch, unwrap=False)) == [{"entry": {"id": "a"}}]
+
+
+class TestApaginate:
+    """Test the async pager."""
+
+    @pytest.mark.asyncio
+    async def test_iter_children_async(self, core_client, server):
+        nodes = [
+            node
+            async for node in core_client.nodes.iter_children_async(
+                "folder-1", page_size=20, prefetch=True
+            )
+        ]
+
+        assert [node["id"] for node in nodes] == [f"node-{i}" for i in range(50)]
+        assert server.requests == [(0, 20), (20, 20), (40, 20)]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_overlaps_processing(self):
+        calls = []
+
+        async def fetch(skip_count, max_items):
+            calls.append(skip_count)
+            entries = [{"n": n} for n in range(skip_count, min(skip_count + max_items, 30))]
+            return _listing(entries, skip_count, 30)
+
+        seen = []
+        async for entry in apaginate(fetch, page_size=10, prefetch=True):
+            if entry["n"] == 0:
+                await asyncio.sleep(0.01)
+                assert calls == [0, 10]
+            seen.append(entry["n"])
+
+        assert seen == list(range(30))
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_prefetch(self):
+        calls, completed = [], []
+
+        async def fetch(skip_count, max_items):
+            calls.append(skip_count)
+            await asyncio.sleep(0.05)
+            completed.append(skip_count)
+            return _listing([{"n": skip_count}], skip_count, 1000)
+
+        pager = apaginate(fetch, page_size=1, prefetch=True)
+        async for _ in pager:
+            await asyncio.sleep(0.01)
+            break
+        await pager.aclose()
+        await asyncio.sleep(0.1)
+
+        assert calls == [0, 1]
+        assert completed == [0]
+
+
+class TestParallelPages:
+    """Test fetching the remaining pages concurrently once totalItems is known."""
+
+    def test_sync_parallel_in_order(self, core_client, server):
+        server.delay = 0.02
+
+        nodes = list(core_client.nodes.iter_children("folder-1", page_size=5, parallel=4))
+
+        assert [node["id"] for node in nodes] == [f"node-{i}" for i in range(50)]
+        assert server.requests[0] == (0, 5)
+        assert sorted(server.requests) == [(skip, 5) for skip in range(0, 50, 5)]
+        assert server.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_async_parallel_in_order(self, core_client, server):
+        server.delay = 0.01
+
+        nodes = [
+            node
+            async for node in core_client.nodes.iter_children_async(
+                "folder-1", page_size=5, parallel=3
+            )
+        ]
+
+        assert [node["id"] for node in nodes] == [f"node-{i}" for i in range(50)]
+        assert len(server.requests) == 10
+        assert server.peak == 3
+
+    def test_parallel_respects_limit(self, core_client, server):
+        nodes = list(
+            core_client.nodes.iter_children("folder-1", page_size=10, limit=25, parallel=4)
+        )
+
+        assert len(nodes) == 25
+        assert sorted(server.requests) == [(0, 10), (10, 10), (20, 5)]
+
+    def test_parallel_without_total_items_is_sequential(self):
+        calls = []
+
+        def fetch(skip_count, max_items):
+            calls.append(skip_count)
+            entries = [{"n": n} for n in range(skip_count, min(skip_count + max_items, 30))]
+            return _listing(entries, skip_count, None, has_more=False)
+
+        assert len(list(paginate(fetch, page_size=10, parallel=4))) == 30
+        assert calls == [0, 10, 20, 30]
+
+    def test_parallel_continues_when_list_grows(self):
+        # totalItems said 20, but the last planned page still reports more items
+        def fetch(skip_count, max_items):
+            entries = [{"n": n} for n in range(skip_count, min(skip_count + max_items, 30))]
+            page = _listing(entries, skip_count, 30)
+            if skip_count == 0:
+                page["list"]["pagination"]["totalItems"] = 20
+            return page
+
+        assert [entry["n"] for entry in paginate(fetch, page_size=10, parallel=4)] == list(
+            range(30)
+        )
+
+    def test_parallel_with_server_capped_page_size(self, core_client, server):
+        server.max_items_cap = 7
+
+        nodes = list(core_client.nodes.iter_children("folder-1", page_size=20, parallel=4))
+
+        assert [node["id"] for node in nodes] == [f"node-{i}" for i in range(50)]
+        # Offsets step by the 7 entries the first page returned
+        assert sorted(server.requests) == [(0, 20)] + [(skip, 7) for skip in range(7, 50, 7)]
+
+    @pytest.mark.asyncio
+    async def test_async_parallel_with_server_capped_page_size(self, core_client, server):
+        server.max_items_cap = 7
+
+        nodes = [
+            node
+            async for node in core_client.nodes.iter_children_async(
+                "folder-1", page_size=20, parallel=4
+            )
+        ]
+
+        assert [node["id"] for node in nodes] == [f"node-{i}" for i in range(50)]
+
+    def test_parallel_short_page_continues_sequentially(self):
+        # The page at 20 comes back with 4 of 10 entries: later offsets would skip 24-29
+        def fetch(skip_count, max_items):
+            end = skip_count + (4 if skip_count == 20 else max_items)
+            return _listing([{"n": n} for n in range(skip_count, min(end, 60))], skip_count, 60)
+
+        assert [entry["n"] for entry in paginate(fetch, page_size=10, parallel=3)] == list(
+            range(60)
+        )
+
+    def test_search_parallel(self, search_client, server):
+        body = SearchRequest(query=RequestQuery(query="TYPE:'cm:content'"))
+
+        results = list(search_client.iter_search(body, page_size=8, parallel=4))
+
+        assert [result.id for result in results] == [f"node-{i}" for i in range(50)]
+        assert sorted(server.requests) == [(skip, 8) for skip in range(0, 50, 8)]
+
+    @pytest.mark.asyncio
+    async def test_search_parallel_async(self, search_client, server):
+        body = SearchRequest(query=RequestQuery(query="TYPE:'cm:content'"))
+
+        results = [
+            result
+            async for result in search_client.iter_search_async(body, page_size=20, parallel=2)
+        ]
+
+        assert len(results) == 50
@@ -0,0 +1,234 @@
+"""
+Tests for named projections (clients/projections.py): the fields/include
+sent on the wire and the slim models responses decode into.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.clients.core.nodes.models import Node, NodeId, NodeResponse, NodeSummary
+from python_alfresco_api.clients.core.people.models import PersonSummary
+from python_alfresco_api.clients.core.sites.models import SiteId
+from python_alfresco_api.clients.projections import (
+    PROJECTIONS,
+    Projection,
+    get_projection,
+    project,
+    register_projection,
+)
+from python_alfresco_api.utils.node_utils import browse_repository
+from python_alfresco_api.raw_clients.alfresco_search_client.search_client.models import (
+    RequestQuery,
+    SearchRequest,
+)
+
+NODE = {
+    "id": "node-1",
+    "name": "report.pdf",
+    "nodeType": "cm:content",
+    "isFile": True,
+    "isFolder": False,
+    "parentId": "folder-1",
+    "createdAt": "2024-01-01T10:00:00.000+0000",
+    "modifiedAt": "2024-02-01T10:00:00.000+0000",
+    "createdByUser": {"id": "admin", "displayName": "Administrator"},
+    "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+}
+SITE = {"id": "swsdp", "guid": "g-1", "title": "Sample", "visibility": "PUBLIC"}
+PERSON = {
+    "id": "jdoe",
+    "firstName": "John",
+    "displayName": "John Doe",
+    "email": "jdoe@example.com",
+    "enabled": True,
+}
+
+
+def _page(entry, total=3):
+    return {
+        "list": {
+            "pagination": {
+                "count": total,
+                "hasMoreItems": False,
+                "totalItems": total,
+                "skipCount": 0,
+                "maxItems": 100,
+            },
+            "entries": [{"entry": dict(entry, id=f"{entry['id']}-{i}")} for i in range(total)],
+        }
+    }
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def factory(requests, mock_factory):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        path = request.url.path
+        if path.endswith("/search"):
+            return httpx.Response(200, json=_page(NODE))
+        if path.endswith("/children"):
+            return httpx.Response(200, json=_page(NODE))
+        if path.endswith("/sites"):
+            return httpx.Response(200, json=_page(SITE))
+        if path.endswith("/people"):
+            return httpx.Response(200, json=_page(PERSON))
+        if "/sites/" in path:
+            return httpx.Response(200, json={"entry": SITE})
+        if "/people/" in path:
+            return httpx.Response(200, json={"entry": PERSON})
+        return httpx.Response(200, json={"entry": NODE})
+
+    return mock_factory(handler)
+
+
+def _params(request: httpx.Request, name: str):
+    return request.url.params.get_list(name) or None
+
+
+class TestProjectionParams:
+    """Test how projections resolve into fields/include."""
+
+    def test_builtin(self):
+        include, fields, model = project("node", "ids")
+
+        assert (include, fields, model) == (None, ["id"], NodeId)
+        assert project("node", "full")[:2] == (
+            ["aspectNames", "properties", "path", "allowableOperations", "isLocked"],
+            None,
+        )
+
+    def test_merge_adds_included_fields(self):
+        include, fields, model = project(
+            "node", "listing", include=["path"], fields=["name", "createdAt"]
+        )
+
+        assert include == ["path"]
+        assert fields[:2] == ["id", "name"]
+        assert fields[-2:] == ["createdAt", "path"]
+        assert model is NodeSummary
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            get_projection("node", "everything")
+
+    def test_register(self):
+        projection = Projection("names", NodeSummary, fields=("id", "name"))
+        register_projection("node", projection)
+        try:
+            assert get_projection("node", "names") is projection
+        finally:
+            del PROJECTIONS["node"]["names"]
+
+
+class TestNodes:
+    """Test node calls send the projection and decode slim entries."""
+
+    def test_get_ids(self, factory, requests):
+        response = factory.create_core_client().nodes.get("node-1", projection="ids")
+
+        assert _params(requests[-1], "fields") == ["id"]
+        assert type(response.entry) is NodeId
+        assert response.entry.id == "node-1"
+
+    def test_get_full(self, factory, requests):
+        response = factory.create_core_client().nodes.get("node-1", projection="full")
+
+        assert "path" in _params(requests[-1], "include")
+        assert _params(requests[-1], "fields") is None
+        assert type(response.entry) is Node
+
+    def test_no_projection_unchanged(self, factory, requests):
+        assert type(factory.create_core_client().nodes.get("node-1")) is NodeResponse
+        assert "fields" not in requests[-1].url.params
+
+    def test_list_children(self, factory, requests):
+        page = factory.create_core_client().nodes.list_children("folder-1", projection="listing")
+
+        assert "modifiedAt" in _params(requests[-1], "fields")
+        assert [type(item.entry) for item in page.list.entries] == [NodeSummary] * 3
+        assert page.list.entries[0].entry.modified_by_user.id == "admin"
+
+    def test_list_children_view(self, factory):
+        page = factory.create_core_client().nodes.list_children(
+            "folder-1", view=True, projection="ids"
+        )
+
+        model = page.entries[0].to_model()
+        assert type(model) is NodeId and model.id == "node-1-0"
+
+    def test_iter_children_async(self, factory, requests):
+        async def collect():
+            return [
+                item
+                async for item in factory.create_core_client().nodes.iter_children_async(
+                    "folder-1", projection="ids"
+                )
+            ]
+
+        items = asyncio.run(collect())
+        assert [type(item) for item in items] == [NodeId] * 3
+        assert _params(requests[-1], "fields") == ["id"]
+
+    def test_browse_repository_passes_include(self, factory, requests):
+        browse_repository(factory.create_core_client(), "folder-1")
+        assert _params(requests[-1], "include") == ["properties", "path", "allowableOperations"]
+
+        page = browse_repository(
+            factory.create_core_client(), "folder-1", include_properties=False, projection="ids"
+        )
+        assert type(page.list.entries[0].entry) is NodeId
+
+
+class TestOtherResources:
+    """Test sites, people and search projections."""
+
+    def test_sites(self, factory, requests):
+        sites = factory.create_core_client().sites
+
+        assert type(sites.get_site_model("swsdp", projection="ids").entry) is SiteId
+        assert _params(requests[-1], "fields") == ["id"]
+        assert [item["id"] for item in sites.iter_sites(projection="ids")] == [
+            "swsdp-0",
+            "swsdp-1",
+            "swsdp-2",
+        ]
+        assert _params(requests[-1], "fields") == ["id"]
+
+    def test_people(self, factory, requests):
+        people = factory.create_core_client().people
+
+        page = people.list_people_model(projection="listing")
+        assert type(page.list.entries[0].entry) is PersonSummary
+        assert "displayName" in _params(requests[-1], "fields")
+        assert [item.id for item in people.iter_people(projection="ids")] == [
+            "jdoe-0",
+            "jdoe-1",
+            "jdoe-2",
+        ]
+
+    def test_search(self, factory, requests):
+        search = factory.create_search_client().search
+        body = SearchRequest(query=RequestQuery(query="report"))
+
+        page = search.search_model(body, projection="listing")
+        sent = json.loads(requests[-1].content)
+        assert type(page.list.entries[0].entry) is NodeSummary
+        assert "name" in sent["fields"] and "include" not in sent
+
+        items = list(search.iter_search(body, projection="full"))
+        sent = json.loads(requests[-1].content)
+        assert len(items) == 3
+        assert "isLink" in sent["include"] and "fields" not in sent
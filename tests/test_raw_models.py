@@ -0,0 +1,124 @@
+"""
+Tests for the optimized generated attrs models (scripts/code-gen/optimize_raw_models.py):
+shared empty additional_properties, copy on write, from_dict() round trips
+and timestamp parsing.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from dateutil.parser import isoparse
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.models import (
+    Node,
+    NodePaging,
+    UserInfo,
+)
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.types import (
+    EMPTY_PROPERTIES,
+    parse_datetime,
+)
+
+NODE = {
+    "id": "node-1", "name": "report.pdf", "nodeType": "cm:content",
+    "isFile": True, "isFolder": False,
+    "createdAt": "2024-01-01T10:00:00.000+0000", "modifiedAt": "2024-02-01T10:00:00.000+0000",
+    "createdByUser": {"id": "admin", "displayName": "Administrator"},
+    "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+    "content": {"mimeType": "application/pdf", "sizeInBytes": 1024},
+}
+
+
+class TestAdditionalProperties:
+    """Test the shared EMPTY_PROPERTIES of decoded models."""
+
+    def test_shared_when_no_extra_keys(self):
+        first, second = Node.from_dict(NODE), Node.from_dict(NODE)
+
+        assert first.additional_properties is EMPTY_PROPERTIES
+        assert second.created_by_user.additional_properties is EMPTY_PROPERTIES
+        assert first.additional_keys == []
+
+    def test_extra_keys_kept(self):
+        node = Node.from_dict({**NODE, "custom": 1})
+
+        assert node["custom"] == 1
+        assert node.to_dict()["custom"] == 1
+
+    def test_copy_on_write(self):
+        node, other = Node.from_dict(NODE), Node.from_dict(NODE)
+        node["custom"] = "x"
+
+        assert node.additional_properties == {"custom": "x"}
+        assert other.additional_properties is EMPTY_PROPERTIES
+        assert len(EMPTY_PROPERTIES) == 0
+
+    def test_constructed_models_own_their_dict(self):
+        first = UserInfo(display_name="Administrator", id="admin")
+        second = UserInfo(display_name="Administrator", id="admin")
+        first.additional_properties["custom"] = "x"
+        first.additional_properties.update(other=1)
+
+        assert first.to_dict()["custom"] == "x" and first["other"] == 1
+        assert second.additional_properties == {}
+        assert second.additional_properties is not EMPTY_PROPERTIES
+
+    def test_read_only(self):
+        with pytest.raises(TypeError):
+            EMPTY_PROPERTIES["x"] = 1
+        with pytest.raises(TypeError):
+            EMPTY_PROPERTIES.update(x=1)
+        with pytest.raises(KeyError):
+            del Node.from_dict(NODE)["missing"]
+
+
+class TestFromDict:
+    """Test nested models still decode (first-use model imports)."""
+
+    def test_round_trip(self):
+        page = {"list": {"pagination": {"count": 1, "hasMoreItems": False},
+                         "entries": [{"entry": NODE}]}}
+        parsed = NodePaging.from_dict(page)
+        node = parsed.list_.entries[0].entry
+
+        assert node.content.size_in_bytes == 1024
+        assert node.created_by_user.display_name == "Administrator"
+        assert (
+            parsed.to_dict()["list"]["entries"][0]["entry"]["createdByUser"]
+            == NODE["createdByUser"]
+        )
+
+
+class TestParseDatetime:
+    """Test parse_datetime() matches dateutil's isoparse()."""
+
+    @pytest.mark.parametrize("value", [
+        "2024-01-01T10:00:00.000+0000",
+        "2024-03-01T16:45:12.345+0100",
+        "2024-03-01T16:45:12.345-0530",
+        "2024-03-01T16:45:12Z",
+        "2024-03-01T16:45:12.123456+00:00",
+    ])
+    def test_matches_isoparse(self, value):
+        assert parse_datetime(value) == isoparse(value)
+        assert parse_datetime(value).utcoffset() == isoparse(value).utcoffset()
+
+    def test_alfresco_format(self):
+        parsed = parse_datetime("2024-03-01T16:45:12.345+0100")
+
+        assert parsed == datetime(2024, 3, 1, 16, 45, 12, 345000, timezone(timedelta(hours=1)))
+
+    def test_fallback(self):
+        # fromisoformat() rejects 24:00, dateutil reads it as the next midnight
+        assert parse_datetime("2024-01-01T24:00:00") == datetime(2024, 1, 2)
+
+    def test_models_use_it(self):
+        node = Node.from_dict(NODE)
+
+        assert node.created_at == datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+        assert node.to_dict()["createdAt"] == "2024-01-01T10:00:00+00:00"
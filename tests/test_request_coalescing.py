@@ -0,0 +1,235 @@
+"""
+Tests for single-flight request coalescing on the shared transport
+(coalescing.py): identical concurrent GETs share one request, everything
+else is sent as is.
+"""
+
+import asyncio
+import gzip
+import os
+import sys
+import threading
+import time
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.client_factory import ClientFactory
+from python_alfresco_api.coalescing import RequestCoalescer
+
+
+def _node(node_id):
+    return {
+        "id": node_id, "name": f"{node_id}.pdf", "nodeType": "cm:content",
+        "isFile": True, "isFolder": False,
+        "createdAt": "2024-01-01T10:00:00.000+0000", "modifiedAt": "2024-02-01T10:00:00.000+0000",
+        "createdByUser": {"id": "admin", "displayName": "Administrator"},
+        "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+    }
+
+
+@pytest.fixture
+def requests():
+    return []
+
+
+@pytest.fixture
+def factory(requests, mock_factory):
+    """Factory whose mock server answers node requests after a short delay."""
+    def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/content"):
+            return httpx.Response(
+                200, headers={"Content-Type": "application/pdf"}, content=b"%PDF" * 1024 * 1024
+            )
+        if "broken" in request.url.path:
+            raise httpx.ConnectError("connection refused", request=request)
+        node_id = request.url.path.split("/nodes/")[1]
+        return httpx.Response(200, json={"entry": _node(node_id)})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.05)
+        return respond(request)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return respond(request)
+
+    return mock_factory(handler, async_handler, coalesce_requests=True)
+
+
+class TestAsync:
+    """Test coalescing of concurrent coroutines."""
+
+    def test_identical_gets_share_one_request(self, factory, requests):
+        nodes = factory.create_core_client().nodes
+
+        async def run():
+            return await asyncio.gather(*(nodes.get_async("node-1") for _ in range(20)))
+
+        results = asyncio.run(run())
+
+        assert len(requests) == 1
+        assert {result.entry.id for result in results} == {"node-1"}
+        # Each caller parsed its own copy
+        assert len({id(result) for result in results}) == 20
+        assert factory.transport.coalescer.coalesced == 19
+
+    def test_different_urls_not_merged(self, factory, requests):
+        nodes = factory.create_core_client().nodes
+
+        async def run():
+            await asyncio.gather(
+                nodes.get_async("node-1"),
+                nodes.get_async("node-2"),
+                nodes.get_async("node-1", include=["path"]),
+            )
+
+        asyncio.run(run())
+        assert len(requests) == 3
+
+    def test_sequential_gets_not_cached(self, factory, requests):
+        nodes = factory.create_core_client().nodes
+
+        async def run():
+            await nodes.get_async("node-1")
+            await nodes.get_async("node-1")
+
+        asyncio.run(run())
+        assert len(requests) == 2
+
+    def test_different_credentials_not_merged(self, factory, requests):
+        client = factory.create_core_client().raw_client.get_async_httpx_client()
+
+        async def run():
+            await asyncio.gather(
+                client.get("nodes/node-1", headers={"Authorization": "Basic YWxpY2U6c2VjcmV0"}),
+                client.get("nodes/node-1", headers={"Authorization": "Basic Ym9iOnNlY3JldA=="}),
+            )
+
+        asyncio.run(run())
+        assert len(requests) == 2
+
+    def test_posts_not_merged(self, factory, requests):
+        client = factory.create_core_client().raw_client.get_async_httpx_client()
+
+        async def run():
+            await asyncio.gather(
+                *(client.post("nodes/node-1/copy", json={"targetParentId": "f"}) for _ in range(3))
+            )
+
+        asyncio.run(run())
+        assert len(requests) == 3
+
+    def test_large_downloads_not_buffered(self, factory, requests):
+        client = factory.create_core_client().raw_client.get_async_httpx_client()
+
+        async def run():
+            return await asyncio.gather(*(client.get("nodes/node-1/content") for _ in range(3)))
+
+        responses = asyncio.run(run())
+        assert len(requests) == 3
+        assert all(len(response.content) == 4 * 1024 * 1024 for response in responses)
+
+    def test_error_shared(self, factory, requests):
+        client = factory.create_core_client().raw_client.get_async_httpx_client()
+
+        async def run():
+            return await asyncio.gather(
+                *(client.get("nodes/broken") for _ in range(5)), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        assert len(requests) == 1
+        assert all(isinstance(result, httpx.ConnectError) for result in results)
+
+    def test_cancelled_leader(self, factory, requests):
+        client = factory.create_core_client().raw_client.get_async_httpx_client()
+
+        async def run():
+            leader = asyncio.ensure_future(client.get("nodes/node-1"))
+            await asyncio.sleep(0.01)
+            waiter = asyncio.ensure_future(client.get("nodes/node-1"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await waiter
+
+        response = asyncio.run(run())
+        assert response.json()["entry"]["id"] == "node-1"
+
+
+class TestSync:
+    """Test coalescing of concurrent threads."""
+
+    def test_identical_gets_share_one_request(self, factory, requests):
+        nodes = factory.create_core_client().nodes
+        results = []
+
+        def worker():
+            results.append(nodes.get("node-1"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert {result.entry.id for result in results} == {"node-1"}
+        assert len(requests) + factory.transport.coalescer.coalesced == 8
+        assert len(requests) < 8
+
+
+class TestCoalescer:
+    """Test the coalescer on its own."""
+
+    def test_encoded_body_decoded_per_copy(self):
+        body = gzip.compress(b'{"entry": {"id": "n"}}')
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(
+                200,
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+                content=body,
+            )
+        )
+        coalescer = RequestCoalescer()
+        request = httpx.Request("GET", "http://localhost/nodes/n")
+
+        response = coalescer.handle(request, transport.handle_request)
+
+        assert response.read() == b'{"entry": {"id": "n"}}'
+
+    def test_request_key(self):
+        get = httpx.Request("GET", "http://localhost/nodes/n?include=path")
+        assert RequestCoalescer.request_key(get) == RequestCoalescer.request_key(
+            httpx.Request("GET", "http://localhost/nodes/n?include=path")
+        )
+        assert RequestCoalescer.request_key(get) != RequestCoalescer.request_key(
+            httpx.Request("GET", "http://localhost/nodes/n")
+        )
+        assert (
+            RequestCoalescer.request_key(httpx.Request("DELETE", "http://localhost/nodes/n"))
+            is None
+        )
+
+    def test_disabled_by_default(self):
+        factory = ClientFactory(
+            base_url="http://localhost:8080", username="admin", password="admin", load_env=False
+        )
+
+        assert factory.transport.coalescer is None
+        assert "coalesce=False" in factory.get_config_info()["shared_transport"]
+
+    def test_requires_shared_transport(self):
+        with pytest.raises(ValueError):
+            ClientFactory(
+                base_url="http://localhost:8080",
+                username="admin",
+                password="admin",
+                load_env=False,
+                coalesce_requests=True,
+                share_connections=False,
+            )
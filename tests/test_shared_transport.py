@@ -0,0 +1,180 @@
+"""
+Tests for the shared connection pool owned by ClientFactory.
+"""
+
+import asyncio
+import gc
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.client_factory import ClientFactory
+from python_alfresco_api.transport import SharedTransport
+
+
+def _make_factory(**kwargs) -> ClientFactory:
+    kwargs.setdefault("base_url", "http://localhost:8080")
+    return ClientFactory(
+        username="admin",
+        password="admin",
+        load_env=False,
+        **kwargs
+    )
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Local keep-alive HTTP server, so pooled connections stay open."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+async def _get_root(factory: ClientFactory) -> httpx.AsyncHTTPTransport:
+    """Send one async request and return the pool that carried it."""
+    client = factory.create_core_client().raw_client.get_async_httpx_client()
+    response = await client.get("nodes/-root-")
+    assert response.status_code == 200
+    pool = factory.transport.async_transport
+    assert len(pool._pool.connections) == 1
+    return pool
+
+
+class TestSharedTransport:
+    """Test that all raw clients of one factory share one connection pool."""
+
+    def test_all_raw_clients_share_transport(self):
+        factory = _make_factory()
+        clients = factory.create_all_clients()
+
+        sync_transports = {id(c.raw_client.get_httpx_client()._transport) for c in clients.values()}
+        async_transports = {
+            id(c.raw_client.get_async_httpx_client()._transport) for c in clients.values()
+        }
+
+        assert sync_transports == {id(factory.transport)}
+        assert async_transports == {id(factory.transport)}
+
+    def test_base_urls_stay_per_api(self):
+        factory = _make_factory()
+        core = factory.create_core_client().raw_client.get_httpx_client()
+        search = factory.create_search_client().raw_client.get_httpx_client()
+
+        assert str(core.base_url).endswith("/public/alfresco/versions/1/")
+        assert str(search.base_url).endswith("/public/search/versions/1/")
+
+    def test_requests_go_through_shared_pool(self):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(str(request.url))
+            return httpx.Response(200, json={})
+
+        factory = _make_factory()
+        factory.transport.use_transport(httpx.MockTransport(handler))
+
+        factory.create_core_client().httpx_client.get("nodes/-root-")
+        factory.create_search_client().httpx_client.post("search", json={})
+
+        assert seen == [
+            "http://localhost:8080/alfresco/api/-default-/public/alfresco/versions/1/nodes/-root-",
+            "http://localhost:8080/alfresco/api/-default-/public/search/versions/1/search",
+        ]
+
+    def test_closing_raw_client_keeps_pool_open(self):
+        factory = _make_factory()
+        pool = factory.transport.sync_transport
+
+        factory.create_core_client().httpx_client.close()
+
+        assert factory.transport.sync_transport is pool
+        factory.close()
+        assert factory.transport._sync_transport is None
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_pools(self):
+        async with _make_factory() as factory:
+            _ = factory.transport.async_transport
+            _ = factory.transport.sync_transport
+        assert len(factory.transport._async_pools) == 0
+        assert factory.transport._sync_transport is None
+
+    def test_async_pool_per_event_loop(self, http_server):
+        factory = _make_factory(base_url=http_server)
+
+        first = asyncio.run(_get_root(factory))
+        second = asyncio.run(_get_root(factory))
+
+        assert first is not second
+        # Each pool is closed when its loop shuts down, and dropped with it
+        assert first._pool.connections == []
+        assert second._pool.connections == []
+        gc.collect()
+        assert len(factory.transport._async_pools) == 0
+        assert len(factory.transport._loop_closers) == 0
+
+    def test_close_closes_async_pool_of_running_loop(self, http_server):
+        factory = _make_factory(base_url=http_server)
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            pool = asyncio.run_coroutine_threadsafe(_get_root(factory), loop).result(5)
+
+            factory.close()
+
+            deadline = time.monotonic() + 5
+            while pool._pool.connections and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert pool._pool.connections == []
+            assert len(factory.transport._async_pools) == 0
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
+
+    def test_pool_limits_configurable(self):
+        factory = _make_factory(max_connections=7, max_keepalive_connections=3, keepalive_expiry=30)
+        assert factory.transport.limits.max_connections == 7
+        assert factory.transport.limits.max_keepalive_connections == 3
+        assert factory.transport.limits.keepalive_expiry == 30
+
+    def test_share_connections_disabled(self):
+        factory = _make_factory(share_connections=False)
+        assert factory.transport is None
+        assert factory.get_httpx_args() == {}
+
+    def test_http2_requires_h2(self):
+        try:
+            import h2  # noqa: F401
+            pytest.skip("h2 installed")
+        except ImportError:
+            pass
+        with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+            SharedTransport(http2=True)
@@ -0,0 +1,187 @@
+"""
+Tests for single-pass JSON decoding in the high-level wrappers
+(clients/decoding.py): responses go straight from bytes to Pydantic via
+model_validate_json, without the attrs models.
+"""
+
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.clients.core.nodes import NodeResponse, UpdateNodeRequest
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.errors import UnexpectedStatus
+from python_alfresco_api.raw_clients.alfresco_core_client.core_client.models import (
+    NodeEntry,
+    NodeChildAssociationPaging,
+)
+from python_alfresco_api.raw_clients.alfresco_search_client.search_client.models import (
+    RequestQuery,
+    SearchRequest,
+)
+
+NODE = {
+    "id": "node-1",
+    "name": "report.pdf",
+    "nodeType": "cm:content",
+    "isFile": True,
+    "isFolder": False,
+    "parentId": "folder-1",
+    "createdAt": "2024-01-01T10:00:00.000+0000",
+    "modifiedAt": "2024-02-01T10:00:00.000+0000",
+    "createdByUser": {"id": "admin", "displayName": "Administrator"},
+    "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+    "content": {
+        "mimeType": "application/pdf",
+        "mimeTypeName": "Adobe PDF Document",
+        "sizeInBytes": 1024,
+        "encoding": "UTF-8",
+    },
+    "properties": {"cm:title": "Report"},
+}
+SITE = {"id": "marketing", "guid": "guid-1", "title": "Marketing", "visibility": "PUBLIC"}
+PERSON = {"id": "jdoe", "firstName": "John", "email": "jdoe@example.com", "enabled": True}
+
+
+def _paging(entries):
+    return {
+        "list": {
+            "pagination": {
+                "count": len(entries),
+                "hasMoreItems": False,
+                "totalItems": len(entries),
+                "skipCount": 0,
+                "maxItems": 100,
+            },
+            "entries": [{"entry": entry} for entry in entries],
+        }
+    }
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if "missing" in path:
+        return httpx.Response(404, json={"error": {"statusCode": 404}})
+    if "forbidden" in path:
+        return httpx.Response(403, json={"error": {"statusCode": 403}})
+    if "broken" in path:
+        return httpx.Response(502, text="Bad Gateway")
+    if path.endswith("/children"):
+        return httpx.Response(200, json=_paging([NODE, NODE]))
+    if path.endswith("/sites"):
+        return httpx.Response(200, json=_paging([SITE]))
+    if "/sites/" in path:
+        return httpx.Response(200, json={"entry": SITE})
+    if path.endswith("/people"):
+        return httpx.Response(200, json=_paging([PERSON]))
+    if "/people/" in path:
+        return httpx.Response(200, json={"entry": PERSON})
+    if path.endswith("/search"):
+        return httpx.Response(200, json=_paging([dict(NODE, search={"score": 1.5})]))
+    if request.method == "PUT":
+        return httpx.Response(
+            200, json={"entry": dict(NODE, name=json.loads(request.content)["name"])}
+        )
+    return httpx.Response(200, json={"entry": NODE})
+
+
+@pytest.fixture
+def factory(mock_factory):
+    return mock_factory(_handler)
+
+
+@pytest.fixture
+def core_client(factory):
+    return factory.create_core_client()
+
+
+@pytest.fixture
+def no_attrs(monkeypatch):
+    """Fail if the attrs response models are used."""
+    def forbidden(*args, **kwargs):
+        raise AssertionError("attrs model parsed")
+    monkeypatch.setattr(NodeEntry, "from_dict", classmethod(forbidden))
+    monkeypatch.setattr(NodeChildAssociationPaging, "from_dict", classmethod(forbidden))
+
+
+class TestNodesFastPath:
+    """Test the nodes wrappers decode in one pass."""
+
+    def test_get_node(self, core_client, no_attrs):
+        node = core_client.nodes.get("node-1")
+
+        assert isinstance(node, NodeResponse)
+        assert node.entry.name == "report.pdf"
+        assert node.entry.created_at.year == 2024
+        assert node.entry.content.size_in_bytes == 1024
+
+    def test_same_result_as_attrs_path(self, core_client):
+        expected = NodeResponse.model_validate(NodeEntry.from_dict({"entry": NODE}).to_dict())
+        assert core_client.nodes.get("node-1") == expected
+
+    def test_not_found(self, core_client):
+        with pytest.raises(ValueError):
+            core_client.nodes.get("missing")
+
+    def test_error_statuses_raise(self, core_client):
+        with pytest.raises(httpx.HTTPStatusError) as error:
+            core_client.nodes.get("forbidden")
+        assert error.value.response.status_code == 403
+
+        # 502 is not documented for get_node
+        with pytest.raises(httpx.HTTPStatusError):
+            core_client.nodes.get("broken")
+        core_client.raw_client.raise_on_unexpected_status = True
+        with pytest.raises(UnexpectedStatus):
+            core_client.nodes.get("broken")
+        with pytest.raises(httpx.HTTPStatusError):
+            core_client.nodes.get("forbidden")
+
+    def test_list_children(self, core_client, no_attrs):
+        children = core_client.nodes.list_children("folder-1")
+        assert len(children.list["entries"]) == 2
+
+    def test_update_sends_body(self, core_client, no_attrs):
+        node = core_client.nodes.update("node-1", UpdateNodeRequest(name="renamed.pdf"))
+        assert node.entry.name == "renamed.pdf"
+
+    @pytest.mark.asyncio
+    async def test_get_node_async(self, core_client, no_attrs):
+        node = await core_client.nodes.get_async("node-1")
+        assert node.entry.id == "node-1"
+
+
+class TestModelVariants:
+    """Test the single-pass Pydantic variants of sites, people and search."""
+
+    def test_sites(self, core_client):
+        site = core_client.sites.get_site_model("marketing")
+        sites = core_client.sites.list_sites_model(max_items=10)
+
+        assert site.entry.title == "Marketing"
+        assert sites.list.entries[0].entry.id == "marketing"
+        assert core_client.sites.get_site_model("missing") is None
+
+    def test_people(self, core_client):
+        people = core_client.people.list_people_model()
+        assert people.list.entries[0].entry.email == "jdoe@example.com"
+
+    @pytest.mark.asyncio
+    async def test_async_variants(self, core_client):
+        site = await core_client.sites.get_site_model_async("marketing")
+        person = await core_client.people.get_person_model_async("jdoe")
+
+        assert site.entry.id == "marketing"
+        assert person.entry.id == "jdoe"
+
+    def test_search(self, factory):
+        search = factory.create_search_client()
+        results = search.search.search_model(SearchRequest(query=RequestQuery(query="report")))
+
+        assert results.list.entries[0].entry.name == "report.pdf"
+        assert results.list.entries[0].entry.search.score == 1.5
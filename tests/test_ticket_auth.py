@@ -0,0 +1,129 @@
+"""
+Tests for ticket-based session auth (ClientFactory(ticket_auth=True)).
+"""
+
+import base64
+import os
+import sys
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.client_factory import ClientFactory
+from python_alfresco_api.auth_flow import TicketAuth
+from python_alfresco_api.auth_util import AuthUtil, SimpleAuthUtil
+
+
+def _ticket_header(ticket: str) -> str:
+    return f"Basic {base64.b64encode(ticket.encode()).decode()}"
+
+
+class FakeTicketServer:
+    """Issues TICKET_1, TICKET_2, ... and accepts only the latest ticket."""
+
+    def __init__(self):
+        self.issued = 0
+        self.api_headers = []
+
+    def issue(self, auth_util: AuthUtil) -> bool:
+        self.issued += 1
+        auth_util.ticket = f"TICKET_{self.issued}"
+        auth_util.ticket_expires = datetime.now() + timedelta(hours=1)
+        auth_util._authenticated = True
+        return True
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        header = request.headers.get("Authorization")
+        self.api_headers.append(header)
+        if header == _ticket_header(f"TICKET_{self.issued}"):
+            return httpx.Response(200, json={"entry": {}})
+        return httpx.Response(401, json={})
+
+
+@pytest.fixture
+def ticket_factory(monkeypatch, mock_factory):
+    server = FakeTicketServer()
+    factory = mock_factory(server.handler, ticket_auth=True)
+    auth_util = factory.auth_flow.auth_util
+    monkeypatch.setattr(auth_util, "authenticate_sync", lambda: server.issue(auth_util))
+
+    async def authenticate():
+        return server.issue(auth_util)
+
+    monkeypatch.setattr(auth_util, "authenticate", authenticate)
+    return factory, server
+
+
+class TestTicketAuth:
+    """Test ticket-based session auth on raw clients."""
+
+    def test_one_ticket_for_many_requests(self, ticket_factory):
+        factory, server = ticket_factory
+        core = factory.create_core_client().httpx_client
+        search = factory.create_search_client().httpx_client
+
+        for _ in range(5):
+            assert core.get("nodes/-root-").status_code == 200
+        assert search.post("search", json={}).status_code == 200
+
+        assert server.issued == 1
+        assert set(server.api_headers) == {_ticket_header("TICKET_1")}
+
+    def test_proactive_renewal_before_expiry(self, ticket_factory):
+        factory, server = ticket_factory
+        core = factory.create_core_client().httpx_client
+        core.get("nodes/-root-")
+
+        # Ticket now expires within the renewal margin
+        factory.auth_flow.auth_util.ticket_expires = datetime.now() + timedelta(seconds=60)
+        assert core.get("nodes/-root-").status_code == 200
+
+        assert server.issued == 2
+        assert server.api_headers[-1] == _ticket_header("TICKET_2")
+
+    def test_retry_once_on_401(self, ticket_factory):
+        factory, server = ticket_factory
+        core = factory.create_core_client().httpx_client
+        core.get("nodes/-root-")
+
+        # Server invalidates the ticket (e.g. restart) - client still thinks it's valid
+        server.issued += 1
+        response = core.get("nodes/-root-")
+
+        assert response.status_code == 200
+        assert server.api_headers[-2:] == [_ticket_header("TICKET_1"), _ticket_header("TICKET_3")]
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_ticket(self, ticket_factory):
+        factory, server = ticket_factory
+        core = factory.create_core_client().raw_client.get_async_httpx_client()
+
+        response = await core.get("nodes/-root-")
+
+        assert response.status_code == 200
+        assert server.api_headers == [_ticket_header("TICKET_1")]
+
+    def test_simple_auth_util_gets_ticket_auth_util(self):
+        factory = ClientFactory(
+            base_url="http://alfresco:8080",
+            auth_util=SimpleAuthUtil("admin", "secret"),
+            load_env=False,
+            ticket_auth=True
+        )
+        assert isinstance(factory.auth_flow, TicketAuth)
+        assert factory.auth_flow.auth_util.base_url == "http://alfresco:8080"
+        assert factory.auth_flow.auth_util.password == "secret"
+
+    def test_basic_auth_is_default(self):
+        factory = ClientFactory(
+            base_url="http://localhost:8080",
+            username="admin",
+            password="admin",
+            load_env=False
+        )
+        assert factory.auth_flow is None
+        assert "auth" not in factory.get_httpx_args()
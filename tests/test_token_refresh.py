@@ -0,0 +1,127 @@
+"""
+Tests for live OAuth2/ticket credential refresh on raw clients.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.client_factory import ClientFactory
+from python_alfresco_api.auth_flow import OAuth2Auth, RefreshingAuth
+from python_alfresco_api.auth_util import OAuth2AuthUtil
+
+
+class FakeTokenServer:
+    """Issues token-1, token-2, ... (slowly) and accepts only the latest token."""
+
+    def __init__(self):
+        self.issued = 0
+        self._lock = threading.Lock()
+
+    def issue(self, auth_util: OAuth2AuthUtil) -> bool:
+        time.sleep(0.05)  # widen the race window
+        with self._lock:
+            self.issued += 1
+            auth_util.access_token = f"token-{self.issued}"
+        auth_util.token_expires = datetime.now() + timedelta(hours=1)
+        auth_util._authenticated = True
+        return True
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.headers.get("Authorization") == f"Bearer token-{self.issued}":
+            return httpx.Response(200, json={"entry": {}})
+        return httpx.Response(401, json={})
+
+
+@pytest.fixture
+def oauth_factory(monkeypatch):
+    server = FakeTokenServer()
+    oauth_util = OAuth2AuthUtil(
+        base_url="http://localhost:8080",
+        client_id="client",
+        client_secret="secret",
+        token_endpoint="http://localhost:8080/token",
+        load_env=False
+    )
+    monkeypatch.setattr(oauth_util, "authenticate_sync", lambda: server.issue(oauth_util))
+    factory = ClientFactory(auth_util=oauth_util, load_env=False)
+    factory.transport.use_transport(httpx.MockTransport(server.handler))
+    return factory, server
+
+
+class TestTokenRefresh:
+    """Test that raw clients pick up refreshed credentials without being rebuilt."""
+
+    def test_oauth2_factory_installs_auth_flow(self, oauth_factory):
+        factory, _ = oauth_factory
+        assert isinstance(factory.auth_flow, OAuth2Auth)
+        assert factory.get_httpx_args()["auth"] is factory.auth_flow
+
+    def test_expired_token_refreshed_on_same_client(self, oauth_factory):
+        factory, server = oauth_factory
+        httpx_client = factory.create_core_client().httpx_client
+        assert httpx_client.get("nodes/-root-").status_code == 200
+
+        # Token expires - the same httpx client (and pool) keeps working
+        factory.auth.token_expires = datetime.now() - timedelta(seconds=1)
+        assert httpx_client.get("nodes/-root-").status_code == 200
+
+        assert server.issued == 2
+        assert factory.transport.sync_transport is factory.transport._sync_transport
+
+    def test_revoked_token_refreshed_on_401(self, oauth_factory):
+        factory, server = oauth_factory
+        httpx_client = factory.create_core_client().httpx_client
+        httpx_client.get("nodes/-root-")
+
+        server.issued += 1  # server revokes token-1
+        assert httpx_client.get("nodes/-root-").status_code == 200
+        assert factory.auth.access_token == "token-3"
+
+    def test_base_flow_is_abstract(self, oauth_factory):
+        factory, _ = oauth_factory
+        with pytest.raises(TypeError):
+            RefreshingAuth(factory.auth)
+
+    def test_valid_token_skips_refresh_lock(self, oauth_factory):
+        factory, _ = oauth_factory
+        httpx_client = factory.create_core_client().httpx_client
+        httpx_client.get("nodes/-root-")
+
+        # A fresh token is sent without waiting for the refresh lock
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with factory.auth_flow._lock:
+                status = pool.submit(lambda: httpx_client.get("nodes/-root-").status_code)
+                assert status.result(timeout=5) == 200
+
+    def test_single_flight_across_threads(self, oauth_factory):
+        factory, server = oauth_factory
+        httpx_client = factory.create_core_client().httpx_client
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            statuses = list(
+                pool.map(lambda _: httpx_client.get("nodes/-root-").status_code, range(32))
+            )
+
+        assert statuses == [200] * 32
+        assert server.issued == 1
+
+    @pytest.mark.asyncio
+    async def test_single_flight_across_tasks(self, oauth_factory):
+        factory, server = oauth_factory
+        httpx_client = factory.create_core_client().raw_client.get_async_httpx_client()
+
+        responses = await asyncio.gather(*(httpx_client.get("nodes/-root-") for _ in range(32)))
+
+        assert [r.status_code for r in responses] == [200] * 32
+        assert server.issued == 1
@@ -0,0 +1,167 @@
+"""
+Tests for the strict / trusted validation profiles and the cached
+TypeAdapters (clients/validation.py).
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import httpx
+import pytest
+from pydantic import BaseModel, ValidationError
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.clients.core.nodes.models import Node, NodeResponse
+from python_alfresco_api.clients.models import UserInfo
+from python_alfresco_api.clients import validation
+from python_alfresco_api.clients.validation import (
+    get_validation_profile, set_validation_profile, reset_validation_profile,
+    trusted_model, type_adapter, validate_python, validation_profile
+)
+
+NODE = {
+    "id": "node-1",
+    "name": "report.pdf",
+    "nodeType": "cm:content",
+    "isFile": True,
+    "isFolder": False,
+    "createdAt": "2024-01-01T10:00:00.000+0000",
+    "modifiedAt": "2024-02-01T10:00:00.000+0000",
+    "createdByUser": {"id": "admin", "displayName": "Administrator"},
+    "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"entry": NODE})
+
+
+@pytest.fixture
+def core_client(mock_factory):
+    return mock_factory(_handler).create_core_client()
+
+
+class TestTrustedModels:
+    """Test the trusted model variants."""
+
+    def test_cached_subclass(self):
+        trusted = trusted_model(NodeResponse)
+
+        assert trusted is trusted_model(NodeResponse)
+        assert issubclass(trusted, NodeResponse)
+        assert trusted.__name__ == "NodeResponse"
+        assert trusted.model_fields["entry"].annotation is trusted_model(Node)
+
+    def test_nested_models_are_trusted(self):
+        response = trusted_model(NodeResponse).model_validate(
+            NodeResponse(entry=NODE).model_dump(by_alias=True)
+        )
+
+        assert isinstance(response.entry, Node)
+        assert type(response.entry) is trusted_model(Node)
+        assert type(response.entry.created_by_user) is trusted_model(UserInfo)
+        assert response.model_dump() == NodeResponse.model_validate({"entry": NODE}).model_dump()
+
+    def test_no_whitespace_stripping_or_constraints(self):
+        data = dict(NODE, id="  node-1  ", name="x" * 300)
+
+        with pytest.raises(ValidationError):
+            Node.model_validate(data)
+        node = validate_python(Node, data, profile="trusted")
+        assert node.id == "  node-1  "
+        assert len(node.name) == 300
+
+    def test_no_assignment_validation(self):
+        node = validate_python(Node, NODE, profile="trusted")
+        node.name = 42
+
+        assert node.name == 42
+        with pytest.raises(ValidationError):
+            Node.model_validate(NODE).name = 42
+
+    def test_type_expressions(self):
+        nodes = validate_python(List[Node], [NODE, NODE], profile="trusted")
+
+        assert [type(node) for node in nodes] == [trusted_model(Node)] * 2
+        assert type_adapter(List[Node], "trusted") is type_adapter(List[Node], "trusted")
+
+
+    def test_concurrent_first_use(self, monkeypatch):
+        class Inner(BaseModel):
+            value: str
+
+        class Outer(BaseModel):
+            inner: Inner
+            name: str
+
+        field = validation.Field
+
+        def slow_field(**kwargs):
+            time.sleep(0.02)  # keep the build in progress while other threads ask
+            return field(**kwargs)
+
+        monkeypatch.setattr(validation, "Field", slow_field)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: trusted_model(Outer), range(8)))
+
+        assert results == [trusted_model(Outer)] * 8
+        assert results[0] is not Outer
+        assert results[0].model_fields["inner"].annotation is trusted_model(Inner)
+
+
+class TestProfileSelection:
+    """Test how the active profile is chosen."""
+
+    def test_default_is_strict(self):
+        assert get_validation_profile() == "strict"
+        assert type(validate_python(Node, NODE)) is Node
+
+    def test_context_manager(self):
+        with validation_profile("trusted"):
+            assert get_validation_profile() == "trusted"
+            assert type(validate_python(Node, NODE)) is trusted_model(Node)
+        assert get_validation_profile() == "strict"
+
+    def test_set_and_reset(self):
+        token = set_validation_profile("trusted")
+        try:
+            assert get_validation_profile() == "trusted"
+        finally:
+            reset_validation_profile(token)
+        assert get_validation_profile() == "strict"
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError):
+            set_validation_profile("fast")
+        with pytest.raises(ValueError):
+            type_adapter(Node, "fast")
+
+
+class TestClientDecoding:
+    """Test the wrappers decode under the active profile."""
+
+    def test_get_node(self, core_client):
+        assert type(core_client.nodes.get("node-1")) is NodeResponse
+
+        with validation_profile("trusted"):
+            response = core_client.nodes.get("node-1")
+        assert type(response) is trusted_model(NodeResponse)
+        assert response.entry.name == "report.pdf"
+
+    def test_get_node_async(self, core_client):
+        async def fetch():
+            with validation_profile("trusted"):
+                return await core_client.nodes.get_async("node-1")
+
+        assert isinstance(asyncio.run(fetch()).entry, trusted_model(Node))
+
+    def test_bulk(self, core_client):
+        report = core_client.nodes.bulk.get(["a", "b"])
+
+        assert [item.result.entry.name for item in report.items] == ["report.pdf", "report.pdf"]
@@ -0,0 +1,166 @@
+"""
+Tests for lazy, zero-validation list views (clients/views.py and the
+view=True modes of list_children / iter_children / search).
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+# Add the project root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from python_alfresco_api.clients.core.nodes.models import Node
+from python_alfresco_api.clients.views import ListView, ModelView, view_class
+from python_alfresco_api.raw_clients.alfresco_search_client.search_client.models import (
+    RequestQuery,
+    SearchRequest,
+)
+
+def _node(i):
+    return {
+        "id": f"node-{i}",
+        "name": f"doc-{i}.txt",
+        "nodeType": "cm:content",
+        "isFile": True,
+        "isFolder": False,
+        "createdAt": "2024-01-01T10:00:00.000+0000",
+        "modifiedAt": "2024-02-01T10:00:00.000+0000",
+        "createdByUser": {"id": "admin", "displayName": "Administrator"},
+        "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+        "content": {
+            "mimeType": "text/plain",
+            "mimeTypeName": "Plain Text",
+            "sizeInBytes": 10 + i,
+            "encoding": "UTF-8",
+        },
+        "aspectNames": ["cm:titled"],
+    }
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/search"):
+        entries = [dict(_node(i), search={"score": 2.0}) for i in range(3)]
+        total = 3
+    else:
+        skip = int(request.url.params.get("skipCount", 0))
+        size = int(request.url.params.get("maxItems", 100))
+        entries = [_node(i) for i in range(skip, min(skip + size, 25))]
+        total = 25
+    skip = int(request.url.params.get("skipCount", 0))
+    return httpx.Response(
+        200,
+        json={
+            "list": {
+                "pagination": {
+                    "count": len(entries),
+                    "hasMoreItems": skip + len(entries) < total,
+                    "totalItems": total,
+                    "skipCount": skip,
+                    "maxItems": 100,
+                },
+                "entries": [{"entry": entry} for entry in entries],
+            }
+        },
+    )
+
+
+@pytest.fixture
+def factory(mock_factory):
+    return mock_factory(_handler)
+
+
+@pytest.fixture
+def core_client(factory):
+    return factory.create_core_client()
+
+
+class TestModelView:
+    """Test the accessor objects."""
+
+    def test_slotted(self):
+        node = view_class(Node)(_node(1))
+
+        assert isinstance(node, ModelView)
+        assert not hasattr(node, "__dict__")
+        assert view_class(Node) is type(node)
+
+    def test_fields_decoded_on_access(self):
+        node = view_class(Node)(_node(1))
+
+        assert node.id == "node-1"
+        assert node.node_type == "cm:content"
+        assert node.aspects == ["cm:titled"]
+        assert node.created_at == datetime.fromisoformat("2024-01-01T10:00:00+00:00")
+        assert isinstance(node.created_by_user, ModelView)
+        assert node.created_by_user.display_name == "Administrator"
+        assert node.content.size_in_bytes == 11
+
+    def test_missing_fields(self):
+        node = view_class(Node)({"id": "x"})
+
+        assert node.parent_id is None
+        with pytest.raises(AttributeError):
+            node.not_a_field
+
+    def test_list_of_models(self):
+        class Child(BaseModel):
+            id: str
+
+        class Parent(BaseModel):
+            children: list[Child] | None = None
+
+        parent = view_class(Parent)({"children": [{"id": "a"}, {"id": "b"}]})
+        assert [child.id for child in parent.children] == ["a", "b"]
+
+    def test_to_model(self):
+        node = view_class(Node)(_node(1))
+        assert node.to_model() == Node.model_validate(_node(1))
+
+
+class TestNodesViews:
+    """Test view=True on the nodes list wrappers."""
+
+    def test_list_children_view(self, core_client):
+        page = core_client.nodes.list_children("folder-1", max_items=10, view=True)
+
+        assert isinstance(page, ListView)
+        assert len(page) == 10
+        assert page.pagination.total_items == 25
+        assert [node.name for node in page.entries][:2] == ["doc-0.txt", "doc-1.txt"]
+        assert page.to_models()[0].is_file
+
+    def test_iter_children_view(self, core_client):
+        nodes = list(core_client.nodes.iter_children("folder-1", page_size=10, view=True))
+
+        assert [node.id for node in nodes] == [f"node-{i}" for i in range(25)]
+        assert all(isinstance(node, ModelView) for node in nodes)
+
+    @pytest.mark.asyncio
+    async def test_list_children_view_async(self, core_client):
+        page = await core_client.nodes.list_children_async("folder-1", view=True)
+        assert page.entries[24].id == "node-24"
+
+
+class TestSearchViews:
+    """Test lazy search views."""
+
+    def test_search_view(self, factory):
+        search = factory.create_search_client()
+        page = search.search.search_view(SearchRequest(query=RequestQuery(query="doc")))
+
+        hit = page.entries[0]
+        assert hit.name == "doc-0.txt"
+        assert hit.is_file and hit.isFile
+        assert hit.search.score == 2.0
+        assert hit.to_model().search.score == 2.0
+
+    def test_iter_search_view(self, factory):
+        search = factory.create_search_client()
+        hits = list(search.iter_search(SearchRequest(query=RequestQuery(query="doc")), view=True))
+
+        assert [hit.id for hit in hits] == ["node-0", "node-1", "node-2"]